@@ -27,22 +27,10 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here for 'autogenerate' support
-from sqlalchemy.orm import declarative_base
-Base = declarative_base()
-
-# Importar modelos para que Alembic los reconozca
-# IMPORTANTE: Estos imports deben estar después de crear Base
-try:
-    from app.users.infrastructure.persistence.user_repository_impl import UserModel
-    from app.users.infrastructure.persistence.activation_token_repository_impl import ActivationTokenModel
-
-    # Asignar metadata
-    UserModel.metadata = Base.metadata
-    ActivationTokenModel.metadata = Base.metadata
-except ImportError as e:
-    print(f"Warning: Could not import models: {e}")
-
-target_metadata = Base.metadata
+# Todos los modelos comparten una sola Base (app/shared/database/base.py)
+from app.shared.database.models import register_models
+
+target_metadata = register_models()
 
 
 def run_migrations_offline() -> None:
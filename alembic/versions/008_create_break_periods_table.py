@@ -0,0 +1,114 @@
+"""create break_periods table
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-01-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Normalizar attendances.break_periods (JSON) en la tabla break_periods"""
+    op.create_table(
+        'break_periods',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('attendance_id', postgresql.UUID(as_uuid=True), nullable=False),
+
+        sa.Column('start_time', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('end_time', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('status', sa.String(50), nullable=False),
+
+        # Geolocalización (JSON)
+        sa.Column('start_location', postgresql.JSON, nullable=True),
+        sa.Column('end_location', postgresql.JSON, nullable=True),
+
+        sa.Column('allowed_duration_minutes', sa.Integer, nullable=False, server_default='30'),
+
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+
+        sa.ForeignKeyConstraint(['attendance_id'], ['attendances.id'], ondelete='CASCADE'),
+    )
+
+    op.create_index('idx_break_periods_attendance_start', 'break_periods', ['attendance_id', 'start_time'])
+
+    op.create_check_constraint(
+        'valid_break_status',
+        'break_periods',
+        "status IN ('in_progress', 'completed', 'exceeded')"
+    )
+
+    # Backfill desde el arreglo JSON (los ids antiguos podían ser null)
+    op.execute(
+        """
+        INSERT INTO break_periods (
+            id, attendance_id, start_time, end_time, status,
+            start_location, end_location, allowed_duration_minutes, created_at
+        )
+        SELECT
+            CASE
+                WHEN bp->>'id' ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+                THEN (bp->>'id')::uuid
+                ELSE gen_random_uuid()
+            END,
+            a.id,
+            (bp->>'start_time')::timestamptz,
+            (bp->>'end_time')::timestamptz,
+            COALESCE(bp->>'status', 'completed'),
+            bp->'start_location',
+            bp->'end_location',
+            COALESCE((bp->>'allowed_duration_minutes')::int, 30),
+            COALESCE((bp->>'start_time')::timestamptz, a.created_at)
+        FROM attendances a
+        CROSS JOIN LATERAL json_array_elements(a.break_periods) AS bp
+        """
+    )
+
+    op.drop_column('attendances', 'break_periods')
+
+
+def downgrade() -> None:
+    """Volver a guardar los descansos como JSON en attendances"""
+    op.add_column(
+        'attendances',
+        sa.Column('break_periods', postgresql.JSON, nullable=False, server_default='[]'),
+    )
+
+    op.execute(
+        """
+        UPDATE attendances a
+        SET break_periods = b.items
+        FROM (
+            SELECT
+                attendance_id,
+                json_agg(
+                    json_build_object(
+                        'id', id::text,
+                        'start_time', start_time,
+                        'end_time', end_time,
+                        'status', status,
+                        'start_location', start_location,
+                        'end_location', end_location,
+                        'allowed_duration_minutes', allowed_duration_minutes
+                    )
+                    ORDER BY start_time
+                ) AS items
+            FROM break_periods
+            GROUP BY attendance_id
+        ) b
+        WHERE b.attendance_id = a.id
+        """
+    )
+
+    op.drop_table('break_periods')
@@ -0,0 +1,88 @@
+"""create attendance_daily_summary table
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-01-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Crear el resumen diario de asistencia y poblarlo con el histórico"""
+    op.create_table(
+        'attendance_daily_summary',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('date', sa.Date, nullable=False),
+        sa.Column('attendance_id', postgresql.UUID(as_uuid=True), nullable=False),
+
+        # Totales del día
+        sa.Column('worked_minutes', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('break_minutes', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('late_minutes', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('is_late', sa.Boolean, nullable=False, server_default='false'),
+        sa.Column('is_holiday', sa.Boolean, nullable=False, server_default='false'),
+        sa.Column('status', sa.String(50), nullable=False),
+
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+
+        sa.PrimaryKeyConstraint('user_id', 'date'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['attendance_id'], ['attendances.id'], ondelete='CASCADE'),
+    )
+
+    # Reportes por periodo de toda la empresa
+    op.create_index('idx_attendance_daily_summary_date', 'attendance_daily_summary', ['date'])
+
+    # Backfill (mismo cálculo que el comando rebuild_attendance_summary)
+    op.execute(
+        """
+        INSERT INTO attendance_daily_summary (
+            user_id, date, attendance_id, worked_minutes, break_minutes,
+            late_minutes, is_late, is_holiday, status, updated_at
+        )
+        SELECT
+            a.user_id,
+            a.date,
+            a.id,
+            CASE
+                WHEN a.check_in_time IS NOT NULL AND a.check_out_time IS NOT NULL
+                THEN GREATEST(
+                    floor(extract(epoch FROM a.check_out_time - a.check_in_time) / 60)
+                    - COALESCE(b.break_minutes, 0),
+                    0
+                )
+                ELSE 0
+            END,
+            COALESCE(b.break_minutes, 0),
+            COALESCE(a.late_minutes, 0),
+            COALESCE(a.is_late, false),
+            a.type = 'holiday',
+            a.status,
+            now()
+        FROM attendances a
+        LEFT JOIN (
+            SELECT attendance_id,
+                   sum(floor(extract(epoch FROM end_time - start_time) / 60)) AS break_minutes
+            FROM break_periods
+            WHERE end_time IS NOT NULL
+            GROUP BY attendance_id
+        ) b ON b.attendance_id = a.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Eliminar el resumen diario de asistencia"""
+    op.drop_table('attendance_daily_summary')
@@ -0,0 +1,32 @@
+"""add attendances history index
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-01-26 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Índice compuesto para el historial paginado por keyset (date, id)"""
+    op.create_index(
+        'idx_attendances_user_date_desc',
+        'attendances',
+        ['user_id', sa.text('date DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Eliminar índice del historial"""
+    op.drop_index('idx_attendances_user_date_desc', table_name='attendances')
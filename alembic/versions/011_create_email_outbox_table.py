@@ -0,0 +1,61 @@
+"""create email_outbox table
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-02-02 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Crear la bandeja de salida de emails (outbox)"""
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('to_email', sa.String(255), nullable=False),
+        sa.Column('context', postgresql.JSON, nullable=False, server_default='{}'),
+
+        # Estado de entrega
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text, nullable=True),
+
+        # Metadatos
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # El worker solo busca lo pendiente: índice parcial pequeño
+    op.create_index(
+        'idx_email_outbox_ready',
+        'email_outbox',
+        ['next_attempt_at'],
+        postgresql_where=sa.text("status IN ('pending', 'sending')")
+    )
+    op.create_index('idx_email_outbox_status', 'email_outbox', ['status'])
+
+    op.create_check_constraint(
+        'valid_email_outbox_status',
+        'email_outbox',
+        "status IN ('pending', 'sending', 'sent', 'failed')"
+    )
+
+
+def downgrade() -> None:
+    """Eliminar la bandeja de salida de emails"""
+    op.drop_table('email_outbox')
@@ -0,0 +1,60 @@
+"""create user_sessions table
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-02-09 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Crear la tabla de sesiones (refresh tokens rotativos)"""
+    op.create_table(
+        'user_sessions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+
+        # Hash SHA-256 del jti vigente (nunca el jti en claro)
+        sa.Column('refresh_jti_hash', sa.String(64), nullable=False),
+
+        # Vigencia y revocación
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('revoked_reason', sa.String(50), nullable=True),
+
+        # Dispositivo
+        sa.Column('user_agent', sa.String(255), nullable=True),
+        sa.Column('ip_address', sa.String(45), nullable=True),
+
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    )
+
+    op.create_index('idx_user_sessions_refresh_jti_hash', 'user_sessions', ['refresh_jti_hash'], unique=True)
+    op.create_index('idx_user_sessions_user_id', 'user_sessions', ['user_id'])
+
+    # Precarga del índice de revocados al arrancar: solo filas revocadas
+    op.create_index(
+        'idx_user_sessions_revoked_at',
+        'user_sessions',
+        ['revoked_at'],
+        postgresql_where=sa.text('revoked_at IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Eliminar la tabla de sesiones"""
+    op.drop_table('user_sessions')
@@ -0,0 +1,37 @@
+"""create login_attempts table
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-02-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Crear la tabla de intentos de login (backend compartido del limitador)"""
+    # UNLOGGED: datos efímeros, no necesitan WAL ni sobrevivir a un crash
+    op.create_table(
+        'login_attempts',
+        sa.Column('id', sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column('key', sa.String(320), nullable=False),
+        sa.Column('attempted_at', sa.DateTime(timezone=True), nullable=False),
+        prefixes=['UNLOGGED'],
+    )
+
+    op.create_index('idx_login_attempts_key_attempted_at', 'login_attempts', ['key', 'attempted_at'])
+
+
+def downgrade() -> None:
+    """Eliminar la tabla de intentos de login"""
+    op.drop_table('login_attempts')
@@ -0,0 +1,34 @@
+"""add GiST index on time_off_requests date range
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-02-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Índice GiST para buscar ausencias que se solapan con un rango (&&)"""
+    # La expresión debe ser idéntica a la del filtro en find_team_absences
+    op.create_index(
+        'idx_time_off_requests_daterange',
+        'time_off_requests',
+        [sa.text("daterange(start_date, end_date, '[]')")],
+        postgresql_using='gist'
+    )
+
+
+def downgrade() -> None:
+    """Eliminar el índice"""
+    op.drop_index('idx_time_off_requests_daterange', table_name='time_off_requests')
@@ -0,0 +1,34 @@
+"""add (policy_id, date DESC) index on sanitary_reviews
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-02-23 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Índice para la última revisión por política y el historial por fecha"""
+    # Sirve al DISTINCT ON (policy_id) ... ORDER BY policy_id, date DESC del
+    # tablero de cumplimiento y al historial de una política en un periodo
+    op.create_index(
+        'idx_sanitary_reviews_policy_date',
+        'sanitary_reviews',
+        ['policy_id', sa.text('date DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Eliminar el índice"""
+    op.drop_index('idx_sanitary_reviews_policy_date', table_name='sanitary_reviews')
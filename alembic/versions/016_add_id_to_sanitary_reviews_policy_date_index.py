@@ -0,0 +1,40 @@
+"""add id to the (policy_id, date DESC) index on sanitary_reviews
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-02-25 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Índice compuesto para el historial paginado por keyset (date, id)"""
+    # Reemplaza a idx_sanitary_reviews_policy_date: el mismo prefijo sigue
+    # sirviendo al DISTINCT ON del tablero de cumplimiento
+    op.create_index(
+        'idx_sanitary_reviews_policy_date_id',
+        'sanitary_reviews',
+        ['policy_id', sa.text('date DESC'), sa.text('id DESC')]
+    )
+    op.drop_index('idx_sanitary_reviews_policy_date', table_name='sanitary_reviews')
+
+
+def downgrade() -> None:
+    """Volver al índice (policy_id, date DESC)"""
+    op.create_index(
+        'idx_sanitary_reviews_policy_date',
+        'sanitary_reviews',
+        ['policy_id', sa.text('date DESC')]
+    )
+    op.drop_index('idx_sanitary_reviews_policy_date_id', table_name='sanitary_reviews')
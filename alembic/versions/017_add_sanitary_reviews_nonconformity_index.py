@@ -0,0 +1,36 @@
+"""add covering index for nonconformity analytics on sanitary_reviews
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-03-02 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+op: Operations
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Índice parcial y cubriente para agrupar inconformidades por mes"""
+    # Solo revisiones inconformes (una fracción de la tabla) y con todas las
+    # columnas del GROUP BY en el INCLUDE: index-only scan por rango de fechas
+    op.create_index(
+        'idx_sanitary_reviews_nonconform_date',
+        'sanitary_reviews',
+        ['date'],
+        postgresql_include=['policy_id', 'incident_type_id', 'company_id'],
+        postgresql_where=sa.text('is_conform IS FALSE')
+    )
+
+
+def downgrade() -> None:
+    """Eliminar el índice de analítica de inconformidades"""
+    op.drop_index('idx_sanitary_reviews_nonconform_date', table_name='sanitary_reviews')
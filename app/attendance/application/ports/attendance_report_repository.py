@@ -0,0 +1,21 @@
+"""Puerto para consultas agregadas de asistencia"""
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from datetime import date
+from app.attendance.domain.attendance_report import AttendanceAggregate
+
+class AttendanceReportRepository(ABC):
+
+    @abstractmethod
+    async def aggregate_by_user(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[str]] = None
+    ) -> List[AttendanceAggregate]:
+        """Totales por usuario en el rango [start_date, end_date]"""
+
+
+    @abstractmethod
+    async def aggregate_by_role(self, start_date: date, end_date: date) -> List[AttendanceAggregate]:
+        """Totales por rol (equipo) en el rango [start_date, end_date]"""
@@ -1,14 +1,14 @@
 """Puerto para repositorio de asistencia"""
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from datetime import date
+from typing import Optional, List, Tuple
+from datetime import date, datetime
 from app.attendance.domain.attendance import Attendance
 
 class AttendanceRepository(ABC):
 
     @abstractmethod
     async def save(self, attendance: Attendance) -> Attendance:
-        """Guarda o actualiza una asistencia"""
+        """Guarda o actualiza una asistencia (sin commit: lo hace la UnitOfWork del caso de uso)"""
 
 
     @abstractmethod
@@ -26,7 +26,35 @@ class AttendanceRepository(ABC):
         """Obtiene las últimas asistencias de un usuario"""
 
 
+    @abstractmethod
+    async def find_history(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[Tuple[date, str]] = None
+    ) -> List[Attendance]:
+        """Historial paginado por keyset (date DESC, id DESC) a partir del cursor (date, id)"""
+
+
     @abstractmethod
     async def has_pending_regularization(self, user_id: str) -> bool:
         """Verifica si el usuario tiene asistencias pendientes de regularizar"""
 
+
+    @abstractmethod
+    async def mark_open_for_regularization(self, now: datetime, reason: str) -> List[Tuple[str, date]]:
+        """
+        Marca en bloque (un solo UPDATE) las asistencias IN_PROGRESS/ON_BREAK cuyo
+        horario ya terminó como pendientes de regularizar. Retorna (user_id, date) afectados
+        """
+
+
+    @abstractmethod
+    async def regularize_many(
+        self,
+        attendance_ids: List[str],
+        admin_id: str,
+        notes: str,
+        now: datetime
+    ) -> List[Tuple[str, str, date]]:
+        """Regulariza en bloque (un solo UPDATE). Retorna (id, user_id, date) regularizados"""
@@ -0,0 +1,25 @@
+"""Puerto para el resumen diario de asistencia"""
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from datetime import date
+from app.attendance.domain.attendance import Attendance
+
+class AttendanceSummaryRepository(ABC):
+    """
+    Las escrituras no hacen commit: el resumen se confirma en la misma
+    transacción que la asistencia de la que se deriva (UnitOfWork).
+    """
+
+    @abstractmethod
+    async def upsert_from_attendance(self, attendance: Attendance) -> None:
+        """Actualiza la fila del resumen (usuario, día) a partir de la asistencia"""
+
+
+    @abstractmethod
+    async def rebuild(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[str]] = None
+    ) -> int:
+        """Recalcula el resumen de un rango desde attendances y break_periods. Retorna filas escritas"""
@@ -0,0 +1,29 @@
+"""Puerto para repositorio de períodos de descanso"""
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from app.attendance.domain.break_period import BreakPeriod
+
+class BreakPeriodRepository(ABC):
+    """
+    Las escrituras no hacen commit: se confirman junto con la asistencia
+    a través de la UnitOfWork del caso de uso.
+    """
+
+    @abstractmethod
+    async def add(self, break_period: BreakPeriod) -> BreakPeriod:
+        """Inserta un nuevo período de descanso (una sola fila)"""
+
+
+    @abstractmethod
+    async def update(self, break_period: BreakPeriod) -> BreakPeriod:
+        """Actualiza un período de descanso existente (una sola fila)"""
+
+
+    @abstractmethod
+    async def find_by_attendance(self, attendance_id: str) -> List[BreakPeriod]:
+        """Obtiene los descansos de una asistencia ordenados por inicio"""
+
+
+    @abstractmethod
+    async def find_by_attendances(self, attendance_ids: List[str]) -> Dict[str, List[BreakPeriod]]:
+        """Obtiene los descansos de varias asistencias en una sola consulta"""
@@ -0,0 +1,57 @@
+"""Caso de uso: Cierre automático de jornadas abiertas"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
+from app.building_blocks.unit_of_work import UnitOfWork
+
+AUTO_CLOSE_REASON = "Cierre automático: jornada sin salida registrada"
+
+@dataclass
+class AutoCloseAttendancesCommand:
+    now: Optional[datetime] = None  # Por defecto, ahora (UTC)
+
+class AutoCloseAttendancesUseCase:
+    """
+    Caso de uso: Marcar como pendientes de regularizar las jornadas
+    IN_PROGRESS/ON_BREAK cuyo horario ya terminó.
+
+    Equivale a llamar mark_as_requiring_regularization sobre cada una,
+    pero con un único UPDATE en la BD (job nocturno).
+    """
+
+    def __init__(
+        self,
+        attendance_repository: AttendanceRepository,
+        summary_repository: AttendanceSummaryRepository,
+        unit_of_work: UnitOfWork
+    ):
+        self.attendance_repository = attendance_repository
+        self.summary_repository = summary_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, command: AutoCloseAttendancesCommand) -> dict:
+        now = command.now or datetime.now(timezone.utc)
+
+        try:
+            # 1. Marcar en bloque
+            closed = await self.attendance_repository.mark_open_for_regularization(now, AUTO_CLOSE_REASON)
+
+            # 2. Sincronizar el resumen diario de los días afectados (misma transacción)
+            if closed:
+                dates = [d for _, d in closed]
+                user_ids = sorted({user_id for user_id, _ in closed})
+                await self.summary_repository.rebuild(min(dates), max(dates), user_ids)
+
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        # 3. Respuesta
+        return {
+            "closed_count": len(closed),
+            "executed_at": now.isoformat(),
+            "message": f"{len(closed)} jornadas marcadas para regularización"
+        }
@@ -0,0 +1,82 @@
+"""Caso de uso: Regularizar asistencias en bloque (Admin)"""
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List
+from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
+from app.building_blocks.unit_of_work import UnitOfWork
+from app.building_blocks.exceptions import DomainException
+
+# Límite por operación para no bloquear demasiadas filas
+MAX_BULK_REGULARIZATION = 500
+
+@dataclass
+class BulkRegularizeAttendancesCommand:
+    attendance_ids: List[str]
+    admin_id: str
+    notes: str
+
+class BulkRegularizeAttendancesUseCase:
+    """
+    Caso de uso: Regularizar varias asistencias a la vez (solo admin).
+
+    Pensado para cerrar lo que deja el cierre automático nocturno
+    sin llamar RegularizeAttendanceUseCase id por id.
+    """
+
+    def __init__(
+        self,
+        attendance_repository: AttendanceRepository,
+        summary_repository: AttendanceSummaryRepository,
+        unit_of_work: UnitOfWork
+    ):
+        self.attendance_repository = attendance_repository
+        self.summary_repository = summary_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, command: BulkRegularizeAttendancesCommand) -> dict:
+        # 1. Validar
+        attendance_ids = list(dict.fromkeys(command.attendance_ids))
+        if not attendance_ids:
+            raise DomainException("Debes indicar al menos una asistencia")
+
+        if len(attendance_ids) > MAX_BULK_REGULARIZATION:
+            raise DomainException(f"No se pueden regularizar más de {MAX_BULK_REGULARIZATION} asistencias a la vez")
+
+        for attendance_id in attendance_ids:
+            try:
+                uuid.UUID(attendance_id)
+            except ValueError:
+                raise DomainException(f"Identificador de asistencia inválido: {attendance_id}")
+
+        if not command.notes or not command.notes.strip():
+            raise DomainException("Las notas de regularización son obligatorias")
+
+        try:
+            # 2. Regularizar en bloque
+            regularized = await self.attendance_repository.regularize_many(
+                attendance_ids,
+                command.admin_id,
+                command.notes.strip(),
+                datetime.now(timezone.utc)
+            )
+
+            # 3. Sincronizar el resumen diario (misma transacción)
+            if regularized:
+                dates = [d for _, _, d in regularized]
+                user_ids = sorted({user_id for _, user_id, _ in regularized})
+                await self.summary_repository.rebuild(min(dates), max(dates), user_ids)
+
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        # 4. Respuesta
+        regularized_ids = {attendance_id for attendance_id, _, _ in regularized}
+        return {
+            "regularized_count": len(regularized_ids),
+            "not_found_ids": [a for a in attendance_ids if a not in regularized_ids],
+            "message": f"{len(regularized_ids)} asistencias regularizadas"
+        }
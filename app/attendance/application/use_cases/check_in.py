@@ -4,9 +4,11 @@ from datetime import datetime, timezone, date
 from app.attendance.domain.attendance import Attendance
 from app.attendance.domain.geolocation import Geolocation
 from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
 from app.attendance.application.ports.holiday_service import HolidayService
 from app.attendance.application.ports.work_schedule_repository import WorkScheduleRepository
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 @dataclass
 class CheckInCommand:
@@ -33,11 +35,15 @@ class CheckInUseCase:
         self,
         attendance_repository: AttendanceRepository,
         holiday_service: HolidayService,
-        work_schedule_repository: WorkScheduleRepository
+        work_schedule_repository: WorkScheduleRepository,
+        summary_repository: AttendanceSummaryRepository,
+        unit_of_work: UnitOfWork
     ):
         self.attendance_repository = attendance_repository
         self.holiday_service = holiday_service
         self.work_schedule_repository = work_schedule_repository
+        self.summary_repository = summary_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: CheckInCommand) -> dict:
         # 1. Verificar si tiene asistencias pendientes de regularización
@@ -89,10 +95,6 @@ class CheckInUseCase:
             longitude=command.workplace_longitude
         )
 
-        print(f"[DEBUG] workplace={command.workplace_latitude},{command.workplace_longitude}")
-        print(f"[DEBUG] command={location.latitude},{location.longitude}")
-
-
         # 6. Verificar si es día festivo
         is_holiday = await self.holiday_service.is_holiday(today)
 
@@ -113,8 +115,14 @@ class CheckInUseCase:
         # 8. Registrar entrada
         attendance.check_in(location, is_holiday)
 
-        # 9. Guardar
-        saved_attendance = await self.attendance_repository.save(attendance)
+        # 9. Guardar (y abrir la fila del resumen: el reporte ve la jornada en curso)
+        try:
+            saved_attendance = await self.attendance_repository.save(attendance)
+            await self.summary_repository.upsert_from_attendance(saved_attendance)
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         # 10. Preparar respuesta
         return {
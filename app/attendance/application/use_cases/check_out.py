@@ -4,7 +4,9 @@ from datetime import datetime, timezone
 from app.attendance.domain.geolocation import Geolocation
 from app.attendance.domain.attendance import Attendance
 from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 @dataclass
 class CheckOutCommand:
@@ -22,8 +24,15 @@ class CheckOutUseCase:
     - Salida sin haber marcado descansos (permitido pero registrado)
     """
 
-    def __init__(self, attendance_repository: AttendanceRepository):
+    def __init__(
+        self,
+        attendance_repository: AttendanceRepository,
+        summary_repository: AttendanceSummaryRepository,
+        unit_of_work: UnitOfWork
+    ):
         self.attendance_repository = attendance_repository
+        self.summary_repository = summary_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: CheckOutCommand) -> dict:
         # 1. Obtener asistencia del día
@@ -49,8 +58,14 @@ class CheckOutUseCase:
         # 4. Registrar salida
         attendance.check_out(location)
 
-        # 5. Guardar
-        await self.attendance_repository.save(attendance)
+        # 5. Guardar (y actualizar el resumen diario) en una sola transacción
+        try:
+            await self.attendance_repository.save(attendance)
+            await self.summary_repository.upsert_from_attendance(attendance)
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         # 6. Calcular horas trabajadas
         work_hours = attendance.get_total_work_hours()
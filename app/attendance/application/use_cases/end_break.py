@@ -3,7 +3,10 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from app.attendance.domain.geolocation import Geolocation
 from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
+from app.attendance.application.ports.break_period_repository import BreakPeriodRepository
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 @dataclass
 class EndBreakCommand:
@@ -17,8 +20,17 @@ class EndBreakUseCase:
     Caso de uso: Finalizar período de descanso.
     """
 
-    def __init__(self, attendance_repository: AttendanceRepository):
+    def __init__(
+        self,
+        attendance_repository: AttendanceRepository,
+        break_period_repository: BreakPeriodRepository,
+        summary_repository: AttendanceSummaryRepository,
+        unit_of_work: UnitOfWork
+    ):
         self.attendance_repository = attendance_repository
+        self.break_period_repository = break_period_repository
+        self.summary_repository = summary_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: EndBreakCommand) -> dict:
         # 1. Obtener asistencia del día
@@ -38,13 +50,19 @@ class EndBreakUseCase:
         )
 
         # 3. Finalizar descanso
-        attendance.end_break(location)
+        last_break = attendance.end_break(location)
 
-        # 4. Guardar
-        await self.attendance_repository.save(attendance)
+        # 4. Guardar (estado de la asistencia + actualización de una sola fila) en una sola transacción
+        try:
+            await self.attendance_repository.save(attendance)
+            await self.break_period_repository.update(last_break)
+            await self.summary_repository.upsert_from_attendance(attendance)
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         # 5. Obtener información del descanso
-        last_break = attendance.break_periods[-1]
         duration = last_break.get_duration_minutes()
 
         # 6. Respuesta
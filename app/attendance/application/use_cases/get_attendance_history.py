@@ -0,0 +1,67 @@
+"""Caso de uso: Historial de asistencia paginado"""
+import base64
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.building_blocks.exceptions import DomainException
+
+# Tamaño de página máximo permitido
+MAX_PAGE_SIZE = 100
+
+@dataclass
+class GetAttendanceHistoryCommand:
+    user_id: str
+    first: int = 30
+    after: Optional[str] = None  # Cursor opaco devuelto en la página anterior
+
+class GetAttendanceHistoryUseCase:
+    """
+    Caso de uso: Obtener el historial de asistencias de un usuario.
+
+    Usa paginación por keyset (date, id): cada página cuesta lo mismo
+    sin importar qué tan atrás esté en el historial.
+    """
+
+    def __init__(self, attendance_repository: AttendanceRepository):
+        self.attendance_repository = attendance_repository
+
+    async def execute(self, command: GetAttendanceHistoryCommand) -> dict:
+        # 1. Validar parámetros
+        if command.first < 1 or command.first > MAX_PAGE_SIZE:
+            raise DomainException(f"El tamaño de página debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        after = decode_cursor(command.after) if command.after else None
+
+        # 2. Pedir un registro extra para saber si hay más páginas
+        attendances = await self.attendance_repository.find_history(
+            command.user_id, command.first + 1, after
+        )
+
+        has_more = len(attendances) > command.first
+        attendances = attendances[:command.first]
+
+        # 3. Respuesta
+        last = attendances[-1] if attendances else None
+        return {
+            "items": attendances,
+            "has_more": has_more,
+            "next_cursor": encode_cursor(last.date.date(), last.id) if last and has_more else None
+        }
+
+
+def encode_cursor(cursor_date: date, attendance_id: str) -> str:
+    """Codifica (date, id) como cursor opaco"""
+    raw = f"{cursor_date.isoformat()}|{attendance_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[date, str]:
+    """Decodifica el cursor opaco a (date, id)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        cursor_date, attendance_id = raw.split("|", 1)
+        return date.fromisoformat(cursor_date), str(uuid.UUID(attendance_id))
+    except (ValueError, UnicodeDecodeError):
+        raise DomainException("Cursor inválido")
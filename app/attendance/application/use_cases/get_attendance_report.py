@@ -0,0 +1,76 @@
+"""Caso de uso: Reporte de asistencia por periodo"""
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional, List
+from app.attendance.application.ports.attendance_report_repository import AttendanceReportRepository
+from app.building_blocks.exceptions import DomainException
+
+# Agrupaciones soportadas
+GROUP_BY_USER = "user"
+GROUP_BY_TEAM = "team"
+
+# Rango máximo para un reporte (un año y algo para cierres anuales)
+MAX_REPORT_DAYS = 400
+
+@dataclass
+class GetAttendanceReportCommand:
+    start_date: date
+    end_date: date
+    group_by: str = GROUP_BY_USER
+    user_ids: Optional[List[str]] = field(default=None)
+
+class GetAttendanceReportUseCase:
+    """
+    Caso de uso: Obtener totales de asistencia de un periodo.
+
+    Calcula por usuario o por equipo (rol):
+    - Horas trabajadas descontando descansos
+    - Minutos y cantidad de tardanzas
+    - Turnos en feriado
+    """
+
+    def __init__(self, attendance_report_repository: AttendanceReportRepository):
+        self.attendance_report_repository = attendance_report_repository
+
+    async def execute(self, command: GetAttendanceReportCommand) -> dict:
+        # 1. Validar rango
+        if command.start_date > command.end_date:
+            raise DomainException("La fecha de inicio debe ser anterior a la fecha de fin")
+
+        if (command.end_date - command.start_date).days > MAX_REPORT_DAYS:
+            raise DomainException(f"El rango del reporte no puede superar {MAX_REPORT_DAYS} días")
+
+        # 2. Consultar agregados (un solo GROUP BY en la BD)
+        if command.group_by == GROUP_BY_USER:
+            rows = await self.attendance_report_repository.aggregate_by_user(
+                command.start_date, command.end_date, command.user_ids
+            )
+        elif command.group_by == GROUP_BY_TEAM:
+            rows = await self.attendance_report_repository.aggregate_by_role(
+                command.start_date, command.end_date
+            )
+        else:
+            raise DomainException("Agrupación no soportada. Usa 'user' o 'team'")
+
+        # 3. Respuesta
+        return {
+            "start_date": command.start_date.isoformat(),
+            "end_date": command.end_date.isoformat(),
+            "group_by": command.group_by,
+            "rows": [
+                {
+                    "group_key": r.group_key,
+                    "group_label": r.group_label,
+                    "users_count": r.users_count,
+                    "days_worked": r.days_worked,
+                    "worked_hours": r.worked_hours,
+                    "break_minutes": r.break_minutes,
+                    "late_minutes": r.late_minutes,
+                    "late_count": r.late_count,
+                    "holiday_shifts": r.holiday_shifts
+                }
+                for r in rows
+            ],
+            "total_worked_hours": round(sum(r.worked_minutes for r in rows) / 60, 2),
+            "total_late_minutes": sum(r.late_minutes for r in rows)
+        }
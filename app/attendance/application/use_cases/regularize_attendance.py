@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 @dataclass
 class RegularizeAttendanceCommand:
@@ -21,8 +23,15 @@ class RegularizeAttendanceUseCase:
     - Olvido de marcar salida (admin cierra jornada)
     """
 
-    def __init__(self, attendance_repository: AttendanceRepository):
+    def __init__(
+        self,
+        attendance_repository: AttendanceRepository,
+        summary_repository: AttendanceSummaryRepository,
+        unit_of_work: UnitOfWork
+    ):
         self.attendance_repository = attendance_repository
+        self.summary_repository = summary_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: RegularizeAttendanceCommand) -> dict:
         # 1. Obtener asistencia
@@ -38,8 +47,14 @@ class RegularizeAttendanceUseCase:
             adjusted_check_in=command.adjusted_check_in
         )
 
-        # 3. Guardar
-        await self.attendance_repository.save(attendance)
+        # 3. Guardar (y actualizar el resumen diario) en una sola transacción
+        try:
+            await self.attendance_repository.save(attendance)
+            await self.summary_repository.upsert_from_attendance(attendance)
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         # 4. Respuesta
         return {
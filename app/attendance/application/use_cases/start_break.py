@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from app.attendance.domain.geolocation import Geolocation
 from app.attendance.application.ports.attendance_repository import AttendanceRepository
+from app.attendance.application.ports.break_period_repository import BreakPeriodRepository
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 @dataclass
 class StartBreakCommand:
@@ -17,8 +19,15 @@ class StartBreakUseCase:
     Caso de uso: Iniciar período de descanso.
     """
 
-    def __init__(self, attendance_repository: AttendanceRepository):
+    def __init__(
+        self,
+        attendance_repository: AttendanceRepository,
+        break_period_repository: BreakPeriodRepository,
+        unit_of_work: UnitOfWork
+    ):
         self.attendance_repository = attendance_repository
+        self.break_period_repository = break_period_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: StartBreakCommand) -> dict:
         # 1. Obtener asistencia del día
@@ -40,8 +49,14 @@ class StartBreakUseCase:
         # 3. Iniciar descanso
         break_period = attendance.start_break(location)
 
-        # 4. Guardar
-        await self.attendance_repository.save(attendance)
+        # 4. Guardar (estado de la asistencia + una sola fila de descanso) en una sola transacción
+        try:
+            await self.attendance_repository.save(attendance)
+            break_period = await self.break_period_repository.add(break_period)
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         # 5. Respuesta
         return {
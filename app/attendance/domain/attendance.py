@@ -64,8 +64,6 @@ class Attendance:
         if self.check_in_time:
             raise DomainException("Ya se registró la entrada para esta jornada")
 
-        print(f"[DEBUG] attendance.workplace={self.workplace_location.latitude},{self.workplace_location.longitude}")
-
         # Validar ubicación
         if self.workplace_location and not location.is_within_radius(
             self.workplace_location, self.workplace_radius_meters
@@ -149,12 +147,15 @@ class Attendance:
 
         return break_period
 
-    def end_break(self, location: Geolocation) -> None:
+    def end_break(self, location: Geolocation) -> BreakPeriod:
         """
         Finaliza el período de descanso actual.
 
         Args:
             location: Ubicación del registro
+
+        Returns:
+            El período de descanso finalizado
         """
         if self.status != AttendanceStatus.ON_BREAK:
             raise DomainException("No estás en descanso")
@@ -170,6 +171,8 @@ class Attendance:
         self.status = AttendanceStatus.IN_PROGRESS
         self.updated_at = datetime.now(timezone.utc)
 
+        return current_break
+
     def check_out(self, location: Geolocation) -> None:
         """
         Registra la salida del empleado.
@@ -246,6 +249,22 @@ class Attendance:
         work_seconds = total_seconds - break_seconds
         return work_seconds / 3600  # Convertir a horas
 
+    def get_break_minutes(self) -> int:
+        """Minutos de descanso ya finalizados"""
+        return sum(
+            bp.get_duration_minutes() or 0
+            for bp in self.break_periods
+            if bp.end_time
+        )
+
+    def get_worked_minutes(self) -> int:
+        """Minutos trabajados de una jornada cerrada (sin contar descansos)"""
+        if not self.check_in_time or not self.check_out_time:
+            return 0
+
+        total_minutes = int((self.check_out_time - self.check_in_time).total_seconds() // 60)
+        return max(total_minutes - self.get_break_minutes(), 0)
+
     def has_incomplete_breaks(self) -> bool:
         """Verifica si hay descansos sin finalizar"""
         return any(
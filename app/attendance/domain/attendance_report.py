@@ -0,0 +1,24 @@
+"""Valores agregados para reportes de asistencia"""
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class AttendanceAggregate:
+    """
+    Totales de asistencia de un grupo (usuario o rol) en un rango de fechas.
+    Se calcula en la base de datos, no fila por fila.
+    """
+    group_key: str                      # user_id o rol, según la agrupación
+    group_label: Optional[str] = None   # Nombre completo o rol
+    users_count: int = 0
+    days_worked: int = 0
+    worked_minutes: int = 0             # Descontando descansos
+    break_minutes: int = 0
+    late_minutes: int = 0
+    late_count: int = 0
+    holiday_shifts: int = 0
+
+    @property
+    def worked_hours(self) -> float:
+        """Horas trabajadas (sin descansos)"""
+        return round(self.worked_minutes / 60, 2)
@@ -1,7 +1,7 @@
 """Inputs GraphQL para asistencia"""
 import strawberry
-from typing import Optional
-from datetime import datetime
+from typing import Optional, List
+from datetime import datetime, date
 
 @strawberry.input
 class CheckInInput:
@@ -37,3 +37,15 @@ class RegularizeAttendanceInput:
     notes: str
     adjusted_check_in: Optional[datetime] = None
     adjusted_check_out: Optional[datetime] = None
+
+@strawberry.input
+class BulkRegularizeAttendanceInput:
+    attendance_ids: List[str]
+    notes: str
+
+@strawberry.input
+class AttendanceReportInput:
+    start_date: date
+    end_date: date
+    group_by: str = "user"  # "user" | "team"
+    user_ids: Optional[List[str]] = None
@@ -8,14 +8,16 @@ from app.attendance.infrastructure.graphql.attendance_inputs import (
     CheckOutInput,
     StartBreakInput,
     EndBreakInput,
-    RegularizeAttendanceInput
+    RegularizeAttendanceInput,
+    BulkRegularizeAttendanceInput
 )
 from app.attendance.infrastructure.graphql.attendance_types import (
     CheckInResponse,
     CheckOutResponse,
     RegularizeAttendanceResponse,
     StartBreakResponse,
-    EndBreakResponse
+    EndBreakResponse,
+    BulkRegularizeAttendanceResponse
 )
 from app.attendance.application.use_cases.check_in import (
     CheckInUseCase,
@@ -37,19 +39,19 @@ from app.attendance.application.use_cases.regularize_attendance import (
     RegularizeAttendanceUseCase,
     RegularizeAttendanceCommand
 )
+from app.attendance.application.use_cases.bulk_regularize_attendances import (
+    BulkRegularizeAttendancesUseCase,
+    BulkRegularizeAttendancesCommand
+)
 from app.building_blocks.exceptions import DomainException, AuthenticationException
 from app.shared.config.settings import settings
+from app.shared.security.permissions import Permission, requires
 
-# DEBUG: Verifica qué valores tiene settings
-print(f"[DEBUG] Settings loaded:")
-print(f"[DEBUG] WORKPLACE_LATITUDE = {settings.WORKPLACE_LATITUDE}")
-print(f"[DEBUG] WORKPLACE_LONGITUDE = {settings.WORKPLACE_LONGITUDE}")
-print(f"[DEBUG] WORKPLACE_RADIUS_METERS = {settings.WORKPLACE_RADIUS_METERS}")
 
 @strawberry.type
 class AttendanceMutations:
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def check_in(
         self,
         info: Info,
@@ -60,10 +62,6 @@ class AttendanceMutations:
         Requiere autenticación.
         """
         try:
-            # Verificar autenticación
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
 
             # Crear comando
@@ -81,7 +79,9 @@ class AttendanceMutations:
             use_case = CheckInUseCase(
                 attendance_repository=info.context["attendance_repository"],
                 holiday_service=info.context["holiday_service"],
-                work_schedule_repository=info.context["work_schedule_repository"]
+                work_schedule_repository=info.context["work_schedule_repository"],
+                summary_repository=info.context["attendance_summary_repository"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -107,7 +107,7 @@ class AttendanceMutations:
                 is_holiday=False
             )
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def check_out(
         self,
         info: Info,
@@ -118,9 +118,6 @@ class AttendanceMutations:
         Requiere autenticación.
         """
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
 
             command = CheckOutCommand(
@@ -131,7 +128,9 @@ class AttendanceMutations:
             )
 
             use_case = CheckOutUseCase(
-                attendance_repository=info.context["attendance_repository"]
+                attendance_repository=info.context["attendance_repository"],
+                summary_repository=info.context["attendance_summary_repository"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -155,7 +154,7 @@ class AttendanceMutations:
                 no_breaks_registered=False
             )
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def start_break(
         self,
         info: Info,
@@ -166,9 +165,6 @@ class AttendanceMutations:
         Requiere autenticación.
         """
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
 
             command = StartBreakCommand(
@@ -179,7 +175,9 @@ class AttendanceMutations:
             )
 
             use_case = StartBreakUseCase(
-                attendance_repository=info.context["attendance_repository"]
+                attendance_repository=info.context["attendance_repository"],
+                break_period_repository=info.context["break_period_repository"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -201,7 +199,7 @@ class AttendanceMutations:
                 allowed_duration_minutes=30
             )
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def end_break(
         self,
         info: Info,
@@ -212,9 +210,6 @@ class AttendanceMutations:
         Requiere autenticación.
         """
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
 
             command = EndBreakCommand(
@@ -225,7 +220,10 @@ class AttendanceMutations:
             )
 
             use_case = EndBreakUseCase(
-                attendance_repository=info.context["attendance_repository"]
+                attendance_repository=info.context["attendance_repository"],
+                break_period_repository=info.context["break_period_repository"],
+                summary_repository=info.context["attendance_summary_repository"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -247,7 +245,7 @@ class AttendanceMutations:
                 is_exceeded=False
             )
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.ATTENDANCE_REGULARIZE))
     async def regularize_attendance(
         self,
         info: Info,
@@ -258,16 +256,8 @@ class AttendanceMutations:
         Requiere autenticación y rol admin.
         """
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
 
-            # Verificar que sea admin
-            from app.users.domain.user_role import UserRole
-            if user.role != UserRole.ADMIN:
-                raise AuthenticationException("Solo administradores pueden regularizar asistencias")
-
             command = RegularizeAttendanceCommand(
                 attendance_id=input.attendance_id,
                 admin_id=user.id,
@@ -276,7 +266,9 @@ class AttendanceMutations:
             )
 
             use_case = RegularizeAttendanceUseCase(
-                attendance_repository=info.context["attendance_repository"]
+                attendance_repository=info.context["attendance_repository"],
+                summary_repository=info.context["attendance_summary_repository"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -290,4 +282,44 @@ class AttendanceMutations:
             return RegularizeAttendanceResponse(
                 success=False,
                 message=str(e)
-            )
\ No newline at end of file
+            )
+
+    @strawberry.mutation(metadata=requires(Permission.ATTENDANCE_REGULARIZE))
+    async def regularize_attendances(
+        self,
+        info: Info,
+        input: BulkRegularizeAttendanceInput
+    ) -> BulkRegularizeAttendanceResponse:
+        """
+        Regulariza varias asistencias a la vez (solo admin).
+        Requiere autenticación y rol admin.
+        """
+        try:
+            user = info.context["current_user"]
+
+            command = BulkRegularizeAttendancesCommand(
+                attendance_ids=input.attendance_ids,
+                admin_id=user.id,
+                notes=input.notes
+            )
+
+            use_case = BulkRegularizeAttendancesUseCase(
+                attendance_repository=info.context["attendance_repository"],
+                summary_repository=info.context["attendance_summary_repository"],
+                unit_of_work=info.context["unit_of_work"]
+            )
+
+            result = await use_case.execute(command)
+
+            return BulkRegularizeAttendanceResponse(
+                success=True,
+                message=result["message"],
+                regularized_count=result["regularized_count"],
+                not_found_ids=result["not_found_ids"]
+            )
+
+        except (DomainException, AuthenticationException) as e:
+            return BulkRegularizeAttendanceResponse(
+                success=False,
+                message=str(e)
+            )
@@ -0,0 +1,157 @@
+"""Queries GraphQL para asistencia"""
+from datetime import date
+from typing import Optional
+from strawberry.types import Info
+import strawberry
+
+from app.attendance.infrastructure.graphql.attendance_inputs import AttendanceReportInput
+from app.attendance.infrastructure.graphql.attendance_types import (
+    AttendanceReportResponse,
+    AttendanceReportRow,
+    AttendanceHistoryResponse,
+    AttendanceInfo,
+    BreakPeriodInfo
+)
+from app.attendance.application.use_cases.get_attendance_report import (
+    GetAttendanceReportUseCase,
+    GetAttendanceReportCommand,
+    GROUP_BY_USER
+)
+from app.attendance.application.use_cases.get_attendance_history import (
+    GetAttendanceHistoryUseCase,
+    GetAttendanceHistoryCommand
+)
+from app.attendance.domain.attendance import Attendance
+from app.building_blocks.exceptions import DomainException, AuthenticationException
+from app.shared.graphql.cost import cost, days_between, per_page
+from app.shared.security.permissions import Permission, has_permission, requires
+
+
+def _to_attendance_info(attendance: Attendance) -> AttendanceInfo:
+    """Convierte la entidad a tipo GraphQL"""
+    work_hours = attendance.get_total_work_hours() if attendance.check_out_time else None
+    return AttendanceInfo(
+        id=attendance.id,
+        user_id=attendance.user_id,
+        date=attendance.date,
+        check_in_time=attendance.check_in_time,
+        check_out_time=attendance.check_out_time,
+        status=attendance.status.value,
+        type=attendance.type.value,
+        is_late=attendance.is_late,
+        late_minutes=attendance.late_minutes,
+        total_work_hours=round(work_hours, 2) if work_hours is not None else None,
+        break_periods=[
+            BreakPeriodInfo(
+                id=bp.id,
+                start_time=bp.start_time,
+                end_time=bp.end_time,
+                duration_minutes=bp.get_duration_minutes(),
+                status=bp.status.value,
+                is_exceeded=bool(bp.is_exceeded())
+            )
+            for bp in attendance.break_periods
+        ],
+        requires_regularization=attendance.requires_regularization
+    )
+
+
+@strawberry.type
+class AttendanceQueries:
+
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=days_between(unit_days=7))))
+    async def attendance_report(
+        self,
+        info: Info,
+        input: AttendanceReportInput
+    ) -> AttendanceReportResponse:
+        """
+        Totales de asistencia de un periodo (horas, tardanzas, feriados).
+        Los administradores ven a todos; el resto solo su propio reporte.
+        """
+        try:
+            user = info.context["current_user"]
+
+            group_by = input.group_by
+            user_ids = input.user_ids
+            if not has_permission(user, Permission.ATTENDANCE_VIEW_TEAM):
+                if group_by != GROUP_BY_USER:
+                    raise AuthenticationException("Solo administradores pueden ver reportes por equipo")
+                user_ids = [user.id]
+
+            command = GetAttendanceReportCommand(
+                start_date=input.start_date,
+                end_date=input.end_date,
+                group_by=group_by,
+                user_ids=user_ids
+            )
+
+            use_case = GetAttendanceReportUseCase(
+                attendance_report_repository=info.context["attendance_report_repository"]
+            )
+
+            result = await use_case.execute(command)
+
+            return AttendanceReportResponse(
+                success=True,
+                message="Reporte generado",
+                start_date=date.fromisoformat(result["start_date"]),
+                end_date=date.fromisoformat(result["end_date"]),
+                group_by=result["group_by"],
+                rows=[AttendanceReportRow(**row) for row in result["rows"]],
+                total_worked_hours=result["total_worked_hours"],
+                total_late_minutes=result["total_late_minutes"]
+            )
+
+        except (DomainException, AuthenticationException) as e:
+            return AttendanceReportResponse(
+                success=False,
+                message=str(e)
+            )
+
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=per_page("first"))))
+    async def attendance_history(
+        self,
+        info: Info,
+        first: int = 30,
+        after: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> AttendanceHistoryResponse:
+        """
+        Historial de asistencias paginado por cursor.
+        Los administradores pueden consultar a otro usuario con user_id.
+        """
+        try:
+            user = info.context["current_user"]
+
+            target_user_id = user.id
+            if user_id and user_id != user.id:
+                if not has_permission(user, Permission.ATTENDANCE_VIEW_TEAM):
+                    raise AuthenticationException("Solo administradores pueden ver el historial de otros usuarios")
+                target_user_id = user_id
+
+            command = GetAttendanceHistoryCommand(
+                user_id=target_user_id,
+                first=first,
+                after=after
+            )
+
+            use_case = GetAttendanceHistoryUseCase(
+                attendance_repository=info.context["attendance_repository"]
+            )
+
+            result = await use_case.execute(command)
+
+            return AttendanceHistoryResponse(
+                success=True,
+                message="Historial obtenido",
+                items=[_to_attendance_info(a) for a in result["items"]],
+                has_more=result["has_more"],
+                next_cursor=result["next_cursor"]
+            )
+
+        except (DomainException, AuthenticationException) as e:
+            return AttendanceHistoryResponse(
+                success=False,
+                message=str(e)
+            )
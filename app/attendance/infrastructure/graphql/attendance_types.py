@@ -1,7 +1,7 @@
 """Tipos GraphQL para asistencia"""
 import strawberry
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, date
 
 @strawberry.type
 class GeolocationInfo:
@@ -71,4 +71,42 @@ class EndBreakResponse:
 @strawberry.type
 class RegularizeAttendanceResponse:
     success: bool
-    message: str
\ No newline at end of file
+    message: str
+
+@strawberry.type
+class BulkRegularizeAttendanceResponse:
+    success: bool
+    message: str
+    regularized_count: int = 0
+    not_found_ids: List[str] = strawberry.field(default_factory=list)
+
+@strawberry.type
+class AttendanceReportRow:
+    group_key: str
+    group_label: Optional[str]
+    users_count: int
+    days_worked: int
+    worked_hours: float
+    break_minutes: int
+    late_minutes: int
+    late_count: int
+    holiday_shifts: int
+
+@strawberry.type
+class AttendanceReportResponse:
+    success: bool
+    message: str
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    group_by: Optional[str] = None
+    rows: List[AttendanceReportRow] = strawberry.field(default_factory=list)
+    total_worked_hours: float = 0.0
+    total_late_minutes: int = 0
+
+@strawberry.type
+class AttendanceHistoryResponse:
+    success: bool
+    message: str
+    items: List[AttendanceInfo] = strawberry.field(default_factory=list)
+    has_more: bool = False
+    next_cursor: Optional[str] = None
@@ -12,13 +12,13 @@ from app.attendance.application.use_cases.assign_work_schedule import (
     AssignWorkScheduleCommand
 )
 from app.building_blocks.exceptions import DomainException, AuthenticationException
-from app.users.domain.user_role import UserRole
+from app.shared.security.permissions import Permission, requires
 
 
 @strawberry.type
 class WorkScheduleMutations:
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.SCHEDULE_ASSIGN))
     async def assign_work_schedule(
         self,
         info: Info,
@@ -29,18 +29,8 @@ class WorkScheduleMutations:
         Solo admin puede ejecutar esto.
         """
         try:
-            # Verificar autenticación
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             admin = info.context["current_user"]
 
-            # Verificar que sea admin
-            if admin.role != UserRole.ADMIN:
-                raise AuthenticationException(
-                    "Solo administradores pueden asignar horarios"
-                )
-
             # Crear comando
             command = AssignWorkScheduleCommand(
                 user_id=input.user_id,
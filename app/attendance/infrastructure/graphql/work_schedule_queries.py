@@ -8,13 +8,13 @@ from app.attendance.application.use_cases.get_my_schedule import (
     GetMyScheduleUseCase,
     GetMyScheduleCommand
 )
-from app.building_blocks.exceptions import AuthenticationException
+from app.shared.security.permissions import Permission, requires
 
 
 @strawberry.type
 class WorkScheduleQueries:
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED))
     async def my_schedule(
         self,
         info: Info
@@ -24,10 +24,6 @@ class WorkScheduleQueries:
         Requiere autenticación.
         Historia de usuario 2: Revisar horario asignado.
         """
-        # Verificar autenticación
-        if not info.context.get("current_user"):
-            raise AuthenticationException("Debes estar autenticado")
-
         user = info.context["current_user"]
 
         # Crear comando
@@ -0,0 +1,111 @@
+"""Consultas agregadas de asistencia con PostgreSQL"""
+from typing import Optional, List
+from datetime import date
+import uuid
+
+from sqlalchemy import func, distinct
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.attendance.domain.attendance_report import AttendanceAggregate
+from app.attendance.application.ports.attendance_report_repository import AttendanceReportRepository
+from app.attendance.infrastructure.persistence.attendance_summary_repository_impl import AttendanceDailySummaryModel
+from app.users.infrastructure.persistence.user_repository_impl import UserModel
+
+
+class PostgreSQLAttendanceReportRepository(AttendanceReportRepository):
+    """
+    Implementación PostgreSQL de los reportes de asistencia.
+    Lee del resumen diario (attendance_daily_summary) y agrega con GROUP BY
+    en la BD (una consulta por reporte).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def aggregate_by_user(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[str]] = None
+    ) -> List[AttendanceAggregate]:
+        """Totales por usuario en el rango [start_date, end_date]"""
+        per_day = self._per_day(start_date, end_date, user_ids)
+
+        stmt = (
+            select(
+                per_day.c.user_id.label("group_key"),
+                UserModel.full_name.label("group_label"),
+                func.count(distinct(per_day.c.user_id)).label("users_count"),
+                *self._totals(per_day)
+            )
+            .join(UserModel, UserModel.id == per_day.c.user_id)
+            .group_by(per_day.c.user_id, UserModel.full_name)
+            .order_by(UserModel.full_name)
+        )
+
+        result = await self.session.execute(stmt)
+        return [self._to_aggregate(row) for row in result.all()]
+
+    async def aggregate_by_role(self, start_date: date, end_date: date) -> List[AttendanceAggregate]:
+        """Totales por rol (equipo) en el rango [start_date, end_date]"""
+        per_day = self._per_day(start_date, end_date)
+
+        stmt = (
+            select(
+                UserModel.role.label("group_key"),
+                UserModel.role.label("group_label"),
+                func.count(distinct(per_day.c.user_id)).label("users_count"),
+                *self._totals(per_day)
+            )
+            .join(UserModel, UserModel.id == per_day.c.user_id)
+            .group_by(UserModel.role)
+            .order_by(UserModel.role)
+        )
+
+        result = await self.session.execute(stmt)
+        return [self._to_aggregate(row) for row in result.all()]
+
+    @staticmethod
+    def _per_day(start_date: date, end_date: date, user_ids: Optional[List[str]] = None):
+        """Filas del resumen diario en el rango (una por usuario y día)"""
+        stmt = select(
+            AttendanceDailySummaryModel.user_id,
+            AttendanceDailySummaryModel.worked_minutes,
+            AttendanceDailySummaryModel.break_minutes,
+            AttendanceDailySummaryModel.late_minutes,
+            AttendanceDailySummaryModel.is_late,
+            AttendanceDailySummaryModel.is_holiday
+        ).where(AttendanceDailySummaryModel.date.between(start_date, end_date))
+
+        if user_ids:
+            stmt = stmt.where(AttendanceDailySummaryModel.user_id.in_([uuid.UUID(u) for u in user_ids]))
+
+        return stmt.subquery()
+
+    @staticmethod
+    def _totals(per_day) -> list:
+        """Columnas agregadas comunes a todos los reportes"""
+        return [
+            func.count().label("days_worked"),
+            func.coalesce(func.sum(per_day.c.worked_minutes), 0).label("worked_minutes"),
+            func.coalesce(func.sum(per_day.c.break_minutes), 0).label("break_minutes"),
+            func.coalesce(func.sum(per_day.c.late_minutes), 0).label("late_minutes"),
+            func.count().filter(per_day.c.is_late.is_(True)).label("late_count"),
+            func.count().filter(per_day.c.is_holiday.is_(True)).label("holiday_shifts"),
+        ]
+
+    @staticmethod
+    def _to_aggregate(row) -> AttendanceAggregate:
+        """Convierte una fila agregada a valor de dominio"""
+        return AttendanceAggregate(
+            group_key=str(row.group_key),
+            group_label=row.group_label,
+            users_count=row.users_count,
+            days_worked=row.days_worked,
+            worked_minutes=int(row.worked_minutes),
+            break_minutes=int(row.break_minutes),
+            late_minutes=int(row.late_minutes),
+            late_count=row.late_count,
+            holiday_shifts=row.holiday_shifts
+        )
@@ -1,21 +1,20 @@
 """Implementación del repositorio de asistencia con PostgreSQL"""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import date, datetime
 import uuid
 
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Float, JSON, Date, Time
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Float, JSON, Date, Time, tuple_, update, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 
-from app.attendance.domain.attendance import Attendance
+from app.attendance.domain.attendance import Attendance, PERU_TZ
 from app.attendance.domain.attendance_status import AttendanceStatus, AttendanceType
 from app.attendance.domain.geolocation import Geolocation
-from app.attendance.domain.break_period import BreakPeriod, BreakStatus
+from app.attendance.domain.break_period import BreakPeriod
 from app.attendance.application.ports.attendance_repository import AttendanceRepository
-
-Base = declarative_base()
+from app.attendance.infrastructure.persistence.break_period_repository_impl import PostgreSQLBreakPeriodRepository
+from app.shared.database.base import Base
 
 
 class AttendanceModel(Base):
@@ -53,8 +52,7 @@ class AttendanceModel(Base):
     regularized_by = Column(UUID(as_uuid=True), nullable=True)
     regularized_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Descansos (JSON array)
-    break_periods = Column(JSON, nullable=False, default=list)
+    # Los descansos viven en la tabla break_periods
 
     # Metadatos
     created_at = Column(DateTime(timezone=True), nullable=False)
@@ -66,9 +64,10 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.break_repository = PostgreSQLBreakPeriodRepository(session)
 
     async def save(self, attendance: Attendance) -> Attendance:
-        """Guarda o actualiza una asistencia"""
+        """Guarda o actualiza una asistencia (flush sin commit: lo hace el caso de uso)"""
         stmt = select(AttendanceModel).where(AttendanceModel.id == attendance.id)
         result = await self.session.execute(stmt)
         db_attendance = result.scalar_one_or_none()
@@ -84,10 +83,11 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
             )
             self.session.add(db_attendance)
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(db_attendance)
 
-        return self._to_domain(db_attendance)
+        # Los descansos se persisten aparte (BreakPeriodRepository)
+        return self._to_domain(db_attendance, attendance.break_periods)
 
     async def find_by_id(self, attendance_id: str) -> Optional[Attendance]:
         """Busca una asistencia por ID"""
@@ -95,7 +95,7 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
         result = await self.session.execute(stmt)
         db_attendance = result.scalar_one_or_none()
 
-        return self._to_domain(db_attendance) if db_attendance else None
+        return await self._with_breaks(db_attendance) if db_attendance else None
 
     async def find_by_user_and_date(self, user_id: str, check_date: date) -> Optional[Attendance]:
         """Busca la asistencia de un usuario para una fecha específica"""
@@ -106,7 +106,7 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
         result = await self.session.execute(stmt)
         db_attendance = result.scalar_one_or_none()
 
-        return self._to_domain(db_attendance) if db_attendance else None
+        return await self._with_breaks(db_attendance) if db_attendance else None
 
     async def find_by_user(self, user_id: str, limit: int = 30) -> List[Attendance]:
         """Obtiene las últimas asistencias de un usuario"""
@@ -117,7 +117,36 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
         result = await self.session.execute(stmt)
         db_attendances = result.scalars().all()
 
-        return [self._to_domain(a) for a in db_attendances]
+        # Una sola consulta para los descansos de todas las asistencias
+        breaks = await self.break_repository.find_by_attendances(
+            [str(a.id) for a in db_attendances]
+        )
+        return [self._to_domain(a, breaks.get(str(a.id), [])) for a in db_attendances]
+
+    async def find_history(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[Tuple[date, str]] = None
+    ) -> List[Attendance]:
+        """Historial paginado por keyset: usa el índice (user_id, date DESC, id DESC), sin OFFSET"""
+        stmt = select(AttendanceModel).where(AttendanceModel.user_id == uuid.UUID(user_id))
+
+        if after:
+            after_date, after_id = after
+            stmt = stmt.where(
+                tuple_(AttendanceModel.date, AttendanceModel.id) < tuple_(after_date, uuid.UUID(after_id))
+            )
+
+        stmt = stmt.order_by(AttendanceModel.date.desc(), AttendanceModel.id.desc()).limit(limit)
+
+        result = await self.session.execute(stmt)
+        db_attendances = result.scalars().all()
+
+        breaks = await self.break_repository.find_by_attendances(
+            [str(a.id) for a in db_attendances]
+        )
+        return [self._to_domain(a, breaks.get(str(a.id), [])) for a in db_attendances]
 
     async def has_pending_regularization(self, user_id: str) -> bool:
         """Verifica si el usuario tiene asistencias pendientes de regularizar"""
@@ -129,6 +158,74 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def mark_open_for_regularization(self, now: datetime, reason: str) -> List[Tuple[str, date]]:
+        """Un solo UPDATE set-based sobre las jornadas abiertas cuyo horario ya terminó (sin commit)"""
+        today_peru = now.astimezone(PERU_TZ).date()
+
+        # Fin de turno en hora de Perú: (date + scheduled_end_time) AT TIME ZONE 'America/Lima'
+        scheduled_end = func.timezone(
+            str(PERU_TZ),
+            AttendanceModel.date + AttendanceModel.scheduled_end_time
+        )
+
+        stmt = (
+            update(AttendanceModel)
+            .where(
+                AttendanceModel.status.in_([
+                    AttendanceStatus.IN_PROGRESS.value,
+                    AttendanceStatus.ON_BREAK.value
+                ]),
+                AttendanceModel.check_out_time.is_(None),
+                or_(
+                    AttendanceModel.date < today_peru,
+                    AttendanceModel.scheduled_end_time.isnot(None) & (scheduled_end < now)
+                )
+            )
+            .values(
+                requires_regularization=True,
+                status=AttendanceStatus.PENDING_REGULARIZATION.value,
+                regularization_notes=reason,
+                updated_at=now
+            )
+            .returning(AttendanceModel.user_id, AttendanceModel.date)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        return [(str(row.user_id), row.date) for row in rows]
+
+    async def regularize_many(
+        self,
+        attendance_ids: List[str],
+        admin_id: str,
+        notes: str,
+        now: datetime
+    ) -> List[Tuple[str, str, date]]:
+        """Regulariza en bloque las asistencias indicadas con un solo UPDATE (sin commit)"""
+        if not attendance_ids:
+            return []
+
+        stmt = (
+            update(AttendanceModel)
+            .where(AttendanceModel.id.in_([uuid.UUID(a) for a in attendance_ids]))
+            .values(
+                requires_regularization=False,
+                regularization_notes=notes,
+                regularized_by=uuid.UUID(admin_id),
+                regularized_at=now,
+                updated_at=now
+            )
+            .returning(AttendanceModel.id, AttendanceModel.user_id, AttendanceModel.date)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        return [(str(row.id), str(row.user_id), row.date) for row in rows]
+
     def _to_dict(self, attendance: Attendance) -> dict:
         """Convierte entidad de dominio a diccionario para BD"""
         return {
@@ -151,7 +248,6 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
             "regularization_notes": attendance.regularization_notes,
             "regularized_by": uuid.UUID(attendance.regularized_by) if attendance.regularized_by else None,
             "regularized_at": attendance.regularized_at,
-            "break_periods": self._breaks_to_json(attendance.break_periods),
             "created_at": attendance.created_at,
             "updated_at": attendance.updated_at
         }
@@ -162,7 +258,12 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
         for key, value in data.items():
             setattr(model, key, value)
 
-    def _to_domain(self, model: AttendanceModel) -> Attendance:
+    async def _with_breaks(self, model: AttendanceModel) -> Attendance:
+        """Convierte el modelo cargando sus descansos"""
+        breaks = await self.break_repository.find_by_attendance(str(model.id))
+        return self._to_domain(model, breaks)
+
+    def _to_domain(self, model: AttendanceModel, break_periods: List[BreakPeriod]) -> Attendance:
         """Convierte modelo de BD a entidad de dominio"""
         return Attendance(
             id=str(model.id),
@@ -185,7 +286,7 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
             regularization_notes=model.regularization_notes,
             regularized_by=str(model.regularized_by) if model.regularized_by else None,
             regularized_at=model.regularized_at,
-            break_periods=self._json_to_breaks(model.break_periods),
+            break_periods=list(break_periods),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -211,38 +312,3 @@ class PostgreSQLAttendanceRepository(AttendanceRepository):
             longitude=data["longitude"],
             accuracy=data.get("accuracy", 10.0)
         )
-
-    @staticmethod
-    def _breaks_to_json(breaks: List[BreakPeriod]) -> list:
-        """Convierte lista de BreakPeriod a JSON"""
-        return [
-            {
-                "id": bp.id,
-                "start_time": bp.start_time.isoformat() if bp.start_time else None,
-                "end_time": bp.end_time.isoformat() if bp.end_time else None,
-                "status": bp.status.value,
-                "start_location": PostgreSQLAttendanceRepository._location_to_json(bp.start_location),
-                "end_location": PostgreSQLAttendanceRepository._location_to_json(bp.end_location),
-                "allowed_duration_minutes": bp.allowed_duration_minutes
-            }
-            for bp in breaks
-        ]
-
-    @staticmethod
-    def _json_to_breaks(data: list) -> List[BreakPeriod]:
-        """Convierte JSON a lista de BreakPeriod"""
-        if not data:
-            return []
-
-        return [
-            BreakPeriod(
-                id=bp["id"],
-                start_time=datetime.fromisoformat(bp["start_time"]) if bp["start_time"] else None,
-                end_time=datetime.fromisoformat(bp["end_time"]) if bp["end_time"] else None,
-                status=BreakStatus(bp["status"]),
-                start_location=PostgreSQLAttendanceRepository._json_to_location(bp.get("start_location")),
-                end_location=PostgreSQLAttendanceRepository._json_to_location(bp.get("end_location")),
-                allowed_duration_minutes=bp.get("allowed_duration_minutes", 30)
-            )
-            for bp in data
-        ]
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Resumen diario de asistencia (tabla attendance_daily_summary) con PostgreSQL"""
+from typing import Optional, List
+from datetime import date, datetime, timezone
+import uuid
+
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Date, func, case, extract, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import UUID, insert
+
+from app.attendance.domain.attendance import Attendance
+from app.attendance.domain.attendance_status import AttendanceType
+from app.attendance.application.ports.attendance_summary_repository import AttendanceSummaryRepository
+from app.attendance.infrastructure.persistence.attendance_repository_impl import AttendanceModel
+from app.attendance.infrastructure.persistence.break_period_repository_impl import BreakPeriodModel
+from app.shared.database.base import Base
+
+
+class AttendanceDailySummaryModel(Base):
+    """Modelo SQLAlchemy del resumen diario (una fila por usuario y día)"""
+    __tablename__ = "attendance_daily_summary"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    date = Column(Date, primary_key=True)
+    attendance_id = Column(UUID(as_uuid=True), nullable=False)
+
+    worked_minutes = Column(Integer, nullable=False, default=0)
+    break_minutes = Column(Integer, nullable=False, default=0)
+    late_minutes = Column(Integer, nullable=False, default=0)
+    is_late = Column(Boolean, nullable=False, default=False)
+    is_holiday = Column(Boolean, nullable=False, default=False)
+    status = Column(String(50), nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class PostgreSQLAttendanceSummaryRepository(AttendanceSummaryRepository):
+    """Implementación PostgreSQL del resumen diario de asistencia"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def upsert_from_attendance(self, attendance: Attendance) -> None:
+        """Actualiza una sola fila del resumen (INSERT ... ON CONFLICT), sin commit"""
+        values = self._to_dict(attendance)
+        stmt = insert(AttendanceDailySummaryModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttendanceDailySummaryModel.user_id, AttendanceDailySummaryModel.date],
+            set_={k: v for k, v in values.items() if k not in ("user_id", "date")}
+        )
+
+        await self.session.execute(stmt)
+
+    async def rebuild(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[str]] = None
+    ) -> int:
+        """Recalcula el resumen de un rango con un único INSERT ... SELECT, sin commit"""
+        source = self._from_attendances(start_date, end_date, user_ids)
+
+        stmt = insert(AttendanceDailySummaryModel).from_select(
+            [
+                "user_id", "date", "attendance_id", "worked_minutes", "break_minutes",
+                "late_minutes", "is_late", "is_holiday", "status", "updated_at"
+            ],
+            source
+        )
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttendanceDailySummaryModel.user_id, AttendanceDailySummaryModel.date],
+            set_={
+                "attendance_id": excluded.attendance_id,
+                "worked_minutes": excluded.worked_minutes,
+                "break_minutes": excluded.break_minutes,
+                "late_minutes": excluded.late_minutes,
+                "is_late": excluded.is_late,
+                "is_holiday": excluded.is_holiday,
+                "status": excluded.status,
+                "updated_at": excluded.updated_at
+            }
+        )
+
+        result = await self.session.execute(stmt)
+
+        return result.rowcount
+
+    @staticmethod
+    def _from_attendances(start_date: date, end_date: date, user_ids: Optional[List[str]] = None):
+        """SELECT con una fila de resumen por asistencia del rango"""
+        in_range = AttendanceModel.date.between(start_date, end_date)
+
+        breaks = (
+            select(
+                BreakPeriodModel.attendance_id,
+                func.sum(
+                    func.floor(extract("epoch", BreakPeriodModel.end_time - BreakPeriodModel.start_time) / 60)
+                ).label("break_minutes")
+            )
+            .join(AttendanceModel, AttendanceModel.id == BreakPeriodModel.attendance_id)
+            .where(in_range, BreakPeriodModel.end_time.isnot(None))
+            .group_by(BreakPeriodModel.attendance_id)
+            .subquery()
+        )
+
+        break_minutes = func.coalesce(breaks.c.break_minutes, 0)
+        worked_minutes = case(
+            (
+                AttendanceModel.check_out_time.isnot(None) & AttendanceModel.check_in_time.isnot(None),
+                func.greatest(
+                    func.floor(extract("epoch", AttendanceModel.check_out_time - AttendanceModel.check_in_time) / 60)
+                    - break_minutes,
+                    0
+                )
+            ),
+            else_=0
+        )
+
+        stmt = (
+            select(
+                AttendanceModel.user_id,
+                AttendanceModel.date,
+                AttendanceModel.id,
+                worked_minutes,
+                break_minutes,
+                AttendanceModel.late_minutes,
+                AttendanceModel.is_late,
+                AttendanceModel.type == AttendanceType.HOLIDAY.value,
+                AttendanceModel.status,
+                literal(datetime.now(timezone.utc))
+            )
+            .outerjoin(breaks, breaks.c.attendance_id == AttendanceModel.id)
+            .where(in_range)
+        )
+
+        if user_ids:
+            stmt = stmt.where(AttendanceModel.user_id.in_([uuid.UUID(u) for u in user_ids]))
+
+        return stmt
+
+    @staticmethod
+    def _to_dict(attendance: Attendance) -> dict:
+        """Convierte la asistencia en la fila de resumen"""
+        return {
+            "user_id": uuid.UUID(attendance.user_id),
+            "date": attendance.date.date(),
+            "attendance_id": uuid.UUID(attendance.id),
+            "worked_minutes": attendance.get_worked_minutes(),
+            "break_minutes": attendance.get_break_minutes(),
+            "late_minutes": attendance.late_minutes or 0,
+            "is_late": attendance.is_late,
+            "is_holiday": attendance.type == AttendanceType.HOLIDAY,
+            "status": attendance.status.value,
+            "updated_at": datetime.now(timezone.utc)
+        }
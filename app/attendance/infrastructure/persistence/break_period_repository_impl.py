@@ -0,0 +1,134 @@
+"""Implementación del repositorio de períodos de descanso con PostgreSQL"""
+from typing import Optional, List, Dict
+import uuid
+
+from sqlalchemy import Column, String, DateTime, Integer, JSON, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.attendance.domain.break_period import BreakPeriod, BreakStatus
+from app.attendance.domain.geolocation import Geolocation
+from app.attendance.application.ports.break_period_repository import BreakPeriodRepository
+from app.shared.database.base import Base
+
+
+class BreakPeriodModel(Base):
+    """Modelo SQLAlchemy para períodos de descanso"""
+    __tablename__ = "break_periods"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    attendance_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+
+    start_time = Column(DateTime(timezone=True), nullable=True)
+    end_time = Column(DateTime(timezone=True), nullable=True)
+    status = Column(String(50), nullable=False)
+
+    # Geolocalización (JSON)
+    start_location = Column(JSON, nullable=True)
+    end_location = Column(JSON, nullable=True)
+
+    allowed_duration_minutes = Column(Integer, nullable=False, default=30)
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class PostgreSQLBreakPeriodRepository(BreakPeriodRepository):
+    """Implementación PostgreSQL del repositorio de descansos"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, break_period: BreakPeriod) -> BreakPeriod:
+        """Inserta un nuevo período de descanso (sin commit: lo hace el caso de uso)"""
+        db_break = BreakPeriodModel(
+            id=uuid.uuid4() if not break_period.id else uuid.UUID(break_period.id),
+            **self._to_dict(break_period)
+        )
+        self.session.add(db_break)
+        await self.session.flush()
+
+        break_period.id = str(db_break.id)
+        return break_period
+
+    async def update(self, break_period: BreakPeriod) -> BreakPeriod:
+        """Actualiza un período de descanso existente sin tocar la asistencia (sin commit)"""
+        stmt = (
+            update(BreakPeriodModel)
+            .where(BreakPeriodModel.id == uuid.UUID(break_period.id))
+            .values(**self._to_dict(break_period))
+        )
+        await self.session.execute(stmt)
+
+        return break_period
+
+    async def find_by_attendance(self, attendance_id: str) -> List[BreakPeriod]:
+        """Obtiene los descansos de una asistencia ordenados por inicio"""
+        breaks = await self.find_by_attendances([attendance_id])
+        return breaks.get(attendance_id, [])
+
+    async def find_by_attendances(self, attendance_ids: List[str]) -> Dict[str, List[BreakPeriod]]:
+        """Obtiene los descansos de varias asistencias en una sola consulta"""
+        if not attendance_ids:
+            return {}
+
+        stmt = select(BreakPeriodModel).where(
+            BreakPeriodModel.attendance_id.in_([uuid.UUID(a) for a in attendance_ids])
+        ).order_by(BreakPeriodModel.attendance_id, BreakPeriodModel.start_time)
+
+        result = await self.session.execute(stmt)
+
+        grouped: Dict[str, List[BreakPeriod]] = {}
+        for model in result.scalars().all():
+            grouped.setdefault(str(model.attendance_id), []).append(self._to_domain(model))
+        return grouped
+
+    def _to_dict(self, break_period: BreakPeriod) -> dict:
+        """Convierte entidad de dominio a diccionario para BD"""
+        return {
+            "attendance_id": uuid.UUID(break_period.attendance_id),
+            "start_time": break_period.start_time,
+            "end_time": break_period.end_time,
+            "status": break_period.status.value,
+            "start_location": self._location_to_json(break_period.start_location),
+            "end_location": self._location_to_json(break_period.end_location),
+            "allowed_duration_minutes": break_period.allowed_duration_minutes,
+            "created_at": break_period.created_at
+        }
+
+    @staticmethod
+    def _to_domain(model: BreakPeriodModel) -> BreakPeriod:
+        """Convierte modelo de BD a entidad de dominio"""
+        return BreakPeriod(
+            id=str(model.id),
+            attendance_id=str(model.attendance_id),
+            start_time=model.start_time,
+            end_time=model.end_time,
+            status=BreakStatus(model.status),
+            start_location=PostgreSQLBreakPeriodRepository._json_to_location(model.start_location),
+            end_location=PostgreSQLBreakPeriodRepository._json_to_location(model.end_location),
+            allowed_duration_minutes=model.allowed_duration_minutes,
+            created_at=model.created_at
+        )
+
+    @staticmethod
+    def _location_to_json(location: Optional[Geolocation]) -> Optional[dict]:
+        """Convierte Geolocation a JSON"""
+        if not location:
+            return None
+        return {
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+            "accuracy": location.accuracy
+        }
+
+    @staticmethod
+    def _json_to_location(data: Optional[dict]) -> Optional[Geolocation]:
+        """Convierte JSON a Geolocation"""
+        if not data:
+            return None
+        return Geolocation(
+            latitude=data["latitude"],
+            longitude=data["longitude"],
+            accuracy=data.get("accuracy", 10.0)
+        )
@@ -3,19 +3,22 @@ from typing import Optional, List
 from datetime import date
 import uuid
 
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, JSON, Date, Time
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, JSON, Date, Time, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.attendance.domain.work_schedule import WorkSchedule, ShiftType
 from app.attendance.application.ports.work_schedule_repository import WorkScheduleRepository
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class WorkScheduleModel(Base):
-    """Modelo SQLAlchemy para horarios de trabajo"""
+    """
+    Modelo SQLAlchemy para horarios de trabajo (tabla work_schedules,
+    migración 003). Lo comparten asistencia y solicitudes; los defaults
+    siguen a la migración.
+    """
     __tablename__ = "work_schedules"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -26,14 +29,14 @@ class WorkScheduleModel(Base):
     end_time = Column(Time, nullable=False)
 
     working_days = Column(JSON, nullable=False)
-    late_tolerance_minutes = Column(Integer, nullable=False, default=15)
-    break_duration_minutes = Column(Integer, nullable=False, default=30)
+    late_tolerance_minutes = Column(Integer, nullable=False, default=15, server_default=text("15"))
+    break_duration_minutes = Column(Integer, nullable=False, default=30, server_default=text("30"))
 
-    is_active = Column(Boolean, nullable=False, default=True, index=True)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("true"), index=True)
     effective_from = Column(Date, nullable=False)
     effective_until = Column(Date, nullable=True)
 
-    created_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
     created_by = Column(UUID(as_uuid=True), nullable=True)
     notes = Column(String(500), nullable=True)
 
@@ -10,6 +10,7 @@ from app.building_blocks.exceptions import (
     NotFoundException,
     ConflictException
 )
+from app.building_blocks.unit_of_work import UnitOfWork
 
 __all__ = [
     "DomainException",
@@ -18,4 +19,5 @@ __all__ = [
     "AuthenticationException",
     "NotFoundException",
     "ConflictException",
+    "UnitOfWork",
 ]
\ No newline at end of file
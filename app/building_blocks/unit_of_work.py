@@ -0,0 +1,21 @@
+"""
+Unidad de trabajo (Unit of Work).
+Permite que un caso de uso agrupe varias escrituras en una sola transacción.
+"""
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """
+    Puerto para confirmar o descartar la transacción en curso.
+    Los repositorios que no hacen commit por sí mismos (operaciones en
+    bloque) dejan sus cambios pendientes hasta que el caso de uso llama commit().
+    """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Confirma la transacción en curso"""
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Descarta la transacción en curso"""
@@ -0,0 +1,49 @@
+"""
+Comando CLI (job nocturno) para cerrar jornadas sin salida registrada.
+Uso: python -m app.cli.commands.close_open_attendances
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from app.shared.database.connection import get_db_session
+from app.shared.database.unit_of_work import SQLAlchemyUnitOfWork
+from app.attendance.application.use_cases.auto_close_attendances import (
+    AutoCloseAttendancesUseCase,
+    AutoCloseAttendancesCommand
+)
+from app.attendance.infrastructure.persistence.attendance_repository_impl import PostgreSQLAttendanceRepository
+from app.attendance.infrastructure.persistence.attendance_summary_repository_impl import (
+    PostgreSQLAttendanceSummaryRepository
+)
+
+
+async def close_open_attendances():
+    """Marca para regularización las jornadas abiertas cuyo horario ya terminó"""
+    try:
+        async with get_db_session() as session:
+            use_case = AutoCloseAttendancesUseCase(
+                attendance_repository=PostgreSQLAttendanceRepository(session),
+                summary_repository=PostgreSQLAttendanceSummaryRepository(session),
+                unit_of_work=SQLAlchemyUnitOfWork(session)
+            )
+
+            result = await use_case.execute(AutoCloseAttendancesCommand())
+
+            print(f"✅ {result['message']}")
+            print(f"   Ejecutado: {result['executed_at']}")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(close_open_attendances())
+
+
+# Ejemplo de uso (cron, todos los días a las 23:30 hora de Perú):
+# 30 23 * * * cd /opt/catering && python -m app.cli.commands.close_open_attendances
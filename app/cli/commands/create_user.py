@@ -15,6 +15,7 @@ from app.users.application.use_cases.create_user_account import (
     CreateUserAccountCommand
 )
 from app.shared.database.connection import get_db_session
+from app.shared.database.unit_of_work import SQLAlchemyUnitOfWork
 from app.users.infrastructure.persistence.user_repository_impl import PostgreSQLUserRepository
 from app.users.infrastructure.persistence.activation_token_repository_impl import PostgreSQLActivationTokenRepository
 from app.users.infrastructure.external.email_service import SMTPEmailService
@@ -101,7 +102,8 @@ async def create_user_interactive():
             use_case = CreateUserAccountUseCase(
                 user_repository=user_repo,
                 token_repository=token_repo,
-                email_service=email_service
+                email_service=email_service,
+                unit_of_work=SQLAlchemyUnitOfWork(session)
             )
 
             result = await use_case.execute(command)
@@ -176,7 +178,8 @@ async def create_user_from_args(args):
             use_case = CreateUserAccountUseCase(
                 user_repository=user_repo,
                 token_repository=token_repo,
-                email_service=email_service
+                email_service=email_service,
+                unit_of_work=SQLAlchemyUnitOfWork(session)
             )
 
             result = await use_case.execute(command)
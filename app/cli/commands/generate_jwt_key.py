@@ -0,0 +1,89 @@
+"""
+Comando CLI para generar una clave de firma JWT (rotación de claves).
+Uso: python -m app.cli.commands.generate_jwt_key --kid 2026-02 --dir /etc/catering/jwt-keys
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from app.shared.security.keyring import SUPPORTED_ALGORITHMS
+
+
+def generate_jwt_key(args):
+    """Genera una clave privada nueva y retira (deja solo la pública) las anteriores"""
+    import argparse
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
+
+    parser = argparse.ArgumentParser(
+        description='Generar clave de firma JWT'
+    )
+    parser.add_argument('--dir', required=True, help='Carpeta de claves (JWT_KEYS_DIR)')
+    parser.add_argument('--kid', default=datetime.now().strftime('%Y-%m'),
+                       help='Identificador de la clave (por defecto año-mes)')
+    parser.add_argument('--algorithm', default='EdDSA', choices=SUPPORTED_ALGORITHMS,
+                       help='Algoritmo de firma')
+    parser.add_argument('--retire-others', action='store_true',
+                       help='Quitar la clave privada de las claves anteriores (quedan solo para verificar)')
+
+    parsed_args = parser.parse_args(args)
+
+    try:
+        keys_dir = Path(parsed_args.dir)
+        keys_dir.mkdir(parents=True, exist_ok=True)
+
+        private_path = keys_dir / f"{parsed_args.kid}.{parsed_args.algorithm.lower()}.pem"
+        if private_path.exists():
+            raise ValueError(f"Ya existe una clave con kid '{parsed_args.kid}'")
+
+        if parsed_args.algorithm == "RS256":
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        else:
+            private_key = ed25519.Ed25519PrivateKey.generate()
+
+        private_path.write_bytes(
+            private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            )
+        )
+        private_path.chmod(0o600)
+
+        # Retirar las claves anteriores: se conserva solo la parte pública
+        if parsed_args.retire_others:
+            for old_path in keys_dir.glob("*.pem"):
+                if old_path == private_path or old_path.name.endswith(".pub.pem"):
+                    continue
+                old_key = serialization.load_pem_private_key(old_path.read_bytes(), password=None)
+                public_path = old_path.with_name(old_path.name[:-len(".pem")] + ".pub.pem")
+                public_path.write_bytes(
+                    old_key.public_key().public_bytes(
+                        encoding=serialization.Encoding.PEM,
+                        format=serialization.PublicFormat.SubjectPublicKeyInfo
+                    )
+                )
+                old_path.unlink()
+                print(f"   Retirada: {old_path.name} -> {public_path.name}")
+
+        print(f"✅ Clave generada: {private_path}")
+        print(f"   Configura JWT_ACTIVE_KID={parsed_args.kid} y reinicia la aplicación")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    generate_jwt_key(sys.argv[1:])
+
+
+# Ejemplo de uso (rotación):
+# 1. Generar la nueva clave y retirar las anteriores:
+# python -m app.cli.commands.generate_jwt_key --dir /etc/catering/jwt-keys --kid 2026-03 --retire-others
+# 2. JWT_ACTIVE_KID=2026-03 y reiniciar: los tokens nuevos se firman con la nueva clave
+#    y los emitidos con las anteriores se siguen verificando con su clave pública.
+# 3. Pasados JWT_REFRESH_TOKEN_EXPIRE_DAYS, borrar los .pub.pem retirados.
@@ -0,0 +1,85 @@
+"""
+Comando CLI para el alta masiva de usuarios desde un archivo de RRHH (CSV/XLSX).
+Uso: python -m app.cli.commands.import_users --file empleados.xlsx
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from app.users.application.use_cases.import_user_accounts import (
+    ImportUserAccountsUseCase,
+    ImportUserAccountsCommand
+)
+from app.shared.database.connection import get_db_session
+from app.shared.database.unit_of_work import SQLAlchemyUnitOfWork
+from app.users.infrastructure.persistence.user_repository_impl import PostgreSQLUserRepository
+from app.users.infrastructure.persistence.activation_token_repository_impl import PostgreSQLActivationTokenRepository
+from app.users.infrastructure.persistence.email_outbox_repository_impl import PostgreSQLEmailOutboxRepository
+
+
+async def import_users(args):
+    """Importa usuarios desde un archivo CSV/XLSX"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Alta masiva de usuarios desde un archivo de RRHH'
+    )
+    parser.add_argument('--file', required=True,
+                       help='Archivo .csv o .xlsx (columnas: employee_id, email, full_name, dni, role, phone, address)')
+    parser.add_argument('--activation-url',
+                       default='https://app.catering.com',
+                       help='URL base para activación')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Solo validar el archivo, sin crear cuentas')
+
+    parsed_args = parser.parse_args(args)
+
+    try:
+        path = Path(parsed_args.file)
+
+        async with get_db_session() as session:
+            use_case = ImportUserAccountsUseCase(
+                user_repository=PostgreSQLUserRepository(session),
+                token_repository=PostgreSQLActivationTokenRepository(session),
+                outbox_repository=PostgreSQLEmailOutboxRepository(session),
+                unit_of_work=SQLAlchemyUnitOfWork(session)
+            )
+
+            result = await use_case.execute(
+                ImportUserAccountsCommand(
+                    filename=path.name,
+                    content=path.read_bytes(),
+                    created_by=None,  # CLI command
+                    activation_base_url=parsed_args.activation_url,
+                    dry_run=parsed_args.dry_run
+                )
+            )
+
+        if result["errors"]:
+            print(f"❌ {result['message']}")
+            for error in result["errors"]:
+                print(f"   Fila {error['row']}: {error['message']}")
+            sys.exit(1)
+
+        print(f"✅ {result['message']}")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(import_users(sys.argv[1:]))
+
+
+# Ejemplo de uso:
+# Validar el archivo sin crear nada:
+# python -m app.cli.commands.import_users --file empleados_temporada.xlsx --dry-run
+
+# Importar:
+# python -m app.cli.commands.import_users \
+#   --file empleados_temporada.csv \
+#   --activation-url https://app.catering.com
@@ -0,0 +1,64 @@
+"""
+Comando CLI para recalcular el resumen diario de asistencia.
+Uso: python -m app.cli.commands.rebuild_attendance_summary --from 2025-01-01 --to 2025-01-31
+"""
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from app.shared.database.connection import get_db_session
+from app.attendance.infrastructure.persistence.attendance_summary_repository_impl import (
+    PostgreSQLAttendanceSummaryRepository
+)
+
+
+async def rebuild_from_args(args):
+    """Recalcula attendance_daily_summary para el rango indicado"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Recalcular el resumen diario de asistencia'
+    )
+    parser.add_argument('--from', dest='start_date', required=True,
+                       type=date.fromisoformat, help='Fecha inicial (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='end_date', required=True,
+                       type=date.fromisoformat, help='Fecha final (YYYY-MM-DD)')
+    parser.add_argument('--user-id', dest='user_ids', action='append',
+                       help='Limitar a un usuario (se puede repetir)')
+
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.start_date > parsed_args.end_date:
+        print("❌ Error: --from debe ser anterior o igual a --to")
+        sys.exit(1)
+
+    try:
+        async with get_db_session() as session:
+            summary_repo = PostgreSQLAttendanceSummaryRepository(session)
+
+            rows = await summary_repo.rebuild(
+                parsed_args.start_date,
+                parsed_args.end_date,
+                parsed_args.user_ids
+            )
+
+            print(f"✅ Resumen recalculado: {rows} filas")
+            print(f"   Rango: {parsed_args.start_date} → {parsed_args.end_date}")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_from_args(sys.argv[1:]))
+
+
+# Ejemplo de uso:
+# python -m app.cli.commands.rebuild_attendance_summary --from 2025-01-01 --to 2025-12-31
+# python -m app.cli.commands.rebuild_attendance_summary --from 2025-03-01 --to 2025-03-31 \
+#   --user-id 3f1c...
@@ -0,0 +1,75 @@
+"""
+Comando CLI para ejecutar el worker de emails como proceso independiente.
+Uso: python -m app.cli.commands.run_email_worker [--once]
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from app.shared.database.connection import get_db_session
+from app.shared.config.settings import settings
+from app.users.infrastructure.external.email_service import SMTPEmailService
+from app.users.infrastructure.external.email_delivery_worker import EmailDeliveryWorker
+from app.users.infrastructure.external.smtp_connection import PooledSMTPConnection
+
+
+async def run_worker(args):
+    """Entrega la bandeja de salida hasta que se detenga el proceso"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Worker de envío de emails (bandeja de salida)'
+    )
+    parser.add_argument('--once', action='store_true',
+                       help='Procesar un solo lote y terminar')
+
+    parsed_args = parser.parse_args(args)
+
+    worker = EmailDeliveryWorker(
+        session_factory=get_db_session,
+        email_service=SMTPEmailService(
+            smtp_host=settings.SMTP_HOST,
+            smtp_port=settings.SMTP_PORT,
+            smtp_username=settings.SMTP_USERNAME,
+            smtp_password=settings.SMTP_PASSWORD,
+            from_email=settings.SMTP_FROM_EMAIL,
+            from_name=settings.SMTP_FROM_NAME
+        ),
+        connection=PooledSMTPConnection(
+            smtp_host=settings.SMTP_HOST,
+            smtp_port=settings.SMTP_PORT,
+            smtp_username=settings.SMTP_USERNAME,
+            smtp_password=settings.SMTP_PASSWORD,
+            start_tls=settings.SMTP_START_TLS
+        ),
+        batch_size=settings.EMAIL_WORKER_BATCH_SIZE,
+        poll_seconds=settings.EMAIL_WORKER_POLL_SECONDS,
+        max_attempts=settings.EMAIL_WORKER_MAX_ATTEMPTS
+    )
+
+    try:
+        if parsed_args.once:
+            processed = await worker.run_once()
+            print(f"✅ Lote procesado: {processed} emails")
+            print(f"   Cola: {worker.metrics.queue_depth}")
+        else:
+            print("📧 Worker de emails iniciado (Ctrl+C para detener)")
+            await worker.run_forever()
+    finally:
+        await worker.connection.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(run_worker(sys.argv[1:]))
+    except KeyboardInterrupt:
+        print("👋 Worker detenido")
+
+
+# Ejemplo de uso:
+# python -m app.cli.commands.run_email_worker
+# python -m app.cli.commands.run_email_worker --once
+# Con el worker separado, desactivar el de la API: EMAIL_WORKER_ENABLED=false
@@ -1,23 +1,40 @@
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 
 from app.shared.config.settings import settings
 from app.shared.database.connection import init_db, close_db, get_db_session
+from app.shared.database.unit_of_work import SQLAlchemyUnitOfWork
 from app.shared.graphql.schema import schema
 from app.building_blocks.exceptions import AuthenticationException
 
 # USERS
 from app.users.infrastructure.persistence.user_repository_impl import PostgreSQLUserRepository
+from app.users.infrastructure.persistence.cached_user_repository import CachedUserRepository
 from app.users.infrastructure.persistence.activation_token_repository_impl import PostgreSQLActivationTokenRepository
+from app.users.infrastructure.persistence.email_outbox_repository_impl import PostgreSQLEmailOutboxRepository
+from app.users.infrastructure.persistence.user_session_repository_impl import PostgreSQLUserSessionRepository
+from app.users.infrastructure.persistence.login_attempt_backend_impl import PostgreSQLRateLimitBackend
 from app.users.infrastructure.external.email_service import SMTPEmailService
+from app.users.infrastructure.external.outbox_email_service import OutboxEmailService
+from app.users.infrastructure.external.email_delivery_worker import EmailDeliveryWorker
+from app.users.infrastructure.external.smtp_connection import PooledSMTPConnection
+from app.users.infrastructure.external.email_templates import get_email_template_registry
 from app.shared.security.auth import JWTAuthService
+from app.shared.security.session_revocation import RevokedSessionIndex
+from app.shared.security.user_cache import AuthenticatedUserCache
+from app.shared.security.keyring import JWTKeyring
+from app.shared.security.rate_limiter import SlidingWindowLoginRateLimiter, InMemoryRateLimitBackend
 
 # ATTENDANCE
 from app.attendance.infrastructure.persistence.attendance_repository_impl import PostgreSQLAttendanceRepository
+from app.attendance.infrastructure.persistence.break_period_repository_impl import PostgreSQLBreakPeriodRepository
+from app.attendance.infrastructure.persistence.attendance_report_repository_impl import PostgreSQLAttendanceReportRepository
+from app.attendance.infrastructure.persistence.attendance_summary_repository_impl import PostgreSQLAttendanceSummaryRepository
 from app.attendance.infrastructure.persistence.work_schedule_repository_impl import (
     PostgreSQLWorkScheduleRepository as AttendanceWorkScheduleRepository
 )
@@ -54,7 +71,149 @@ from app.sanitary.infrastructure.persistence.sanitary_review_repository_impl imp
 from app.sanitary.infrastructure.persistence.sanitary_company_repository_impl import (
     PostgreSQLSanitaryCompanyRepository,
 )
+from app.sanitary.infrastructure.persistence.cached_reference_repositories import (
+    CachedIncidentTypeRepository,
+    CachedSanitaryCompanyRepository,
+    CachedSanitaryPolicyRepository,
+)
+from app.sanitary.infrastructure.persistence.cached_sanitary_review_repository import (
+    CachedSanitaryReviewRepository,
+)
+from app.sanitary.infrastructure.services.review_due_scheduler import (
+    LEADER_LOCK_KEY as SANITARY_DUE_LEADER_LOCK_KEY,
+    SanitaryReviewDueScheduler,
+)
+from app.shared.cache.invalidation import PostgresInvalidationBus
+from app.shared.graphql.cost import QueryCostLimiter, TokenBucketBudget
+from app.shared.cache.query_results import QueryResultCache
+from app.shared.cache.reference_data import ReferenceDataCache
+
+
+
+# Claves de firma JWT: se cargan una sola vez por proceso
+jwt_keyring = (
+    JWTKeyring.from_directory(settings.JWT_KEYS_DIR, settings.JWT_ACTIVE_KID)
+    if settings.JWT_KEYS_DIR and settings.JWT_ACTIVE_KID
+    else None
+)
 
+# Límite de intentos de login (antes de BD y bcrypt)
+login_rate_limiter = SlidingWindowLoginRateLimiter(
+    backend=(
+        PostgreSQLRateLimitBackend(get_db_session)
+        if settings.LOGIN_RATE_LIMIT_BACKEND == "postgres"
+        else InMemoryRateLimitBackend()
+    ),
+    max_attempts_per_email=settings.LOGIN_RATE_LIMIT_MAX_PER_EMAIL,
+    max_attempts_per_ip=settings.LOGIN_RATE_LIMIT_MAX_PER_IP,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+)
+
+# Canal de invalidación entre workers: mantiene coherentes las cachés en memoria
+invalidation_bus = (
+    PostgresInvalidationBus(settings.DATABASE_URL, channel=settings.CACHE_INVALIDATION_CHANNEL)
+    if settings.CACHE_INVALIDATION_ENABLED
+    else None
+)
+
+# Costo de las operaciones GraphQL: límites por operación y presupuesto por usuario
+query_cost_limiter = QueryCostLimiter(
+    max_cost=settings.GRAPHQL_MAX_QUERY_COST,
+    max_depth=settings.GRAPHQL_MAX_QUERY_DEPTH,
+    budget=(
+        TokenBucketBudget(
+            capacity=settings.GRAPHQL_COST_BUDGET_CAPACITY,
+            refill_per_second=settings.GRAPHQL_COST_BUDGET_REFILL_PER_SECOND,
+        )
+        if settings.GRAPHQL_COST_BUDGET_ENABLED
+        else None
+    ),
+)
+
+# Sesiones revocadas: se consultan en memoria en cada request
+revoked_sessions = RevokedSessionIndex(ttl=timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
+
+# Usuarios autenticados (current_user) en memoria: sin consultar users en cada request
+authenticated_users = AuthenticatedUserCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+)
+
+# Templates de email compilados una sola vez por proceso (jinja2 se carga al primer uso)
+email_templates = get_email_template_registry(settings.EMAIL_TEMPLATE_BYTECODE_CACHE_DIR)
+
+# Catálogos de sanidad (políticas, tipos de incidencia, empresas) en memoria
+sanitary_reference_cache = ReferenceDataCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
+
+# Analítica de inconformidades por periodo y filtros (acotada, LRU)
+sanitary_analytics_cache = QueryResultCache(
+    ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+    max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES,
+)
+
+# Worker de envío de emails (bandeja de salida)
+email_worker = EmailDeliveryWorker(
+    session_factory=get_db_session,
+    email_service=SMTPEmailService(
+        smtp_host=settings.SMTP_HOST,
+        smtp_port=settings.SMTP_PORT,
+        smtp_username=settings.SMTP_USERNAME,
+        smtp_password=settings.SMTP_PASSWORD,
+        from_email=settings.SMTP_FROM_EMAIL,
+        from_name=settings.SMTP_FROM_NAME,
+        template_registry=email_templates,
+    ),
+    connection=PooledSMTPConnection(
+        smtp_host=settings.SMTP_HOST,
+        smtp_port=settings.SMTP_PORT,
+        smtp_username=settings.SMTP_USERNAME,
+        smtp_password=settings.SMTP_PASSWORD,
+        start_tls=settings.SMTP_START_TLS,
+    ),
+    batch_size=settings.EMAIL_WORKER_BATCH_SIZE,
+    poll_seconds=settings.EMAIL_WORKER_POLL_SECONDS,
+    max_attempts=settings.EMAIL_WORKER_MAX_ATTEMPTS,
+)
+
+# Avisos de revisiones de sanidad vencidas / por vencer (heap en memoria)
+sanitary_due_scheduler = SanitaryReviewDueScheduler(
+    session_factory=get_db_session,
+    upcoming_days=settings.SANITARY_DUE_UPCOMING_DAYS,
+    check_seconds=settings.SANITARY_DUE_CHECK_SECONDS,
+    # Con varios workers, solo el que tiene el advisory lock envía avisos
+    leader=(lambda: invalidation_bus.try_lock(SANITARY_DUE_LEADER_LOCK_KEY)) if invalidation_bus else None,
+)
+
+
+async def load_revoked_sessions() -> None:
+    """Precarga las revocaciones cuyos access tokens aún podrían estar vigentes"""
+    since = datetime.now(timezone.utc) - revoked_sessions.ttl
+    async with get_db_session() as session:
+        revoked = await PostgreSQLUserSessionRepository(session).find_revoked_since(since)
+    for user_session in sorted(revoked, key=lambda s: s.revoked_at):
+        revoked_sessions.revoke(user_session.id, user_session.revoked_at, publish=False)
+
+
+# Cada caché en memoria publica sus invalidaciones y aplica las de otros workers
+if invalidation_bus:
+    revoked_sessions.publisher = invalidation_bus.publisher("revoked_sessions")
+    invalidation_bus.subscribe(
+        "revoked_sessions", revoked_sessions.apply_remote, resync=load_revoked_sessions
+    )
+    authenticated_users.publisher = invalidation_bus.publisher("authenticated_users")
+    invalidation_bus.subscribe(
+        "authenticated_users", authenticated_users.apply_remote, resync=authenticated_users.resync
+    )
+    sanitary_reference_cache.publisher = invalidation_bus.publisher("sanitary_reference")
+    invalidation_bus.subscribe(
+        "sanitary_reference", sanitary_reference_cache.apply_remote, resync=sanitary_reference_cache.resync
+    )
+    sanitary_analytics_cache.publisher = invalidation_bus.publisher("sanitary_analytics")
+    invalidation_bus.subscribe(
+        "sanitary_analytics", sanitary_analytics_cache.apply_remote, resync=sanitary_analytics_cache.resync
+    )
+    sanitary_due_scheduler.publisher = invalidation_bus.publisher("sanitary_due")
+    invalidation_bus.subscribe("sanitary_due", sanitary_due_scheduler.apply_remote)
 
 
 @asynccontextmanager
@@ -62,9 +221,28 @@ async def lifespan(app: FastAPI):
     print("🚀 Iniciando Sistema de Catering...")
     await init_db()
     print("✅ Base de datos inicializada")
+    await load_revoked_sessions()
+    if invalidation_bus:
+        invalidation_bus.start()
+        print(f"🔁 Canal de invalidación entre workers: {invalidation_bus.channel}")
+    if settings.EMAIL_WORKER_ENABLED:
+        # Solo el worker renderiza: sin él, jinja2 ni se importa
+        print(f"📝 Templates de email compilados: {email_templates.precompile()}")
+        email_worker.start()
+        print("📧 Worker de emails iniciado")
+    if settings.SANITARY_DUE_SCHEDULER_ENABLED:
+        # Carga las políticas en su primer tick (si este worker es el líder)
+        sanitary_due_scheduler.start()
+        print("🧼 Planificador de avisos de sanidad iniciado")
     print("📊 GraphQL Playground: http://localhost:8000/graphql")
     yield
     print("👋 Cerrando Sistema de Catering...")
+    if settings.SANITARY_DUE_SCHEDULER_ENABLED:
+        await sanitary_due_scheduler.stop()
+    if settings.EMAIL_WORKER_ENABLED:
+        await email_worker.stop()
+    if invalidation_bus:
+        await invalidation_bus.stop()
     await close_db()
     print("✅ Conexiones cerradas")
 
@@ -89,9 +267,14 @@ async def get_context(request: Request) -> dict:
 
     async with get_db_session() as session:
         # Repos existentes
-        user_repo = PostgreSQLUserRepository(session)
+        # Cada save invalida al usuario en authenticated_users
+        user_repo = CachedUserRepository(PostgreSQLUserRepository(session), authenticated_users, session)
         token_repo = PostgreSQLActivationTokenRepository(session)
+        user_session_repo = PostgreSQLUserSessionRepository(session)
         attendance_repo = PostgreSQLAttendanceRepository(session)
+        break_period_repo = PostgreSQLBreakPeriodRepository(session)
+        attendance_report_repo = PostgreSQLAttendanceReportRepository(session)
+        attendance_summary_repo = PostgreSQLAttendanceSummaryRepository(session)
 
         # Clave: un repo para attendance y otro para requests
         attendance_work_schedule_repo = AttendanceWorkScheduleRepository(session)
@@ -111,37 +294,54 @@ async def get_context(request: Request) -> dict:
         component_type_repo = PostgreSQLComponentTypeRepository(session)
 
         # Sanidad (módulo de políticas, incidencias y revisiones)
-        sanitary_policy_repo = PostgreSQLSanitaryPolicyRepository(session)
-        incident_type_repo = PostgreSQLIncidentTypeRepository(session)
-        sanitary_review_repo = PostgreSQLSanitaryReviewRepository(session)
-        sanitary_company_repo = PostgreSQLSanitaryCompanyRepository(session)
-
-        email_service = SMTPEmailService(
-            smtp_host=settings.SMTP_HOST,
-            smtp_port=settings.SMTP_PORT,
-            smtp_username=settings.SMTP_USERNAME,
-            smtp_password=settings.SMTP_PASSWORD,
-            from_email=settings.SMTP_FROM_EMAIL,
-            from_name=settings.SMTP_FROM_NAME,
+        # Los catálogos se leen de sanitary_reference_cache; las escrituras la invalidan tras el commit
+        sanitary_policy_repo = CachedSanitaryPolicyRepository(
+            PostgreSQLSanitaryPolicyRepository(session), sanitary_reference_cache, session
+        )
+        incident_type_repo = CachedIncidentTypeRepository(
+            PostgreSQLIncidentTypeRepository(session), sanitary_reference_cache, session
         )
+        sanitary_company_repo = CachedSanitaryCompanyRepository(
+            PostgreSQLSanitaryCompanyRepository(session), sanitary_reference_cache, session
+        )
+        # La analítica de inconformidades se cachea por periodo; registrar revisiones la invalida tras el commit
+        sanitary_review_repo = CachedSanitaryReviewRepository(
+            PostgreSQLSanitaryReviewRepository(session),
+            sanitary_analytics_cache,
+            session,
+            policy_repo=sanitary_policy_repo,
+            company_repo=sanitary_company_repo,
+        )
+
+        # Los casos de uso solo encolan; email_worker hace el envío
+        email_outbox_repo = PostgreSQLEmailOutboxRepository(session)
+        email_service = OutboxEmailService(email_outbox_repo)
 
         auth_service = JWTAuthService(
             secret_key=settings.JWT_SECRET_KEY,
             algorithm=settings.JWT_ALGORITHM,
             access_token_expire_minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
             refresh_token_expire_days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS,
+            keyring=jwt_keyring,
+            accept_legacy_hs256=settings.JWT_ACCEPT_LEGACY_HS256,
         )
 
         holiday_service = SimpleHolidayService()
 
         current_user = None
+        session_id = None
         if authorization:
             try:
                 token = authorization.replace("Bearer ", "")
                 payload = await auth_service.verify_token(token)
-                if payload:
+                # Sesión revocada: se descarta en memoria, sin consultar la BD
+                if payload and not revoked_sessions.is_revoked(payload.get("sid")):
                     user_id = payload.get("sub")
-                    current_user = await user_repo.find_by_id(user_id)
+                    session_id = payload.get("sid")
+                    # Solo se lee la BD si el usuario no está en caché (o se invalidó)
+                    current_user = await authenticated_users.get(
+                        user_id, lambda: user_repo.find_by_id(user_id)
+                    )
             except AuthenticationException:
                 pass
 
@@ -149,14 +349,23 @@ async def get_context(request: Request) -> dict:
             "request": request,
             "session": session,
             "settings": settings,
+            "unit_of_work": SQLAlchemyUnitOfWork(session),
 
             "user_repository": user_repo,
             "token_repository": token_repo,
+            "user_session_repository": user_session_repo,
+            "revoked_sessions": revoked_sessions,
+            "login_rate_limiter": login_rate_limiter if settings.LOGIN_RATE_LIMIT_ENABLED else None,
+            "query_cost_limiter": query_cost_limiter,
             "email_service": email_service,
+            "email_outbox_repository": email_outbox_repo,
             "auth_service": auth_service,
 
             # Attendance
             "attendance_repository": attendance_repo,
+            "break_period_repository": break_period_repo,
+            "attendance_report_repository": attendance_report_repo,
+            "attendance_summary_repository": attendance_summary_repo,
             "work_schedule_repository": attendance_work_schedule_repo,
             "holiday_service": holiday_service,
 
@@ -180,8 +389,10 @@ async def get_context(request: Request) -> dict:
             "incident_type_repository": incident_type_repo,
             "sanitary_review_repository": sanitary_review_repo,
             "sanitary_company_repository": sanitary_company_repo,
+            "sanitary_due_tracker": sanitary_due_scheduler if settings.SANITARY_DUE_SCHEDULER_ENABLED else None,
 
             "current_user": current_user,
+            "session_id": session_id,
         }
 
 
@@ -198,6 +409,55 @@ async def health_check():
     return {"status": "healthy", "app": settings.APP_NAME, "version": settings.APP_VERSION}
 
 
+@app.get("/.well-known/jwks.json")
+async def jwks():
+    """Claves públicas para que otros servicios validen nuestros tokens"""
+    return JSONResponse(
+        content=jwt_keyring.jwks() if jwt_keyring else {"keys": []},
+        headers={"Cache-Control": "public, max-age=300"},
+    )
+
+
+@app.get("/metrics/email-queue")
+async def email_queue_metrics():
+    return email_worker.metrics.snapshot()
+
+
+@app.get("/metrics/login-rate-limit")
+async def login_rate_limit_metrics():
+    return login_rate_limiter.metrics.snapshot()
+
+
+@app.get("/metrics/user-cache")
+async def user_cache_metrics():
+    return {**authenticated_users.metrics.snapshot(), "size": len(authenticated_users)}
+
+
+@app.get("/metrics/reference-cache")
+async def reference_cache_metrics():
+    return sanitary_reference_cache.metrics.snapshot()
+
+
+@app.get("/metrics/analytics-cache")
+async def analytics_cache_metrics():
+    return {**sanitary_analytics_cache.metrics.snapshot(), "size": len(sanitary_analytics_cache)}
+
+
+@app.get("/metrics/sanitary-due")
+async def sanitary_due_metrics():
+    return sanitary_due_scheduler.metrics.snapshot()
+
+
+@app.get("/metrics/graphql-cost")
+async def graphql_cost_metrics():
+    return query_cost_limiter.metrics.snapshot()
+
+
+@app.get("/metrics/cache-invalidation")
+async def cache_invalidation_metrics():
+    return invalidation_bus.metrics.snapshot() if invalidation_bus else {"enabled": False}
+
+
 @app.get("/")
 async def root():
     return {"message": f"Bienvenido a {settings.APP_NAME}", "version": settings.APP_VERSION, "graphql": "/graphql",
@@ -218,6 +478,7 @@ async def activate_success_page():
 
 
 if __name__ == "__main__":
+    # Desarrollo (un proceso, con reload). Producción: python -m app.server
     import uvicorn
 
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=settings.DEBUG)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from app.menu.domain.monthly_menu import MonthlyMenu
+from app.menu.domain.menu_day_detail import MenuDayDetail
 
 class MonthlyMenuRepository(ABC):
     @abstractmethod
@@ -11,3 +12,7 @@ class MonthlyMenuRepository(ABC):
     async def find_by_id(self, menu_id: str) -> Optional[MonthlyMenu]: ...
     @abstractmethod
     async def list_recent(self, limit: int = 12) -> List[MonthlyMenu]: ...
+    @abstractmethod
+    async def list_days_with_meals(self, menu_id: str) -> List[MenuDayDetail]:
+        """Días del menú (por fecha) con comidas, componentes y tipo de componente"""
+        ...
@@ -9,15 +9,11 @@ from app.menu.application.ports.weekly_menu_repository import WeeklyMenuReposito
 from app.menu.application.ports.daily_menu_repository import DailyMenuRepository
 from app.menu.application.ports.meal_repository import MealRepository
 from app.menu.application.ports.meal_component_repository import MealComponentRepository
+from app.shared.excel.workbook import get_load_workbook
 
 # Este UC solo PREVISA el contenido detectado; no escribe en BD.
 # Se usa antes de hacer el upload definitivo para validar el archivo.
 
-try:
-    from openpyxl import load_workbook  # type: ignore
-except Exception:  # pragma: no cover
-    load_workbook = None  # type: ignore
-
 
 @dataclass(frozen=True)
 class ConfirmOverwriteCommand:
@@ -136,6 +132,7 @@ class ConfirmOverwriteUseCase:
                 "preview": {},
             }
 
+        load_workbook = get_load_workbook()
         if load_workbook is None:
             return {
                 "status": "error",
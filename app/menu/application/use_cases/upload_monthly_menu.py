@@ -20,12 +20,7 @@ from app.menu.application.ports.daily_menu_repository import DailyMenuRepository
 from app.menu.application.ports.meal_repository import MealRepository
 from app.menu.application.ports.meal_component_repository import MealComponentRepository
 from app.menu.application.ports.component_type_repository import ComponentTypeRepository
-
-try:
-    # openpyxl nos permite leer la estructura de la hoja tal cual la ve el nutricionista
-    from openpyxl import load_workbook  # type: ignore
-except Exception:  # pragma: no cover
-    load_workbook = None  # type: ignore
+from app.shared.excel.workbook import get_load_workbook
 
 
 DAY_NAMES = {
@@ -326,6 +321,8 @@ class UploadMonthlyMenuUseCase:
         if ext not in {"xlsx", "xls"}:
             raise ValueError("Solo se soportan archivos Excel (.xlsx, .xls) para el nuevo formato de menú.")
 
+        # openpyxl nos permite leer la estructura de la hoja tal cual la ve el nutricionista
+        load_workbook = get_load_workbook()
         if load_workbook is None:
             raise RuntimeError(
                 "Se envió un Excel de menú pero no está instalado 'openpyxl' en el servidor."
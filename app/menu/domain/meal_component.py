@@ -20,3 +20,4 @@ class MealComponent:
     dish_name: str
     calories: Optional[float] = None
     order_position: int = 0
+    component_type_name: Optional[str] = None  # Solo en lecturas que cargan el tipo
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from app.menu.domain.daily_menu import DailyMenu
+from app.menu.domain.meal import Meal
+from app.menu.domain.meal_component import MealComponent
+from app.menu.domain.menu_enums import MealType
+
+
+@dataclass
+class MealDetail:
+    """Comida con sus componentes, ordenados por order_position"""
+    meal: Meal
+    components: List[MealComponent] = field(default_factory=list)
+
+
+@dataclass
+class MenuDayDetail:
+    """
+    Un día del menú mensual con todas sus comidas (modelo de lectura).
+    Se carga de una vez para todo el mes (ver list_days_with_meals).
+    """
+    day: DailyMenu
+    meals: Dict[MealType, MealDetail] = field(default_factory=dict)
@@ -2,11 +2,8 @@ import strawberry
 from typing import List
 from datetime import date, datetime
 
-from app.building_blocks.exceptions import (
-    AuthenticationException,
-    AuthorizationException,
-)
-from app.users.domain.user_role import UserRole
+from app.shared.graphql.cost import cost
+from app.shared.security.permissions import Permission, requires
 
 from app.menu.application.use_cases.upload_monthly_menu import (
     UploadMonthlyMenuUseCase,
@@ -34,22 +31,9 @@ from .menu_inputs import (
 from .menu_types import UploadMenuResponse, ConfirmOverwriteResponse, MenuChangeInfo
 
 
-def _get_current_user(info):
-    user = info.context.get("current_user")
-    if not user:
-        raise AuthenticationException("Debes estar autenticado")
-    return user
-
-
-def _require_role(user, allowed: List[UserRole]):
-    if user.role not in allowed:
-        raise AuthorizationException("No autorizado")
-
-
-
 @strawberry.type
 class MenuMutations:
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.MENU_UPLOAD, metadata=cost(base=50)))
     async def upload_monthly_menu(
         self,
         info,
@@ -59,8 +43,7 @@ class MenuMutations:
         Sube y REEMPLAZA el menú mensual completo usando el formato plano
         (date, breakfast, lunch, dinner) del Excel/CSV.
         """
-        user = _get_current_user(info)
-        _require_role(user, [UserRole.NUTRITIONIST, UserRole.ADMIN])
+        user = info.context["current_user"]
 
         uc = UploadMonthlyMenuUseCase(
             monthly_repo=info.context["monthly_menu_repository"],
@@ -88,7 +71,7 @@ class MenuMutations:
             preview=result.get("preview") or [],
         )
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.MENU_UPLOAD))
     async def confirm_overwrite_menu(
         self,
         info,
@@ -98,8 +81,7 @@ class MenuMutations:
         Solo lee el archivo y devuelve un preview sin escribir en BD.
         Se usa antes de hacer el upload definitivo.
         """
-        user = _get_current_user(info)
-        _require_role(user, [UserRole.NUTRITIONIST, UserRole.ADMIN])
+        user = info.context["current_user"]
 
         uc = ConfirmOverwriteUseCase(
             info.context["monthly_menu_repository"],
@@ -124,7 +106,7 @@ class MenuMutations:
             preview=res.get("preview") or {},
         )
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.MENU_PROPOSE_CHANGE))
     async def propose_menu_change(
         self,
         info,
@@ -135,9 +117,8 @@ class MenuMutations:
         Cada ítem sigue usando el nombre menu_day_id por compatibilidad con el
         frontend, pero internamente es el daily_menu_id.
         """
-        user = _get_current_user(info)
+        user = info.context["current_user"]
         # Cocinero propone, admin también puede.
-        _require_role(user, [UserRole.COOK, UserRole.ADMIN])
 
         uc = UploadMonthlyMenuUseCase(
             info.context["monthly_menu_repository"],
@@ -180,7 +161,7 @@ class MenuMutations:
             for r in reqs
         ]
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.MENU_REVIEW_CHANGE))
     async def review_menu_change(
         self,
         info,
@@ -190,8 +171,7 @@ class MenuMutations:
         Nutricionista/Admin aprueba o rechaza un cambio de menú.
         Si se aprueba, se aplica sobre los componentes del meal correspondiente.
         """
-        user = _get_current_user(info)
-        _require_role(user, [UserRole.NUTRITIONIST, UserRole.ADMIN])
+        user = info.context["current_user"]
 
         uc = ReviewMenuChangeUseCase(
             info.context["menu_change_repository"],
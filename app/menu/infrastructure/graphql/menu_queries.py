@@ -19,11 +19,8 @@ from .menu_types import (
     MenuMealInfo,
     MenuMealComponentInfo,
 )
-
-
-def _require_auth(info) -> None:
-    if not info.context.get("current_user"):
-        raise Exception("No autenticado")
+from app.shared.graphql.cost import cost, days_in_month
+from app.shared.security.permissions import Permission, requires
 
 
 def _parse_date(value: Optional[str]) -> Optional[date]:
@@ -41,22 +38,15 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
 
 @strawberry.type
 class MenuQueries:
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=days_in_month)))
     async def menu(self, info, year: int, month: int) -> Optional[MonthlyMenuCalendar]:
         """
         Devuelve el calendario mensual ya normalizado (daily_menus + meals +
         meal_components) empaquetado en la estructura plana que usa el frontend:
         breakfast / lunch / dinner por día, y además el detalle completo en 'meals'.
         """
-        _require_auth(info)
 
-        uc = GetMonthlyMenuUseCase(
-            info.context["monthly_menu_repository"],
-            info.context["weekly_menu_repository"],
-            info.context["daily_menu_repository"],
-            info.context["meal_repository"],
-            info.context["meal_component_repository"],
-        )
+        uc = GetMonthlyMenuUseCase(info.context["monthly_menu_repository"])
         rows = await uc.execute(GetMonthlyMenuQuery(year=year, month=month))
 
         if not rows:
@@ -105,7 +95,7 @@ class MenuQueries:
 
         return MonthlyMenuCalendar(year=year, month=month, days=days)
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(base=5)))
     async def menu_change_history(
         self,
         info,
@@ -115,7 +105,6 @@ class MenuQueries:
         """
         Historial de cambios solicitados para el mes (para auditoría).
         """
-        _require_auth(info)
 
         uc = GetMenuChangeHistoryUseCase(info.context["menu_change_repository"])
         data = await uc.execute(GetMenuChangeHistoryQuery(year=year, month=month))
@@ -137,7 +126,7 @@ class MenuQueries:
             for x in data
         ]
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(base=2, multiplier=days_in_month)))
     async def export_monthly_menu(
         self,
         info,
@@ -148,7 +137,6 @@ class MenuQueries:
         Exporta el menú mensual a un archivo (base64) usando el mismo formato
         plano que el Excel.
         """
-        _require_auth(info)
 
         uc = ExportMonthlyMenuUseCase(
             info.context["monthly_menu_repository"],
@@ -6,20 +6,25 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Date, String, Boolean, DateTime, text
+from sqlalchemy import Column, Date, ForeignKey, String, Boolean, DateTime, text
+from sqlalchemy.orm import relationship
 
 from app.menu.application.ports.daily_menu_repository import DailyMenuRepository
 from app.menu.domain.daily_menu import DailyMenu
-
-Base = declarative_base()
+from app.menu.infrastructure.persistence.meal_repository_impl import MealModel
+from app.shared.database.base import Base
 
 
 class DailyMenuModel(Base):
     __tablename__ = "daily_menus"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    weekly_menu_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    weekly_menu_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("weekly_menus.id", ondelete="CASCADE", name="fk_daily_menus_weekly_menus"),
+        nullable=False,
+        index=True,
+    )
     date = Column(Date, nullable=False, index=True)
     day_of_week = Column(String(20), nullable=True)
     is_holiday = Column(
@@ -46,6 +51,8 @@ class DailyMenuModel(Base):
         ),
     )
 
+    meals = relationship(MealModel, viewonly=True, lazy="raise")
+
 
 class PostgreSQLDailyMenuRepository(DailyMenuRepository):
     def __init__(self, session: AsyncSession):
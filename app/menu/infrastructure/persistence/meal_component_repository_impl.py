@@ -5,25 +5,38 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, String, Integer, Float
+from sqlalchemy import Column, ForeignKey, String, Integer, Float
+from sqlalchemy.orm import relationship
 
 from app.menu.application.ports.meal_component_repository import MealComponentRepository
 from app.menu.domain.meal_component import MealComponent
-
-Base = declarative_base()
+from app.menu.infrastructure.persistence.component_type_repository_impl import ComponentTypeModel
+from app.shared.database.base import Base
 
 
 class MealComponentModel(Base):
     __tablename__ = "meal_components"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    meal_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
-    component_type_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    meal_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("meals.id", ondelete="CASCADE", name="fk_meal_components_meals"),
+        nullable=False,
+        index=True,
+    )
+    component_type_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("component_types.id", ondelete="RESTRICT", name="fk_meal_components_component_types"),
+        nullable=False,
+        index=True,
+    )
     dish_name = Column(String(255), nullable=False)
     calories = Column(Float, nullable=True)
     order_position = Column(Integer, nullable=False, server_default="0")
 
+    # Solo lectura: se carga con selectinload (lazy="raise" evita consultas implícitas)
+    component_type = relationship(ComponentTypeModel, viewonly=True, lazy="raise")
+
 
 class PostgreSQLMealComponentRepository(MealComponentRepository):
     def __init__(self, session: AsyncSession):
@@ -5,21 +5,26 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, String, Float
+from sqlalchemy import Column, ForeignKey, String, Float
+from sqlalchemy.orm import relationship
 
 from app.menu.application.ports.meal_repository import MealRepository
 from app.menu.domain.meal import Meal
 from app.menu.domain.menu_enums import MealType
-
-Base = declarative_base()
+from app.menu.infrastructure.persistence.meal_component_repository_impl import MealComponentModel
+from app.shared.database.base import Base
 
 
 class MealModel(Base):
     __tablename__ = "meals"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    daily_menu_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    daily_menu_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("daily_menus.id", ondelete="CASCADE", name="fk_meals_daily_menus"),
+        nullable=False,
+        index=True,
+    )
     meal_type = Column(String(20), nullable=False)
     total_kcal = Column(Float, nullable=True)
 
@@ -31,6 +36,13 @@ class MealModel(Base):
         ),
     )
 
+    components = relationship(
+        MealComponentModel,
+        order_by=MealComponentModel.order_position,
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class PostgreSQLMealRepository(MealRepository):
     def __init__(self, session: AsyncSession):
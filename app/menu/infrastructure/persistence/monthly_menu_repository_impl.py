@@ -6,15 +6,23 @@ from datetime import datetime
 
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.future import select
 from sqlalchemy import Column, Integer, String, DateTime, text
+from sqlalchemy.orm import relationship, selectinload
 
 from app.menu.application.ports.monthly_menu_repository import MonthlyMenuRepository
 from app.menu.domain.monthly_menu import MonthlyMenu
-from app.menu.domain.menu_enums import MenuStatus
+from app.menu.domain.menu_enums import MenuStatus, MealType
+from app.menu.domain.daily_menu import DailyMenu
+from app.menu.domain.meal import Meal
+from app.menu.domain.meal_component import MealComponent
+from app.menu.domain.menu_day_detail import MealDetail, MenuDayDetail
+from app.menu.infrastructure.persistence.weekly_menu_repository_impl import WeeklyMenuModel
+from app.menu.infrastructure.persistence.daily_menu_repository_impl import DailyMenuModel
+from app.menu.infrastructure.persistence.meal_repository_impl import MealModel
+from app.menu.infrastructure.persistence.meal_component_repository_impl import MealComponentModel
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class MonthlyMenuModel(Base):
     __tablename__ = "monthly_menus"
@@ -33,6 +41,11 @@ class MonthlyMenuModel(Base):
         sa.UniqueConstraint("year", "month", name="uq_monthly_menus_year_month"),
     )
 
+    # Árbol del menú: meses -> semanas -> días -> comidas -> componentes.
+    # Todas las relaciones son de solo lectura y lazy="raise": se cargan con
+    # selectinload (una consulta por nivel, sin N+1 ni IO implícito en async)
+    weeks = relationship(WeeklyMenuModel, order_by=WeeklyMenuModel.week_number, viewonly=True, lazy="raise")
+
 class PostgreSQLMonthlyMenuRepository(MonthlyMenuRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -122,3 +135,67 @@ class PostgreSQLMonthlyMenuRepository(MonthlyMenuRepository):
         r = await self.session.execute(stmt)
         rows = r.scalars().all()
         return [self._to_domain(m) for m in rows]
+
+    async def list_days_with_meals(self, menu_id: str) -> List[MenuDayDetail]:
+        """
+        Todo el mes en 4 consultas, sin importar cuántos días tenga:
+          1. días (JOIN semanas del menú)
+          2. comidas de esos días          (selectinload)
+          3. componentes de esas comidas   (selectinload)
+          4. tipos de componente usados    (selectinload)
+        """
+        stmt = (
+            select(DailyMenuModel)
+            .join(WeeklyMenuModel, WeeklyMenuModel.id == DailyMenuModel.weekly_menu_id)
+            .where(WeeklyMenuModel.monthly_menu_id == uuid.UUID(str(menu_id)))
+            .options(
+                selectinload(DailyMenuModel.meals)
+                .selectinload(MealModel.components)
+                .selectinload(MealComponentModel.component_type)
+            )
+            .order_by(DailyMenuModel.date)
+        )
+
+        async with self.session_factory() as session:
+            r = await session.execute(stmt)
+            days = r.scalars().all()
+
+            return [
+                MenuDayDetail(
+                    day=DailyMenu(
+                        id=str(d.id),
+                        weekly_menu_id=str(d.weekly_menu_id),
+                        date=d.date,
+                        day_of_week=d.day_of_week,
+                        is_holiday=bool(d.is_holiday),
+                        created_at=d.created_at,
+                        updated_at=d.updated_at,
+                    ),
+                    meals={
+                        MealType(m.meal_type): MealDetail(
+                            meal=Meal(
+                                id=str(m.id),
+                                daily_menu_id=str(m.daily_menu_id),
+                                meal_type=MealType(m.meal_type),
+                                total_kcal=m.total_kcal,
+                            ),
+                            components=[
+                                MealComponent(
+                                    id=str(c.id),
+                                    meal_id=str(c.meal_id),
+                                    component_type_id=str(c.component_type_id),
+                                    dish_name=c.dish_name,
+                                    calories=c.calories,
+                                    order_position=c.order_position,
+                                    component_type_name=(
+                                        c.component_type.component_name if c.component_type else None
+                                    ),
+                                )
+                                for c in m.components
+                            ],
+                        )
+                        for m in d.meals
+                    },
+                )
+                for d in days
+            ]
@@ -5,20 +5,25 @@ import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
 
 from app.menu.application.ports.weekly_menu_repository import WeeklyMenuRepository
 from app.menu.domain.weekly_menu import WeeklyMenu
-
-Base = declarative_base()
+from app.menu.infrastructure.persistence.daily_menu_repository_impl import DailyMenuModel
+from app.shared.database.base import Base
 
 
 class WeeklyMenuModel(Base):
     __tablename__ = "weekly_menus"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    monthly_menu_id = Column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    monthly_menu_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("monthly_menus.id", ondelete="CASCADE", name="fk_weekly_menus_monthly_menus"),
+        nullable=False,
+        index=True,
+    )
     week_number = Column(Integer, nullable=False)
     title = Column(String(255), nullable=True)
 
@@ -30,6 +35,8 @@ class WeeklyMenuModel(Base):
         ),
     )
 
+    days = relationship(DailyMenuModel, order_by=DailyMenuModel.date, viewonly=True, lazy="raise")
+
 
 class PostgreSQLWeeklyMenuRepository(WeeklyMenuRepository):
     def __init__(self, session: AsyncSession):
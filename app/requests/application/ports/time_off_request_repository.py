@@ -1,8 +1,9 @@
 """Puerto para repositorio de solicitudes de tiempo libre (vacaciones/permisos)"""
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from datetime import date
 from app.requests.domain.time_off_request import TimeOffRequest
+from app.requests.domain.team_absence import TeamAbsence
 
 class TimeOffRequestRepository(ABC):
     """Contrato para persistencia y consultas de TimeOffRequest"""
@@ -25,3 +26,28 @@ class TimeOffRequestRepository(ABC):
         Devuelve solicitudes que se solapan con el rango [start, end] para el usuario.
         Solo aplica a estados que cuenten (p.ej. pending/approved).
         """
+
+    @abstractmethod
+    async def find_team_absences(
+        self,
+        start: date,
+        end: date,
+        user_ids: Optional[Sequence[str]] = None,
+        role: Optional[str] = None
+    ) -> List[TeamAbsence]:
+        """
+        Solicitudes pendientes o aprobadas de varios usuarios que se solapan
+        con [start, end], en una sola consulta.
+        """
+
+    @abstractmethod
+    async def find_many_for_update(self, request_ids: Sequence[str]) -> List[TimeOffRequest]:
+        """
+        Carga varias solicitudes en una sola consulta y bloquea sus filas
+        (SELECT ... FOR UPDATE) hasta el commit de la unidad de trabajo.
+        Los ids inexistentes o inválidos simplemente no aparecen.
+        """
+
+    @abstractmethod
+    async def save_many(self, requests: Sequence[TimeOffRequest]) -> None:
+        """Actualiza varias solicitudes existentes sin hacer commit (lo hace la unidad de trabajo)"""
@@ -1,6 +1,6 @@
 """Puerto para repositorio de saldos de vacaciones"""
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 from app.requests.domain.vacation_balance import VacationBalance
 
 class VacationBalanceRepository(ABC):
@@ -13,3 +13,29 @@ class VacationBalanceRepository(ABC):
     @abstractmethod
     async def save(self, balance: VacationBalance) -> VacationBalance:
         """Guarda o actualiza el saldo de vacaciones"""
+
+    @abstractmethod
+    async def try_consume(self, user_id: str, year: int, days: int) -> Optional[VacationBalance]:
+        """
+        Consume días de forma atómica: solo si quedan suficientes.
+        Retorna el saldo actualizado o None si no hay saldo o no alcanza.
+        No hace commit: se confirma junto con el guardado de la solicitud.
+        """
+
+    @abstractmethod
+    async def refund_days(self, user_id: str, year: int, days: int) -> Optional[VacationBalance]:
+        """
+        Devuelve días de forma atómica (nunca deja used_days negativo).
+        Retorna el saldo actualizado o None si no aplica. No hace commit.
+        """
+
+    @abstractmethod
+    async def get_many_for_update(self, keys: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], VacationBalance]:
+        """
+        Carga los saldos de varios (user_id, year) en una sola consulta y
+        bloquea sus filas (SELECT ... FOR UPDATE) hasta el commit.
+        """
+
+    @abstractmethod
+    async def save_many(self, balances: Sequence[VacationBalance]) -> None:
+        """Actualiza varios saldos existentes sin hacer commit (lo hace la unidad de trabajo)"""
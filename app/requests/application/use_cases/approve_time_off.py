@@ -25,11 +25,9 @@ class ApproveTimeOffUseCase:
 
         # Si es VACATION y NO se consumió al crear, consumir ahora
         if req.type == RequestType.VACATION and not req.audit.get("consumed_on_request", False):
-            balance = await self.balance_repository.get_for_user_year(req.user_id, req.start_date.year)
-            if not balance or not balance.can_consume(req.days_requested):
+            balance = await self.balance_repository.try_consume(req.user_id, req.start_date.year, req.days_requested)
+            if not balance:
                 raise DomainException("Saldo insuficiente al aprobar")
-            balance.consume(req.days_requested)
-            await self.balance_repository.save(balance)
             req.audit["consumed_on_approve"] = req.days_requested
 
         req.status = RequestStatus.APPROVED
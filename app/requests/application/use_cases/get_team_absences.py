@@ -0,0 +1,72 @@
+"""Caso de uso: Calendario de ausencias del equipo"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set
+
+from app.requests.application.ports.time_off_request_repository import TimeOffRequestRepository
+from app.requests.domain.request_status import RequestStatus
+from app.building_blocks.exceptions import DomainException
+
+# Rango máximo del calendario (un trimestre)
+MAX_CALENDAR_DAYS = 93
+
+
+@dataclass
+class GetTeamAbsencesCommand:
+    start_date: date
+    end_date: date
+    user_ids: Optional[List[str]] = field(default=None)
+    role: Optional[str] = None
+
+
+class GetTeamAbsencesUseCase:
+    """
+    Quién está ausente en un rango de fechas.
+
+    Una sola consulta trae todas las solicitudes pendientes y aprobadas que
+    se solapan con el rango; el conteo por día se arma en memoria.
+    """
+
+    def __init__(self, request_repository: TimeOffRequestRepository):
+        self.request_repository = request_repository
+
+    async def execute(self, cmd: GetTeamAbsencesCommand) -> dict:
+        # 1. Validar rango
+        if cmd.start_date > cmd.end_date:
+            raise DomainException("La fecha de inicio debe ser anterior a la fecha de fin")
+        if (cmd.end_date - cmd.start_date).days >= MAX_CALENDAR_DAYS:
+            raise DomainException(f"El calendario no puede superar {MAX_CALENDAR_DAYS} días")
+
+        # 2. Ausencias del rango (una consulta)
+        absences = await self.request_repository.find_team_absences(
+            cmd.start_date, cmd.end_date, cmd.user_ids, cmd.role
+        )
+
+        # 3. Personas ausentes por día (un usuario cuenta una vez aunque tenga dos solicitudes)
+        approved: Dict[date, Set[str]] = defaultdict(set)
+        pending: Dict[date, Set[str]] = defaultdict(set)
+        for absence in absences:
+            target = approved if absence.status == RequestStatus.APPROVED.value else pending
+            for day in absence.days_within(cmd.start_date, cmd.end_date):
+                target[day].add(absence.user_id)
+
+        days = []
+        day = cmd.start_date
+        while day <= cmd.end_date:
+            approved_users = approved.get(day, set())
+            pending_users = pending.get(day, set()) - approved_users
+            days.append({
+                "date": day,
+                "approved": len(approved_users),
+                "pending": len(pending_users),
+                "total": len(approved_users) + len(pending_users),
+            })
+            day += timedelta(days=1)
+
+        return {
+            "start_date": cmd.start_date,
+            "end_date": cmd.end_date,
+            "absences": absences,
+            "days": days,
+        }
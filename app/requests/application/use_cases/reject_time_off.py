@@ -28,10 +28,7 @@ class RejectTimeOffUseCase:
         consumed = bool(req.audit.get("consumed_on_request"))
         consumed_days = int(req.audit.get("consumed_days", 0))
         if consumed and req.type == RequestType.VACATION and consumed_days > 0:
-            balance = await self.balance_repository.get_for_user_year(req.user_id, req.start_date.year)
-            if balance:
-                balance.refund(consumed_days)
-                await self.balance_repository.save(balance)
+            await self.balance_repository.refund_days(req.user_id, req.start_date.year, consumed_days)
             req.audit["refund_on_reject"] = consumed_days
 
         req.status = RequestStatus.REJECTED
@@ -52,20 +52,19 @@ class RequestTimeOffUseCase:
         }
 
         if cmd.type == RequestType.VACATION:
-            balance = await self.balance_repository.get_for_user_year(cmd.user_id, cmd.start_date.year)
-            if not balance:
-                raise DomainException("No tienes saldo de vacaciones configurado para este año")
-
-            if not balance.can_consume(days_requested):
-                raise DomainException("No tienes días suficientes en tu saldo de vacaciones")
-
+            year = cmd.start_date.year
             if cmd.consume_on_request:
-                balance.consume(days_requested)
-                await self.balance_repository.save(balance)
+                # Consumo atómico en un solo viaje: el UPDATE condicional valida el saldo
+                if not await self.balance_repository.try_consume(cmd.user_id, year, days_requested):
+                    await self._raise_insufficient_balance(cmd.user_id, year)
                 audit["consumed_on_request"] = True
                 audit["consumed_days"] = days_requested
+            else:
+                balance = await self.balance_repository.get_for_user_year(cmd.user_id, year)
+                if not balance or not balance.can_consume(days_requested):
+                    await self._raise_insufficient_balance(cmd.user_id, year, balance)
 
-        # 4) Crear solicitud en estado pending
+        # 4) Crear solicitud en estado pending (la entidad valida ventana y fechas al construirse)
         req = TimeOffRequest(
             user_id=cmd.user_id,
             type=cmd.type,
@@ -76,8 +75,6 @@ class RequestTimeOffUseCase:
             reason=cmd.reason,
             audit=audit
         )
-        # valida reglas embebidas (ventana + cálculo días) dentro del modelo
-        req.validate_window(now_utc=now_utc)
 
         saved = await self.request_repository.save(req)
 
@@ -87,3 +84,11 @@ class RequestTimeOffUseCase:
             days_requested=saved.days_requested,
             message="Solicitud creada correctamente"
         )
+
+    async def _raise_insufficient_balance(self, user_id: str, year: int, balance=None) -> None:
+        """Solo en el camino de error: distingue saldo inexistente de saldo insuficiente"""
+        if balance is None:
+            balance = await self.balance_repository.get_for_user_year(user_id, year)
+        if not balance:
+            raise DomainException("No tienes saldo de vacaciones configurado para este año")
+        raise DomainException("No tienes días suficientes en tu saldo de vacaciones")
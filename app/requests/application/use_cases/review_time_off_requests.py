@@ -0,0 +1,166 @@
+"""Caso de uso: Aprobar o rechazar varias solicitudes a la vez (admin)"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
+from app.requests.application.ports.time_off_request_repository import TimeOffRequestRepository
+from app.requests.application.ports.vacation_balance_repository import VacationBalanceRepository
+from app.requests.domain.request_status import RequestStatus, RequestType
+from app.requests.domain.time_off_request import TimeOffRequest
+from app.requests.domain.vacation_balance import VacationBalance
+
+# Límite por lote: las filas quedan bloqueadas hasta el commit
+MAX_REVIEW_BATCH = 200
+
+
+@dataclass
+class ReviewTimeOffRequestsCommand:
+    request_ids: List[str]
+    admin_id: str
+    approve: bool
+    reason: Optional[str] = None  # Obligatorio al rechazar
+
+
+class ReviewTimeOffRequestsUseCase:
+    """
+    Revisión masiva de solicitudes de días.
+
+    - Dos consultas: las solicitudes y los saldos afectados, ambas con
+      SELECT ... FOR UPDATE para que otra aprobación concurrente no
+      consuma el mismo saldo
+    - Las reglas (estado pending, saldo suficiente, devolución al rechazar)
+      se aplican en memoria; los saldos de un mismo usuario se acumulan
+    - Una sola transacción: se guardan las solicitudes válidas y las que no
+      cumplen las reglas se reportan por fila sin detener el lote
+    """
+
+    def __init__(
+        self,
+        request_repository: TimeOffRequestRepository,
+        balance_repository: VacationBalanceRepository,
+        unit_of_work: UnitOfWork
+    ):
+        self.request_repository = request_repository
+        self.balance_repository = balance_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, cmd: ReviewTimeOffRequestsCommand) -> dict:
+        # 1. Validar el lote
+        request_ids = list(dict.fromkeys(rid.strip() for rid in cmd.request_ids if rid and rid.strip()))
+        if not request_ids:
+            raise DomainException("Debes indicar al menos una solicitud")
+        if len(request_ids) > MAX_REVIEW_BATCH:
+            raise DomainException(f"Máximo {MAX_REVIEW_BATCH} solicitudes por lote")
+        if not cmd.approve and not (cmd.reason or "").strip():
+            raise DomainException("Debes indicar el motivo del rechazo")
+
+        try:
+            # 2. Cargar y bloquear solicitudes y saldos (dos consultas)
+            requests = {
+                req.id: req for req in await self.request_repository.find_many_for_update(request_ids)
+            }
+            balances = await self.balance_repository.get_many_for_update(
+                {_balance_key(req) for req in requests.values() if self._touches_balance(req, cmd.approve)}
+            )
+
+            # 3. Aplicar las reglas en memoria
+            results = []
+            changed_requests: List[TimeOffRequest] = []
+            changed_balances: Dict[str, VacationBalance] = {}
+
+            for request_id in request_ids:
+                req = requests.get(request_id)
+                if not req:
+                    results.append(_row(request_id, False, None, "Solicitud no encontrada"))
+                    continue
+
+                try:
+                    balance = balances.get(_balance_key(req))
+                    if cmd.approve:
+                        touched = _approve(req, balance, cmd.admin_id)
+                    else:
+                        touched = _reject(req, balance, cmd.admin_id, cmd.reason.strip())
+                except DomainException as e:
+                    results.append(_row(request_id, False, req.status.value, str(e)))
+                    continue
+
+                if touched:
+                    changed_balances[touched.id] = touched
+                changed_requests.append(req)
+                results.append(_row(
+                    request_id, True, req.status.value,
+                    "Solicitud aprobada" if cmd.approve else "Solicitud rechazada"
+                ))
+
+            # 4. Guardar todo en una sola transacción
+            await self.balance_repository.save_many(list(changed_balances.values()))
+            await self.request_repository.save_many(changed_requests)
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        processed = len(changed_requests)
+        return {
+            "success": processed > 0,
+            "processed": processed,
+            "failed": len(results) - processed,
+            "results": results,
+            "message": f"{processed} de {len(results)} solicitudes "
+                       f"{'aprobadas' if cmd.approve else 'rechazadas'}"
+        }
+
+    @staticmethod
+    def _touches_balance(req: TimeOffRequest, approve: bool) -> bool:
+        if req.type != RequestType.VACATION or req.status != RequestStatus.PENDING:
+            return False
+        if approve:
+            return not req.audit.get("consumed_on_request", False)
+        return bool(req.audit.get("consumed_on_request")) and int(req.audit.get("consumed_days", 0)) > 0
+
+
+def _approve(req: TimeOffRequest, balance: Optional[VacationBalance], admin_id: str) -> Optional[VacationBalance]:
+    """Mismas reglas que ApproveTimeOffUseCase. Retorna el saldo modificado, si hubo"""
+    if req.status != RequestStatus.PENDING:
+        raise DomainException("Solo puedes aprobar solicitudes en estado pending")
+
+    touched = None
+    if req.type == RequestType.VACATION and not req.audit.get("consumed_on_request", False):
+        if not balance or not balance.can_consume(req.days_requested):
+            raise DomainException("Saldo insuficiente al aprobar")
+        balance.consume(req.days_requested)
+        req.audit["consumed_on_approve"] = req.days_requested
+        touched = balance
+
+    req.status = RequestStatus.APPROVED
+    req.audit["approved_by"] = admin_id
+    return touched
+
+
+def _reject(req: TimeOffRequest, balance: Optional[VacationBalance], admin_id: str, reason: str) -> Optional[VacationBalance]:
+    """Mismas reglas que RejectTimeOffUseCase. Retorna el saldo modificado, si hubo"""
+    if req.status != RequestStatus.PENDING:
+        raise DomainException("Solo puedes rechazar solicitudes en estado pending")
+
+    touched = None
+    consumed = bool(req.audit.get("consumed_on_request"))
+    consumed_days = int(req.audit.get("consumed_days", 0))
+    if consumed and req.type == RequestType.VACATION and consumed_days > 0:
+        if balance:
+            balance.refund(consumed_days)
+            touched = balance
+        req.audit["refund_on_reject"] = consumed_days
+
+    req.status = RequestStatus.REJECTED
+    req.audit["rejected_by"] = admin_id
+    req.audit["reject_reason"] = reason
+    return touched
+
+
+def _balance_key(req: TimeOffRequest) -> Tuple[str, int]:
+    return req.user_id, req.start_date.year
+
+
+def _row(request_id: str, success: bool, status: Optional[str], message: str) -> dict:
+    return {"request_id": request_id, "success": success, "status": status, "message": message}
@@ -0,0 +1,29 @@
+"""Ausencias del equipo para el calendario"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterator, Optional
+
+
+@dataclass
+class TeamAbsence:
+    """
+    Solicitud de días (pendiente o aprobada) vista desde el calendario del
+    equipo. Es un modelo de lectura: no pasa por las reglas de creación de
+    TimeOffRequest (ventana de 48h), así que sirve para ausencias en curso.
+    """
+    request_id: str
+    user_id: str
+    type: str
+    status: str
+    start_date: date
+    end_date: date
+    full_name: Optional[str] = None
+    role: Optional[str] = None
+
+    def days_within(self, start: date, end: date) -> Iterator[date]:
+        """Días de la ausencia que caen dentro de [start, end]"""
+        day = max(self.start_date, start)
+        last = min(self.end_date, end)
+        while day <= last:
+            yield day
+            day += timedelta(days=1)
@@ -1,7 +1,7 @@
 """Inputs GraphQL para solicitudes (time off y swap)"""
 import strawberry
-from typing import Optional
-from datetime import datetime
+from typing import List, Optional
+from datetime import datetime, date
 
 @strawberry.input
 class RequestTimeOffInput:
@@ -23,6 +23,12 @@ class RejectTimeOffInput:
     request_id: str
     reason: str
 
+@strawberry.input
+class ReviewTimeOffRequestsInput:
+    request_ids: List[str]
+    approve: bool
+    reason: Optional[str] = None  # obligatorio al rechazar
+
 @strawberry.input
 class ProposeShiftSwapInput:
     requester_shift_id: str
@@ -35,3 +41,10 @@ class RespondShiftSwapInput:
     swap_id: str
     accept: bool
     note: Optional[str] = None
+
+@strawberry.input
+class TeamAbsenceCalendarInput:
+    start_date: date
+    end_date: date
+    user_ids: Optional[List[str]] = None
+    role: Optional[str] = None   # p. ej. "cook" para ver solo a cocina
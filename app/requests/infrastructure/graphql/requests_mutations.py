@@ -7,12 +7,13 @@ from app.building_blocks.exceptions import DomainException, AuthenticationExcept
 
 from app.requests.infrastructure.graphql.requests_inputs import (
     RequestTimeOffInput, CancelTimeOffInput,
-    ApproveTimeOffInput, RejectTimeOffInput,
+    ApproveTimeOffInput, RejectTimeOffInput, ReviewTimeOffRequestsInput,
     ProposeShiftSwapInput, RespondShiftSwapInput
 )
 from app.requests.infrastructure.graphql.requests_types import (
     RequestTimeOffResponse, CancelTimeOffResponse,
     ApproveTimeOffResponse, RejectTimeOffResponse,
+    ReviewTimeOffRequestsResponse, TimeOffReviewRowResult,
     ProposeShiftSwapResponse, RespondShiftSwapResponse,
     TimeOffRequestInfo, ShiftSwapInfo
 )
@@ -30,24 +31,25 @@ from app.requests.application.use_cases.approve_time_off import (
 from app.requests.application.use_cases.reject_time_off import (
     RejectTimeOffUseCase, RejectTimeOffCommand
 )
+from app.requests.application.use_cases.review_time_off_requests import (
+    ReviewTimeOffRequestsUseCase, ReviewTimeOffRequestsCommand
+)
 from app.requests.application.use_cases.propose_shift_swap import (
     ProposeShiftSwapUseCase, ProposeShiftSwapCommand
 )
 from app.requests.application.use_cases.respond_shift_swap import (
     RespondShiftSwapUseCase, RespondShiftSwapCommand
 )
+from app.shared.security.permissions import Permission, requires
 
 
 @strawberry.type
 class RequestsMutations:
 
     # ----- Time off -----
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def request_time_off(self, info: Info, input: RequestTimeOffInput) -> RequestTimeOffResponse:
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
 
             cmd = RequestTimeOffCommand(
@@ -59,9 +61,8 @@ class RequestsMutations:
             )
 
             use_case = RequestTimeOffUseCase(
-                time_off_repository=info.context["time_off_repository"],
-                vacation_balance_repository=info.context["vacation_balance_repository"],
-                user_repository=info.context["user_repository"]
+                request_repository=info.context["time_off_repository"],
+                balance_repository=info.context["vacation_balance_repository"]
             )
             result = await use_case.execute(cmd)
 
@@ -85,55 +86,39 @@ class RequestsMutations:
         except (DomainException, AuthenticationException) as e:
             return RequestTimeOffResponse(success=False, message=str(e))
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def cancel_time_off(self, info: Info, input: CancelTimeOffInput) -> CancelTimeOffResponse:
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
-
             user = info.context["current_user"]
             cmd = CancelTimeOffCommand(request_id=input.request_id, user_id=user.id)
             use_case = CancelTimeOffUseCase(
-                time_off_repository=info.context["time_off_repository"],
-                vacation_balance_repository=info.context["vacation_balance_repository"]
+                request_repository=info.context["time_off_repository"],
+                balance_repository=info.context["vacation_balance_repository"]
             )
             result = await use_case.execute(cmd)
             return CancelTimeOffResponse(success=True, message=result["message"])
         except (DomainException, AuthenticationException) as e:
             return CancelTimeOffResponse(success=False, message=str(e))
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.TIME_OFF_APPROVE))
     async def approve_time_off(self, info: Info, input: ApproveTimeOffInput) -> ApproveTimeOffResponse:
         try:
-            user = info.context.get("current_user")
-            if not user:
-                raise AuthenticationException("Debes estar autenticado")
-
-            # Autorización admin (igual a attendance.regularize)
-            from app.users.domain.user_role import UserRole
-            if user.role != UserRole.ADMIN:
-                raise AuthenticationException("Solo administradores pueden aprobar solicitudes")
+            user = info.context["current_user"]
 
             cmd = ApproveTimeOffCommand(request_id=input.request_id, admin_id=user.id)
             use_case = ApproveTimeOffUseCase(
-                time_off_repository=info.context["time_off_repository"],
-                vacation_balance_repository=info.context["vacation_balance_repository"]
+                request_repository=info.context["time_off_repository"],
+                balance_repository=info.context["vacation_balance_repository"]
             )
             result = await use_case.execute(cmd)
             return ApproveTimeOffResponse(success=True, message=result["message"])
         except (DomainException, AuthenticationException) as e:
             return ApproveTimeOffResponse(success=False, message=str(e))
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.TIME_OFF_APPROVE))
     async def reject_time_off(self, info: Info, input: RejectTimeOffInput) -> RejectTimeOffResponse:
         try:
-            user = info.context.get("current_user")
-            if not user:
-                raise AuthenticationException("Debes estar autenticado")
-
-            from app.users.domain.user_role import UserRole
-            if user.role != UserRole.ADMIN:
-                raise AuthenticationException("Solo administradores pueden rechazar solicitudes")
+            user = info.context["current_user"]
 
             cmd = RejectTimeOffCommand(
                 request_id=input.request_id,
@@ -141,20 +126,48 @@ class RequestsMutations:
                 reason=input.reason
             )
             use_case = RejectTimeOffUseCase(
-                time_off_repository=info.context["time_off_repository"],
-                vacation_balance_repository=info.context["vacation_balance_repository"]
+                request_repository=info.context["time_off_repository"],
+                balance_repository=info.context["vacation_balance_repository"]
             )
             result = await use_case.execute(cmd)
             return RejectTimeOffResponse(success=True, message=result["message"])
         except (DomainException, AuthenticationException) as e:
             return RejectTimeOffResponse(success=False, message=str(e))
 
+    @strawberry.mutation(metadata=requires(Permission.TIME_OFF_APPROVE))
+    async def review_time_off_requests(
+        self, info: Info, input: ReviewTimeOffRequestsInput
+    ) -> ReviewTimeOffRequestsResponse:
+        """Aprueba o rechaza varias solicitudes en una sola transacción (solo admin)"""
+        try:
+            user = info.context["current_user"]
+
+            cmd = ReviewTimeOffRequestsCommand(
+                request_ids=input.request_ids,
+                admin_id=user.id,
+                approve=input.approve,
+                reason=input.reason
+            )
+            use_case = ReviewTimeOffRequestsUseCase(
+                request_repository=info.context["time_off_repository"],
+                balance_repository=info.context["vacation_balance_repository"],
+                unit_of_work=info.context["unit_of_work"]
+            )
+            result = await use_case.execute(cmd)
+            return ReviewTimeOffRequestsResponse(
+                success=result["success"],
+                message=result["message"],
+                processed=result["processed"],
+                failed=result["failed"],
+                results=[TimeOffReviewRowResult(**row) for row in result["results"]]
+            )
+        except (DomainException, AuthenticationException) as e:
+            return ReviewTimeOffRequestsResponse(success=False, message=str(e))
+
     # ----- Shift swap -----
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def propose_shift_swap(self, info: Info, input: ProposeShiftSwapInput) -> ProposeShiftSwapResponse:
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
             user = info.context["current_user"]
 
             cmd = ProposeShiftSwapCommand(
@@ -191,11 +204,9 @@ class RequestsMutations:
         except (DomainException, AuthenticationException) as e:
             return ProposeShiftSwapResponse(success=False, message=str(e))
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def respond_shift_swap(self, info: Info, input: RespondShiftSwapInput) -> RespondShiftSwapResponse:
         try:
-            if not info.context.get("current_user"):
-                raise AuthenticationException("Debes estar autenticado")
             user = info.context["current_user"]
 
             cmd = RespondShiftSwapCommand(
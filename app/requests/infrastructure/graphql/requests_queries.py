@@ -4,16 +4,22 @@ from strawberry.types import Info
 from datetime import datetime
 from app.requests.infrastructure.graphql.requests_types import (
     MyTimeOffRequestsResult, MyShiftSwapsResult, MyVacationBalanceResult,
-    TimeOffRequestInfo, ShiftSwapInfo, VacationBalanceInfo
+    TimeOffRequestInfo, ShiftSwapInfo, VacationBalanceInfo,
+    TeamAbsenceCalendarResponse, TeamAbsenceInfo, AbsenceDayCount
 )
+from app.requests.infrastructure.graphql.requests_inputs import TeamAbsenceCalendarInput
+from app.requests.application.use_cases.get_team_absences import (
+    GetTeamAbsencesUseCase, GetTeamAbsencesCommand
+)
+from app.building_blocks.exceptions import DomainException
+from app.shared.graphql.cost import cost, days_between, per_page
+from app.shared.security.permissions import Permission, requires
 
 @strawberry.type
 class RequestsQueries:
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=per_page("limit"))))
     async def my_time_off_requests(self, info: Info, limit: int = 30) -> MyTimeOffRequestsResult:
-        if not info.context.get("current_user"):
-            raise Exception("Debes estar autenticado")
         user = info.context["current_user"]
 
         # use case simple o directo al repo:
@@ -37,10 +43,8 @@ class RequestsQueries:
             ]
         )
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=per_page("limit"))))
     async def my_shift_swaps(self, info: Info, limit: int = 30) -> MyShiftSwapsResult:
-        if not info.context.get("current_user"):
-            raise Exception("Debes estar autenticado")
         user = info.context["current_user"]
 
         items = await info.context["swap_repository"].find_my_swaps(user.id, limit=limit)
@@ -63,10 +67,8 @@ class RequestsQueries:
             ]
         )
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED))
     async def my_vacation_balance(self, info: Info, year: int | None = None) -> MyVacationBalanceResult:
-        if not info.context.get("current_user"):
-            raise Exception("Debes estar autenticado")
         user = info.context["current_user"]
 
         # Año por defecto: actual (Perú / tz no afecta al año civil)
@@ -89,3 +91,38 @@ class RequestsQueries:
                 available_days=balance.available_days()
             )
         )
+
+    @strawberry.field(metadata=requires(Permission.TIME_OFF_VIEW_TEAM, metadata=cost(multiplier=days_between(unit_days=7))))
+    async def team_absence_calendar(
+        self, info: Info, input: TeamAbsenceCalendarInput
+    ) -> TeamAbsenceCalendarResponse:
+        """Ausencias (pendientes y aprobadas) del equipo y personas ausentes por día"""
+        try:
+            use_case = GetTeamAbsencesUseCase(request_repository=info.context["time_off_repository"])
+            result = await use_case.execute(GetTeamAbsencesCommand(
+                start_date=input.start_date,
+                end_date=input.end_date,
+                user_ids=input.user_ids,
+                role=input.role.lower() if input.role else None
+            ))
+        except DomainException as e:
+            return TeamAbsenceCalendarResponse(success=False, message=str(e))
+
+        return TeamAbsenceCalendarResponse(
+            success=True,
+            message="OK",
+            absences=[
+                TeamAbsenceInfo(
+                    request_id=a.request_id,
+                    user_id=a.user_id,
+                    full_name=a.full_name,
+                    role=a.role,
+                    type=a.type,
+                    status=a.status,
+                    start_date=a.start_date,
+                    end_date=a.end_date
+                )
+                for a in result["absences"]
+            ],
+            days=[AbsenceDayCount(**day) for day in result["days"]]
+        )
@@ -61,6 +61,21 @@ class RejectTimeOffResponse:
     success: bool
     message: str
 
+@strawberry.type
+class TimeOffReviewRowResult:
+    request_id: str
+    success: bool
+    status: Optional[str]
+    message: str
+
+@strawberry.type
+class ReviewTimeOffRequestsResponse:
+    success: bool
+    message: str
+    processed: int = 0
+    failed: int = 0
+    results: List[TimeOffReviewRowResult] = strawberry.field(default_factory=list)
+
 @strawberry.type
 class ProposeShiftSwapResponse:
     success: bool
@@ -87,3 +102,28 @@ class MyVacationBalanceResult:
     success: bool
     message: str
     balance: Optional[VacationBalanceInfo] = None
+
+@strawberry.type
+class TeamAbsenceInfo:
+    request_id: str
+    user_id: str
+    full_name: Optional[str]
+    role: Optional[str]
+    type: str
+    status: str
+    start_date: date
+    end_date: date
+
+@strawberry.type
+class AbsenceDayCount:
+    date: date
+    approved: int
+    pending: int
+    total: int
+
+@strawberry.type
+class TeamAbsenceCalendarResponse:
+    success: bool
+    message: str
+    absences: List[TeamAbsenceInfo] = strawberry.field(default_factory=list)
+    days: List[AbsenceDayCount] = strawberry.field(default_factory=list)
@@ -1,5 +1,5 @@
 """Implementación PostgreSQL del repositorio de TimeOffRequest"""
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from datetime import date, datetime, timezone
 import uuid
 
@@ -7,14 +7,14 @@ import sqlalchemy as sa
 from sqlalchemy import Column, String, Date, Integer, DateTime, JSON
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.requests.domain.time_off_request import TimeOffRequest
+from app.requests.domain.team_absence import TeamAbsence
 from app.requests.domain.request_status import RequestStatus, RequestType
 from app.requests.application.ports.time_off_request_repository import TimeOffRequestRepository
-
-Base = declarative_base()
+from app.users.infrastructure.persistence.user_repository_impl import UserModel
+from app.shared.database.base import Base
 
 
 class TimeOffRequestModel(Base):
@@ -101,6 +101,86 @@ class PostgreSQLTimeOffRequestRepository(TimeOffRequestRepository):
         items = result.scalars().all()
         return [self._to_domain(r) for r in items]
 
+    async def find_team_absences(
+        self,
+        start: date,
+        end: date,
+        user_ids: Optional[Sequence[str]] = None,
+        role: Optional[str] = None
+    ) -> List[TeamAbsence]:
+        """
+        Ausencias que se solapan con [start, end] para un conjunto de usuarios.
+        El filtro de solape usa la misma expresión que el índice GiST
+        idx_time_off_requests_daterange (daterange(start_date, end_date, '[]')).
+        """
+        stmt = (
+            select(
+                TimeOffRequestModel.id,
+                TimeOffRequestModel.user_id,
+                TimeOffRequestModel.type,
+                TimeOffRequestModel.status,
+                TimeOffRequestModel.start_date,
+                TimeOffRequestModel.end_date,
+                UserModel.full_name,
+                UserModel.role,
+            )
+            .join(UserModel, UserModel.id == TimeOffRequestModel.user_id)
+            .where(_date_range(TimeOffRequestModel.start_date, TimeOffRequestModel.end_date).op("&&")(
+                _date_range(sa.literal(start, sa.Date), sa.literal(end, sa.Date))
+            ))
+            .where(TimeOffRequestModel.status.in_(
+                [RequestStatus.PENDING.value, RequestStatus.APPROVED.value]
+            ))
+            .order_by(TimeOffRequestModel.start_date, UserModel.full_name)
+        )
+        if user_ids is not None:
+            stmt = stmt.where(TimeOffRequestModel.user_id.in_(_parse_uuids(user_ids)))
+        if role:
+            stmt = stmt.where(UserModel.role == role)
+
+        result = await self.session.execute(stmt)
+        return [
+            TeamAbsence(
+                request_id=str(row.id),
+                user_id=str(row.user_id),
+                type=row.type,
+                status=row.status,
+                start_date=row.start_date,
+                end_date=row.end_date,
+                full_name=row.full_name,
+                role=row.role,
+            )
+            for row in result.all()
+        ]
+
+    async def find_many_for_update(self, request_ids: Sequence[str]) -> List[TimeOffRequest]:
+        ids = _parse_uuids(request_ids)
+        if not ids:
+            return []
+
+        stmt = (
+            select(TimeOffRequestModel)
+            .where(TimeOffRequestModel.id.in_(ids))
+            .order_by(TimeOffRequestModel.id)  # Orden fijo de bloqueo: evita deadlocks entre lotes
+            .with_for_update()
+        )
+        result = await self.session.execute(stmt)
+        return [self._to_domain(r) for r in result.scalars().all()]
+
+    async def save_many(self, requests: Sequence[TimeOffRequest]) -> None:
+        if not requests:
+            return
+
+        now = datetime.now(timezone.utc)
+        # UPDATE por clave primaria en un solo executemany
+        await self.session.execute(
+            sa.update(TimeOffRequestModel),
+            [
+                {"id": uuid.UUID(req.id), "status": req.status.value, "audit": req.audit or {}, "updated_at": now}
+                for req in requests
+            ]
+        )
+
     # ---------- helpers ----------
     def _to_dict(self, req: TimeOffRequest) -> dict:
         return {
@@ -130,3 +210,18 @@ class PostgreSQLTimeOffRequestRepository(TimeOffRequestRepository):
             created_at=m.created_at,
             updated_at=m.updated_at,
         )
+
+
+def _date_range(start, end):
+    """daterange cerrado por ambos lados; el '[]' va literal para que coincida con el índice"""
+    return sa.func.daterange(start, end, sa.literal_column("'[]'"))
+
+
+def _parse_uuids(values: Sequence[str]) -> List[uuid.UUID]:
+    ids = []
+    for value in values:
+        try:
+            ids.append(uuid.UUID(str(value)))
+        except ValueError:
+            continue
+    return ids
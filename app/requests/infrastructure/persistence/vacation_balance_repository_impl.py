@@ -1,5 +1,5 @@
 """Implementación PostgreSQL del repositorio de saldos de vacaciones"""
-from typing import Optional
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 from datetime import datetime, timezone
 import uuid
 
@@ -7,13 +7,11 @@ import sqlalchemy as sa
 from sqlalchemy import Column, Integer, DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.requests.domain.vacation_balance import VacationBalance
 from app.requests.application.ports.vacation_balance_repository import VacationBalanceRepository
-
-Base = declarative_base()
+from app.shared.database.base import Base
 
 
 class VacationBalanceModel(Base):
@@ -38,7 +36,7 @@ class PostgreSQLVacationBalanceRepository(VacationBalanceRepository):
 
     async def get_for_user_year(self, user_id: str, year: int) -> Optional[VacationBalance]:
         stmt = select(VacationBalanceModel).where(
-            VacationBalanceModel.user_id == UUID(user_id),
+            VacationBalanceModel.user_id == uuid.UUID(user_id),
             VacationBalanceModel.year == year
         )
         result = await self.session.execute(stmt)
@@ -68,6 +66,75 @@ class PostgreSQLVacationBalanceRepository(VacationBalanceRepository):
         await self.session.refresh(m)
         return self._to_domain(m)
 
+    async def try_consume(self, user_id: str, year: int, days: int) -> Optional[VacationBalance]:
+        """
+        UPDATE condicional en un solo viaje a la BD:
+            used_days = used_days + :n  WHERE ... AND (total + arrastrado - usados) >= :n
+        Dos requests concurrentes no pueden sobregirar el saldo: la segunda
+        re-evalúa la condición sobre la fila ya actualizada y no la cumple.
+        """
+        if days < 1:
+            return None
+
+        table = VacationBalanceModel.__table__
+        stmt = (
+            sa.update(table)
+            .where(
+                table.c.user_id == uuid.UUID(user_id),
+                table.c.year == year,
+                table.c.total_days + table.c.carried_over_days - table.c.used_days >= days
+            )
+            .values(used_days=table.c.used_days + days, updated_at=sa.func.now())
+            .returning(table)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return self._to_domain(row) if row else None
+
+    async def refund_days(self, user_id: str, year: int, days: int) -> Optional[VacationBalance]:
+        if days < 1:
+            return None
+
+        table = VacationBalanceModel.__table__
+        stmt = (
+            sa.update(table)
+            .where(
+                table.c.user_id == uuid.UUID(user_id),
+                table.c.year == year,
+                table.c.used_days >= days
+            )
+            .values(used_days=table.c.used_days - days, updated_at=sa.func.now())
+            .returning(table)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return self._to_domain(row) if row else None
+
+    async def get_many_for_update(self, keys: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], VacationBalance]:
+        pairs = sorted({(uuid.UUID(user_id), year) for user_id, year in keys})
+        if not pairs:
+            return {}
+
+        stmt = (
+            select(VacationBalanceModel)
+            .where(sa.tuple_(VacationBalanceModel.user_id, VacationBalanceModel.year).in_(pairs))
+            .order_by(VacationBalanceModel.user_id, VacationBalanceModel.year)  # Orden fijo de bloqueo
+            .with_for_update()
+        )
+        result = await self.session.execute(stmt)
+        balances = [self._to_domain(m) for m in result.scalars().all()]
+        return {(b.user_id, b.year): b for b in balances}
+
+    async def save_many(self, balances: Sequence[VacationBalance]) -> None:
+        if not balances:
+            return
+
+        now = datetime.now(timezone.utc)
+        await self.session.execute(
+            sa.update(VacationBalanceModel),
+            [{"id": uuid.UUID(b.id), "used_days": b.used_days, "updated_at": now} for b in balances]
+        )
+
     # ---------- helpers ----------
     def _to_dict(self, b: VacationBalance) -> dict:
         return {
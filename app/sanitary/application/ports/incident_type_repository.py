@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from app.sanitary.domain.incident_type import IncidentType
@@ -12,6 +12,7 @@ class IncidentTypeRepository(ABC):
     Operaciones alineadas con tu E-R e interfaces:
       - Obtener por id.
       - Listar por política.
+      - Listar todos (catálogo completo, para la caché de referencia).
       - Guardar (crear / actualizar).
     """
 
@@ -22,6 +23,14 @@ class IncidentTypeRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(self, incident_type_ids: Iterable[UUID]) -> Dict[UUID, IncidentType]:
+        """
+        Devuelve {id: tipo de incidencia} para todos los IDs indicados,
+        en una sola consulta (los que no existen no aparecen).
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_policy(self, policy_id: UUID, only_active: bool = True) -> List[IncidentType]:
         """
@@ -31,6 +40,14 @@ class IncidentTypeRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_all(self) -> List[IncidentType]:
+        """
+        Lista todos los tipos de incidencia (activos e inactivos) de todas
+        las políticas, ordenados por nombre.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def save(self, incident_type: IncidentType) -> IncidentType:
         """
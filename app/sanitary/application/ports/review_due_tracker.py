@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+
+
+class ReviewDueTracker(ABC):
+    """
+    Puerto para avisar que una política recibió una revisión, de modo que
+    se recalcule su próxima fecha de revisión (= última + 30 días) sin
+    volver a consultar la BD.
+
+    La implementación vive en infraestructura (planificador de vencimientos).
+    """
+
+    @abstractmethod
+    def record_review(self, policy_id: UUID, review_date: date) -> None:
+        """
+        Registra una revisión de la política en la fecha indicada.
+        Si ya se conocía una revisión más reciente, no cambia nada.
+        """
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from app.sanitary.domain.sanitary_company import SanitaryCompany
@@ -23,6 +23,14 @@ class SanitaryCompanyRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(self, company_ids: Iterable[UUID]) -> Dict[UUID, SanitaryCompany]:
+        """
+        Devuelve {id: empresa} para todos los IDs indicados, en una sola consulta
+        (los que no existen no aparecen).
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_all(self) -> List[SanitaryCompany]:
         """
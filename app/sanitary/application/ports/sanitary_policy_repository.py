@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from app.sanitary.domain.sanitary_policy import SanitaryPolicy
@@ -22,6 +22,14 @@ class SanitaryPolicyRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(self, policy_ids: Iterable[UUID]) -> Dict[UUID, SanitaryPolicy]:
+        """
+        Devuelve {id: política} para todos los IDs indicados, en una sola consulta.
+        Los IDs que no existen simplemente no aparecen en el resultado.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_all(self) -> List[SanitaryPolicy]:
         """
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.sanitary.domain.sanitary_review import SanitaryReview
+from app.sanitary.domain.sanitary_analytics import NonconformityCount
+from app.sanitary.domain.sanitary_compliance import PolicyCompliance
+from app.sanitary.domain.sanitary_history import PolicyHistoryPage
 
 
 class SanitaryReviewRepository(ABC):
@@ -11,7 +14,7 @@ class SanitaryReviewRepository(ABC):
     Puerto de acceso a persistencia para las revisiones de sanidad (RevisionSanidad).
 
     Operaciones alineadas con tu E-R y las pantallas:
-      - Registrar una revisión.
+      - Registrar una revisión (o un lote, p. ej. una ronda de inspección).
       - Obtener una revisión por id (para detalles si hiciera falta).
       - Listar revisiones de una política en un rango de fechas
         (para el historial con filtros de 6m, 1 año, 2 años).
@@ -34,6 +37,15 @@ class SanitaryReviewRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, reviews: List[SanitaryReview]) -> List[SanitaryReview]:
+        """
+        Inserta varias revisiones nuevas con un solo INSERT multi-fila.
+        No hace commit: lo decide el caso de uso (una sola transacción
+        para todo el lote).
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_policy_and_period(
         self,
@@ -60,3 +72,50 @@ class SanitaryReviewRepository(ABC):
         sin necesidad de guardar ese dato en la BD.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_policy_history(
+        self,
+        policy_id: UUID,
+        start_date: date,
+        end_date: date,
+        limit: int,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> PolicyHistoryPage:
+        """
+        Historial de una política en una sola consulta:
+          - hasta `limit` revisiones en [start_date, end_date], ordenadas por
+            (fecha DESC, id DESC) y posteriores al cursor `after` (keyset)
+          - la última revisión de la política, sin importar el periodo
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_compliance_overview(
+        self,
+        start_date: date,
+        end_date: date,
+        include_inactive: bool = False,
+    ) -> List[PolicyCompliance]:
+        """
+        Estado de cumplimiento de todas las políticas en una sola consulta:
+          - última revisión de cada política (sin importar el periodo)
+          - revisiones e inconformidades dentro de [start_date, end_date]
+        Las políticas sin revisiones también aparecen (con valores vacíos).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_nonconformity_counts(
+        self,
+        start_date: date,
+        end_date: date,
+        policy_id: Optional[UUID] = None,
+        company_id: Optional[UUID] = None,
+    ) -> List[NonconformityCount]:
+        """
+        Inconformidades dentro de [start_date, end_date] agrupadas en SQL por
+        mes × política × tipo de incidencia × empresa (para las tendencias).
+        Ordenadas por mes y luego por cantidad descendente.
+        """
+        raise NotImplementedError
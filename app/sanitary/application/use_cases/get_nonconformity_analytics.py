@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from app.sanitary.application.ports.incident_type_repository import (
+    IncidentTypeRepository,
+)
+from app.sanitary.application.ports.sanitary_company_repository import (
+    SanitaryCompanyRepository,
+)
+from app.sanitary.application.ports.sanitary_policy_repository import (
+    SanitaryPolicyRepository,
+)
+from app.sanitary.application.ports.sanitary_review_repository import (
+    SanitaryReviewRepository,
+)
+from app.sanitary.domain.sanitary_analytics import analytics_period
+
+# Tope del periodo: 3 años de tendencia
+MAX_ANALYTICS_MONTHS = 36
+
+
+@dataclass
+class GetNonconformityAnalyticsCommand:
+    """
+    Comando para la analítica de inconformidades (gráficos de tendencia).
+
+      - months     -> meses calendario completos hasta hoy (12, 24...)
+      - policy_id  -> opcional, solo una política
+      - company_id -> opcional, solo una empresa
+      - today      -> fecha de referencia (por defecto, hoy)
+    """
+
+    months: int = 12
+    policy_id: Optional[UUID] = None
+    company_id: Optional[UUID] = None
+    today: Optional[date] = None
+
+
+class GetNonconformityAnalyticsUseCase:
+    """
+    Caso de uso para ver qué incidencias se repiten, en qué políticas y con
+    qué empresas, mes a mes.
+
+      - Los conteos salen agrupados de una sola consulta
+        (get_nonconformity_counts); en producción el repositorio los
+        cachea por periodo.
+      - Los nombres se resuelven con los catálogos (una consulta por tabla,
+        o la caché de referencia).
+    """
+
+    def __init__(
+        self,
+        review_repo: SanitaryReviewRepository,
+        policy_repo: SanitaryPolicyRepository,
+        incident_type_repo: IncidentTypeRepository,
+        company_repo: SanitaryCompanyRepository,
+    ) -> None:
+        self._review_repo = review_repo
+        self._policy_repo = policy_repo
+        self._incident_type_repo = incident_type_repo
+        self._company_repo = company_repo
+
+    async def execute(self, cmd: GetNonconformityAnalyticsCommand) -> Dict[str, Any]:
+        # 1) Validar el periodo
+        if cmd.months < 1 or cmd.months > MAX_ANALYTICS_MONTHS:
+            return {
+                "success": False,
+                "message": f"El periodo debe ser de 1 a {MAX_ANALYTICS_MONTHS} meses.",
+                "start_date": None,
+                "end_date": None,
+                "total": 0,
+                "items": [],
+                "monthly_totals": [],
+            }
+
+        today = cmd.today or date.today()
+        start_date, end_date = analytics_period(today, cmd.months)
+
+        # 2) Conteos agrupados (mes × política × tipo de incidencia × empresa)
+        counts = await self._review_repo.get_nonconformity_counts(
+            start_date=start_date,
+            end_date=end_date,
+            policy_id=cmd.policy_id,
+            company_id=cmd.company_id,
+        )
+
+        # 3) Resolver nombres (una consulta por catálogo)
+        policies = await self._policy_repo.get_many_by_ids({c.policy_id for c in counts})
+        incident_types = await self._incident_type_repo.get_many_by_ids(
+            {c.incident_type_id for c in counts if c.incident_type_id}
+        )
+        companies = await self._company_repo.get_many_by_ids({c.company_id for c in counts if c.company_id})
+
+        # 4) Armar la respuesta
+        items: List[Dict[str, Any]] = []
+        monthly_totals: Dict[date, int] = {}
+        for c in counts:
+            policy = policies.get(c.policy_id)
+            incident_type = incident_types.get(c.incident_type_id) if c.incident_type_id else None
+            company = companies.get(c.company_id) if c.company_id else None
+
+            items.append(
+                {
+                    "month": c.month.isoformat(),
+                    "policy_id": str(c.policy_id),
+                    "policy_name": policy.name if policy else None,
+                    "incident_type_id": str(c.incident_type_id) if c.incident_type_id else None,
+                    "incident_type_name": incident_type.name if incident_type else None,
+                    "company_id": str(c.company_id) if c.company_id else None,
+                    "company_name": company.business_name if company else None,
+                    "count": c.count,
+                }
+            )
+            monthly_totals[c.month] = monthly_totals.get(c.month, 0) + c.count
+
+        return {
+            "success": True,
+            "message": "Analítica de inconformidades obtenida correctamente.",
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "total": sum(monthly_totals.values()),
+            "items": items,
+            "monthly_totals": [
+                {"month": month.isoformat(), "count": count}
+                for month, count in sorted(monthly_totals.items())
+            ],
+        }
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Any, List, Optional
+
+from app.sanitary.application.ports.sanitary_review_repository import (
+    SanitaryReviewRepository,
+)
+from app.sanitary.domain.sanitary_history import period_start
+
+
+@dataclass
+class GetSanitaryComplianceOverviewCommand:
+    """
+    Comando para el tablero de cumplimiento de sanidad.
+
+      - months_back    -> periodo para contar revisiones e inconformidades
+                          (6, 12, 24 meses, igual que el historial)
+      - upcoming_days  -> cuántos días antes del vencimiento se marca
+                          una política como 'por vencer'
+      - today          -> fecha de referencia (por defecto, hoy)
+    """
+
+    months_back: int = 6
+    upcoming_days: int = 7
+    include_inactive: bool = False
+    today: Optional[date] = None
+
+
+class GetSanitaryComplianceOverviewUseCase:
+    """
+    Caso de uso para la pantalla de listado de políticas con su estado:
+
+      - Última revisión y si fue conforme.
+      - Próxima revisión (= última + 30 días) y si está vencida o por vencer.
+      - Revisiones e inconformidades en el periodo.
+
+    Reemplaza llamar al historial política por política: todo sale de
+    una sola consulta (get_compliance_overview).
+    """
+
+    def __init__(self, review_repo: SanitaryReviewRepository) -> None:
+        self._review_repo = review_repo
+
+    async def execute(self, cmd: GetSanitaryComplianceOverviewCommand) -> Dict[str, Any]:
+        # 1) Periodo en meses calendario (mismo cálculo que el historial de una política)
+        today = cmd.today or date.today()
+        start_date = period_start(today, cmd.months_back)
+
+        # 2) Estado de todas las políticas en una sola consulta
+        rows = await self._review_repo.get_compliance_overview(
+            start_date=start_date,
+            end_date=today,
+            include_inactive=cmd.include_inactive,
+        )
+
+        # 3) Derivar próxima revisión / vencimiento
+        items: List[Dict[str, Any]] = []
+        overdue = upcoming = 0
+        for row in rows:
+            next_date = row.next_review_date
+            is_overdue = row.is_overdue(today)
+            is_upcoming = (
+                not is_overdue
+                and next_date is not None
+                and (next_date - today).days <= cmd.upcoming_days
+            )
+            overdue += int(is_overdue)
+            upcoming += int(is_upcoming)
+
+            items.append(
+                {
+                    "policy": {
+                        "id": str(row.policy_id),
+                        "name": row.policy_name,
+                        "description": row.policy_description,
+                        "is_active": row.is_active,
+                    },
+                    "last_review_date": row.last_review_date.isoformat() if row.last_review_date else None,
+                    "last_review_is_conform": row.last_review_is_conform,
+                    "next_review_date": next_date.isoformat() if next_date else None,
+                    "days_until_due": (next_date - today).days if next_date else None,
+                    "is_overdue": is_overdue,
+                    "is_upcoming": is_upcoming,
+                    "reviews_in_period": row.reviews_in_period,
+                    "nonconformities_in_period": row.nonconformities_in_period,
+                }
+            )
+
+        # 4) Armar respuesta
+        return {
+            "success": True,
+            "message": "Estado de cumplimiento obtenido correctamente.",
+            "start_date": start_date.isoformat(),
+            "end_date": today.isoformat(),
+            "overdue_count": overdue,
+            "upcoming_count": upcoming,
+            "items": items,
+        }
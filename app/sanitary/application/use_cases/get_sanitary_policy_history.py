@@ -1,6 +1,7 @@
+import base64
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 
 from app.sanitary.application.ports.sanitary_policy_repository import (
@@ -9,6 +10,11 @@ from app.sanitary.application.ports.sanitary_policy_repository import (
 from app.sanitary.application.ports.sanitary_review_repository import (
     SanitaryReviewRepository,
 )
+from app.sanitary.domain.sanitary_compliance import REVIEW_INTERVAL_DAYS
+from app.sanitary.domain.sanitary_history import period_start
+
+# Tamaño de página máximo permitido
+MAX_HISTORY_PAGE_SIZE = 100
 
 
 @dataclass
@@ -24,6 +30,9 @@ class GetSanitaryPolicyHistoryCommand:
 
     policy_id: UUID
     months_back: int  # 6, 12, 24, etc.
+    first: int = 50  # Revisiones por página
+    after: Optional[str] = None  # Cursor opaco devuelto en la página anterior
+    today: Optional[date] = None  # Fecha de referencia (por defecto, hoy)
 
 
 class GetSanitaryPolicyHistoryUseCase:
@@ -32,10 +41,14 @@ class GetSanitaryPolicyHistoryUseCase:
     de una política:
 
       - Datos básicos de la política.
-      - Historial de revisiones en un periodo (6m, 1 año, 2 años).
+      - Historial de revisiones en un periodo (6m, 1 año, 2 años), en meses
+        calendario y paginado por keyset (fecha DESC, id DESC).
       - Fecha de la última revisión.
       - Próxima revisión (= última + 30 días) si existe alguna.
 
+    El historial y la última revisión salen de una sola consulta
+    (get_policy_history); la política se lee del catálogo.
+
     *No añadimos ningún campo nuevo a la BD; todo se calcula a partir de las revisiones.*
     """
 
@@ -48,39 +61,43 @@ class GetSanitaryPolicyHistoryUseCase:
         self._review_repo = review_repo
 
     async def execute(self, cmd: GetSanitaryPolicyHistoryCommand) -> Dict[str, Any]:
-        # 1) Validar que la política exista
+        # 1) Validar parámetros
+        if cmd.months_back < 1:
+            return _failure("El periodo debe ser de al menos 1 mes.")
+        if cmd.first < 1 or cmd.first > MAX_HISTORY_PAGE_SIZE:
+            return _failure(f"El tamaño de página debe estar entre 1 y {MAX_HISTORY_PAGE_SIZE}.")
+
+        after = None
+        if cmd.after:
+            after = decode_cursor(cmd.after)
+            if after is None:
+                return _failure("Cursor inválido.")
+
+        # 2) Validar que la política exista
         policy = await self._policy_repo.get_by_id(cmd.policy_id)
         if not policy:
-            return {
-                "success": False,
-                "message": "La política de sanidad seleccionada no existe.",
-                "policy": None,
-                "history": [],
-                "last_review_date": None,
-                "next_review_date": None,
-            }
-
-        # 2) Calcular rango de fechas del historial
-        today = date.today()
-
-        # months_back lo convertimos a días aproximados (30 días por mes),
-        # suficiente para el filtro de historial 6m, 1 año, 2 años.
-        days_back = cmd.months_back * 30
-        start_date = today - timedelta(days=days_back)
-        end_date = today
-
-        # 3) Obtener historial en ese rango
-        reviews = await self._review_repo.list_by_policy_and_period(
+            return _failure("La política de sanidad seleccionada no existe.")
+
+        # 3) Rango de fechas del historial en meses calendario
+        end_date = cmd.today or date.today()
+        start_date = period_start(end_date, cmd.months_back)
+
+        # 4) Página del historial + última revisión (una sola consulta).
+        #    Se pide un registro extra para saber si hay más páginas.
+        page = await self._review_repo.get_policy_history(
             policy_id=cmd.policy_id,
             start_date=start_date,
             end_date=end_date,
+            limit=cmd.first + 1,
+            after=after,
         )
 
-        # 4) Obtener última revisión (para calcular próxima)
-        last_review = await self._review_repo.get_last_by_policy(cmd.policy_id)
-        if last_review:
-            last_review_date = last_review.date
-            next_review_date = last_review_date + timedelta(days=30)
+        reviews = page.reviews[:cmd.first]
+        has_more = len(page.reviews) > cmd.first
+
+        if page.last_review:
+            last_review_date = page.last_review.date
+            next_review_date = last_review_date + timedelta(days=REVIEW_INTERVAL_DAYS)
         else:
             last_review_date = None
             next_review_date = None
@@ -100,6 +117,7 @@ class GetSanitaryPolicyHistoryUseCase:
             )
 
         # 6) Armar respuesta
+        last = reviews[-1] if reviews else None
         return {
             "success": True,
             "message": "Historial de la política obtenido correctamente.",
@@ -110,6 +128,39 @@ class GetSanitaryPolicyHistoryUseCase:
                 "is_active": policy.is_active,
             },
             "history": history,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
             "last_review_date": last_review_date.isoformat() if last_review_date else None,
             "next_review_date": next_review_date.isoformat() if next_review_date else None,
+            "has_more": has_more,
+            "next_cursor": encode_cursor(last.date, last.id) if last and has_more else None,
         }
+
+
+def encode_cursor(cursor_date: date, review_id: UUID) -> str:
+    """Codifica (fecha, id) como cursor opaco"""
+    raw = f"{cursor_date.isoformat()}|{review_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[date, UUID]]:
+    """Decodifica el cursor opaco a (fecha, id); None si es inválido"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        cursor_date, review_id = raw.split("|", 1)
+        return date.fromisoformat(cursor_date), UUID(review_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _failure(message: str) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "message": message,
+        "policy": None,
+        "history": [],
+        "last_review_date": None,
+        "next_review_date": None,
+        "has_more": False,
+        "next_cursor": None,
+    }
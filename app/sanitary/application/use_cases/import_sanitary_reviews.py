@@ -0,0 +1,264 @@
+import csv
+import io
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.sanitary.application.use_cases.register_sanitary_reviews import (
+    MAX_REVIEWS_PER_BATCH,
+    RegisterSanitaryReviewsCommand,
+    RegisterSanitaryReviewsUseCase,
+    SanitaryReviewItem,
+    _result,
+    _row_error,
+)
+from app.shared.excel.workbook import get_load_workbook
+
+REQUIRED_COLUMNS = ("policy", "date", "result")
+
+# Encabezados aceptados en la planilla del auditor -> columna interna
+COLUMN_ALIASES = {
+    "POLICY": "policy",
+    "POLITICA": "policy",
+    "DATE": "date",
+    "FECHA": "date",
+    "RESULT": "result",
+    "RESULTADO": "result",
+    "INCIDENT_TYPE": "incident_type",
+    "TIPO_INCIDENCIA": "incident_type",
+    "TIPO DE INCIDENCIA": "incident_type",
+    "COMPANY": "company",
+    "EMPRESA": "company",
+    "RUC": "company",
+    "OBSERVATION": "observation",
+    "OBSERVACION": "observation",
+}
+
+CONFORM_VALUES = {"CONFORME", "CONFORM", "SI", "TRUE", "1"}
+NON_CONFORM_VALUES = {"INCONFORME", "NO CONFORME", "NON_CONFORM", "NO", "FALSE", "0"}
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+
+@dataclass
+class ImportSanitaryReviewsCommand:
+    """
+    Comando para importar una ronda de inspección desde un archivo (.csv / .xlsx).
+
+    Columnas: política, fecha, resultado (Conforme / Inconforme) y, si es
+    inconforme, tipo de incidencia y empresa (razón social o RUC).
+    Las referencias pueden venir por nombre o por ID.
+    """
+
+    filename: str
+    content: bytes
+    user_id: UUID
+    dry_run: bool = False  # Solo validar el archivo
+
+
+class ImportSanitaryReviewsUseCase(RegisterSanitaryReviewsUseCase):
+    """
+    Caso de uso para importar revisiones de sanidad desde CSV/XLSX.
+
+      - El archivo se lee y valida completo en memoria.
+      - Los catálogos (políticas, tipos de incidencia, empresas) se cargan
+        una vez cada uno para resolver los nombres del archivo.
+      - El registro es el mismo que el del lote: errores por fila, todo o
+        nada, INSERT multi-fila en una transacción.
+    """
+
+    async def execute(self, cmd: ImportSanitaryReviewsCommand) -> Dict[str, Any]:
+        # 1) Leer el archivo
+        try:
+            rows = parse_reviews_file(cmd.filename, cmd.content)
+        except ValueError as e:
+            return _result(False, str(e))
+
+        if not rows:
+            return _result(False, "El archivo no contiene revisiones para importar.")
+        if len(rows) > MAX_REVIEWS_PER_BATCH:
+            return _result(False, f"No se pueden importar más de {MAX_REVIEWS_PER_BATCH} revisiones a la vez.")
+
+        # 2) Cargar los catálogos (una consulta por tabla)
+        policies = {p.id: p for p in await self._policy_repo.list_all()}
+        incident_types = {t.id: t for t in await self._incident_type_repo.list_all()}
+        companies = {c.id: c for c in await self._company_repo.list_all()}
+
+        # Los tipos de incidencia se buscan dentro de su política (los nombres se repiten)
+        policy_lookup = _index((None, p.id, p.name) for p in policies.values())
+        incident_lookup = _index((t.policy_id, t.id, t.name) for t in incident_types.values())
+        company_lookup = _index(
+            (None, c.id, name) for c in companies.values() for name in (c.business_name, c.ruc)
+        )
+
+        # 3) Resolver nombres -> IDs
+        items: List[SanitaryReviewItem] = []
+        errors: List[Dict[str, Any]] = []
+        for row_number, row in rows:
+            try:
+                items.append(_to_item(row_number, row, policy_lookup, incident_lookup, company_lookup))
+            except ValueError as e:
+                errors.append(_row_error(row_number, str(e)))
+
+        # 4) Validar y registrar igual que un lote
+        return await self._register(
+            RegisterSanitaryReviewsCommand(items=items, user_id=cmd.user_id, dry_run=cmd.dry_run, errors=errors),
+            policies,
+            incident_types,
+            companies,
+        )
+
+
+def _to_item(
+    row_number: int,
+    row: Dict[str, str],
+    policy_lookup: Dict[Tuple[Optional[UUID], str], UUID],
+    incident_lookup: Dict[Tuple[Optional[UUID], str], UUID],
+    company_lookup: Dict[Tuple[Optional[UUID], str], UUID],
+) -> SanitaryReviewItem:
+    missing = [c for c in REQUIRED_COLUMNS if not row.get(c)]
+    if missing:
+        raise ValueError(f"Faltan campos obligatorios: {', '.join(missing)}")
+
+    policy_id = _resolve(row["policy"], policy_lookup)
+    if policy_id is None:
+        raise ValueError(f"La política '{row['policy']}' no existe.")
+
+    is_conform = _parse_result(row["result"])
+    incident_type_id = company_id = None
+
+    if not is_conform:
+        if row.get("incident_type"):
+            incident_type_id = _resolve(row["incident_type"], incident_lookup, scope=policy_id)
+            if incident_type_id is None:
+                raise ValueError(
+                    f"El tipo de incidencia '{row['incident_type']}' no existe para la política seleccionada."
+                )
+        if row.get("company"):
+            company_id = _resolve(row["company"], company_lookup)
+            if company_id is None:
+                raise ValueError(f"La empresa '{row['company']}' no existe.")
+
+    return SanitaryReviewItem(
+        row=row_number,
+        policy_id=policy_id,
+        date=_parse_date(row["date"]),
+        is_conform=is_conform,
+        observation=row.get("observation") or None,
+        incident_type_id=incident_type_id,
+        company_id=company_id,
+    )
+
+
+def _index(entries) -> Dict[Tuple[Optional[UUID], str], UUID]:
+    """Índice {(ámbito, id o nombre normalizado): id} para resolver las referencias del archivo"""
+    lookup: Dict[Tuple[Optional[UUID], str], UUID] = {}
+    for scope, item_id, name in entries:
+        lookup[(scope, str(item_id))] = item_id
+        if name:
+            lookup[(scope, _normalize(name))] = item_id
+    return lookup
+
+
+def _resolve(
+    value: str,
+    lookup: Dict[Tuple[Optional[UUID], str], UUID],
+    scope: Optional[UUID] = None,
+) -> Optional[UUID]:
+    try:
+        key = str(UUID(value))
+    except ValueError:
+        key = _normalize(value)
+    return lookup.get((scope, key))
+
+
+def _parse_result(value: str) -> bool:
+    normalized = _normalize(value)
+    if normalized in CONFORM_VALUES:
+        return True
+    if normalized in NON_CONFORM_VALUES:
+        return False
+    raise ValueError(f"Resultado inválido: {value} (use Conforme o Inconforme)")
+
+
+def _parse_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Fecha inválida: {value} (use AAAA-MM-DD o DD/MM/AAAA)")
+
+
+def parse_reviews_file(filename: str, content: bytes) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Lee un .csv o .xlsx y devuelve [(número de fila, {columna: valor})].
+    La fila 1 es la cabecera; las filas vacías se ignoran.
+    """
+    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+    if ext == "csv":
+        text = content.decode("utf-8-sig")
+        sample = text[:2048]
+        delimiter = ";" if sample.count(";") > sample.count(",") else ","
+        raw_rows = list(csv.reader(io.StringIO(text), delimiter=delimiter))
+    elif ext in {"xlsx", "xlsm"}:
+        load_workbook = get_load_workbook()
+        if load_workbook is None:
+            raise ValueError("No está instalado 'openpyxl' en el servidor para leer archivos Excel.")
+        wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        ws = wb.worksheets[0]
+        raw_rows = [list(r) for r in ws.iter_rows(values_only=True)]
+        wb.close()
+    else:
+        raise ValueError("Solo se soportan archivos .csv y .xlsx")
+
+    if not raw_rows:
+        return []
+
+    header = [COLUMN_ALIASES.get(_normalize(h)) for h in raw_rows[0]]
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
+    if missing:
+        raise ValueError(f"Faltan columnas en el archivo: {', '.join(missing)}")
+
+    rows = []
+    for row_number, raw in enumerate(raw_rows[1:], start=2):
+        values = {
+            column: _clean_cell(value)
+            for column, value in zip(header, raw)
+            if column
+        }
+        if not any(values.values()):
+            continue
+        rows.append((row_number, values))
+
+    return rows
+
+
+def _normalize(value: Any) -> str:
+    if value is None:
+        return ""
+    text = " ".join(str(value).strip().upper().replace("-", "_").split())
+    # quitar acentos
+    return "".join(
+        c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn"
+    )
+
+
+def _clean_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    # Excel entrega las fechas como datetime: se conservan para _parse_date
+    if isinstance(value, (date, datetime)):
+        return value
+    # RUC guardado como número: 20123456789.0 -> "20123456789"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
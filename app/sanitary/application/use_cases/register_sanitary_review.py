@@ -15,6 +15,7 @@ from app.sanitary.application.ports.sanitary_review_repository import (
 from app.sanitary.application.ports.sanitary_company_repository import (
     SanitaryCompanyRepository,
 )
+from app.sanitary.application.ports.review_due_tracker import ReviewDueTracker
 from app.sanitary.domain.sanitary_review import SanitaryReview
 
 
@@ -65,11 +66,13 @@ class RegisterSanitaryReviewUseCase:
         incident_type_repo: IncidentTypeRepository,
         review_repo: SanitaryReviewRepository,
         company_repo: SanitaryCompanyRepository,
+        due_tracker: Optional[ReviewDueTracker] = None,
     ) -> None:
         self._policy_repo = policy_repo
         self._incident_type_repo = incident_type_repo
         self._review_repo = review_repo
         self._company_repo = company_repo
+        self._due_tracker = due_tracker
 
     async def execute(self, cmd: RegisterSanitaryReviewCommand) -> Dict[str, Any]:
         # 1) Validar que la política exista
@@ -145,6 +148,10 @@ class RegisterSanitaryReviewUseCase:
         # 3) Guardar la revisión
         saved = await self._review_repo.save(review)
 
+        # 3.1) Reprogramar el aviso de la próxima revisión (sin consultar la BD)
+        if self._due_tracker:
+            self._due_tracker.record_review(saved.policy_id, saved.date)
+
         # 4) Respuesta estándar (igual estilo que swaps / otros módulos)
         return {
             "success": True,
@@ -0,0 +1,267 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.building_blocks.unit_of_work import UnitOfWork
+from app.sanitary.application.ports.sanitary_policy_repository import (
+    SanitaryPolicyRepository,
+)
+from app.sanitary.application.ports.incident_type_repository import (
+    IncidentTypeRepository,
+)
+from app.sanitary.application.ports.sanitary_review_repository import (
+    SanitaryReviewRepository,
+)
+from app.sanitary.application.ports.sanitary_company_repository import (
+    SanitaryCompanyRepository,
+)
+from app.sanitary.application.ports.review_due_tracker import ReviewDueTracker
+from app.sanitary.domain.incident_type import IncidentType
+from app.sanitary.domain.sanitary_company import SanitaryCompany
+from app.sanitary.domain.sanitary_policy import SanitaryPolicy
+from app.sanitary.domain.sanitary_review import SanitaryReview
+
+# Límite por lote: una ronda de inspección cabe de sobra
+MAX_REVIEWS_PER_BATCH = 500
+
+
+@dataclass
+class SanitaryReviewItem:
+    """
+    Una revisión dentro de un lote.
+
+    `row` identifica la fila en los errores: posición en la lista (desde 1)
+    o número de fila del archivo importado.
+    """
+
+    row: int
+    policy_id: Optional[UUID]
+    date: Optional[date]
+    is_conform: bool
+
+    observation: Optional[str] = None
+    incident_type_id: Optional[UUID] = None
+    company_id: Optional[UUID] = None
+
+
+@dataclass
+class RegisterSanitaryReviewsCommand:
+    """
+    Comando para registrar varias revisiones de sanidad a la vez
+    (p. ej. una ronda de inspección que el auditor sube al terminar).
+    """
+
+    items: List[SanitaryReviewItem]
+    user_id: UUID
+    dry_run: bool = False  # Solo validar, sin registrar nada
+    errors: List[Dict[str, Any]] = field(default_factory=list)  # Errores previos (p. ej. al leer el archivo)
+
+
+class RegisterSanitaryReviewsUseCase:
+    """
+    Caso de uso para registrar un lote de revisiones de sanidad.
+
+    Mismas reglas que RegisterSanitaryReviewUseCase, pero:
+      - Una consulta por tabla de referencia (políticas, tipos de
+        incidencia, empresas) para todos los IDs del lote, en vez de
+        hasta tres consultas por revisión.
+      - Las reglas se validan en memoria y los errores se reportan por fila.
+      - Si alguna fila tiene errores no se registra ninguna revisión
+        (todo o nada): el auditor corrige y vuelve a enviar sin duplicar.
+      - Las revisiones válidas se insertan con un solo INSERT multi-fila
+        dentro de una transacción.
+    """
+
+    def __init__(
+        self,
+        policy_repo: SanitaryPolicyRepository,
+        incident_type_repo: IncidentTypeRepository,
+        review_repo: SanitaryReviewRepository,
+        company_repo: SanitaryCompanyRepository,
+        unit_of_work: UnitOfWork,
+        due_tracker: Optional[ReviewDueTracker] = None,
+    ) -> None:
+        self._policy_repo = policy_repo
+        self._incident_type_repo = incident_type_repo
+        self._review_repo = review_repo
+        self._company_repo = company_repo
+        self._unit_of_work = unit_of_work
+        self._due_tracker = due_tracker
+
+    async def execute(self, cmd: RegisterSanitaryReviewsCommand) -> Dict[str, Any]:
+        # 1) Validar el tamaño del lote
+        row_count = len(cmd.items) + len({e["row"] for e in cmd.errors})
+        if row_count == 0:
+            return _result(False, "Debe indicar al menos una revisión.")
+        if row_count > MAX_REVIEWS_PER_BATCH:
+            return _result(False, f"No se pueden registrar más de {MAX_REVIEWS_PER_BATCH} revisiones a la vez.")
+
+        # 2) Cargar las referencias de todo el lote (una consulta por tabla)
+        policies = await self._policy_repo.get_many_by_ids(
+            {item.policy_id for item in cmd.items if item.policy_id}
+        )
+        incident_types = await self._incident_type_repo.get_many_by_ids(
+            {item.incident_type_id for item in cmd.items if item.incident_type_id and not item.is_conform}
+        )
+        companies = await self._company_repo.get_many_by_ids(
+            {item.company_id for item in cmd.items if item.company_id and not item.is_conform}
+        )
+
+        return await self._register(cmd, policies, incident_types, companies)
+
+    async def _register(
+        self,
+        cmd: RegisterSanitaryReviewsCommand,
+        policies: Dict[UUID, SanitaryPolicy],
+        incident_types: Dict[UUID, IncidentType],
+        companies: Dict[UUID, SanitaryCompany],
+    ) -> Dict[str, Any]:
+        # 3) Validar cada fila en memoria
+        reviews, errors = build_reviews(cmd.items, cmd.user_id, policies, incident_types, companies)
+        errors = sorted([*cmd.errors, *errors], key=lambda e: e["row"])
+
+        if errors or cmd.dry_run:
+            error_rows = {e["row"] for e in errors}
+            valid_count = sum(1 for row, _ in reviews if row not in error_rows)
+            return _result(
+                not errors,
+                (
+                    f"Se encontraron {len(errors)} errores; no se registró ninguna revisión."
+                    if errors else f"Lote válido: {valid_count} revisiones listas para registrar."
+                ),
+                valid_count=valid_count,
+                errors=errors,
+            )
+
+        # 4) Guardar todo en una sola transacción (INSERT multi-fila)
+        new_reviews = [review for _, review in reviews]
+        try:
+            await self._review_repo.add_many(new_reviews)
+            await self._unit_of_work.commit()
+        except Exception:
+            await self._unit_of_work.rollback()
+            raise
+
+        if self._due_tracker:
+            for review in new_reviews:
+                self._due_tracker.record_review(review.policy_id, review.date)
+
+        # 5) Respuesta estándar
+        return _result(
+            True,
+            f"{len(new_reviews)} revisiones de sanidad registradas correctamente.",
+            created_count=len(new_reviews),
+            valid_count=len(new_reviews),
+            reviews=[_review_to_dict(review) for review in new_reviews],
+        )
+
+
+def build_reviews(
+    items: List[SanitaryReviewItem],
+    user_id: UUID,
+    policies: Dict[UUID, SanitaryPolicy],
+    incident_types: Dict[UUID, IncidentType],
+    companies: Dict[UUID, SanitaryCompany],
+) -> Tuple[List[Tuple[int, SanitaryReview]], List[Dict[str, Any]]]:
+    """
+    Aplica las reglas de RegisterSanitaryReviewUseCase a cada fila con las
+    referencias ya cargadas. Retorna ([(fila, revisión)], [errores por fila]).
+    """
+    reviews: List[Tuple[int, SanitaryReview]] = []
+    errors: List[Dict[str, Any]] = []
+    seen: Dict[Tuple[UUID, date], int] = {}
+
+    for item in items:
+        if item.policy_id is None or item.date is None:
+            errors.append(_row_error(item.row, "Debe indicar la política y la fecha de la revisión."))
+            continue
+
+        # La política debe existir
+        if item.policy_id not in policies:
+            errors.append(_row_error(item.row, "La política de sanidad seleccionada no existe."))
+            continue
+
+        # Una política se revisa una sola vez por fecha dentro del lote
+        key = (item.policy_id, item.date)
+        if key in seen:
+            errors.append(_row_error(item.row, f"Revisión repetida en el lote (fila {seen[key]})."))
+            continue
+
+        if item.is_conform:
+            review = SanitaryReview.create_conform(
+                policy_id=item.policy_id,
+                user_id=user_id,
+                date_value=item.date,
+                observation=item.observation,
+            )
+        else:
+            message = _non_conform_error(item, incident_types, companies)
+            if message:
+                errors.append(_row_error(item.row, message))
+                continue
+
+            review = SanitaryReview.create_non_conform(
+                policy_id=item.policy_id,
+                user_id=user_id,
+                date_value=item.date,
+                incident_type_id=item.incident_type_id,
+                company_id=item.company_id,
+                observation=item.observation,
+            )
+
+        seen[key] = item.row
+        reviews.append((item.row, review))
+
+    return reviews, errors
+
+
+def _non_conform_error(
+    item: SanitaryReviewItem,
+    incident_types: Dict[UUID, IncidentType],
+    companies: Dict[UUID, SanitaryCompany],
+) -> Optional[str]:
+    if item.incident_type_id is None:
+        return "Debe seleccionar un tipo de incidencia para una revisión inconforme."
+    if item.company_id is None:
+        return "Debe seleccionar una empresa a contactar para una revisión inconforme."
+
+    incident_type = incident_types.get(item.incident_type_id)
+    if not incident_type:
+        return "El tipo de incidencia seleccionado no existe."
+    if incident_type.policy_id != item.policy_id:
+        return "El tipo de incidencia no pertenece a la política seleccionada."
+
+    if item.company_id not in companies:
+        return "La empresa seleccionada no existe."
+    return None
+
+
+def _review_to_dict(review: SanitaryReview) -> Dict[str, Any]:
+    return {
+        "id": str(review.id),
+        "policy_id": str(review.policy_id),
+        "user_id": str(review.user_id),
+        "date": review.date.isoformat(),
+        "is_conform": review.is_conform,
+        "observation": review.observation,
+        "incident_type_id": str(review.incident_type_id) if review.incident_type_id else None,
+        "company_id": str(review.company_id) if review.company_id else None,
+    }
+
+
+def _row_error(row: int, message: str) -> Dict[str, Any]:
+    return {"row": row, "message": message}
+
+
+def _result(success: bool, message: str, **extra) -> Dict[str, Any]:
+    result = {
+        "success": success,
+        "message": message,
+        "created_count": 0,
+        "valid_count": 0,
+        "errors": [],
+        "reviews": [],
+    }
+    result.update(extra)
+    return result
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+from uuid import UUID
+
+from dateutil.relativedelta import relativedelta
+
+
+def analytics_period(today: date, months: int) -> Tuple[date, date]:
+    """
+    Periodo de 'months' meses calendario completos hasta 'today', alineado
+    al día 1 para que el primer mes del gráfico no quede recortado.
+
+    Ej.: 12 meses hasta el 2026-02-20 -> [2025-03-01, 2026-02-20].
+    """
+    start = (today - relativedelta(months=months - 1)).replace(day=1)
+    return start, today
+
+
+@dataclass(frozen=True)
+class NonconformityCount:
+    """
+    Cantidad de inconformidades de un mes para una combinación
+    política × tipo de incidencia × empresa (modelo de lectura).
+
+    Se calcula en SQL (GROUP BY date_trunc('month', date), ...) sobre las
+    revisiones inconformes; los nombres se resuelven con los catálogos.
+    """
+
+    month: date
+    policy_id: UUID
+    incident_type_id: Optional[UUID]
+    company_id: Optional[UUID]
+    count: int
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+from uuid import UUID
+
+# Cada política se revisa cada 30 días (próxima = última + 30 días)
+REVIEW_INTERVAL_DAYS = 30
+
+
+@dataclass
+class PolicyCompliance:
+    """
+    Estado de cumplimiento de una política de sanidad (modelo de lectura).
+
+    Se calcula en una sola consulta para todas las políticas:
+      - última revisión (fecha y si fue conforme)
+      - cantidad de revisiones e inconformidades en el periodo consultado
+    La próxima revisión y el vencimiento se derivan de la última fecha,
+    igual que en el historial de la política.
+    """
+
+    policy_id: UUID
+    policy_name: str
+    policy_description: Optional[str]
+    is_active: bool
+
+    last_review_date: Optional[date] = None
+    last_review_is_conform: Optional[bool] = None
+
+    reviews_in_period: int = 0
+    nonconformities_in_period: int = 0
+
+    @property
+    def next_review_date(self) -> Optional[date]:
+        if self.last_review_date is None:
+            return None
+        return self.last_review_date + timedelta(days=REVIEW_INTERVAL_DAYS)
+
+    def is_overdue(self, today: date) -> bool:
+        """Vencida si nunca se revisó o si la próxima revisión ya pasó"""
+        next_date = self.next_review_date
+        return next_date is None or next_date < today
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional
+
+from dateutil.relativedelta import relativedelta
+
+from app.sanitary.domain.sanitary_review import SanitaryReview
+
+
+def period_start(today: date, months_back: int) -> date:
+    """
+    Inicio del periodo de 'months_back' meses calendario hasta 'today'.
+
+    Ej.: 24 meses antes del 2026-02-28 es el 2024-02-28 (con 30 días por
+    mes serían 720 días y se perderían ~10 días del periodo). Si el día no
+    existe en el mes de destino se usa el último día del mes (31/08 - 6
+    meses = 28/02 o 29/02).
+    """
+    return today - relativedelta(months=months_back)
+
+
+@dataclass
+class PolicyHistoryPage:
+    """
+    Página del historial de una política (modelo de lectura).
+
+    Se obtiene en una sola consulta:
+      - reviews: revisiones del periodo, ordenadas por (fecha DESC, id DESC)
+      - last_review: última revisión de la política, aunque sea anterior
+        al periodo (para calcular la próxima)
+    """
+
+    reviews: List[SanitaryReview] = field(default_factory=list)
+    last_review: Optional[SanitaryReview] = None
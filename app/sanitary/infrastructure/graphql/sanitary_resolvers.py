@@ -1,5 +1,8 @@
+import base64
+import binascii
 import datetime
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
@@ -12,10 +15,27 @@ from app.sanitary.application.use_cases.get_sanitary_policy_history import (
     GetSanitaryPolicyHistoryUseCase,
     GetSanitaryPolicyHistoryCommand,
 )
+from app.sanitary.application.use_cases.get_sanitary_compliance_overview import (
+    GetSanitaryComplianceOverviewUseCase,
+    GetSanitaryComplianceOverviewCommand,
+)
+from app.sanitary.application.use_cases.get_nonconformity_analytics import (
+    GetNonconformityAnalyticsUseCase,
+    GetNonconformityAnalyticsCommand,
+)
 from app.sanitary.application.use_cases.register_sanitary_review import (
     RegisterSanitaryReviewUseCase,
     RegisterSanitaryReviewCommand,
 )
+from app.sanitary.application.use_cases.register_sanitary_reviews import (
+    RegisterSanitaryReviewsUseCase,
+    RegisterSanitaryReviewsCommand,
+    SanitaryReviewItem,
+)
+from app.sanitary.application.use_cases.import_sanitary_reviews import (
+    ImportSanitaryReviewsUseCase,
+    ImportSanitaryReviewsCommand,
+)
 
 from app.sanitary.infrastructure.graphql.sanitary_types import (
     SanitaryPolicyType,
@@ -27,7 +47,18 @@ from app.sanitary.infrastructure.graphql.sanitary_types import (
     SanitaryPoliciesResponse,
     SanitaryPolicyHistoryResponse,
     RegisterSanitaryReviewResponse,
+    RegisterSanitaryReviewsInput,
+    ImportSanitaryReviewsInput,
+    RegisterSanitaryReviewsResponse,
+    SanitaryReviewRowError,
+    SanitaryPolicyComplianceType,
+    SanitaryComplianceOverviewResponse,
+    SanitaryNonconformityCountType,
+    SanitaryMonthlyNonconformityType,
+    SanitaryNonconformityAnalyticsResponse,
 )
+from app.shared.graphql.cost import by_arg, cost
+from app.shared.security.permissions import Permission, requires
 
 
 # =========================
@@ -56,6 +87,26 @@ def _map_review_dict_to_type(r: dict) -> SanitaryReviewType:
     )
 
 
+def _parse_optional_date(value):
+    return datetime.date.fromisoformat(value) if value else None
+
+
+def _parse_optional_uuid(value):
+    """None si no viene; ValueError si no es un UUID válido"""
+    return UUID(str(value)) if value else None
+
+
+def _map_batch_result(result: dict) -> RegisterSanitaryReviewsResponse:
+    return RegisterSanitaryReviewsResponse(
+        success=result["success"],
+        message=result["message"],
+        created_count=result["created_count"],
+        valid_count=result["valid_count"],
+        errors=[SanitaryReviewRowError(row=e["row"], message=e["message"]) for e in result["errors"]],
+        reviews=[_map_review_dict_to_type(r) for r in result["reviews"]],
+    )
+
+
 # =========================
 # Queries
 # =========================
@@ -84,7 +135,7 @@ class SanitaryQueries:
             policies=policies,
         )
 
-    @strawberry.field
+    @strawberry.field(metadata=cost(multiplier=by_arg("months_back", 6, input_name="filter")))
     async def sanitary_policy_history(
         self,
         info: Info,
@@ -93,18 +144,32 @@ class SanitaryQueries:
         """
         Historial de una política de sanidad, con:
           - datos básicos de la política
-          - lista de revisiones en el periodo (6m, 1 año, 2 años)
+          - lista de revisiones en el periodo (6m, 1 año, 2 años), paginada
           - última fecha de revisión
           - próxima revisión (= última + 30 días)
         """
         policy_repo = info.context["sanitary_policy_repository"]
         review_repo = info.context["sanitary_review_repository"]
 
+        try:
+            policy_id = UUID(str(filter.policy_id))
+        except ValueError:
+            return SanitaryPolicyHistoryResponse(
+                success=False,
+                message="La política de sanidad seleccionada no existe.",
+                policy=None,
+                history=[],
+                last_review_date=None,
+                next_review_date=None,
+            )
+
         uc = GetSanitaryPolicyHistoryUseCase(policy_repo, review_repo)
 
         cmd = GetSanitaryPolicyHistoryCommand(
-            policy_id=filter.policy_id,
+            policy_id=policy_id,
             months_back=filter.months_back,
+            first=filter.first,
+            after=filter.after,
         )
         result = await uc.execute(cmd)
 
@@ -141,6 +206,123 @@ class SanitaryQueries:
             history=history_types,
             last_review_date=last_review_date,
             next_review_date=next_review_date,
+            has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
+        )
+
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=by_arg("months_back", 6))))
+    async def sanitary_compliance_overview(
+        self,
+        info: Info,
+        months_back: int = 6,
+        upcoming_days: int = 7,
+    ) -> SanitaryComplianceOverviewResponse:
+        """
+        Tablero de cumplimiento: todas las políticas activas con su última
+        y próxima revisión, si están vencidas y las inconformidades del
+        periodo. Una sola consulta para todas las políticas.
+        """
+        review_repo = info.context["sanitary_review_repository"]
+
+        uc = GetSanitaryComplianceOverviewUseCase(review_repo)
+        result = await uc.execute(
+            GetSanitaryComplianceOverviewCommand(
+                months_back=months_back,
+                upcoming_days=upcoming_days,
+            )
+        )
+
+        items = [
+            SanitaryPolicyComplianceType(
+                policy=_map_policy_dict_to_type(item["policy"]),
+                last_review_date=_parse_optional_date(item["last_review_date"]),
+                last_review_is_conform=item["last_review_is_conform"],
+                next_review_date=_parse_optional_date(item["next_review_date"]),
+                days_until_due=item["days_until_due"],
+                is_overdue=item["is_overdue"],
+                is_upcoming=item["is_upcoming"],
+                reviews_in_period=item["reviews_in_period"],
+                nonconformities_in_period=item["nonconformities_in_period"],
+            )
+            for item in result["items"]
+        ]
+
+        return SanitaryComplianceOverviewResponse(
+            success=result["success"],
+            message=result["message"],
+            start_date=datetime.date.fromisoformat(result["start_date"]),
+            end_date=datetime.date.fromisoformat(result["end_date"]),
+            overdue_count=result["overdue_count"],
+            upcoming_count=result["upcoming_count"],
+            items=items,
+        )
+
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=by_arg("months", 12))))
+    async def sanitary_nonconformity_analytics(
+        self,
+        info: Info,
+        months: int = 12,
+        policy_id: Optional[strawberry.ID] = None,
+        company_id: Optional[strawberry.ID] = None,
+    ) -> SanitaryNonconformityAnalyticsResponse:
+        """
+        Tendencia de inconformidades: cantidad por mes × política × tipo de
+        incidencia × empresa (qué incidencias se repiten y dónde).
+        Agrupado en SQL y cacheado por periodo.
+        """
+        try:
+            cmd = GetNonconformityAnalyticsCommand(
+                months=months,
+                policy_id=_parse_optional_uuid(policy_id),
+                company_id=_parse_optional_uuid(company_id),
+            )
+        except ValueError:
+            return SanitaryNonconformityAnalyticsResponse(
+                success=False,
+                message="ID de política o empresa inválido.",
+                start_date=None,
+                end_date=None,
+                total=0,
+                items=[],
+                monthly_totals=[],
+            )
+
+        uc = GetNonconformityAnalyticsUseCase(
+            review_repo=info.context["sanitary_review_repository"],
+            policy_repo=info.context["sanitary_policy_repository"],
+            incident_type_repo=info.context["incident_type_repository"],
+            company_repo=info.context["sanitary_company_repository"],
+        )
+        result = await uc.execute(cmd)
+
+        items = [
+            SanitaryNonconformityCountType(
+                month=datetime.date.fromisoformat(item["month"]),
+                policy_id=strawberry.ID(item["policy_id"]),
+                policy_name=item["policy_name"],
+                incident_type_id=strawberry.ID(item["incident_type_id"]) if item["incident_type_id"] else None,
+                incident_type_name=item["incident_type_name"],
+                company_id=strawberry.ID(item["company_id"]) if item["company_id"] else None,
+                company_name=item["company_name"],
+                count=item["count"],
+            )
+            for item in result["items"]
+        ]
+
+        return SanitaryNonconformityAnalyticsResponse(
+            success=result["success"],
+            message=result["message"],
+            start_date=_parse_optional_date(result["start_date"]),
+            end_date=_parse_optional_date(result["end_date"]),
+            total=result["total"],
+            items=items,
+            monthly_totals=[
+                SanitaryMonthlyNonconformityType(
+                    month=datetime.date.fromisoformat(m["month"]),
+                    count=m["count"],
+                )
+                for m in result["monthly_totals"]
+            ],
         )
 
     @strawberry.field
@@ -198,7 +380,7 @@ class SanitaryMutations:
     Root de mutations relacionadas con el módulo de sanidad.
     """
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def register_sanitary_review(
         self,
         info: Info,
@@ -214,18 +396,13 @@ class SanitaryMutations:
         company_repo = info.context["sanitary_company_repository"]
 
         current_user = info.context["current_user"]
-        if current_user is None:
-            return RegisterSanitaryReviewResponse(
-                success=False,
-                message="Usuario no autenticado.",
-                review=None,
-            )
 
         uc = RegisterSanitaryReviewUseCase(
             policy_repo=policy_repo,
             incident_type_repo=incident_type_repo,
             review_repo=review_repo,
             company_repo=company_repo,
+            due_tracker=info.context.get("sanitary_due_tracker"),
         )
 
         cmd = RegisterSanitaryReviewCommand(
@@ -254,3 +431,83 @@ class SanitaryMutations:
             message=result["message"],
             review=review_type,
         )
+
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED, metadata=cost(base=20)))
+    async def register_sanitary_reviews(
+        self,
+        info: Info,
+        input: RegisterSanitaryReviewsInput,
+    ) -> RegisterSanitaryReviewsResponse:
+        """
+        Registra varias revisiones de sanidad en una sola operación
+        (una ronda de inspección). Los errores se devuelven por fila
+        (1 = primera revisión de la lista).
+        """
+        current_user = info.context["current_user"]
+
+        items = []
+        errors = []
+        for row, review in enumerate(input.reviews, start=1):
+            try:
+                items.append(SanitaryReviewItem(
+                    row=row,
+                    policy_id=_parse_optional_uuid(review.policy_id),
+                    date=review.date,
+                    is_conform=review.is_conform,
+                    observation=review.observation,
+                    incident_type_id=_parse_optional_uuid(review.incident_type_id),
+                    company_id=_parse_optional_uuid(review.company_id),
+                ))
+            except ValueError:
+                errors.append({"row": row, "message": "ID inválido en la revisión."})
+
+        uc = RegisterSanitaryReviewsUseCase(
+            policy_repo=info.context["sanitary_policy_repository"],
+            incident_type_repo=info.context["incident_type_repository"],
+            review_repo=info.context["sanitary_review_repository"],
+            company_repo=info.context["sanitary_company_repository"],
+            unit_of_work=info.context["unit_of_work"],
+            due_tracker=info.context.get("sanitary_due_tracker"),
+        )
+
+        result = await uc.execute(RegisterSanitaryReviewsCommand(
+            items=items,
+            user_id=UUID(str(current_user.id)),
+            dry_run=input.dry_run,
+            errors=errors,
+        ))
+        return _map_batch_result(result)
+
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED, metadata=cost(base=50)))
+    async def import_sanitary_reviews(
+        self,
+        info: Info,
+        input: ImportSanitaryReviewsInput,
+    ) -> RegisterSanitaryReviewsResponse:
+        """
+        Importa una ronda de inspección desde un archivo CSV/XLSX.
+        Si alguna fila es inválida no se registra ninguna revisión.
+        """
+        current_user = info.context["current_user"]
+
+        try:
+            content = base64.b64decode(input.file_base64, validate=True)
+        except (binascii.Error, ValueError):
+            return RegisterSanitaryReviewsResponse(success=False, message="El archivo no es un base64 válido")
+
+        uc = ImportSanitaryReviewsUseCase(
+            policy_repo=info.context["sanitary_policy_repository"],
+            incident_type_repo=info.context["incident_type_repository"],
+            review_repo=info.context["sanitary_review_repository"],
+            company_repo=info.context["sanitary_company_repository"],
+            unit_of_work=info.context["unit_of_work"],
+            due_tracker=info.context.get("sanitary_due_tracker"),
+        )
+
+        result = await uc.execute(ImportSanitaryReviewsCommand(
+            filename=input.filename,
+            content=content,
+            user_id=UUID(str(current_user.id)),
+            dry_run=input.dry_run,
+        ))
+        return _map_batch_result(result)
@@ -87,16 +87,85 @@ class RegisterSanitaryReviewInput:
     company_id: Optional[strawberry.ID] = None
 
 
+@strawberry.input
+class RegisterSanitaryReviewsInput:
+    """
+    Input para registrar varias revisiones a la vez (ronda de inspección).
+    Si alguna es inválida no se registra ninguna.
+    """
+
+    reviews: List[RegisterSanitaryReviewInput]
+    dry_run: bool = False  # Solo validar
+
+
+@strawberry.input
+class ImportSanitaryReviewsInput:
+    """
+    Input para importar revisiones desde la planilla del auditor.
+
+    Columnas: Politica, Fecha, Resultado (Conforme / Inconforme),
+    Tipo de incidencia, Empresa (razón social o RUC), Observacion.
+    """
+
+    filename: str  # .csv o .xlsx
+    file_base64: str
+    dry_run: bool = False  # Solo validar el archivo
+
+
 @strawberry.input
 class SanitaryPolicyHistoryFilterInput:
     """
     Filtro para obtener el historial de una política.
 
-    months_back: 6, 12, 24 (6 meses, 1 año, 2 años)
+    months_back: 6, 12, 24 (6 meses, 1 año, 2 años), en meses calendario.
+    first / after: paginación por cursor (after = next_cursor de la página anterior).
     """
 
     policy_id: strawberry.ID
     months_back: int  # 6, 12, 24, etc.
+    first: int = 50
+    after: Optional[str] = None
+
+
+@strawberry.type
+class SanitaryPolicyComplianceType:
+    """
+    Estado de cumplimiento de una política (tablero de sanidad):
+    última revisión, próxima revisión y conteos del periodo.
+    """
+
+    policy: SanitaryPolicyType
+    last_review_date: Optional[datetime.date]
+    last_review_is_conform: Optional[bool]
+    next_review_date: Optional[datetime.date]
+    days_until_due: Optional[int]
+    is_overdue: bool
+    is_upcoming: bool
+    reviews_in_period: int
+    nonconformities_in_period: int
+
+
+@strawberry.type
+class SanitaryNonconformityCountType:
+    """
+    Inconformidades de un mes para una política, tipo de incidencia y
+    empresa (una celda de los gráficos de tendencia).
+    """
+
+    month: datetime.date  # Primer día del mes
+    policy_id: strawberry.ID
+    policy_name: Optional[str]
+    incident_type_id: Optional[strawberry.ID]
+    incident_type_name: Optional[str]
+    company_id: Optional[strawberry.ID]
+    company_name: Optional[str]
+    count: int
+
+
+@strawberry.type
+class SanitaryMonthlyNonconformityType:
+    month: datetime.date
+    count: int
 
 
 # =========================
@@ -118,6 +187,8 @@ class SanitaryPolicyHistoryResponse:
     history: List[SanitaryReviewType]
     last_review_date: Optional[datetime.date]
     next_review_date: Optional[datetime.date]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 @strawberry.type
@@ -125,3 +196,42 @@ class RegisterSanitaryReviewResponse:
     success: bool
     message: str
     review: Optional[SanitaryReviewType]
+
+
+@strawberry.type
+class SanitaryReviewRowError:
+    """Error de validación de una revisión del lote (o fila del archivo)"""
+    row: int
+    message: str
+
+
+@strawberry.type
+class RegisterSanitaryReviewsResponse:
+    success: bool
+    message: str
+    created_count: int = 0
+    valid_count: int = 0
+    errors: List[SanitaryReviewRowError] = strawberry.field(default_factory=list)
+    reviews: List[SanitaryReviewType] = strawberry.field(default_factory=list)
+
+
+@strawberry.type
+class SanitaryComplianceOverviewResponse:
+    success: bool
+    message: str
+    start_date: datetime.date
+    end_date: datetime.date
+    overdue_count: int
+    upcoming_count: int
+    items: List[SanitaryPolicyComplianceType]
+
+
+@strawberry.type
+class SanitaryNonconformityAnalyticsResponse:
+    success: bool
+    message: str
+    start_date: Optional[datetime.date]
+    end_date: Optional[datetime.date]
+    total: int
+    items: List[SanitaryNonconformityCountType]
+    monthly_totals: List[SanitaryMonthlyNonconformityType]
@@ -0,0 +1,200 @@
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.sanitary.application.ports.incident_type_repository import (
+    IncidentTypeRepository,
+)
+from app.sanitary.application.ports.sanitary_company_repository import (
+    SanitaryCompanyRepository,
+)
+from app.sanitary.application.ports.sanitary_policy_repository import (
+    SanitaryPolicyRepository,
+)
+from app.sanitary.domain.incident_type import IncidentType
+from app.sanitary.domain.sanitary_company import SanitaryCompany
+from app.sanitary.domain.sanitary_policy import SanitaryPolicy
+from app.shared.cache.reference_data import ReferenceDataCache
+
+# Claves de la caché de referencia (una por catálogo)
+POLICIES_CACHE_KEY = "sanitary:policies"
+INCIDENT_TYPES_CACHE_KEY = "sanitary:incident_types"
+COMPANIES_CACHE_KEY = "sanitary:companies"
+
+
+def _as_uuid(value) -> Optional[UUID]:
+    """Los resolvers a veces pasan el ID como string (strawberry.ID)"""
+    if value is None or isinstance(value, UUID):
+        return value
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _pick(by_id: dict, ids: Iterable) -> dict:
+    """Copias de los elementos pedidos que existen en el catálogo"""
+    picked = {}
+    for raw_id in ids:
+        item = by_id.get(_as_uuid(raw_id))
+        if item is not None:
+            picked[item.id] = copy(item)
+    return picked
+
+
+class _InvalidateOnCommit:
+    """
+    Invalida la clave de un catálogo tras una escritura (que solo hace flush):
+
+    - en el momento, solo en este worker, para que ninguna carga en curso
+      se instale
+    - y otra vez tras el commit de la sesión, avisando a los demás workers:
+      una carga que leyó la BD entre el flush y el commit tampoco queda en
+      la caché
+    """
+
+    def __init__(self, cache: ReferenceDataCache, session: AsyncSession, key: str) -> None:
+        self._cache = cache
+        self._session = session
+        self._key = key
+        self._pending = False
+
+    def __call__(self) -> None:
+        self._cache.invalidate(self._key, publish=False)
+        if not self._pending:
+            event.listen(self._session.sync_session, "after_commit", self._after_commit, once=True)
+            self._pending = True
+
+    def _after_commit(self, _session) -> None:
+        self._pending = False
+        self._cache.invalidate(self._key)
+
+
+@dataclass
+class _Catalog:
+    """Snapshot de un catálogo: lista ordenada por nombre + índice por id"""
+    items: list
+    by_id: dict = field(default_factory=dict)
+    by_policy: Dict[UUID, list] = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, items: list) -> "_Catalog":
+        catalog = cls(items=list(items), by_id={item.id: item for item in items})
+        for item in items:
+            policy_id = getattr(item, "policy_id", None)
+            if policy_id is not None:
+                catalog.by_policy.setdefault(policy_id, []).append(item)
+        return catalog
+
+
+class CachedSanitaryPolicyRepository(SanitaryPolicyRepository):
+    """
+    Decorador de SanitaryPolicyRepository que lee las políticas desde la
+    caché de referencia del proceso. Las escrituras van a la BD e invalidan
+    el catálogo (otra vez tras el commit de la sesión).
+
+    Se devuelven copias: el catálogo cacheado nunca se modifica desde fuera.
+    """
+
+    def __init__(self, delegate: SanitaryPolicyRepository, cache: ReferenceDataCache, session: AsyncSession) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._invalidate = _InvalidateOnCommit(cache, session, POLICIES_CACHE_KEY)
+
+    async def _catalog(self) -> _Catalog:
+        async def load() -> _Catalog:
+            return _Catalog.of(await self._delegate.list_all())
+
+        return await self._cache.get(POLICIES_CACHE_KEY, load)
+
+    async def get_by_id(self, policy_id: UUID) -> Optional[SanitaryPolicy]:
+        policy = (await self._catalog()).by_id.get(_as_uuid(policy_id))
+        return copy(policy) if policy else None
+
+    async def get_many_by_ids(self, policy_ids: Iterable[UUID]) -> Dict[UUID, SanitaryPolicy]:
+        return _pick((await self._catalog()).by_id, policy_ids)
+
+    async def list_all(self) -> List[SanitaryPolicy]:
+        return [copy(p) for p in (await self._catalog()).items]
+
+    async def list_active(self) -> List[SanitaryPolicy]:
+        return [copy(p) for p in (await self._catalog()).items if p.is_active]
+
+    async def save(self, policy: SanitaryPolicy) -> SanitaryPolicy:
+        saved = await self._delegate.save(policy)
+        self._invalidate()
+        return saved
+
+
+class CachedIncidentTypeRepository(IncidentTypeRepository):
+    """
+    Decorador de IncidentTypeRepository: el catálogo completo se carga una
+    vez y se indexa por id y por política (combo de la UI al marcar
+    'Inconforme').
+    """
+
+    def __init__(self, delegate: IncidentTypeRepository, cache: ReferenceDataCache, session: AsyncSession) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._invalidate = _InvalidateOnCommit(cache, session, INCIDENT_TYPES_CACHE_KEY)
+
+    async def _catalog(self) -> _Catalog:
+        async def load() -> _Catalog:
+            return _Catalog.of(await self._delegate.list_all())
+
+        return await self._cache.get(INCIDENT_TYPES_CACHE_KEY, load)
+
+    async def get_by_id(self, incident_type_id: UUID) -> Optional[IncidentType]:
+        incident_type = (await self._catalog()).by_id.get(_as_uuid(incident_type_id))
+        return copy(incident_type) if incident_type else None
+
+    async def get_many_by_ids(self, incident_type_ids: Iterable[UUID]) -> Dict[UUID, IncidentType]:
+        return _pick((await self._catalog()).by_id, incident_type_ids)
+
+    async def list_by_policy(self, policy_id: UUID, only_active: bool = True) -> List[IncidentType]:
+        incident_types = (await self._catalog()).by_policy.get(_as_uuid(policy_id), [])
+        return [copy(t) for t in incident_types if t.is_active or not only_active]
+
+    async def list_all(self) -> List[IncidentType]:
+        return [copy(t) for t in (await self._catalog()).items]
+
+    async def save(self, incident_type: IncidentType) -> IncidentType:
+        saved = await self._delegate.save(incident_type)
+        self._invalidate()
+        return saved
+
+
+class CachedSanitaryCompanyRepository(SanitaryCompanyRepository):
+    """
+    Decorador de SanitaryCompanyRepository (combo 'Empresa a contactar').
+    """
+
+    def __init__(self, delegate: SanitaryCompanyRepository, cache: ReferenceDataCache, session: AsyncSession) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._invalidate = _InvalidateOnCommit(cache, session, COMPANIES_CACHE_KEY)
+
+    async def _catalog(self) -> _Catalog:
+        async def load() -> _Catalog:
+            return _Catalog.of(await self._delegate.list_all())
+
+        return await self._cache.get(COMPANIES_CACHE_KEY, load)
+
+    async def get_by_id(self, company_id: UUID) -> Optional[SanitaryCompany]:
+        company = (await self._catalog()).by_id.get(_as_uuid(company_id))
+        return copy(company) if company else None
+
+    async def get_many_by_ids(self, company_ids: Iterable[UUID]) -> Dict[UUID, SanitaryCompany]:
+        return _pick((await self._catalog()).by_id, company_ids)
+
+    async def list_all(self) -> List[SanitaryCompany]:
+        return [copy(c) for c in (await self._catalog()).items]
+
+    async def save(self, company: SanitaryCompany) -> SanitaryCompany:
+        saved = await self._delegate.save(company)
+        self._invalidate()
+        return saved
@@ -0,0 +1,143 @@
+from datetime import date
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.sanitary.application.ports.sanitary_company_repository import (
+    SanitaryCompanyRepository,
+)
+from app.sanitary.application.ports.sanitary_policy_repository import (
+    SanitaryPolicyRepository,
+)
+from app.sanitary.application.ports.sanitary_review_repository import (
+    SanitaryReviewRepository,
+)
+from app.sanitary.domain.sanitary_analytics import NonconformityCount
+from app.sanitary.domain.sanitary_compliance import PolicyCompliance
+from app.sanitary.domain.sanitary_history import PolicyHistoryPage
+from app.sanitary.domain.sanitary_review import SanitaryReview
+from app.shared.cache.query_results import QueryResultCache
+
+# Prefijo de la analítica de inconformidades (una clave por periodo y filtros)
+NONCONFORMITY_CACHE_PREFIX = "sanitary:nonconformity:"
+
+
+def nonconformity_cache_key(
+    start_date: date,
+    end_date: date,
+    policy_id: Optional[UUID] = None,
+    company_id: Optional[UUID] = None,
+) -> str:
+    return (
+        f"{NONCONFORMITY_CACHE_PREFIX}{start_date.isoformat()}:{end_date.isoformat()}"
+        f":{policy_id or '*'}:{company_id or '*'}"
+    )
+
+
+class CachedSanitaryReviewRepository(SanitaryReviewRepository):
+    """
+    Decorador de SanitaryReviewRepository que cachea la analítica de
+    inconformidades por periodo en su propia caché acotada.
+
+    - Las revisiones y el historial se leen siempre de la BD
+    - Solo se cachea si los filtros (política, empresa) existen en los
+      catálogos: IDs inventados van directo a la BD y no ocupan entradas
+    - Registrar una revisión (o un lote) invalida toda la analítica en el
+      momento y otra vez tras el commit de la sesión, avisando a los demás
+      workers: una carga que leyó la BD antes del commit no queda instalada
+    """
+
+    def __init__(
+        self,
+        delegate: SanitaryReviewRepository,
+        cache: QueryResultCache,
+        session: AsyncSession,
+        policy_repo: SanitaryPolicyRepository,
+        company_repo: SanitaryCompanyRepository,
+    ) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._session = session
+        self._policy_repo = policy_repo
+        self._company_repo = company_repo
+        self._pending = False
+
+    async def get_by_id(self, review_id: UUID) -> Optional[SanitaryReview]:
+        return await self._delegate.get_by_id(review_id)
+
+    async def save(self, review: SanitaryReview) -> SanitaryReview:
+        saved = await self._delegate.save(review)
+        self._invalidate_on_commit()
+        return saved
+
+    async def add_many(self, reviews: List[SanitaryReview]) -> List[SanitaryReview]:
+        added = await self._delegate.add_many(reviews)
+        self._invalidate_on_commit()
+        return added
+
+    def _invalidate_on_commit(self) -> None:
+        self._cache.invalidate(publish=False)
+        if not self._pending:
+            event.listen(self._session.sync_session, "after_commit", self._after_commit, once=True)
+            self._pending = True
+
+    def _after_commit(self, _session) -> None:
+        self._pending = False
+        self._cache.invalidate()
+
+    async def list_by_policy_and_period(
+        self,
+        policy_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> List[SanitaryReview]:
+        return await self._delegate.list_by_policy_and_period(policy_id, start_date, end_date)
+
+    async def get_last_by_policy(self, policy_id: UUID) -> Optional[SanitaryReview]:
+        return await self._delegate.get_last_by_policy(policy_id)
+
+    async def get_policy_history(
+        self,
+        policy_id: UUID,
+        start_date: date,
+        end_date: date,
+        limit: int,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> PolicyHistoryPage:
+        return await self._delegate.get_policy_history(policy_id, start_date, end_date, limit, after)
+
+    async def get_compliance_overview(
+        self,
+        start_date: date,
+        end_date: date,
+        include_inactive: bool = False,
+    ) -> List[PolicyCompliance]:
+        return await self._delegate.get_compliance_overview(start_date, end_date, include_inactive)
+
+    async def get_nonconformity_counts(
+        self,
+        start_date: date,
+        end_date: date,
+        policy_id: Optional[UUID] = None,
+        company_id: Optional[UUID] = None,
+    ) -> List[NonconformityCount]:
+        # Los filtros se resuelven con los catálogos (en memoria); uno desconocido no se cachea
+        if policy_id is not None:
+            policy = await self._policy_repo.get_by_id(policy_id)
+            if policy is None:
+                return await self._delegate.get_nonconformity_counts(start_date, end_date, policy_id, company_id)
+            policy_id = policy.id
+        if company_id is not None:
+            company = await self._company_repo.get_by_id(company_id)
+            if company is None:
+                return await self._delegate.get_nonconformity_counts(start_date, end_date, policy_id, company_id)
+            company_id = company.id
+
+        async def load() -> Tuple[NonconformityCount, ...]:
+            return tuple(await self._delegate.get_nonconformity_counts(start_date, end_date, policy_id, company_id))
+
+        key = nonconformity_cache_key(start_date, end_date, policy_id, company_id)
+        # NonconformityCount es inmutable: basta con copiar la lista
+        return list(await self._cache.get(key, load))
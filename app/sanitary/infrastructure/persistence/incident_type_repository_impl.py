@@ -1,18 +1,18 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Mapped, mapped_column, declarative_base
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.sanitary.application.ports.incident_type_repository import (
     IncidentTypeRepository,
 )
 from app.sanitary.domain.incident_type import IncidentType
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class IncidentTypeModel(Base):
     """
@@ -90,6 +90,15 @@ class PostgreSQLIncidentTypeRepository(IncidentTypeRepository):
             return None
         return self._to_domain(model)
 
+    async def get_many_by_ids(self, incident_type_ids: Iterable[UUID]) -> Dict[UUID, IncidentType]:
+        ids = set(incident_type_ids)
+        if not ids:
+            return {}
+
+        stmt = select(IncidentTypeModel).where(IncidentTypeModel.id.in_(ids))
+        result = await self._session.execute(stmt)
+        return {m.id: self._to_domain(m) for m in result.scalars().all()}
+
     async def list_by_policy(self, policy_id: UUID, only_active: bool = True) -> List[IncidentType]:
         stmt = select(IncidentTypeModel).where(IncidentTypeModel.policy_id == policy_id)
 
@@ -102,6 +111,12 @@ class PostgreSQLIncidentTypeRepository(IncidentTypeRepository):
         models = result.scalars().all()
         return [self._to_domain(m) for m in models]
 
+    async def list_all(self) -> List[IncidentType]:
+        stmt = select(IncidentTypeModel).order_by(IncidentTypeModel.name.asc())
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [self._to_domain(m) for m in models]
+
     async def save(self, incident_type: IncidentType) -> IncidentType:
         """
         Crea o actualiza un tipo de incidencia.
@@ -1,18 +1,18 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Mapped, mapped_column, declarative_base
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.sanitary.application.ports.sanitary_company_repository import (
     SanitaryCompanyRepository,
 )
 from app.sanitary.domain.sanitary_company import SanitaryCompany
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class SanitaryCompanyModel(Base):
     """
@@ -85,6 +85,15 @@ class PostgreSQLSanitaryCompanyRepository(SanitaryCompanyRepository):
             return None
         return self._to_domain(model)
 
+    async def get_many_by_ids(self, company_ids: Iterable[UUID]) -> Dict[UUID, SanitaryCompany]:
+        ids = set(company_ids)
+        if not ids:
+            return {}
+
+        stmt = select(SanitaryCompanyModel).where(SanitaryCompanyModel.id.in_(ids))
+        result = await self._session.execute(stmt)
+        return {m.id: self._to_domain(m) for m in result.scalars().all()}
+
     async def list_all(self) -> List[SanitaryCompany]:
         """
         Lista todas las empresas disponibles para ser contactadas.
@@ -1,18 +1,18 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Mapped, mapped_column, declarative_base
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.sanitary.application.ports.sanitary_policy_repository import (
     SanitaryPolicyRepository,
 )
 from app.sanitary.domain.sanitary_policy import SanitaryPolicy
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class SanitaryPolicyModel(Base):
     """
@@ -76,6 +76,15 @@ class PostgreSQLSanitaryPolicyRepository(SanitaryPolicyRepository):
             return None
         return self._to_domain(model)
 
+    async def get_many_by_ids(self, policy_ids: Iterable[UUID]) -> Dict[UUID, SanitaryPolicy]:
+        ids = set(policy_ids)
+        if not ids:
+            return {}
+
+        stmt = select(SanitaryPolicyModel).where(SanitaryPolicyModel.id.in_(ids))
+        result = await self._session.execute(stmt)
+        return {m.id: self._to_domain(m) for m in result.scalars().all()}
+
     async def list_all(self) -> List[SanitaryPolicy]:
         stmt = select(SanitaryPolicyModel).order_by(SanitaryPolicyModel.name.asc())
         result = await self._session.execute(stmt)
@@ -1,19 +1,25 @@
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Mapped, mapped_column, declarative_base
+from sqlalchemy.orm import Mapped, aliased, mapped_column
 
 from app.sanitary.application.ports.sanitary_review_repository import (
     SanitaryReviewRepository,
 )
 from app.sanitary.domain.sanitary_review import SanitaryReview
+from app.sanitary.domain.sanitary_analytics import NonconformityCount
+from app.sanitary.domain.sanitary_compliance import PolicyCompliance
+from app.sanitary.domain.sanitary_history import PolicyHistoryPage
+from app.sanitary.infrastructure.persistence.sanitary_policy_repository_impl import (
+    SanitaryPolicyModel,
+)
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class SanitaryReviewModel(Base):
     """
@@ -143,6 +149,17 @@ class PostgreSQLSanitaryReviewRepository(SanitaryReviewRepository):
         await self._session.flush()
         return self._to_domain(model)
 
+    async def add_many(self, reviews: List[SanitaryReview]) -> List[SanitaryReview]:
+        """Inserta las revisiones con un solo INSERT multi-fila (sin commit)"""
+        if not reviews:
+            return []
+
+        await self._session.execute(
+            sa.insert(SanitaryReviewModel),
+            [self._to_model_dict(review) for review in reviews],
+        )
+        return reviews
+
     async def list_by_policy_and_period(
         self,
         policy_id: UUID,
@@ -179,3 +196,198 @@ class PostgreSQLSanitaryReviewRepository(SanitaryReviewRepository):
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
+
+    async def get_policy_history(
+        self,
+        policy_id: UUID,
+        start_date: date,
+        end_date: date,
+        limit: int,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> PolicyHistoryPage:
+        """
+        Una sola sentencia SQL (UNION ALL de dos lecturas por índice):
+
+          - last: la última revisión de la política (LIMIT 1)
+          - page: la página del periodo, por keyset (date, id) < cursor,
+            sin OFFSET; cada página cuesta lo mismo sin importar qué tan
+            atrás esté en el historial
+
+        Ambas recorren idx_sanitary_reviews_policy_date_id
+        (policy_id, date DESC, id DESC).
+        """
+        newest_first = (SanitaryReviewModel.date.desc(), SanitaryReviewModel.id.desc())
+
+        last = (
+            select(SanitaryReviewModel, sa.true().label("is_last"))
+            .where(SanitaryReviewModel.policy_id == policy_id)
+            .order_by(*newest_first)
+            .limit(1)
+        )
+
+        page = (
+            select(SanitaryReviewModel, sa.false().label("is_last"))
+            .where(SanitaryReviewModel.policy_id == policy_id)
+            .where(SanitaryReviewModel.date >= start_date)
+            .where(SanitaryReviewModel.date <= end_date)
+        )
+        if after:
+            after_date, after_id = after
+            page = page.where(
+                sa.tuple_(SanitaryReviewModel.date, SanitaryReviewModel.id) < sa.tuple_(after_date, after_id)
+            )
+        page = page.order_by(*newest_first).limit(limit)
+
+        history = sa.union_all(
+            last.subquery("last").select(),
+            page.subquery("page").select(),
+        ).subquery("history")
+        review = aliased(SanitaryReviewModel, history)
+
+        stmt = select(review, history.c.is_last).order_by(
+            history.c.is_last.desc(), review.date.desc(), review.id.desc()
+        )
+        result = await self._session.execute(stmt)
+
+        history_page = PolicyHistoryPage()
+        for model, is_last in result.all():
+            if is_last:
+                history_page.last_review = self._to_domain(model)
+            else:
+                history_page.reviews.append(self._to_domain(model))
+        return history_page
+
+    async def get_compliance_overview(
+        self,
+        start_date: date,
+        end_date: date,
+        include_inactive: bool = False,
+    ) -> List[PolicyCompliance]:
+        """
+        Una sola sentencia SQL para todas las políticas:
+
+          - last_review: DISTINCT ON (policy_id) ordenado por fecha DESC
+            (usa el índice idx_sanitary_reviews_policy_date_id)
+          - period: COUNT(*) y COUNT(*) FILTER (WHERE NOT is_conform)
+            de las revisiones dentro del periodo
+          - LEFT JOIN de ambas contra sanitary_policies, para que las
+            políticas sin revisiones también aparezcan
+        """
+        last_review = (
+            select(
+                SanitaryReviewModel.policy_id,
+                SanitaryReviewModel.date.label("last_review_date"),
+                SanitaryReviewModel.is_conform.label("last_review_is_conform"),
+            )
+            .distinct(SanitaryReviewModel.policy_id)
+            .order_by(
+                SanitaryReviewModel.policy_id,
+                SanitaryReviewModel.date.desc(),
+                SanitaryReviewModel.id.desc(),
+            )
+            .subquery("last_review")
+        )
+
+        period = (
+            select(
+                SanitaryReviewModel.policy_id,
+                sa.func.count().label("reviews"),
+                sa.func.count().filter(SanitaryReviewModel.is_conform.is_(False)).label("nonconformities"),
+            )
+            .where(SanitaryReviewModel.date >= start_date)
+            .where(SanitaryReviewModel.date <= end_date)
+            .group_by(SanitaryReviewModel.policy_id)
+            .subquery("period")
+        )
+
+        stmt = (
+            select(
+                SanitaryPolicyModel.id,
+                SanitaryPolicyModel.name,
+                SanitaryPolicyModel.description,
+                SanitaryPolicyModel.is_active,
+                last_review.c.last_review_date,
+                last_review.c.last_review_is_conform,
+                sa.func.coalesce(period.c.reviews, 0).label("reviews"),
+                sa.func.coalesce(period.c.nonconformities, 0).label("nonconformities"),
+            )
+            .outerjoin(last_review, last_review.c.policy_id == SanitaryPolicyModel.id)
+            .outerjoin(period, period.c.policy_id == SanitaryPolicyModel.id)
+            .order_by(SanitaryPolicyModel.name)
+        )
+        if not include_inactive:
+            stmt = stmt.where(SanitaryPolicyModel.is_active.is_(True))
+
+        result = await self._session.execute(stmt)
+        return [
+            PolicyCompliance(
+                policy_id=row.id,
+                policy_name=row.name,
+                policy_description=row.description,
+                is_active=row.is_active,
+                last_review_date=row.last_review_date,
+                last_review_is_conform=row.last_review_is_conform,
+                reviews_in_period=row.reviews,
+                nonconformities_in_period=row.nonconformities,
+            )
+            for row in result.all()
+        ]
+
+    async def get_nonconformity_counts(
+        self,
+        start_date: date,
+        end_date: date,
+        policy_id: Optional[UUID] = None,
+        company_id: Optional[UUID] = None,
+    ) -> List[NonconformityCount]:
+        """
+        GROUP BY date_trunc('month', date), policy_id, incident_type_id,
+        company_id sobre las revisiones inconformes del periodo.
+
+        El índice parcial idx_sanitary_reviews_nonconform_date (date) INCLUDE
+        (policy_id, incident_type_id, company_id) WHERE NOT is_conform cubre
+        la consulta: se resuelve con un index-only scan sin leer la tabla.
+        """
+        # 'month' va como literal: con un parámetro, el GROUP BY no
+        # reconocería la misma expresión del SELECT
+        month = sa.cast(
+            sa.func.date_trunc(sa.literal_column("'month'"), SanitaryReviewModel.date),
+            sa.Date,
+        ).label("month")
+        incidents = sa.func.count().label("incidents")
+
+        stmt = (
+            select(
+                month,
+                SanitaryReviewModel.policy_id,
+                SanitaryReviewModel.incident_type_id,
+                SanitaryReviewModel.company_id,
+                incidents,
+            )
+            .where(SanitaryReviewModel.is_conform.is_(False))
+            .where(SanitaryReviewModel.date >= start_date)
+            .where(SanitaryReviewModel.date <= end_date)
+            .group_by(
+                month,
+                SanitaryReviewModel.policy_id,
+                SanitaryReviewModel.incident_type_id,
+                SanitaryReviewModel.company_id,
+            )
+            .order_by(month, incidents.desc())
+        )
+        if policy_id is not None:
+            stmt = stmt.where(SanitaryReviewModel.policy_id == policy_id)
+        if company_id is not None:
+            stmt = stmt.where(SanitaryReviewModel.company_id == company_id)
+
+        result = await self._session.execute(stmt)
+        return [
+            NonconformityCount(
+                month=row.month,
+                policy_id=row.policy_id,
+                incident_type_id=row.incident_type_id,
+                company_id=row.company_id,
+                count=row.incidents,
+            )
+            for row in result.all()
+        ]
@@ -0,0 +1,278 @@
+from dataclasses import dataclass, asdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+import asyncio
+import heapq
+import itertools
+import time
+
+from app.sanitary.application.ports.review_due_tracker import ReviewDueTracker
+from app.sanitary.domain.sanitary_compliance import REVIEW_INTERVAL_DAYS
+from app.sanitary.infrastructure.persistence.sanitary_review_repository_impl import (
+    PostgreSQLSanitaryReviewRepository,
+)
+from app.users.domain.outbox_email import OutboxEmail, EMAIL_SANITARY_DUE_ALERT
+from app.users.domain.user_role import UserRole
+from app.users.infrastructure.persistence.email_outbox_repository_impl import PostgreSQLEmailOutboxRepository
+from app.users.infrastructure.persistence.user_repository_impl import PostgreSQLUserRepository
+
+# Etapas de aviso de una política
+STAGE_UPCOMING = "upcoming"   # La próxima revisión vence en pocos días
+STAGE_OVERDUE = "overdue"     # La próxima revisión ya pasó (o nunca se revisó)
+
+# Advisory lock del líder: con varios workers solo uno envía los avisos
+LEADER_LOCK_KEY = 7_201_045
+
+
+@dataclass
+class DueAlert:
+    """Aviso de vencimiento de una política (una línea del resumen por email)"""
+    policy_id: UUID
+    policy_name: str
+    next_review_date: Optional[date]
+    stage: str
+
+    def to_context(self) -> dict:
+        return {
+            "name": self.policy_name,
+            "next_review_date": self.next_review_date.isoformat() if self.next_review_date else None,
+        }
+
+
+@dataclass
+class SanitaryDueMetrics:
+    """Métricas en memoria del planificador de vencimientos"""
+    tracked_policies: int = 0
+    pending_alerts: int = 0          # Entradas en el heap (incluye obsoletas)
+    loads: int = 0
+    ticks: int = 0
+    idle_ticks: int = 0              # Sin nada vencido: no se tocó la BD
+    standby_ticks: int = 0           # Otro worker es el líder
+    alerts_sent: int = 0
+    emails_enqueued: int = 0
+    last_load_at: Optional[str] = None
+    last_run_at: Optional[str] = None
+    last_error: Optional[str] = None
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class SanitaryReviewDueScheduler(ReviewDueTracker):
+    """
+    Planificador de avisos de revisiones de sanidad vencidas o por vencer.
+
+    - Al arrancar lee la última revisión de todas las políticas activas en
+      una sola consulta (get_compliance_overview) y arma un min-heap por
+      fecha de aviso
+    - Cada revisión registrada llama a `record_review`: se calcula la nueva
+      fecha y se agrega al heap (las entradas anteriores quedan obsoletas y
+      se descartan al salir)
+    - En cada tick solo se mira el tope del heap: si no hay nada vencido no
+      se consulta la BD
+    - Lo vencido se agrupa en un solo email por destinatario, encolado en la
+      bandeja de salida (lo entrega EmailDeliveryWorker)
+    - Cada política se avisa una vez por etapa y fecha de vencimiento
+
+    El estado es del proceso: debe correr en una sola instancia.
+    Con varios workers, `leader` decide en cada tick quién lo corre (los
+    demás quedan en espera) y `publisher` le hace llegar las revisiones
+    registradas en otros workers (`apply_remote`).
+    Una recarga periódica recoge políticas nuevas o desactivadas.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        upcoming_days: int = 3,
+        check_seconds: float = 3600.0,
+        reload_seconds: float = 86400.0,
+        recipient_roles: Tuple[UserRole, ...] = (UserRole.NUTRITIONIST, UserRole.ADMIN),
+        today: Callable[[], date] = date.today,
+        leader: Optional[Callable[[], Awaitable[bool]]] = None,
+        publisher: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.session_factory = session_factory
+        self.upcoming_days = upcoming_days
+        self.check_seconds = check_seconds
+        self.reload_seconds = reload_seconds
+        self.recipient_roles = recipient_roles
+        self.today = today
+        self.leader = leader
+        self.publisher = publisher
+
+        self.metrics = SanitaryDueMetrics()
+        self._heap: List[Tuple[date, int, UUID, Optional[date], str]] = []
+        self._seq = itertools.count()
+        self._due: Dict[UUID, Optional[date]] = {}   # Próxima revisión vigente por política
+        self._names: Dict[UUID, str] = {}
+        self._sent: Set[Tuple[UUID, Optional[date], str]] = set()
+        self._loaded_at: Optional[float] = None
+
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ---------- Heap ----------
+
+    def track(self, policy_id: UUID, policy_name: str, last_review_date: Optional[date]) -> None:
+        """Agrega (o reemplaza) una política con su última revisión"""
+        self._names[policy_id] = policy_name
+        due = last_review_date + timedelta(days=REVIEW_INTERVAL_DAYS) if last_review_date else None
+        self._due[policy_id] = due
+
+        if due is None:
+            self._push(date.min, policy_id, None, STAGE_OVERDUE)
+        else:
+            self._push(due - timedelta(days=self.upcoming_days), policy_id, due, STAGE_UPCOMING)
+
+    def record_review(self, policy_id: UUID, review_date: date, publish: bool = True) -> None:
+        """Una revisión nueva mueve la próxima fecha (si es la más reciente)"""
+        if publish and self.publisher:
+            self.publisher({"policy_id": str(policy_id), "review_date": review_date.isoformat()})
+
+        if policy_id not in self._due:
+            # Política nueva o inactiva: la recoge la próxima recarga
+            return
+
+        due = self._due[policy_id]
+        new_due = review_date + timedelta(days=REVIEW_INTERVAL_DAYS)
+        if due is not None and new_due <= due:
+            return
+
+        self.track(policy_id, self._names[policy_id], review_date)
+
+    def apply_remote(self, data: Dict[str, Any]) -> None:
+        """Revisión registrada en otro worker"""
+        self.record_review(UUID(data["policy_id"]), date.fromisoformat(data["review_date"]), publish=False)
+
+    def collect_due(self, today: date) -> List[DueAlert]:
+        """Saca del heap los avisos cuya fecha ya llegó"""
+        alerts: List[DueAlert] = []
+        keys: Set[Tuple[UUID, Optional[date], str]] = set()
+
+        while self._heap and self._heap[0][0] <= today:
+            _, _, policy_id, due, stage = heapq.heappop(self._heap)
+
+            # Entrada obsoleta: la política se revisó o dejó de seguirse
+            if policy_id not in self._due or self._due[policy_id] != due:
+                continue
+
+            if stage == STAGE_UPCOMING:
+                if due < today:
+                    stage = STAGE_OVERDUE
+                else:
+                    # Tras el aviso previo, queda el de vencida
+                    self._push(due + timedelta(days=1), policy_id, due, STAGE_OVERDUE)
+
+            key = (policy_id, due, stage)
+            if key in self._sent or key in keys:
+                continue
+            keys.add(key)
+            alerts.append(DueAlert(policy_id, self._names[policy_id], due, stage))
+
+        self.metrics.pending_alerts = len(self._heap)
+        return alerts
+
+    def _push(self, alert_date: date, policy_id: UUID, due: Optional[date], stage: str) -> None:
+        heapq.heappush(self._heap, (alert_date, next(self._seq), policy_id, due, stage))
+        self.metrics.pending_alerts = len(self._heap)
+
+    def _restore(self, alerts: List[DueAlert]) -> None:
+        """Devuelve al heap avisos que no se pudieron encolar"""
+        for alert in alerts:
+            self._push(date.min, alert.policy_id, alert.next_review_date, alert.stage)
+
+    # ---------- BD ----------
+
+    async def load(self) -> int:
+        """Reconstruye el heap desde la BD. Retorna cuántas políticas se siguen"""
+        today = self.today()
+        async with self.session_factory() as session:
+            overview = await PostgreSQLSanitaryReviewRepository(session).get_compliance_overview(today, today)
+
+        self._heap = []
+        self._due = {}
+        self._names = {}
+        for policy in overview:
+            self.track(policy.policy_id, policy.policy_name, policy.last_review_date)
+
+        # Olvidar avisos de vencimientos que ya no existen
+        self._sent = {key for key in self._sent if key[0] in self._due and self._due[key[0]] == key[1]}
+
+        self._loaded_at = time.monotonic()
+        self.metrics.loads += 1
+        self.metrics.tracked_policies = len(self._due)
+        self.metrics.last_load_at = datetime.now(timezone.utc).isoformat()
+        return len(self._due)
+
+    async def run_once(self) -> int:
+        """Procesa un tick. Retorna cuántas políticas se avisaron"""
+        if self.leader and not await self.leader():
+            # Otro worker corre el planificador; al tomar el relevo se recarga
+            self._loaded_at = None
+            self.metrics.standby_ticks += 1
+            return 0
+
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.reload_seconds:
+            await self.load()
+
+        self.metrics.ticks += 1
+        self.metrics.last_run_at = datetime.now(timezone.utc).isoformat()
+
+        alerts = self.collect_due(self.today())
+        if not alerts:
+            self.metrics.idle_ticks += 1
+            return 0
+
+        overdue = [a.to_context() for a in alerts if a.stage == STAGE_OVERDUE]
+        upcoming = [a.to_context() for a in alerts if a.stage == STAGE_UPCOMING]
+
+        try:
+            async with self.session_factory() as session:
+                recipients = await PostgreSQLUserRepository(session).find_active_by_roles(list(self.recipient_roles))
+                emails = [
+                    OutboxEmail(
+                        kind=EMAIL_SANITARY_DUE_ALERT,
+                        to_email=user.email,
+                        context={"user_name": user.full_name, "overdue": overdue, "upcoming": upcoming},
+                    )
+                    for user in recipients
+                ]
+                enqueued = await PostgreSQLEmailOutboxRepository(session).enqueue_many(emails)
+        except Exception:
+            self._restore(alerts)
+            raise
+
+        self._sent.update((a.policy_id, a.next_review_date, a.stage) for a in alerts)
+        self.metrics.alerts_sent += len(alerts)
+        self.metrics.emails_enqueued += enqueued
+        return len(alerts)
+
+    # ---------- Tarea de fondo ----------
+
+    def start(self) -> None:
+        """Inicia el planificador como tarea de fondo"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+
+    async def run_forever(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                # Error de BD u otro inesperado: reintentar en el próximo tick
+                self.metrics.last_error = str(e)
+                print(f"Error en planificador de sanidad: {e}")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.check_seconds)
+            except asyncio.TimeoutError:
+                pass
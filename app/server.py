@@ -0,0 +1,86 @@
+"""
+Entrada de producción: Gunicorn con workers de Uvicorn.
+
+    python -m app.server
+
+- WEB_CONCURRENCY workers (procesos); cada uno con su event loop, su pool
+  de conexiones y sus cachés en memoria
+- SERVER_PRELOAD importa la app una vez en el proceso maestro antes del
+  fork: los workers arrancan sin volver a importar todo
+- Las cachés se mantienen coherentes con el canal de invalidación
+  (CACHE_INVALIDATION_ENABLED) y el planificador de sanidad corre en un
+  solo worker (advisory lock)
+
+Sin Gunicorn (p. ej. en Windows) se usa el supervisor de Uvicorn, que no
+soporta preload.
+"""
+from typing import Any, Dict
+
+from app.shared.config.settings import settings
+
+
+def gunicorn_options() -> Dict[str, Any]:
+    """Configuración de Gunicorn a partir de settings"""
+    return {
+        "bind": f"{settings.SERVER_HOST}:{settings.SERVER_PORT}",
+        "workers": settings.WEB_CONCURRENCY,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": settings.SERVER_PRELOAD,
+        "timeout": settings.SERVER_TIMEOUT_SECONDS,
+        "graceful_timeout": settings.SERVER_TIMEOUT_SECONDS,
+        "post_fork": _post_fork,
+    }
+
+
+def _post_fork(server, worker) -> None:
+    """
+    Con preload el engine se creó en el maestro: cada worker descarta el
+    pool heredado (sin cerrar conexiones ajenas) y abre las suyas.
+    """
+    from app.shared.database.connection import engine
+
+    engine.sync_engine.dispose(close=False)
+
+
+def _warn_per_process_state() -> None:
+    if settings.WEB_CONCURRENCY > 1 and settings.LOGIN_RATE_LIMIT_BACKEND == "memory":
+        print("⚠️  LOGIN_RATE_LIMIT_BACKEND=memory: el límite de login se cuenta por worker")
+    if settings.WEB_CONCURRENCY > 1 and not settings.CACHE_INVALIDATION_ENABLED:
+        print("⚠️  CACHE_INVALIDATION_ENABLED=false: las cachés de cada worker solo se renuevan por TTL")
+
+
+def run() -> None:
+    _warn_per_process_state()
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        import uvicorn
+
+        uvicorn.run(
+            "app.main:app",
+            host=settings.SERVER_HOST,
+            port=settings.SERVER_PORT,
+            workers=settings.WEB_CONCURRENCY,
+        )
+        return
+
+    class GunicornApplication(BaseApplication):
+        def __init__(self, options: Dict[str, Any]):
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.main import app
+
+            return app
+
+    GunicornApplication(gunicorn_options()).run()
+
+
+if __name__ == "__main__":
+    run()
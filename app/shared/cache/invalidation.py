@@ -0,0 +1,229 @@
+"""Canal de invalidación entre workers (PostgreSQL LISTEN/NOTIFY)"""
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+import asyncio
+import json
+import os
+import socket
+import uuid
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+# Handler de un tópico: recibe el dict publicado por otro worker
+Handler = Callable[[Dict[str, Any]], None]
+# Se llama tras (re)conectar: pudo haberse perdido algún aviso
+Resync = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class InvalidationMetrics:
+    """Métricas en memoria del canal de invalidación"""
+    connected: bool = False
+    published: int = 0
+    received: int = 0
+    applied: int = 0
+    dropped: int = 0           # Avisos no enviados (sin conexión o cola llena)
+    reconnects: int = 0
+    last_error: Optional[str] = None
+    last_connected_at: Optional[str] = None
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """postgresql+asyncpg://... -> postgresql://... (asyncpg no entiende el dialecto)"""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class PostgresInvalidationBus:
+    """
+    Canal para que las cachés en memoria de cada worker sigan siendo coherentes.
+
+    - Un worker que invalida algo localmente publica {topic, data} con
+      NOTIFY en un canal de la misma BD
+    - Todos los workers escuchan (LISTEN) en una conexión dedicada, fuera
+      del pool de SQLAlchemy, y aplican el aviso con el handler del tópico
+    - Los avisos propios se ignoran (ya se aplicaron al publicar)
+    - Si la conexión se cae, se reconecta y se llama a `resync` de cada
+      tópico: los avisos perdidos se cubren recargando o vaciando la caché
+    - La misma conexión sirve para elegir un líder con advisory locks
+      (tareas que deben correr en un solo worker); asyncpg no admite dos
+      operaciones a la vez en una conexión, así que NOTIFY y advisory lock
+      se serializan con un asyncio.Lock
+
+    NOTIFY no es transaccional respecto a la escritura que invalida: los
+    repositorios cacheados publican desde el `after_commit` de la sesión,
+    así ningún worker recarga antes de que el cambio sea visible. El TTL de
+    cada caché queda para avisos perdidos.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        channel: str = "cache_invalidation",
+        reconnect_seconds: float = 5.0,
+        max_pending: int = 10_000,
+    ):
+        self.dsn = asyncpg_dsn(database_url)
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self.metrics = InvalidationMetrics()
+        self._handlers: Dict[str, Handler] = {}
+        self._resyncs: Dict[str, Resync] = {}
+        self._held_locks: Set[int] = set()
+
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_pending)
+        self._conn: Optional[asyncpg.Connection] = None
+        self._conn_lock = asyncio.Lock()  # Una operación a la vez sobre self._conn
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ---------- Tópicos ----------
+
+    def subscribe(self, topic: str, handler: Handler, resync: Optional[Resync] = None) -> None:
+        """Registra el handler de un tópico (antes de `start`)"""
+        self._handlers[topic] = handler
+        if resync:
+            self._resyncs[topic] = resync
+
+    def publisher(self, topic: str) -> Callable[[Dict[str, Any]], None]:
+        """Función para publicar en un tópico (se le pasa a la caché)"""
+        return lambda data: self.publish(topic, data)
+
+    def publish(self, topic: str, data: Dict[str, Any]) -> None:
+        """Encola el aviso; lo envía la tarea de fondo. Sin conexión se descarta"""
+        if self._task is None:
+            return
+        payload = json.dumps({"origin": self.origin, "topic": topic, "data": data})
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.metrics.dropped += 1
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        self.metrics.received += 1
+        try:
+            message = json.loads(payload)
+            if message.get("origin") == self.origin:
+                return
+            handler = self._handlers.get(message.get("topic"))
+            if handler:
+                handler(message.get("data") or {})
+                self.metrics.applied += 1
+        except Exception as e:
+            self.metrics.last_error = str(e)
+            print(f"Error aplicando invalidación: {e}")
+
+    # ---------- Líder ----------
+
+    async def try_lock(self, key: int) -> bool:
+        """
+        Advisory lock de sesión en la conexión del canal: solo un worker lo
+        obtiene. Se libera solo si la conexión se cae (otro worker lo toma).
+        """
+        if key in self._held_locks:
+            return True
+
+        async with self._conn_lock:
+            conn = self._conn
+            if conn is None or conn.is_closed():
+                return False
+            if await conn.fetchval("SELECT pg_try_advisory_lock($1)", key):
+                self._held_locks.add(key)
+                return True
+        return False
+
+    def holds_lock(self, key: int) -> bool:
+        return key in self._held_locks
+
+    # ---------- Tarea de fondo ----------
+
+    def start(self) -> None:
+        """Conecta y empieza a escuchar/publicar como tarea de fondo"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+
+    async def run_forever(self) -> None:
+        attempts = 0
+        while not self._stopping.is_set():
+            try:
+                # Desde el segundo intento pudo haberse perdido algún aviso
+                attempts += 1
+                await self._connect(resync=attempts > 1)
+                await self._send_loop()
+            except Exception as e:
+                self.metrics.last_error = str(e)
+                print(f"Error en canal de invalidación: {e}")
+            finally:
+                await self._disconnect()
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.reconnect_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _connect(self, resync: bool) -> None:
+        self._conn = await asyncpg.connect(self.dsn)
+        await self._conn.add_listener(self.channel, self._on_notification)
+        self.metrics.connected = True
+        self.metrics.last_connected_at = datetime.now(timezone.utc).isoformat()
+
+        if resync:
+            self.metrics.reconnects += 1
+            for topic, callback in self._resyncs.items():
+                try:
+                    await callback()
+                except Exception as e:
+                    self.metrics.last_error = f"{topic}: {e}"
+
+    async def _disconnect(self) -> None:
+        self.metrics.connected = False
+        async with self._conn_lock:
+            self._held_locks.clear()
+            conn, self._conn = self._conn, None
+            if conn is not None and not conn.is_closed():
+                try:
+                    await conn.remove_listener(self.channel, self._on_notification)
+                finally:
+                    await conn.close()
+
+    async def _send_loop(self) -> None:
+        """Envía los avisos encolados hasta que se pida parar (o falle la conexión)"""
+        stopping = asyncio.ensure_future(self._stopping.wait())
+        try:
+            while True:
+                getter = asyncio.ensure_future(self._queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, stopping}, timeout=self.reconnect_seconds, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter not in done:
+                    getter.cancel()
+                    if stopping in done:
+                        return
+                    # Sin avisos que enviar: verificar que la conexión siga viva
+                    if self._conn.is_closed():
+                        raise ConnectionError("Se perdió la conexión del canal de invalidación")
+                    continue
+
+                payload = getter.result()
+                try:
+                    async with self._conn_lock:
+                        await self._conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+                except Exception:
+                    self.metrics.dropped += 1
+                    raise
+                self.metrics.published += 1
+        finally:
+            stopping.cancel()
@@ -0,0 +1,130 @@
+"""Caché en memoria para resultados de consultas costosas (analítica por filtros)"""
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import time
+
+
+@dataclass
+class QueryCacheMetrics:
+    """Métricas en memoria de la caché de resultados"""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    stale_loads: int = 0
+    evictions: int = 0         # Entradas descartadas por vencidas o por tamaño
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class QueryResultCache:
+    """
+    Caché por proceso de resultados cuya clave depende de los filtros del
+    cliente (periodo, política, empresa...), a diferencia de los catálogos
+    de ReferenceDataCache, que son unas pocas claves fijas.
+
+    - Tamaño acotado (LRU): al pasar `max_entries` se descarta la entrada
+      menos usada
+    - Las entradas vencidas se eliminan al leerlas y al guardar otra
+    - Las cargas concurrentes de una misma clave se serializan; el lock
+      solo existe mientras alguien espera esa clave
+    - `invalidate()` descarta todo y sube la generación: una carga que
+      empezó antes no se instala
+    - Con `publisher` (canal entre workers) cada invalidación se avisa a
+      los demás workers, que la aplican con `apply_remote`
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1_000,
+        publisher: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.publisher = publisher
+        self.metrics = QueryCacheMetrics()
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._loads: Dict[str, List[Any]] = {}  # clave -> [lock, corrutinas esperando]
+        self._generation = 0
+
+    def _expired(self, loaded_at: float, now: float) -> bool:
+        return now - loaded_at > self.ttl_seconds
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Valor vigente de la clave, sin cargar (None si no hay)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, loaded_at = entry
+        if self._expired(loaded_at, time.monotonic()):
+            del self._entries[key]
+            self.metrics.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Retorna el valor cacheado o lo carga con `loader`"""
+        value = self.peek(key)
+        if value is not None:
+            self.metrics.hits += 1
+            return value
+
+        load = self._loads.setdefault(key, [asyncio.Lock(), 0])
+        load[1] += 1
+        try:
+            async with load[0]:
+                # Otra corrutina pudo cargarlo mientras esperábamos
+                value = self.peek(key)
+                if value is not None:
+                    self.metrics.hits += 1
+                    return value
+
+                self.metrics.misses += 1
+                generation = self._generation
+                value = await loader()
+
+                if generation == self._generation:
+                    self._store(key, value)
+                else:
+                    self.metrics.stale_loads += 1
+                return value
+        finally:
+            load[1] -= 1
+            if load[1] == 0:
+                self._loads.pop(key, None)
+
+    def _store(self, key: str, value: Any) -> None:
+        now = time.monotonic()
+        for stale_key in [k for k, (_, loaded_at) in self._entries.items() if self._expired(loaded_at, now)]:
+            del self._entries[stale_key]
+            self.metrics.evictions += 1
+
+        self._entries[key] = (value, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
+
+    def invalidate(self, publish: bool = True) -> None:
+        """Descarta todos los resultados (llamar después de cada escritura)"""
+        self._generation += 1
+        self._entries.clear()
+        self.metrics.invalidations += 1
+        if publish and self.publisher:
+            self.publisher({})
+
+    def apply_remote(self, data: Dict[str, Any]) -> None:
+        """Aplica una invalidación publicada por otro worker"""
+        self.invalidate(publish=False)
+
+    async def resync(self) -> None:
+        """Tras perder avisos de otros workers: todo vuelve a cargarse de la BD"""
+        self.invalidate(publish=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
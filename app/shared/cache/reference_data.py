@@ -0,0 +1,116 @@
+"""Caché en memoria para datos de referencia (catálogos que casi no cambian)"""
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import time
+
+
+@dataclass
+class ReferenceCacheMetrics:
+    """Métricas en memoria de la caché de referencia"""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    stale_loads: int = 0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class ReferenceDataCache:
+    """
+    Caché por proceso de catálogos (políticas, tipos de incidencia, empresas...).
+
+    - Cada clave tiene una versión; una escritura llama a `invalidate(key)`
+      y la versión sube
+    - Una carga solo se instala si la versión no cambió mientras se leía de
+      la BD: si hubo una escritura en el medio, el resultado se devuelve a
+      quien lo pidió pero no se guarda
+    - Las cargas concurrentes de una misma clave se serializan: la segunda
+      espera y usa lo que cargó la primera
+    - Con `publisher` (canal entre workers) cada invalidación se avisa a
+      los demás workers, que la aplican con `apply_remote`
+    - Los repositorios cacheados invalidan en el momento y otra vez tras el
+      commit de la sesión: una carga que leyó la BD antes del commit no
+      queda instalada
+    - El TTL es solo una red de seguridad (cambios hechos directamente en la
+      BD o un aviso perdido)
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, publisher: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.ttl_seconds = ttl_seconds
+        self.publisher = publisher
+        self.metrics = ReferenceCacheMetrics()
+        self._versions: Dict[str, int] = {}
+        self._entries: Dict[str, Tuple[int, Any, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Valor vigente de la clave, sin cargar (None si no hay)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        version, value, loaded_at = entry
+        if version != self.version(key) or time.monotonic() - loaded_at > self.ttl_seconds:
+            return None
+        return value
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Retorna el valor cacheado o lo carga con `loader`"""
+        value = self.peek(key)
+        if value is not None:
+            self.metrics.hits += 1
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Otra corrutina pudo cargarlo mientras esperábamos
+            value = self.peek(key)
+            if value is not None:
+                self.metrics.hits += 1
+                return value
+
+            self.metrics.misses += 1
+            version = self.version(key)
+            value = await loader()
+
+            if version == self.version(key):
+                self._entries[key] = (version, value, time.monotonic())
+            else:
+                self.metrics.stale_loads += 1
+            return value
+
+    def invalidate(self, key: str, publish: bool = True) -> None:
+        """Marca la clave como obsoleta (llamar después de cada escritura)"""
+        self._versions[key] = self.version(key) + 1
+        self._entries.pop(key, None)
+        self.metrics.invalidations += 1
+        if publish and self.publisher:
+            self.publisher({"key": key})
+
+    def invalidate_prefix(self, prefix: str, publish: bool = True) -> None:
+        """Invalida todas las claves con ese prefijo (p. ej. resultados por periodo)"""
+        for key in {*self._entries, *self._locks}:
+            if key.startswith(prefix):
+                self.invalidate(key, publish=False)
+        if publish and self.publisher:
+            self.publisher({"prefix": prefix})
+
+    def apply_remote(self, data: Dict[str, Any]) -> None:
+        """Aplica una invalidación publicada por otro worker"""
+        if "prefix" in data:
+            self.invalidate_prefix(data["prefix"], publish=False)
+        elif "key" in data:
+            self.invalidate(data["key"], publish=False)
+
+    async def resync(self) -> None:
+        """Tras perder avisos de otros workers: todo vuelve a cargarse de la BD"""
+        self.clear()
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self.invalidate(key, publish=False)
@@ -1,4 +1,5 @@
 # app/shared/config/settings.py
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -12,6 +13,17 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Firma asimétrica (RS256/EdDSA): carpeta de claves y kid activo
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_ACTIVE_KID: Optional[str] = None
+    JWT_ACCEPT_LEGACY_HS256: bool = True
+
+    # Límite de intentos de login (ventana deslizante)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_BACKEND: str = "memory"  # memory | postgres (compartido entre workers)
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 900
+    LOGIN_RATE_LIMIT_MAX_PER_EMAIL: int = 5
+    LOGIN_RATE_LIMIT_MAX_PER_IP: int = 100
 
     # Email SMTP
     SMTP_HOST: str = "smtp.gmail.com"
@@ -20,6 +32,50 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str
     SMTP_FROM_EMAIL: str
     SMTP_FROM_NAME: str = "Sistema de Catering"
+    SMTP_START_TLS: bool = True
+
+    # Bandeja de salida de emails (worker de envío)
+    EMAIL_WORKER_ENABLED: bool = True
+    EMAIL_WORKER_BATCH_SIZE: int = 50
+    EMAIL_WORKER_POLL_SECONDS: float = 5.0
+    EMAIL_WORKER_MAX_ATTEMPTS: int = 5
+
+    # Templates de email (bytecode compilado en disco, opcional)
+    EMAIL_TEMPLATE_BYTECODE_CACHE_DIR: Optional[str] = None
+
+    # Caché de catálogos (datos de referencia); el TTL es solo red de seguridad
+    REFERENCE_CACHE_TTL_SECONDS: float = 300.0
+
+    # Caché de la analítica de sanidad (una entrada por periodo y filtros, LRU)
+    ANALYTICS_CACHE_TTL_SECONDS: float = 300.0
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 1_000
+
+    # Caché de usuarios autenticados (current_user); se invalida al guardar un usuario
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Avisos de revisiones de sanidad vencidas / por vencer
+    SANITARY_DUE_SCHEDULER_ENABLED: bool = True
+    SANITARY_DUE_UPCOMING_DAYS: int = 3
+    SANITARY_DUE_CHECK_SECONDS: float = 3600.0
+
+    # Costo de las operaciones GraphQL (se rechazan antes de ejecutar)
+    GRAPHQL_MAX_QUERY_COST: int = 300
+    GRAPHQL_MAX_QUERY_DEPTH: int = 12
+    GRAPHQL_COST_BUDGET_ENABLED: bool = True
+    GRAPHQL_COST_BUDGET_CAPACITY: int = 1500         # Unidades por usuario
+    GRAPHQL_COST_BUDGET_REFILL_PER_SECOND: float = 5.0
+
+    # Servidor de producción (python -m app.server)
+    WEB_CONCURRENCY: int = 1
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_PRELOAD: bool = True
+    SERVER_TIMEOUT_SECONDS: int = 60
+
+    # Invalidación de cachés entre workers (LISTEN/NOTIFY)
+    CACHE_INVALIDATION_ENABLED: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
 
     # Aplicación
     APP_NAME: str = "Sistema de Catering"
@@ -0,0 +1,6 @@
+"""Base declarativa única para todos los modelos ORM"""
+from sqlalchemy.orm import declarative_base
+
+# Un solo registry / MetaData para toda la aplicación: las claves foráneas
+# entre módulos se resuelven y se pueden definir relaciones entre modelos
+Base = declarative_base()
@@ -1,7 +1,8 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
 from contextlib import asynccontextmanager
 from app.shared.config.settings import settings
+from app.shared.database.base import Base  # noqa: F401  (re-export)
 
 # Crear engine
 engine = create_async_engine(
@@ -17,9 +18,6 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
-# Base para modelos
-Base = declarative_base()
-
 
 @asynccontextmanager
 async def get_db_session():
@@ -36,9 +34,16 @@ async def get_db_session():
 
 
 async def init_db():
-    """Inicializa la base de datos (crear tablas)"""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """
+    Registra todos los modelos en la Base compartida (y valida sus
+    relaciones) y abre la primera conexión del pool.
+    Las tablas las crea Alembic: `alembic upgrade head`.
+    """
+    from app.shared.database.models import register_models
+
+    register_models()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 
 async def close_db():
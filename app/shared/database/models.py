@@ -0,0 +1,58 @@
+"""
+Registro de los modelos ORM en la Base compartida.
+
+Los módulos se importan siempre en el mismo orden (primero las tablas
+referenciadas por claves foráneas) para que init_db y Alembic vean la
+misma MetaData sin depender de qué importó antes cada proceso.
+"""
+import importlib
+
+from sqlalchemy.orm import configure_mappers
+
+from app.shared.database.base import Base
+
+MODEL_MODULES = (
+    # Usuarios
+    "app.users.infrastructure.persistence.user_repository_impl",
+    "app.users.infrastructure.persistence.activation_token_repository_impl",
+    "app.users.infrastructure.persistence.user_session_repository_impl",
+    "app.users.infrastructure.persistence.login_attempt_backend_impl",
+    "app.users.infrastructure.persistence.email_outbox_repository_impl",
+    # Asistencia
+    "app.attendance.infrastructure.persistence.work_schedule_repository_impl",
+    "app.attendance.infrastructure.persistence.attendance_repository_impl",
+    "app.attendance.infrastructure.persistence.break_period_repository_impl",
+    "app.attendance.infrastructure.persistence.attendance_summary_repository_impl",
+    # Solicitudes
+    "app.requests.infrastructure.persistence.time_off_request_repository_impl",
+    "app.requests.infrastructure.persistence.vacation_balance_repository_impl",
+    "app.requests.infrastructure.persistence.shift_swap_repository_impl",
+    # Menú
+    "app.menu.infrastructure.persistence.component_type_repository_impl",
+    "app.menu.infrastructure.persistence.monthly_menu_repository_impl",
+    "app.menu.infrastructure.persistence.weekly_menu_repository_impl",
+    "app.menu.infrastructure.persistence.daily_menu_repository_impl",
+    "app.menu.infrastructure.persistence.meal_repository_impl",
+    "app.menu.infrastructure.persistence.meal_component_repository_impl",
+    "app.menu.infrastructure.persistence.menu_change_repository_impl",
+    # Sanidad
+    "app.sanitary.infrastructure.persistence.sanitary_policy_repository_impl",
+    "app.sanitary.infrastructure.persistence.incident_type_repository_impl",
+    "app.sanitary.infrastructure.persistence.sanitary_company_repository_impl",
+    "app.sanitary.infrastructure.persistence.sanitary_review_repository_impl",
+)
+
+
+def register_models():
+    """
+    Importa todos los modelos y configura los mappers.
+    Retorna la MetaData con todas las tablas.
+
+    configure_mappers() valida las relaciones al arrancar, no en la
+    primera consulta que las use.
+    """
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+    configure_mappers()
+    return Base.metadata
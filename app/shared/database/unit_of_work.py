@@ -0,0 +1,15 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.building_blocks.unit_of_work import UnitOfWork
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """Unidad de trabajo sobre la sesión compartida por los repositorios del request"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
@@ -0,0 +1,18 @@
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+
+@lru_cache(maxsize=1)
+def get_load_workbook() -> Optional[Callable[..., Any]]:
+    """
+    `openpyxl.load_workbook`, importado en el primer uso.
+
+    openpyxl tarda ~100 ms en importarse y solo lo usan las cargas de Excel
+    (menús, usuarios, revisiones de sanidad): así no se paga al arrancar
+    cada worker. Retorna None si no está instalado.
+    """
+    try:
+        from openpyxl import load_workbook  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return load_workbook
@@ -1,6 +1,6 @@
 # app/shared/graphql/context.py
 from dataclasses import dataclass
-from typing import Optional, TypedDict, TYPE_CHECKING
+from typing import FrozenSet, Optional, TypedDict, TYPE_CHECKING
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
@@ -40,18 +40,35 @@ from app.sanitary.application.ports.sanitary_company_repository import (
 )
 
 if TYPE_CHECKING:
+    from app.building_blocks.unit_of_work import UnitOfWork
     from app.users.domain.user import User
     from app.users.application.ports.user_repository import UserRepository
     from app.users.application.ports.activation_token_repository import (
         ActivationTokenRepository,
     )
+    from app.users.application.ports.user_session_repository import (
+        UserSessionRepository,
+    )
+    from app.shared.security.session_revocation import RevokedSessionIndex
+    from app.users.application.ports.login_rate_limiter import LoginRateLimiter
+    from app.shared.security.permissions import Permission
 
     from app.attendance.application.ports.attendance_repository import (
         AttendanceRepository,
     )
+    from app.attendance.application.ports.break_period_repository import (
+        BreakPeriodRepository,
+    )
+    from app.attendance.application.ports.attendance_report_repository import (
+        AttendanceReportRepository,
+    )
+    from app.attendance.application.ports.attendance_summary_repository import (
+        AttendanceSummaryRepository,
+    )
     from app.attendance.application.ports.holiday_service import HolidayService
 
     from app.users.application.ports.email_service import EmailService
+    from app.users.application.ports.email_outbox_repository import EmailOutboxRepository
     from app.users.application.ports.auth_service import AuthService
 
 
@@ -61,11 +78,18 @@ class GraphQLContex(TypedDict):
 
     request: Request
     session: AsyncSession
+    unit_of_work: "UnitOfWork"
 
     # Usuarios / Auth / Attendance
     user_repository: "UserRepository"
     token_repository: "ActivationTokenRepository"
+    user_session_repository: "UserSessionRepository"
+    revoked_sessions: "RevokedSessionIndex"
+    login_rate_limiter: Optional["LoginRateLimiter"]
     attendance_repository: "AttendanceRepository"
+    break_period_repository: "BreakPeriodRepository"
+    attendance_report_repository: "AttendanceReportRepository"
+    attendance_summary_repository: "AttendanceSummaryRepository"
 
     time_off_repository: "TimeOffRequestRepository"
     vacation_balance_repository: "VacationBalanceRepository"
@@ -73,6 +97,7 @@ class GraphQLContex(TypedDict):
     work_schedule_repository: "WorkScheduleRepository"
 
     email_service: "EmailService"
+    email_outbox_repository: "EmailOutboxRepository"
     auth_service: "AuthService"
     holiday_service: "HolidayService"
 
@@ -92,3 +117,5 @@ class GraphQLContex(TypedDict):
     sanitary_company_repository: "SanitaryCompanyRepository"
 
     current_user: Optional["User"] = None
+    session_id: Optional[str] = None
+    permissions: Optional[FrozenSet["Permission"]] = None  # Lo llena PermissionExtension
@@ -0,0 +1,358 @@
+"""Análisis de costo de las operaciones GraphQL (antes de ejecutar)"""
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, field
+from datetime import date
+from math import ceil
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+import calendar
+import threading
+import time
+
+from graphql import GraphQLError
+from graphql.execution.values import get_argument_values, get_variable_values
+from graphql.language import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+)
+from graphql.type import GraphQLNamedType, get_named_type
+from graphql.validation import ValidationRule
+from strawberry.extensions import SchemaExtension
+from strawberry.utils.str_converters import to_snake_case
+
+# Clave bajo la que los campos GraphQL declaran su costo (metadata)
+COST_METADATA_KEY = "cost"
+
+# Campo raíz sin costo declarado (una consulta simple); los anidados son lecturas en memoria
+DEFAULT_ROOT_COST = 1
+
+Multiplier = Callable[[Dict[str, Any]], int]
+
+
+@dataclass(frozen=True)
+class FieldCost:
+    """Costo de un campo: (base + hijos) × multiplicador según sus argumentos"""
+    base: int = 1
+    multiplier: Optional[Multiplier] = None
+
+
+def cost(base: int = 1, multiplier: Optional[Multiplier] = None) -> dict:
+    """
+    Metadata para declarar el costo de un campo; se combina con los permisos:
+
+        @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=days_in_month)))
+    """
+    return {COST_METADATA_KEY: FieldCost(base, multiplier)}
+
+
+# ---------- Multiplicadores ----------
+
+def _get(value: Any, name: str, default: Any = None) -> Any:
+    """Campo de un input (llega como dict)"""
+    return value.get(name, default) if isinstance(value, dict) else default
+
+
+def days_in_month(args: Dict[str, Any]) -> int:
+    """Menú de un mes: un día de comidas por cada día del mes"""
+    try:
+        return calendar.monthrange(args["year"], args["month"])[1]
+    except (KeyError, TypeError, ValueError, calendar.IllegalMonthError):
+        return 31
+
+
+def by_arg(name: str, default: int = 1, input_name: Optional[str] = None) -> Multiplier:
+    """Multiplicador = valor de un argumento (p. ej. months_back), opcionalmente dentro de un input"""
+
+    def multiplier(args: Dict[str, Any]) -> int:
+        source = args.get(input_name) if input_name else args
+        value = _get(source, name, default)
+        return value if isinstance(value, int) else default
+
+    return multiplier
+
+
+def per_page(name: str, page_size: int = 10) -> Multiplier:
+    """Listas paginadas: una unidad por cada `page_size` elementos pedidos"""
+    base = by_arg(name, page_size)
+    return lambda args: ceil(base(args) / page_size)
+
+
+def days_between(
+    input_name: str = "input",
+    start: str = "start_date",
+    end: str = "end_date",
+    unit_days: int = 1,
+) -> Multiplier:
+    """Reportes por rango de fechas: una unidad cada `unit_days` días (7 = por semana)"""
+
+    def multiplier(args: Dict[str, Any]) -> int:
+        source = args.get(input_name)
+        start_date, end_date = _get(source, start), _get(source, end)
+        if isinstance(start_date, date) and isinstance(end_date, date):
+            return ceil(((end_date - start_date).days + 1) / unit_days)
+        return 1
+
+    return multiplier
+
+
+def _python_names(value: Any) -> Any:
+    """Los multiplicadores usan los nombres de Python (monthsBack -> months_back), también en inputs"""
+    if isinstance(value, dict):
+        return {to_snake_case(name): _python_names(item) for name, item in value.items()}
+    return value
+
+
+# ---------- Presupuesto por usuario ----------
+
+class TokenBucketBudget:
+    """
+    Presupuesto de costo por usuario (token bucket en memoria, por proceso).
+
+    Cada clave tiene `capacity` unidades y recupera `refill_per_second`;
+    una operación se acepta si su costo cabe en lo disponible. Acotado: si
+    hay demasiadas claves se descartan las menos recientes.
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float, max_keys: int = 100_000):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def try_consume(self, key: str, amount: int, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Descuenta `amount` si alcanza. Retorna (aceptado, segundos hasta que alcance)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(self.capacity), now))
+            tokens = min(float(self.capacity), tokens + (now - updated_at) * self.refill_per_second)
+
+            accepted = amount <= tokens
+            if accepted:
+                tokens -= amount
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        if accepted:
+            return True, 0.0
+        if amount > self.capacity or self.refill_per_second <= 0:
+            return False, float("inf")
+        return False, (amount - tokens) / self.refill_per_second
+
+
+# ---------- Límites y métricas ----------
+
+@dataclass
+class QueryCostMetrics:
+    """Métricas en memoria del análisis de costo"""
+    operations: int = 0
+    total_cost: int = 0
+    max_cost: int = 0
+    rejected_by_cost: int = 0
+    rejected_by_depth: int = 0
+    rejected_by_budget: int = 0
+    cost_by_field: Dict[str, int] = field(default_factory=dict)  # Costo acumulado por campo raíz
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class QueryCostLimiter:
+    """
+    Límites de costo de GraphQL, compartidos por todo el proceso:
+      - max_cost / max_depth por operación
+      - presupuesto por usuario (opcional), descontado al validar
+    """
+
+    def __init__(self, max_cost: int, max_depth: int, budget: Optional[TokenBucketBudget] = None):
+        self.max_cost = max_cost
+        self.max_depth = max_depth
+        self.budget = budget
+        self.metrics = QueryCostMetrics()
+
+    def record(self, total: int, root_costs: Dict[str, int]) -> None:
+        self.metrics.operations += 1
+        self.metrics.total_cost += total
+        self.metrics.max_cost = max(self.metrics.max_cost, total)
+        for name, value in root_costs.items():
+            self.metrics.cost_by_field[name] = self.metrics.cost_by_field.get(name, 0) + value
+
+
+# ---------- Extensión ----------
+
+class QueryCostExtension(SchemaExtension):
+    """
+    Rechaza en la fase de validación las operaciones demasiado caras.
+
+    - Cada campo declara su costo con `metadata=requires(..., metadata=cost(...))`;
+      el menú pesa por días del mes y los historiales por meses pedidos
+    - Los alias cuentan por separado: pedir el menú de 12 meses con alias
+      cuesta 12 menús
+    - Se rechaza si la operación supera max_cost o max_depth, o si el
+      usuario (o la IP, sin sesión) no tiene presupuesto
+    - El límite se toma del context ("query_cost_limiter"); sin él no se
+      analiza nada
+    """
+
+    def on_validate(self):
+        context = self.execution_context.context
+        limiter = context.get("query_cost_limiter") if isinstance(context, dict) else None
+        if limiter is not None:
+            self.execution_context.validation_rules = (
+                *self.execution_context.validation_rules,
+                _cost_rule(
+                    limiter,
+                    _budget_key(context),
+                    self.execution_context.variables or {},
+                    self.execution_context.operation_name,
+                ),
+            )
+        yield
+
+
+def _budget_key(context: dict) -> str:
+    user = context.get("current_user")
+    if user is not None:
+        return f"user:{user.id}"
+    request = context.get("request")
+    client = getattr(request, "client", None)
+    return f"ip:{client.host if client else 'unknown'}"
+
+
+def _cost_rule(
+    limiter: QueryCostLimiter,
+    budget_key: str,
+    variables: Dict[str, Any],
+    operation_name: Optional[str],
+) -> Type[ValidationRule]:
+    """Regla de validación para la operación de este request"""
+
+    class QueryCostRule(ValidationRule):
+        def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+            if operation_name and (node.name is None or node.name.value != operation_name):
+                return
+
+            root_type = self.context.schema.get_root_type(node.operation)
+            if root_type is None:
+                return
+
+            # Variables convertidas (fechas, inputs); si son inválidas las reporta la ejecución
+            coerced = get_variable_values(self.context.schema, node.variable_definitions or [], variables)
+            analyzer = _CostAnalyzer(self.context, coerced if isinstance(coerced, dict) else {})
+            root_costs = analyzer.root_costs(root_type, node.selection_set)
+            total = sum(root_costs.values())
+            limiter.record(total, root_costs)
+
+            if analyzer.max_depth > limiter.max_depth:
+                limiter.metrics.rejected_by_depth += 1
+                self.report_error(GraphQLError(
+                    f"La consulta es demasiado profunda ({analyzer.max_depth} niveles, máximo {limiter.max_depth})",
+                    node,
+                    extensions={"code": "QUERY_TOO_DEEP", "depth": analyzer.max_depth, "max_depth": limiter.max_depth},
+                ))
+                return
+
+            if total > limiter.max_cost:
+                limiter.metrics.rejected_by_cost += 1
+                self.report_error(GraphQLError(
+                    f"La consulta es demasiado costosa ({total}, máximo {limiter.max_cost})",
+                    node,
+                    extensions={"code": "QUERY_TOO_COMPLEX", "cost": total, "max_cost": limiter.max_cost},
+                ))
+                return
+
+            if limiter.budget is not None:
+                accepted, retry_after = limiter.budget.try_consume(budget_key, total)
+                if not accepted:
+                    limiter.metrics.rejected_by_budget += 1
+                    self.report_error(GraphQLError(
+                        "Demasiadas consultas costosas; intenta nuevamente en unos segundos",
+                        node,
+                        extensions={
+                            "code": "RATE_LIMITED",
+                            "cost": total,
+                            "retry_after_seconds": ceil(retry_after) if retry_after != float("inf") else None,
+                        },
+                    ))
+
+    return QueryCostRule
+
+
+class _CostAnalyzer:
+    """Recorre la selección (con fragmentos) y suma el costo declarado de cada campo"""
+
+    def __init__(self, context, variables: Dict[str, Any]):
+        self.schema = context.schema
+        self.fragments = {
+            f.name.value: f for f in context.document.definitions if isinstance(f, FragmentDefinitionNode)
+        }
+        self.variables = variables
+        self.max_depth = 0
+
+    def root_costs(self, root_type: GraphQLNamedType, selection_set: SelectionSetNode) -> Dict[str, int]:
+        costs: Dict[str, int] = {}
+        for name, value in self._fields(root_type, selection_set, depth=1, visited=frozenset()):
+            costs[name] = costs.get(name, 0) + value
+        return costs
+
+    def _cost(self, parent_type: GraphQLNamedType, selection_set: Optional[SelectionSetNode], depth: int, visited) -> int:
+        if selection_set is None:
+            return 0
+        return sum(value for _, value in self._fields(parent_type, selection_set, depth, visited))
+
+    def _fields(self, parent_type: GraphQLNamedType, selection_set: SelectionSetNode, depth: int, visited):
+        """(nombre del campo, costo) de cada campo de la selección"""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                name = selection.name.value
+                # La introspección (GraphiQL) no consulta la BD
+                if name.startswith("__"):
+                    continue
+
+                field_def = getattr(parent_type, "fields", {}).get(name)
+                if field_def is None:
+                    continue  # Lo reporta la validación estándar
+
+                self.max_depth = max(self.max_depth, depth)
+                declared = self._declared_cost(field_def)
+                base = declared.base if declared else (DEFAULT_ROOT_COST if depth == 1 else 0)
+                multiplier = self._multiplier(declared, field_def, selection)
+
+                children = self._cost(get_named_type(field_def.type), selection.selection_set, depth + 1, visited)
+                yield name, multiplier * (base + children)
+
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition else parent_type
+                )
+                yield from self._fields(fragment_type or parent_type, selection.selection_set, depth, visited)
+
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited:
+                    continue  # Fragmento inexistente o cíclico: lo reporta la validación estándar
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value) or parent_type
+                yield from self._fields(fragment_type, fragment.selection_set, depth, visited | {name})
+
+    @staticmethod
+    def _declared_cost(field_def) -> Optional[FieldCost]:
+        strawberry_field = field_def.extensions.get("strawberry-definition")
+        metadata = getattr(strawberry_field, "metadata", None) or {}
+        return metadata.get(COST_METADATA_KEY)
+
+    def _multiplier(self, declared: Optional[FieldCost], field_def, node: FieldNode) -> int:
+        if declared is None or declared.multiplier is None:
+            return 1
+        try:
+            args = get_argument_values(field_def, node, self.variables)
+        except GraphQLError:
+            return 1  # Argumentos inválidos: los reporta la validación estándar
+        return max(1, int(declared.multiplier(_python_names(args))))
@@ -0,0 +1,80 @@
+"""Extensión de Strawberry que valida permisos antes de ejecutar"""
+from functools import lru_cache
+from typing import FrozenSet, Type
+
+from graphql import GraphQLError
+from graphql.language import FieldNode
+from graphql.validation import ValidationRule
+from strawberry.extensions import SchemaExtension
+
+from app.shared.security.permissions import (
+    PERMISSION_METADATA_KEY,
+    Permission,
+    missing_permissions,
+    permissions_for,
+)
+
+
+class PermissionExtension(SchemaExtension):
+    """
+    Rechaza la operación en la fase de validación si pide un campo para el
+    que el usuario no tiene permiso.
+
+    - El usuario se resuelve una sola vez por request (el context ya lo trae)
+      y sus permisos se toman de la tabla por rol calculada al arrancar
+    - Los campos declaran sus permisos con `metadata=requires(...)`
+    - Si falta un permiso no se ejecuta ningún resolver: no se abre ninguna
+      consulta ni se construye ningún caso de uso
+    """
+
+    def on_validate(self):
+        context = self.execution_context.context
+        user = context.get("current_user") if isinstance(context, dict) else getattr(context, "current_user", None)
+        granted = permissions_for(user)
+
+        # Los resolvers pueden consultar los permisos sin recalcularlos
+        if isinstance(context, dict):
+            context["permissions"] = granted
+
+        self.execution_context.validation_rules = (
+            *self.execution_context.validation_rules,
+            _permission_rule(granted),
+        )
+        yield
+
+
+@lru_cache(maxsize=None)
+def _permission_rule(granted: FrozenSet[Permission]) -> Type[ValidationRule]:
+    """Regla de validación para un conjunto de permisos (una por rol, cacheada)"""
+
+    class PermissionRule(ValidationRule):
+        def enter_field(self, node: FieldNode, *_args):
+            field_def = self.context.get_field_def()
+            if field_def is None:
+                return
+
+            strawberry_field = field_def.extensions.get("strawberry-definition")
+            required = getattr(strawberry_field, "metadata", None) or {}
+            required = required.get(PERMISSION_METADATA_KEY)
+            if not required:
+                return
+
+            missing = missing_permissions(granted, required)
+            if not missing:
+                return
+
+            if not granted:
+                message, code = "Debes estar autenticado", "UNAUTHENTICATED"
+            else:
+                message, code = "No tienes permisos para esta operación", "FORBIDDEN"
+
+            self.report_error(GraphQLError(
+                f"{message}: {node.name.value}",
+                node,
+                extensions={
+                    "code": code,
+                    "missing_permissions": sorted(p.value for p in missing),
+                },
+            ))
+
+    return PermissionRule
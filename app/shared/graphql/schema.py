@@ -1,6 +1,9 @@
 """Module de definición del schema de GraphQL"""
 import strawberry
 
+from app.shared.graphql.cost import QueryCostExtension
+from app.shared.graphql.permissions import PermissionExtension
+
 from app.menu.infrastructure.graphql.menu_mutations import MenuMutations
 from app.menu.infrastructure.graphql.menu_queries import MenuQueries
 
@@ -13,6 +16,7 @@ from app.users.infrastructure.graphql.mutations import UserMutations
 from app.users.infrastructure.graphql.auth.auth_queries import AuthQueries
 from app.users.infrastructure.graphql.auth.auth_mutations import AuthMutations
 from app.attendance.infrastructure.graphql.attendance_mutations import AttendanceMutations
+from app.attendance.infrastructure.graphql.attendance_queries import AttendanceQueries
 from app.attendance.infrastructure.graphql.work_schedule_mutations import WorkScheduleMutations
 
 # 🔹 SANIDAD (nuevo módulo)
@@ -28,6 +32,7 @@ class Query(
     AuthQueries,
     RequestsQueries,
     WorkScheduleQueries,
+    AttendanceQueries,
     MenuQueries,
     SanitaryQueries,  # ⬅️ añadimos las queries de sanidad
 ):
@@ -57,4 +62,5 @@ class Mutation(
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    extensions=[PermissionExtension, QueryCostExtension],
 )
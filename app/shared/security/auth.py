@@ -4,24 +4,36 @@ from typing import Optional
 import jwt
 from app.users.application.ports.auth_service import AuthService
 from app.users.domain.user import User
+from app.shared.security.keyring import JWTKeyring
 
 
 class JWTAuthService(AuthService):
-    """Implementación del servicio de autenticación con JWT"""
+    """
+    Implementación del servicio de autenticación con JWT.
+
+    Con llavero (keyring) firma con la clave asimétrica activa (RS256/EdDSA)
+    y verifica según el `kid` de la cabecera; otros servicios pueden validar
+    los tokens con el JWKS público. Sin llavero usa el secreto compartido HS256.
+    """
 
     def __init__(
         self,
         secret_key: str,
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 30,
-        refresh_token_expire_days: int = 7
+        refresh_token_expire_days: int = 7,
+        keyring: Optional[JWTKeyring] = None,
+        accept_legacy_hs256: bool = True
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
+        self.keyring = keyring
+        # Durante la migración a claves asimétricas: aceptar tokens HS256 sin kid
+        self.accept_legacy_hs256 = accept_legacy_hs256
 
-    async def generate_access_token(self, user: User) -> str:
+    async def generate_access_token(self, user: User, session_id: Optional[str] = None) -> str:
         """Genera un token JWT de acceso"""
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=self.access_token_expire_minutes
@@ -35,11 +47,17 @@ class JWTAuthService(AuthService):
             "exp": expire,
             "iat": datetime.now(timezone.utc)
         }
+        if session_id:
+            payload["sid"] = session_id
 
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
-        return token
+        return self._encode(payload)
 
-    async def generate_refresh_token(self, user: User) -> str:
+    async def generate_refresh_token(
+        self,
+        user: User,
+        session_id: Optional[str] = None,
+        jti: Optional[str] = None
+    ) -> str:
         """Genera un token JWT de refresh"""
         expire = datetime.now(timezone.utc) + timedelta(
             days=self.refresh_token_expire_days
@@ -51,13 +69,25 @@ class JWTAuthService(AuthService):
             "exp": expire,
             "iat": datetime.now(timezone.utc)
         }
+        if session_id:
+            payload["sid"] = session_id
+        if jti:
+            payload["jti"] = jti
 
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
-        return token
+        return self._encode(payload)
 
     async def verify_token(self, token: str) -> Optional[dict]:
         """Verifica y decodifica un token JWT"""
         try:
+            if self.keyring:
+                kid = jwt.get_unverified_header(token).get("kid")
+                key = self.keyring.get(kid)
+                if key:
+                    return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+                if kid or not self.accept_legacy_hs256:
+                    # kid desconocido o ya retirado
+                    return None
+
             payload = jwt.decode(
                 token,
                 self.secret_key,
@@ -69,4 +99,17 @@ class JWTAuthService(AuthService):
             return None
         except jwt.InvalidTokenError:
             # Token inválido
-            return None
\ No newline at end of file
+            return None
+
+    def _encode(self, payload: dict) -> str:
+        """Firma con la clave activa del llavero o, sin llavero, con el secreto HS256"""
+        if self.keyring:
+            key = self.keyring.active
+            return jwt.encode(
+                payload,
+                key.private_key,
+                algorithm=key.algorithm,
+                headers={"kid": key.kid}
+            )
+
+        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
@@ -0,0 +1,105 @@
+"""Llavero de claves asimétricas para firmar y verificar JWT"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from jwt.algorithms import get_default_algorithms
+
+# Algoritmos asimétricos soportados
+SUPPORTED_ALGORITHMS = ("RS256", "EdDSA")
+
+
+@dataclass(frozen=True)
+class JWTKey:
+    """Clave del llavero, ya cargada (no se vuelve a parsear el PEM)"""
+    kid: str
+    algorithm: str
+    public_key: Any
+    private_key: Optional[Any] = None  # Solo la clave activa firma
+
+
+class JWTKeyring:
+    """
+    Llavero de claves identificadas por `kid`.
+
+    - Una clave activa firma los tokens nuevos (su kid va en la cabecera)
+    - Las claves retiradas se conservan solo con la parte pública durante
+      la ventana de rotación, para que los tokens ya emitidos sigan válidos
+    - Los PEM se cargan una sola vez al construir el llavero; verificar
+      reutiliza los objetos de clave ya cargados
+    """
+
+    def __init__(self, keys: List[JWTKey], active_kid: str):
+        self._keys: Dict[str, JWTKey] = {key.kid: key for key in keys}
+
+        active = self._keys.get(active_kid)
+        if not active or active.private_key is None:
+            raise ValueError(f"La clave activa '{active_kid}' no existe o no tiene clave privada")
+        self.active = active
+
+        self._jwks = {"keys": [self._to_jwk(key) for key in self._keys.values()]}
+
+    @classmethod
+    def from_directory(cls, keys_dir: str, active_kid: str) -> "JWTKeyring":
+        """
+        Carga las claves de una carpeta:
+        - <kid>.<alg>.pem      clave privada (la activa y, opcionalmente, otras)
+        - <kid>.<alg>.pub.pem  clave pública de una clave retirada
+        donde <alg> es rs256 o eddsa.
+        """
+        from cryptography.hazmat.primitives.serialization import (
+            load_pem_private_key,
+            load_pem_public_key,
+        )
+
+        keys: Dict[str, JWTKey] = {}
+        for path in sorted(Path(keys_dir).glob("*.pem")):
+            parts = path.name.split(".")
+            is_public = path.name.endswith(".pub.pem")
+            if len(parts) != (4 if is_public else 3):
+                continue
+
+            kid, algorithm = parts[0], _algorithm_from_suffix(parts[1])
+            data = path.read_bytes()
+
+            if is_public:
+                if kid not in keys:
+                    keys[kid] = JWTKey(kid=kid, algorithm=algorithm, public_key=load_pem_public_key(data))
+            else:
+                private_key = load_pem_private_key(data, password=None)
+                keys[kid] = JWTKey(
+                    kid=kid,
+                    algorithm=algorithm,
+                    public_key=private_key.public_key(),
+                    private_key=private_key
+                )
+
+        return cls(list(keys.values()), active_kid)
+
+    def get(self, kid: Optional[str]) -> Optional[JWTKey]:
+        """Clave de verificación para un kid (None si no existe o ya fue retirada)"""
+        if not kid:
+            return None
+        return self._keys.get(kid)
+
+    def jwks(self) -> dict:
+        """Claves públicas en formato JWKS (calculado una sola vez)"""
+        return self._jwks
+
+    @property
+    def kids(self) -> List[str]:
+        return list(self._keys)
+
+    @staticmethod
+    def _to_jwk(key: JWTKey) -> dict:
+        algorithm = get_default_algorithms()[key.algorithm]
+        jwk = algorithm.to_jwk(key.public_key, as_dict=True)
+        jwk.update({"kid": key.kid, "alg": key.algorithm, "use": "sig"})
+        return jwk
+
+
+def _algorithm_from_suffix(suffix: str) -> str:
+    for algorithm in SUPPORTED_ALGORITHMS:
+        if algorithm.lower() == suffix.lower():
+            return algorithm
+    raise ValueError(f"Algoritmo de clave no soportado: {suffix}")
@@ -0,0 +1,81 @@
+"""Permisos por rol, resueltos una sola vez al arrancar"""
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from app.users.domain.user_role import UserRole
+
+# Clave bajo la que los campos GraphQL declaran sus permisos (metadata)
+PERMISSION_METADATA_KEY = "permissions"
+
+
+class Permission(str, Enum):
+    """Operaciones protegidas del sistema"""
+    AUTHENTICATED = "authenticated"  # Cualquier usuario con sesión
+
+    MENU_UPLOAD = "menu:upload"
+    MENU_PROPOSE_CHANGE = "menu:propose_change"
+    MENU_REVIEW_CHANGE = "menu:review_change"
+
+    TIME_OFF_APPROVE = "time_off:approve"
+    TIME_OFF_VIEW_TEAM = "time_off:view_team"
+    SCHEDULE_ASSIGN = "schedule:assign"
+
+    ATTENDANCE_REGULARIZE = "attendance:regularize"
+    ATTENDANCE_VIEW_TEAM = "attendance:view_team"
+
+    USERS_MANAGE = "users:manage"
+
+
+# Qué roles (además de ADMIN, que tiene todos) pueden hacer cada operación
+_GRANTS: Dict[Permission, FrozenSet[UserRole]] = {
+    Permission.AUTHENTICATED: frozenset(UserRole),
+    Permission.MENU_UPLOAD: frozenset({UserRole.NUTRITIONIST}),
+    Permission.MENU_PROPOSE_CHANGE: frozenset({UserRole.COOK}),
+    Permission.MENU_REVIEW_CHANGE: frozenset({UserRole.NUTRITIONIST}),
+}
+
+
+def _build_role_permissions() -> Dict[UserRole, FrozenSet[Permission]]:
+    role_permissions = {}
+    for role in UserRole:
+        if role == UserRole.ADMIN:
+            role_permissions[role] = frozenset(Permission)
+        else:
+            role_permissions[role] = frozenset(
+                permission for permission, roles in _GRANTS.items() if role in roles
+            )
+    return role_permissions
+
+
+# Calculado una sola vez: en cada request solo se hace un lookup por rol
+ROLE_PERMISSIONS: Dict[UserRole, FrozenSet[Permission]] = _build_role_permissions()
+
+_NO_PERMISSIONS: FrozenSet[Permission] = frozenset()
+
+
+def permissions_for(user) -> FrozenSet[Permission]:
+    """Permisos del usuario autenticado (vacío si no hay sesión)"""
+    if user is None:
+        return _NO_PERMISSIONS
+    return ROLE_PERMISSIONS.get(user.role, _NO_PERMISSIONS)
+
+
+def has_permission(user, permission: Permission) -> bool:
+    return permission in permissions_for(user)
+
+
+def requires(*permissions: Permission, metadata: Optional[dict] = None) -> dict:
+    """
+    Metadata para declarar los permisos de un campo:
+
+        @strawberry.mutation(metadata=requires(Permission.TIME_OFF_APPROVE))
+
+    La extensión de permisos la lee al validar la operación.
+    """
+    result = dict(metadata or {})
+    result[PERMISSION_METADATA_KEY] = frozenset(permissions or (Permission.AUTHENTICATED,))
+    return result
+
+
+def missing_permissions(granted: FrozenSet[Permission], required: Iterable[Permission]) -> FrozenSet[Permission]:
+    return frozenset(required) - granted
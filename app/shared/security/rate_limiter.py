@@ -0,0 +1,145 @@
+"""Limitador de intentos de login por ventana deslizante"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Optional, Tuple
+import time
+
+from app.users.application.ports.login_rate_limiter import LoginRateLimiter
+
+
+class RateLimitBackend(ABC):
+    """Almacén de intentos; en memoria por proceso o compartido entre workers"""
+
+    @abstractmethod
+    async def hit(self, limits: Dict[str, int], now: float, window_seconds: int) -> Optional[Tuple[str, float]]:
+        """
+        Registra el intento en todas las claves solo si cada una está por
+        debajo de su límite ({clave: límite}, se revisan en orden).
+        Un intento rechazado no se registra en ninguna clave.
+
+        Retorna None si se registró, o (clave excedida, instante de su intento más antiguo).
+        """
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """Borra los intentos de una clave"""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Ventana deslizante en memoria (un deque de instantes por clave).
+    Acotado: si hay demasiadas claves se descartan las menos recientes.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._hits: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    async def hit(self, limits: Dict[str, int], now: float, window_seconds: int) -> Optional[Tuple[str, float]]:
+        cutoff = now - window_seconds
+        windows = []
+        for key, limit in limits.items():
+            hits = self._window(key, cutoff)
+            if len(hits) >= limit:
+                return key, hits[0]
+            windows.append(hits)
+
+        for hits in windows:
+            hits.append(now)
+        return None
+
+    def _window(self, key: str, cutoff: float) -> Deque[float]:
+        """Intentos de la clave dentro de la ventana"""
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = deque()
+            self._hits[key] = hits
+            while len(self._hits) > self.max_keys:
+                self._hits.popitem(last=False)
+        else:
+            self._hits.move_to_end(key)
+
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+        return hits
+
+    async def reset(self, key: str) -> None:
+        self._hits.pop(key, None)
+
+
+@dataclass
+class LoginRateLimitMetrics:
+    """Métricas en memoria del limitador de login"""
+    allowed: int = 0
+    rejected_by_email: int = 0
+    rejected_by_ip: int = 0
+    backend_errors: int = 0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class SlidingWindowLoginRateLimiter(LoginRateLimiter):
+    """
+    Limita los intentos de login por email y por IP en una ventana deslizante.
+
+    Se consulta antes de buscar al usuario y de verificar la contraseña,
+    así una ráfaga de credential stuffing se corta sin gastar bcrypt.
+    Un login exitoso limpia el contador del email (no el de la IP: en una
+    IP compartida el límite por IP es más alto).
+
+    Solo se registran los intentos que pasan el límite: quien sigue
+    enviando intentos ya bloqueados no alarga el bloqueo del email.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        max_attempts_per_email: int = 5,
+        max_attempts_per_ip: int = 100,
+        window_seconds: int = 900
+    ):
+        self.backend = backend
+        self.max_attempts_per_email = max_attempts_per_email
+        self.max_attempts_per_ip = max_attempts_per_ip
+        self.window_seconds = window_seconds
+        self.metrics = LoginRateLimitMetrics()
+
+    async def acquire(self, email: str, ip_address: Optional[str]) -> Optional[int]:
+        now = time.time()
+        limits = {}
+        # 1. Por IP primero: corta ráfagas que rotan emails
+        if ip_address:
+            limits[f"ip:{ip_address}"] = self.max_attempts_per_ip
+        # 2. Por email: corta ataques dirigidos a una cuenta
+        limits[f"email:{_normalize_email(email)}"] = self.max_attempts_per_email
+
+        try:
+            rejected = await self.backend.hit(limits, now, self.window_seconds)
+            if rejected:
+                key, oldest = rejected
+                if key.startswith("ip:"):
+                    self.metrics.rejected_by_ip += 1
+                else:
+                    self.metrics.rejected_by_email += 1
+                return self._retry_after(oldest, now)
+        except Exception:
+            # Si el backend compartido falla no se bloquea el login
+            self.metrics.backend_errors += 1
+
+        self.metrics.allowed += 1
+        return None
+
+    async def reset(self, email: str) -> None:
+        try:
+            await self.backend.reset(f"email:{_normalize_email(email)}")
+        except Exception:
+            self.metrics.backend_errors += 1
+
+    def _retry_after(self, oldest: float, now: float) -> int:
+        return max(int(oldest + self.window_seconds - now) + 1, 1)
+
+
+def _normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
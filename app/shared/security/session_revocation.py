@@ -0,0 +1,89 @@
+"""Índice en memoria de sesiones revocadas"""
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Optional
+import threading
+
+
+class RevokedSessionIndex:
+    """
+    Índice en memoria de sesiones revocadas, consultado en cada request.
+
+    Un access token lleva el id de su sesión (claim "sid"). Para rechazarlo
+    basta una búsqueda en un dict, sin ir a la BD: los tokens no revocados
+    (el caso normal) nunca generan consultas.
+
+    Una entrada solo necesita vivir lo que dura un access token: pasado ese
+    tiempo, cualquier token de la sesión ya expiró por sí mismo y el refresh
+    siempre se valida contra la BD. Por eso el índice es acotado (LRU por
+    vencimiento) y no crece con el histórico.
+
+    Con varios workers, `publisher` avisa cada revocación a los demás
+    (canal entre workers), que la registran con `apply_remote`.
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta,
+        max_entries: int = 100_000,
+        publisher: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.publisher = publisher
+        self._entries: "OrderedDict[str, datetime]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def revoke(self, session_id: str, revoked_at: Optional[datetime] = None, publish: bool = True) -> None:
+        """Registra una sesión revocada"""
+        self.revoke_many([session_id], revoked_at, publish)
+
+    def revoke_many(
+        self,
+        session_ids: Iterable[str],
+        revoked_at: Optional[datetime] = None,
+        publish: bool = True,
+    ) -> None:
+        revoked_at = revoked_at or datetime.now(timezone.utc)
+        session_ids = list(session_ids)
+        until = revoked_at + self.ttl
+        with self._lock:
+            for session_id in session_ids:
+                self._entries[session_id] = until
+                self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if publish and self.publisher and session_ids:
+            self.publisher({"session_ids": session_ids, "revoked_at": revoked_at.isoformat()})
+
+    def apply_remote(self, data: Dict[str, Any]) -> None:
+        """Registra revocaciones hechas en otro worker"""
+        self.revoke_many(data["session_ids"], datetime.fromisoformat(data["revoked_at"]), publish=False)
+
+    def is_revoked(self, session_id: Optional[str], now: Optional[datetime] = None) -> bool:
+        """Verifica si la sesión fue revocada (O(1), sin BD)"""
+        if not session_id:
+            return False
+
+        until = self._entries.get(session_id)
+        if until is None:
+            return False
+
+        if until < (now or datetime.now(timezone.utc)):
+            self._purge()
+            return False
+        return True
+
+    def _purge(self) -> None:
+        """Elimina las entradas vencidas (están ordenadas por vencimiento)"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            while self._entries:
+                session_id, until = next(iter(self._entries.items()))
+                if until >= now:
+                    break
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,119 @@
+"""Caché en memoria de los usuarios autenticados (current_user)"""
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import threading
+import time
+
+from app.users.domain.user import User
+
+
+@dataclass
+class UserCacheMetrics:
+    """Métricas en memoria de la caché de usuarios autenticados"""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    stale_loads: int = 0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class AuthenticatedUserCache:
+    """
+    Usuarios autenticados por proceso, para armar current_user en cada
+    request sin consultar la tabla users.
+
+    - Un request autenticado solo necesita id, rol y estado (permisos) y
+      los datos de perfil que muestra `me`: se guarda una copia sin hashes
+      de contraseña, de solo lectura. Los casos de uso que modifican al
+      usuario lo cargan de la BD con UserRepository
+    - TTL corto y tamaño acotado (LRU)
+    - Cada cambio de un usuario (rol, estado, activación) llama a
+      `invalidate(user_id)`; con `publisher` se avisa a los demás workers,
+      que lo aplican con `apply_remote`
+    - Como en ReferenceDataCache, una carga solo se instala si no hubo una
+      invalidación del mismo usuario mientras se leía de la BD
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10_000,
+        publisher: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.publisher = publisher
+        self.metrics = UserCacheMetrics()
+        self._entries: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._generation = 0  # Sube con clear(): descarta cargas en curso de cualquier usuario
+        self._lock = threading.Lock()
+
+    def _version(self, user_id: str) -> Tuple[int, int]:
+        return self._generation, self._versions.get(user_id, 0)
+
+    def peek(self, user_id: str) -> Optional[User]:
+        """Usuario vigente en caché, sin cargar (None si no hay)"""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        user, loaded_at = entry
+        if time.monotonic() - loaded_at > self.ttl_seconds:
+            with self._lock:
+                self._entries.pop(user_id, None)
+            return None
+        return user
+
+    async def get(self, user_id: str, loader: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        """Retorna el usuario cacheado o lo carga con `loader` (una consulta por id)"""
+        user = self.peek(user_id)
+        if user is not None:
+            self.metrics.hits += 1
+            return user
+
+        self.metrics.misses += 1
+        version = self._version(user_id)
+        loaded = await loader()
+        if loaded is None:
+            return None
+
+        user = replace(loaded, password_hash=None, previous_passwords=[])
+        with self._lock:
+            if version != self._version(user_id):
+                self.metrics.stale_loads += 1
+                return user
+
+            self._entries[user_id] = (user, time.monotonic())
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return user
+
+    def invalidate(self, user_id: str, publish: bool = True) -> None:
+        """Descarta al usuario (llamar tras cambiar su rol, estado o perfil)"""
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._entries.pop(user_id, None)
+        self.metrics.invalidations += 1
+        if publish and self.publisher:
+            self.publisher({"user_id": user_id})
+
+    def apply_remote(self, data: Dict[str, Any]) -> None:
+        """Aplica una invalidación publicada por otro worker"""
+        self.invalidate(data["user_id"], publish=False)
+
+    async def resync(self) -> None:
+        """Tras perder avisos de otros workers: todo vuelve a cargarse de la BD"""
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
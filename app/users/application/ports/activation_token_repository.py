@@ -3,7 +3,7 @@ Puerto (interfaz) para el repositorio de tokens de activación.
 Define el contrato que debe cumplir cualquier implementación.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List
 from app.users.domain.activation_token import ActivationToken
 
 
@@ -13,7 +13,7 @@ class ActivationTokenRepository(ABC):
     @abstractmethod
     async def save(self, token: ActivationToken) -> ActivationToken:
         """
-        Guarda un token de activación.
+        Guarda un token de activación (sin commit: lo hace la UnitOfWork).
 
         Args:
             token: Token a guardar
@@ -50,8 +50,21 @@ class ActivationTokenRepository(ABC):
     @abstractmethod
     async def invalidate_user_tokens(self, user_id: str) -> None:
         """
-        Invalida todos los tokens activos de un usuario.
+        Invalida todos los tokens activos de un usuario (sin commit).
 
         Args:
             user_id: ID del usuario
         """
+
+    @abstractmethod
+    async def add_many(self, tokens: List[ActivationToken]) -> List[ActivationToken]:
+        """
+        Inserta varios tokens con un solo INSERT multi-fila.
+        No hace commit: queda dentro de la transacción del caso de uso.
+
+        Args:
+            tokens: Tokens a insertar
+
+        Returns:
+            Tokens con ID asignado
+        """
@@ -6,13 +6,18 @@ class AuthService(ABC):
     """Puerto para el servicio de autenticación"""
 
     @abstractmethod
-    async def generate_access_token(self, user: User) -> str:
-        """Genera un token JWT de acceso"""
+    async def generate_access_token(self, user: User, session_id: Optional[str] = None) -> str:
+        """Genera un token JWT de acceso (ligado a la sesión si se indica)"""
         pass
 
     @abstractmethod
-    async def generate_refresh_token(self, user: User) -> str:
-        """Genera un token JWT de refresh"""
+    async def generate_refresh_token(
+        self,
+        user: User,
+        session_id: Optional[str] = None,
+        jti: Optional[str] = None
+    ) -> str:
+        """Genera un token JWT de refresh (con sesión y jti para rotación)"""
         pass
 
     @abstractmethod
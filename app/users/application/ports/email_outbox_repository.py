@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from datetime import datetime
+from app.users.domain.outbox_email import OutboxEmail
+
+class EmailOutboxRepository(ABC):
+    """Puerto para la bandeja de salida de emails (outbox)"""
+
+    @abstractmethod
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        """Encola un email (sin commit: junto con la escritura que lo origina)"""
+        pass
+
+    @abstractmethod
+    async def enqueue_many(self, emails: List[OutboxEmail]) -> int:
+        """Encola varios emails con un solo INSERT multi-fila (sin commit)"""
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, limit: int, now: datetime) -> List[OutboxEmail]:
+        """
+        Toma un lote de emails listos para enviar y los marca como 'sending'.
+        Varias instancias del worker no toman el mismo email (SKIP LOCKED).
+        """
+        pass
+
+    @abstractmethod
+    async def save_results(self, emails: List[OutboxEmail]) -> None:
+        """Persiste el resultado (enviado, reintento o fallido) de un lote"""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self) -> Dict[str, int]:
+        """Cantidad de emails por estado (métricas de la cola)"""
+        pass
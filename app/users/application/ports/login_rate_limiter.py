@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class LoginRateLimiter(ABC):
+    """Puerto para limitar intentos de login (fuerza bruta / credential stuffing)"""
+
+    @abstractmethod
+    async def acquire(self, email: str, ip_address: Optional[str]) -> Optional[int]:
+        """
+        Registra un intento de login.
+
+        Returns:
+            None si el intento está permitido, o los segundos a esperar si
+            se superó el límite (en ese caso no se debe tocar la BD ni bcrypt)
+        """
+        pass
+
+    @abstractmethod
+    async def reset(self, email: str) -> None:
+        """Limpia el contador del email tras un login exitoso"""
+        pass
@@ -3,8 +3,9 @@ Puerto (interfaz) para el repositorio de usuarios.
 Define el contrato que debe cumplir cualquier implementación.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List, Set, Tuple
 from app.users.domain.user import User
+from app.users.domain.user_role import UserRole
 
 
 class UserRepository(ABC):
@@ -13,7 +14,7 @@ class UserRepository(ABC):
     @abstractmethod
     async def save(self, user: User) -> User:
         """
-        Guarda o actualiza un usuario.
+        Guarda o actualiza un usuario (sin commit: lo hace la UnitOfWork).
 
         Args:
             user: Usuario a guardar
@@ -86,4 +87,50 @@ class UserRepository(ABC):
         Returns:
             True si existe, False si no
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_existing_identifiers(
+        self,
+        employee_ids: List[str],
+        emails: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Busca en una sola consulta cuáles employee_id y emails ya existen.
+
+        Args:
+            employee_ids: Employee IDs a verificar
+            emails: Emails a verificar
+
+        Returns:
+            (employee_ids existentes, emails existentes)
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, users: List[User]) -> List[User]:
+        """
+        Inserta varios usuarios nuevos con un solo INSERT multi-fila.
+        No hace commit: queda dentro de la transacción del caso de uso.
+
+        Args:
+            users: Usuarios a insertar
+
+        Returns:
+            Usuarios con ID asignado
+        """
+        pass
+
+    @abstractmethod
+    async def find_active_by_roles(self, roles: List[UserRole]) -> List[User]:
+        """
+        Busca los usuarios activos con alguno de los roles indicados
+        (destinatarios de avisos del sistema).
+
+        Args:
+            roles: Roles a incluir
+
+        Returns:
+            Lista de usuarios activos
+        """
+        pass
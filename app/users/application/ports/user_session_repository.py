@@ -0,0 +1,82 @@
+"""
+Puerto (interfaz) para el repositorio de sesiones (refresh tokens).
+Define el contrato que debe cumplir cualquier implementación.
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, List
+from app.users.domain.user_session import UserSession
+
+
+class UserSessionRepository(ABC):
+    """Puerto para el repositorio de sesiones de usuario"""
+
+    @abstractmethod
+    async def create(self, session: UserSession) -> UserSession:
+        """
+        Registra una sesión nueva (login).
+
+        Args:
+            session: Sesión a guardar
+
+        Returns:
+            Sesión guardada con ID asignado
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, session_id: str) -> Optional[UserSession]:
+        """
+        Busca una sesión por ID.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Sesión encontrada o None
+        """
+        pass
+
+    @abstractmethod
+    async def rotate(
+        self,
+        session_id: str,
+        current_jti_hash: str,
+        new_jti_hash: str,
+        now: datetime
+    ) -> bool:
+        """
+        Reemplaza el jti vigente solo si sigue siendo current_jti_hash
+        y la sesión no está revocada (UPDATE condicional).
+
+        Returns:
+            True si rotó, False si otro refresh se adelantó o fue revocada
+        """
+        pass
+
+    @abstractmethod
+    async def revoke(self, session_id: str, reason: str, now: datetime) -> Optional[UserSession]:
+        """
+        Revoca una sesión.
+
+        Returns:
+            Sesión revocada o None si no existía o ya estaba revocada
+        """
+        pass
+
+    @abstractmethod
+    async def revoke_all_for_user(self, user_id: str, reason: str, now: datetime) -> List[UserSession]:
+        """
+        Revoca todas las sesiones activas de un usuario.
+
+        Returns:
+            Sesiones revocadas
+        """
+        pass
+
+    @abstractmethod
+    async def find_revoked_since(self, since: datetime) -> List[UserSession]:
+        """
+        Sesiones revocadas desde `since` (para precargar el índice en memoria al arrancar).
+        """
+        pass
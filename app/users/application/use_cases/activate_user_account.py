@@ -7,6 +7,7 @@ from app.users.application.ports.user_repository import UserRepository
 from app.users.application.ports.activation_token_repository import ActivationTokenRepository
 from app.users.application.ports.email_service import EmailService
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 
 @dataclass
@@ -30,18 +31,22 @@ class ActivateUserAccountUseCase:
     3. Valida la contraseña
     4. Activa la cuenta del usuario
     5. Invalida el token
-    6. Envía email de confirmación
+    6. Encola el email de confirmación
+
+    Todo se confirma en una sola transacción (usuario, tokens y email).
     """
 
     def __init__(
         self,
         user_repository: UserRepository,
         token_repository: ActivationTokenRepository,
-        email_service: EmailService
+        email_service: EmailService,
+        unit_of_work: UnitOfWork
     ):
         self.user_repository = user_repository
         self.token_repository = token_repository
         self.email_service = email_service
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: ActivateUserAccountCommand) -> dict:
         # 1. Validar formato de contraseñas
@@ -82,21 +87,28 @@ class ActivateUserAccountUseCase:
             data_consent=command.data_processing_consent
         )
 
-        # 7. Guardar usuario actualizado
-        updated_user = await self.user_repository.save(user)
+        try:
+            # 7. Guardar usuario actualizado
+            updated_user = await self.user_repository.save(user)
 
-        # 8. Marcar token como usado
-        token.mark_as_used()
-        await self.token_repository.save(token)
+            # 8. Marcar token como usado
+            token.mark_as_used()
+            await self.token_repository.save(token)
 
-        # 9. Invalidar otros tokens del usuario (si existieran)
-        await self.token_repository.invalidate_user_tokens(user.id)
+            # 9. Invalidar otros tokens del usuario (si existieran)
+            await self.token_repository.invalidate_user_tokens(user.id)
 
-        # 10. Enviar email de confirmación
-        await self.email_service.send_account_activated_email(
-            to_email=updated_user.email,
-            user_name=updated_user.full_name
-        )
+            # 10. Enviar email de confirmación
+            await self.email_service.send_account_activated_email(
+                to_email=updated_user.email,
+                user_name=updated_user.full_name
+            )
+
+            # 11. Confirmar todo junto
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         return {
             "user_id": updated_user.id,
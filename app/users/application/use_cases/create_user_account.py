@@ -12,6 +12,7 @@ from app.users.application.ports.user_repository import UserRepository
 from app.users.application.ports.activation_token_repository import ActivationTokenRepository
 from app.users.application.ports.email_service import EmailService
 from app.building_blocks.exceptions import DomainException
+from app.building_blocks.unit_of_work import UnitOfWork
 
 
 @dataclass
@@ -36,18 +37,23 @@ class CreateUserAccountUseCase:
     1. Valida que no exista el usuario
     2. Crea el usuario en estado PENDING_ACTIVATION
     3. Genera un token de activación seguro
-    4. Envía email con link de activación
+    4. Encola el email con link de activación
+
+    Usuario, token y email se confirman en una sola transacción: con el
+    outbox, el email no se pierde si el proceso cae tras crear el usuario.
     """
 
     def __init__(
         self,
         user_repository: UserRepository,
         token_repository: ActivationTokenRepository,
-        email_service: EmailService
+        email_service: EmailService,
+        unit_of_work: UnitOfWork
     ):
         self.user_repository = user_repository
         self.token_repository = token_repository
         self.email_service = email_service
+        self.unit_of_work = unit_of_work
 
     async def execute(self, command: CreateUserAccountCommand) -> dict:
         # 1. Validar que no exista el usuario
@@ -67,33 +73,40 @@ class CreateUserAccountUseCase:
             created_at=datetime.now(timezone.utc)
         )
 
-        # 3. Guardar usuario
-        saved_user = await self.user_repository.save(user)
+        try:
+            # 3. Guardar usuario
+            saved_user = await self.user_repository.save(user)
 
-        # 4. Generar token de activación
-        token = ActivationToken(
-            token=ActivationToken.generate_secure_token(),
-            user_id=saved_user.id,
-            employee_id=saved_user.employee_id,
-            created_at=datetime.now(timezone.utc)
-        )
+            # 4. Generar token de activación
+            token = ActivationToken(
+                token=ActivationToken.generate_secure_token(),
+                user_id=saved_user.id,
+                employee_id=saved_user.employee_id,
+                created_at=datetime.now(timezone.utc)
+            )
 
-        # 5. Guardar token
-        saved_token = await self.token_repository.save(token)
+            # 5. Guardar token
+            saved_token = await self.token_repository.save(token)
 
-        # 6. Construir link de activación
-        activation_link = f"{command.activation_base_url}/activate?token={saved_token.token}"
+            # 6. Construir link de activación
+            activation_link = f"{command.activation_base_url}/activate?token={saved_token.token}"
 
-        # 7. Enviar email de activación
-        email_sent = await self.email_service.send_activation_email(
-            to_email=saved_user.email,
-            user_name=saved_user.full_name,
-            activation_link=activation_link,
-            expires_in_hours=48
-        )
+            # 7. Enviar email de activación
+            email_sent = await self.email_service.send_activation_email(
+                to_email=saved_user.email,
+                user_name=saved_user.full_name,
+                activation_link=activation_link,
+                expires_in_hours=48
+            )
+
+            if not email_sent:
+                raise DomainException("No se pudo enviar el email de activación")
 
-        if not email_sent:
-            raise DomainException("No se pudo enviar el email de activación")
+            # 8. Confirmar usuario, token y email juntos
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
 
         return {
             "user_id": saved_user.id,
@@ -0,0 +1,299 @@
+"""
+Caso de uso: Importar cuentas de usuario en bloque desde un archivo de RRHH (CSV/XLSX).
+"""
+import csv
+import io
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.users.domain.user import User, UserRole, UserStatus
+from app.users.domain.activation_token import ActivationToken
+from app.users.domain.outbox_email import OutboxEmail, EMAIL_ACTIVATION
+
+from app.users.application.ports.user_repository import UserRepository
+from app.users.application.ports.activation_token_repository import ActivationTokenRepository
+from app.users.application.ports.email_outbox_repository import EmailOutboxRepository
+from app.building_blocks.unit_of_work import UnitOfWork
+from app.building_blocks.exceptions import DomainException
+from app.shared.excel.workbook import get_load_workbook
+
+# Límite de filas por archivo (una temporada de contratación cabe de sobra)
+MAX_IMPORT_ROWS = 2000
+
+# Horas de validez del link de activación (igual que en la creación individual)
+ACTIVATION_EXPIRE_HOURS = 48
+
+REQUIRED_COLUMNS = ("employee_id", "email", "full_name", "dni", "role")
+
+# Encabezados aceptados en el archivo de RRHH -> columna interna
+COLUMN_ALIASES = {
+    "EMPLOYEE_ID": "employee_id",
+    "CODIGO": "employee_id",
+    "EMAIL": "email",
+    "CORREO": "email",
+    "FULL_NAME": "full_name",
+    "NOMBRE": "full_name",
+    "NOMBRE COMPLETO": "full_name",
+    "DNI": "dni",
+    "ROLE": "role",
+    "ROL": "role",
+    "PHONE": "phone",
+    "TELEFONO": "phone",
+    "ADDRESS": "address",
+    "DIRECCION": "address",
+}
+
+
+@dataclass
+class ImportUserAccountsCommand:
+    """Comando para importar cuentas desde un archivo (ejecutado por admin)"""
+    filename: str
+    content: bytes  # Contenido del .csv o .xlsx
+    created_by: Optional[str] = None  # ID del admin
+    activation_base_url: str = ""
+    dry_run: bool = False  # Solo validar, sin crear nada
+
+
+class ImportUserAccountsUseCase:
+    """
+    Caso de uso: Alta masiva de empleados.
+
+    Este caso de uso:
+    1. Lee y valida todo el archivo en memoria
+    2. Verifica duplicados contra la BD con una sola consulta
+    3. Inserta usuarios y tokens en INSERT multi-fila dentro de una transacción
+    4. Encola los emails de activación en bloque
+
+    Si alguna fila tiene errores no se crea ninguna cuenta (todo o nada),
+    y se devuelven los errores con su número de fila.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        token_repository: ActivationTokenRepository,
+        outbox_repository: EmailOutboxRepository,
+        unit_of_work: UnitOfWork
+    ):
+        self.user_repository = user_repository
+        self.token_repository = token_repository
+        self.outbox_repository = outbox_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, command: ImportUserAccountsCommand) -> dict:
+        # 1. Leer el archivo
+        rows = parse_import_file(command.filename, command.content)
+        if not rows:
+            raise DomainException("El archivo no contiene filas para importar")
+
+        if len(rows) > MAX_IMPORT_ROWS:
+            raise DomainException(f"No se pueden importar más de {MAX_IMPORT_ROWS} filas a la vez")
+
+        # 2. Validar en memoria (formato, roles y duplicados dentro del archivo)
+        now = datetime.now(timezone.utc)
+        users, errors = self._build_users(rows, command.created_by, now)
+
+        # 3. Duplicados contra la BD en una sola consulta
+        existing_employee_ids, existing_emails = await self.user_repository.find_existing_identifiers(
+            [u.employee_id for _, u in users],
+            [u.email for _, u in users]
+        )
+        for row_number, user in users:
+            if user.employee_id in existing_employee_ids:
+                errors.append(_row_error(row_number, f"Ya existe un usuario con el employee_id: {user.employee_id}"))
+            if user.email in existing_emails:
+                errors.append(_row_error(row_number, f"Ya existe un usuario con el email: {user.email}"))
+
+        errors.sort(key=lambda e: e["row"])
+
+        if errors or command.dry_run:
+            error_rows = {e["row"] for e in errors}
+            return {
+                "created_count": 0,
+                "valid_count": sum(1 for row_number, _ in users if row_number not in error_rows),
+                "errors": errors,
+                "message": (
+                    f"Se encontraron {len(errors)} errores; no se creó ninguna cuenta"
+                    if errors else f"Archivo válido: {len(users)} cuentas listas para crear"
+                )
+            }
+
+        # 4. Generar tokens de activación
+        new_users = [u for _, u in users]
+        tokens = []
+        for user in new_users:
+            token = ActivationToken(
+                token=ActivationToken.generate_secure_token(),
+                employee_id=user.employee_id,
+                created_at=now,
+                expires_at=now + timedelta(hours=ACTIVATION_EXPIRE_HOURS)
+            )
+            tokens.append(token)
+
+        # 5. Insertar todo en una transacción
+        try:
+            await self.user_repository.add_many(new_users)
+            for user, token in zip(new_users, tokens):
+                token.user_id = user.id
+            await self.token_repository.add_many(tokens)
+
+            emails = []
+            for user, token in zip(new_users, tokens):
+                emails.append(
+                    OutboxEmail(
+                        kind=EMAIL_ACTIVATION,
+                        to_email=user.email,
+                        context={
+                            "user_name": user.full_name,
+                            "activation_link": f"{command.activation_base_url}/activate?token={token.token}",
+                            "expires_in_hours": ACTIVATION_EXPIRE_HOURS
+                        }
+                    )
+                )
+            await self.outbox_repository.enqueue_many(emails)
+
+            await self.unit_of_work.commit()
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        return {
+            "created_count": len(new_users),
+            "valid_count": len(new_users),
+            "errors": [],
+            "user_ids": [u.id for u in new_users],
+            "message": f"{len(new_users)} cuentas creadas. Se encolaron los emails de activación."
+        }
+
+    def _build_users(
+        self,
+        rows: List[Tuple[int, Dict[str, str]]],
+        created_by: Optional[str],
+        now: datetime
+    ) -> Tuple[List[Tuple[int, User]], List[dict]]:
+        """Valida cada fila y construye los usuarios; acumula errores por fila"""
+        users: List[Tuple[int, User]] = []
+        errors: List[dict] = []
+        seen_employee_ids: Dict[str, int] = {}
+        seen_emails: Dict[str, int] = {}
+
+        for row_number, row in rows:
+            missing = [c for c in REQUIRED_COLUMNS if not row.get(c)]
+            if missing:
+                errors.append(_row_error(row_number, f"Faltan campos obligatorios: {', '.join(missing)}"))
+                continue
+
+            try:
+                role = UserRole(row["role"].lower())
+            except ValueError:
+                errors.append(_row_error(row_number, f"Rol inválido: {row['role']}"))
+                continue
+
+            try:
+                user = User(
+                    employee_id=row["employee_id"],
+                    email=row["email"],
+                    full_name=row["full_name"],
+                    dni=row["dni"],
+                    role=role,
+                    phone=row.get("phone") or None,
+                    address=row.get("address") or None,
+                    status=UserStatus.PENDING_ACTIVATION,
+                    created_by=created_by,
+                    created_at=now,
+                    updated_at=now
+                )
+            except DomainException as e:
+                errors.append(_row_error(row_number, e.message))
+                continue
+
+            # Duplicados dentro del mismo archivo
+            email_key = user.email.lower()
+            if user.employee_id in seen_employee_ids:
+                errors.append(_row_error(
+                    row_number,
+                    f"employee_id repetido en el archivo (fila {seen_employee_ids[user.employee_id]})"
+                ))
+                continue
+            if email_key in seen_emails:
+                errors.append(_row_error(
+                    row_number,
+                    f"Email repetido en el archivo (fila {seen_emails[email_key]})"
+                ))
+                continue
+
+            seen_employee_ids[user.employee_id] = row_number
+            seen_emails[email_key] = row_number
+            users.append((row_number, user))
+
+        return users, errors
+
+
+def parse_import_file(filename: str, content: bytes) -> List[Tuple[int, Dict[str, str]]]:
+    """
+    Lee un .csv o .xlsx y devuelve [(número de fila, {columna: valor})].
+    La fila 1 es la cabecera; las filas vacías se ignoran.
+    """
+    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+    if ext == "csv":
+        text = content.decode("utf-8-sig")
+        sample = text[:2048]
+        delimiter = ";" if sample.count(";") > sample.count(",") else ","
+        raw_rows = list(csv.reader(io.StringIO(text), delimiter=delimiter))
+    elif ext in {"xlsx", "xlsm"}:
+        load_workbook = get_load_workbook()
+        if load_workbook is None:
+            raise DomainException("No está instalado 'openpyxl' en el servidor para leer archivos Excel.")
+        wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        ws = wb.worksheets[0]
+        raw_rows = [list(r) for r in ws.iter_rows(values_only=True)]
+        wb.close()
+    else:
+        raise DomainException("Solo se soportan archivos .csv y .xlsx")
+
+    if not raw_rows:
+        return []
+
+    header = [COLUMN_ALIASES.get(_normalize_header(h)) for h in raw_rows[0]]
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
+    if missing:
+        raise DomainException(f"Faltan columnas en el archivo: {', '.join(missing)}")
+
+    rows = []
+    for row_number, raw in enumerate(raw_rows[1:], start=2):
+        values = {
+            column: _clean_cell(value)
+            for column, value in zip(header, raw)
+            if column
+        }
+        if not any(values.values()):
+            continue
+        rows.append((row_number, values))
+
+    return rows
+
+
+def _normalize_header(value: Any) -> str:
+    if value is None:
+        return ""
+    text = str(value).strip().upper().replace("-", "_")
+    # quitar acentos
+    return "".join(
+        c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn"
+    )
+
+
+def _clean_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    # Excel guarda DNI/teléfonos como números: 12345678.0 -> "12345678"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _row_error(row_number: int, message: str) -> dict:
+    return {"row": row_number, "message": message}
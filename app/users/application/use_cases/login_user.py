@@ -3,10 +3,13 @@ Caso de uso: Login de usuario
 """
 from dataclasses import dataclass
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
+from app.users.domain.user_session import UserSession
 from app.users.application.ports.user_repository import UserRepository
+from app.users.application.ports.user_session_repository import UserSessionRepository
 from app.users.application.ports.auth_service import AuthService
+from app.users.application.ports.login_rate_limiter import LoginRateLimiter
 from app.building_blocks.exceptions import AuthenticationException, DomainException
 
 
@@ -15,6 +18,9 @@ class LoginUserCommand:
     """Comando para login de usuario"""
     email: str
     password: str
+    user_agent: Optional[str] = None
+    ip_address: Optional[str] = None
+    session_expire_days: int = 7  # Vida del refresh token
 
 
 @dataclass
@@ -32,21 +38,35 @@ class LoginUserUseCase:
     Caso de uso: Login de usuario.
 
     Este caso de uso:
+    0. Corta intentos por encima del límite (antes de BD y bcrypt)
     1. Valida las credenciales (email y contraseña)
     2. Verifica que el usuario esté activo
-    3. Genera tokens JWT (access y refresh)
-    4. Actualiza la fecha de último login
+    3. Abre una sesión en el servidor (permite revocarla luego)
+    4. Genera tokens JWT (access y refresh) ligados a la sesión
     """
 
     def __init__(
         self,
         user_repository: UserRepository,
-        auth_service: AuthService
+        auth_service: AuthService,
+        session_repository: UserSessionRepository,
+        rate_limiter: Optional[LoginRateLimiter] = None
     ):
         self.user_repository = user_repository
         self.auth_service = auth_service
+        self.session_repository = session_repository
+        self.rate_limiter = rate_limiter
 
     async def execute(self, command: LoginUserCommand) -> LoginUserResponse:
+        # 0. Límite de intentos por email e IP
+        if self.rate_limiter:
+            retry_after = await self.rate_limiter.acquire(command.email, command.ip_address)
+            if retry_after is not None:
+                minutes = max(retry_after // 60, 1)
+                raise AuthenticationException(
+                    f"Demasiados intentos de inicio de sesión. Intenta nuevamente en {minutes} minuto(s)"
+                )
+
         # 1. Buscar usuario por email
         user = await self.user_repository.find_by_email(command.email)
 
@@ -64,13 +84,27 @@ class LoginUserUseCase:
                 f"La cuenta no está activa. Estado: {user.status.value}"
             )
 
-        # 4. Generar tokens
-        access_token = await self.auth_service.generate_access_token(user)
-        refresh_token = await self.auth_service.generate_refresh_token(user)
+        if self.rate_limiter:
+            await self.rate_limiter.reset(command.email)
+
+        # 4. Abrir sesión (solo se guarda el hash del jti)
+        now = datetime.now(timezone.utc)
+        jti = UserSession.generate_jti()
+        session = await self.session_repository.create(
+            UserSession(
+                user_id=user.id,
+                refresh_jti_hash=UserSession.hash_jti(jti),
+                created_at=now,
+                last_used_at=now,
+                expires_at=now + timedelta(days=command.session_expire_days),
+                user_agent=command.user_agent,
+                ip_address=command.ip_address
+            )
+        )
 
-        # 5. Actualizar último login (opcional, agregar campo a User si lo necesitas)
-        # user.last_login = datetime.now(timezone.utc)
-        # await self.user_repository.save(user)
+        # 5. Generar tokens
+        access_token = await self.auth_service.generate_access_token(user, session_id=session.id)
+        refresh_token = await self.auth_service.generate_refresh_token(user, session_id=session.id, jti=jti)
 
         # 6. Preparar respuesta
         return LoginUserResponse(
@@ -2,31 +2,56 @@
 Caso de uso: Logout de usuario
 """
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.users.application.ports.user_session_repository import UserSessionRepository
+from app.shared.security.session_revocation import RevokedSessionIndex
 
 
 @dataclass
 class LogoutUserCommand:
     """Comando para logout"""
     user_id: str
+    session_id: Optional[str] = None  # Claim "sid" del access token
+    all_sessions: bool = False  # Cerrar sesión en todos los dispositivos
 
 
 class LogoutUserUseCase:
     """
     Caso de uso: Logout de usuario.
 
-    En una implementación con JWT stateless, el logout se maneja en el cliente
-    eliminando los tokens. Si quieres implementar una blacklist de tokens,
-    necesitarías un repositorio adicional para tokens revocados.
+    Revoca la sesión actual (o todas las del usuario) en el servidor:
+    el refresh token deja de servir y los access tokens emitidos para
+    esas sesiones se rechazan sin esperar a que expiren.
     """
 
-    async def execute(self, command: LogoutUserCommand) -> dict:
-        # En JWT stateless, el logout se maneja en el cliente
-        # El cliente debe eliminar los tokens del almacenamiento local
+    def __init__(
+        self,
+        session_repository: UserSessionRepository,
+        revocation_index: RevokedSessionIndex
+    ):
+        self.session_repository = session_repository
+        self.revocation_index = revocation_index
 
-        # Opcional: Implementar blacklist de tokens
-        # await self.token_blacklist_repository.add(command.access_token)
+    async def execute(self, command: LogoutUserCommand) -> dict:
+        now = datetime.now(timezone.utc)
+
+        # 1. Todas las sesiones del usuario
+        if command.all_sessions:
+            revoked = await self.session_repository.revoke_all_for_user(command.user_id, "logout_all", now)
+            self.revocation_index.revoke_many([s.id for s in revoked], now)
+            return {
+                "success": True,
+                "message": f"Se cerraron {len(revoked)} sesiones"
+            }
+
+        # 2. Solo la sesión actual (tokens antiguos sin sesión: se maneja en el cliente)
+        if command.session_id:
+            await self.session_repository.revoke(command.session_id, "logout", now)
+            self.revocation_index.revoke(command.session_id, now)
 
         return {
             "success": True,
             "message": "Sesión cerrada exitosamente"
-        }
\ No newline at end of file
+        }
@@ -2,10 +2,17 @@
 Caso de uso: Refrescar token de acceso
 """
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from app.users.domain.user_session import UserSession
 from app.users.application.ports.user_repository import UserRepository
+from app.users.application.ports.user_session_repository import UserSessionRepository
 from app.users.application.ports.auth_service import AuthService
+from app.shared.security.session_revocation import RevokedSessionIndex
 from app.building_blocks.exceptions import AuthenticationException
 
+# Motivo de revocación cuando se presenta un refresh token ya rotado
+REUSE_DETECTED_REASON = "refresh_reuse"
+
 
 @dataclass
 class RefreshTokenCommand:
@@ -19,17 +26,25 @@ class RefreshTokenUseCase:
 
     Este caso de uso:
     1. Valida el refresh token
-    2. Verifica que el usuario siga activo
-    3. Genera un nuevo access token
+    2. Valida la sesión en el servidor y rota el refresh token
+    3. Verifica que el usuario siga activo
+    4. Genera un nuevo access token y un nuevo refresh token
+
+    Cada refresh token sirve una sola vez. Si llega uno ya rotado, alguien
+    más lo tiene: se revoca la sesión completa.
     """
 
     def __init__(
         self,
         user_repository: UserRepository,
-        auth_service: AuthService
+        auth_service: AuthService,
+        session_repository: UserSessionRepository,
+        revocation_index: RevokedSessionIndex
     ):
         self.user_repository = user_repository
         self.auth_service = auth_service
+        self.session_repository = session_repository
+        self.revocation_index = revocation_index
 
     async def execute(self, command: RefreshTokenCommand) -> dict:
         # 1. Verificar refresh token
@@ -42,23 +57,57 @@ class RefreshTokenUseCase:
         if payload.get("type") != "refresh":
             raise AuthenticationException("Token inválido")
 
-        # 3. Obtener usuario
-        user_id = payload.get("sub")
-        user = await self.user_repository.find_by_id(user_id)
+        # 3. Validar la sesión del servidor
+        session_id = payload.get("sid")
+        jti = payload.get("jti")
+        if not session_id or not jti:
+            raise AuthenticationException("Sesión inválida, inicia sesión nuevamente")
+
+        session = await self.session_repository.find_by_id(session_id)
+        now = datetime.now(timezone.utc)
+
+        if not session or not session.is_active(now) or session.user_id != payload.get("sub"):
+            raise AuthenticationException("La sesión fue cerrada, inicia sesión nuevamente")
+
+        if not session.matches_jti(jti):
+            await self._revoke(session_id, REUSE_DETECTED_REASON, now)
+            raise AuthenticationException("La sesión fue cerrada, inicia sesión nuevamente")
+
+        # 4. Obtener usuario
+        user = await self.user_repository.find_by_id(session.user_id)
 
         if not user:
             raise AuthenticationException("Usuario no encontrado")
 
-        # 4. Verificar que el usuario esté activo
+        # 5. Verificar que el usuario esté activo
         from app.users.domain.user import UserStatus
         if user.status != UserStatus.ACTIVE:
+            await self._revoke(session_id, "user_inactive", now)
             raise AuthenticationException("Usuario inactivo")
 
-        # 5. Generar nuevo access token
-        access_token = await self.auth_service.generate_access_token(user)
+        # 6. Rotar el refresh token (UPDATE condicional: un solo refresh gana)
+        new_jti = UserSession.generate_jti()
+        rotated = await self.session_repository.rotate(
+            session_id,
+            session.refresh_jti_hash,
+            UserSession.hash_jti(new_jti),
+            now
+        )
+        if not rotated:
+            await self._revoke(session_id, REUSE_DETECTED_REASON, now)
+            raise AuthenticationException("La sesión fue cerrada, inicia sesión nuevamente")
+
+        # 7. Generar nuevos tokens
+        access_token = await self.auth_service.generate_access_token(user, session_id=session_id)
+        refresh_token = await self.auth_service.generate_refresh_token(user, session_id=session_id, jti=new_jti)
 
         return {
             "access_token": access_token,
+            "refresh_token": refresh_token,
             "token_type": "Bearer",
             "expires_in": 1800
-        }
\ No newline at end of file
+        }
+
+    async def _revoke(self, session_id: str, reason: str, now: datetime) -> None:
+        await self.session_repository.revoke(session_id, reason, now)
+        self.revocation_index.revoke(session_id, now)
@@ -0,0 +1,50 @@
+"""
+Caso de uso: Revocar todas las sesiones de un usuario (Admin)
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from app.users.application.ports.user_repository import UserRepository
+from app.users.application.ports.user_session_repository import UserSessionRepository
+from app.shared.security.session_revocation import RevokedSessionIndex
+from app.building_blocks.exceptions import DomainException
+
+
+@dataclass
+class RevokeUserSessionsCommand:
+    """Comando para revocar las sesiones de un usuario"""
+    user_id: str
+    reason: str = "admin_revoked"
+
+
+class RevokeUserSessionsUseCase:
+    """
+    Caso de uso: Cerrar todas las sesiones de un usuario (p. ej. al
+    desactivarlo o ante un dispositivo perdido). Efecto inmediato.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        session_repository: UserSessionRepository,
+        revocation_index: RevokedSessionIndex
+    ):
+        self.user_repository = user_repository
+        self.session_repository = session_repository
+        self.revocation_index = revocation_index
+
+    async def execute(self, command: RevokeUserSessionsCommand) -> dict:
+        # 1. Validar usuario
+        user = await self.user_repository.find_by_id(command.user_id)
+        if not user:
+            raise DomainException("Usuario no encontrado")
+
+        # 2. Revocar en BD y en el índice en memoria
+        now = datetime.now(timezone.utc)
+        revoked = await self.session_repository.revoke_all_for_user(command.user_id, command.reason, now)
+        self.revocation_index.revoke_many([s.id for s in revoked], now)
+
+        return {
+            "revoked_count": len(revoked),
+            "message": f"Se cerraron {len(revoked)} sesiones de {user.full_name}"
+        }
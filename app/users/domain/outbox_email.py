@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional
+from datetime import datetime, timezone, timedelta
+
+
+class OutboxStatus(str, Enum):
+    """Estados de un email en la bandeja de salida"""
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+# Tipos de email soportados por el worker de envío
+EMAIL_ACTIVATION = "activation"
+EMAIL_ACCOUNT_ACTIVATED = "account_activated"
+EMAIL_SANITARY_DUE_ALERT = "sanitary_due_alert"
+
+
+@dataclass
+class OutboxEmail:
+    """
+    Email pendiente de envío (patrón outbox).
+    Los casos de uso solo lo encolan; el worker de envío lo entrega.
+    """
+    id: Optional[str] = None
+    kind: str = ""          # activation | account_activated | sanitary_due_alert
+    to_email: str = ""
+    context: dict = field(default_factory=dict)  # Variables para el template
+
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    next_attempt_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    sent_at: Optional[datetime] = None
+
+    # Reintentos: 30s, 1m, 2m, 4m... hasta 1 hora
+    BACKOFF_BASE_SECONDS = 30
+    BACKOFF_MAX_SECONDS = 3600
+
+    def mark_sent(self) -> None:
+        """Marca el email como enviado"""
+        self.status = OutboxStatus.SENT
+        self.sent_at = datetime.now(timezone.utc)
+        self.last_error = None
+
+    def mark_failed(self, error: str, max_attempts: int) -> None:
+        """
+        Registra un intento fallido. Programa un reintento con backoff
+        exponencial o lo da por fallido al agotar los intentos.
+        """
+        self.last_error = error[:500]
+        if self.attempts >= max_attempts:
+            self.status = OutboxStatus.FAILED
+            return
+
+        delay = min(
+            self.BACKOFF_BASE_SECONDS * (2 ** max(self.attempts - 1, 0)),
+            self.BACKOFF_MAX_SECONDS
+        )
+        self.status = OutboxStatus.PENDING
+        self.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Optional
+from datetime import datetime, timezone, timedelta
+import hashlib
+import hmac
+import secrets
+
+
+@dataclass
+class UserSession:
+    """
+    Sesión de usuario respaldada por un refresh token.
+    Solo se guarda el hash del jti vigente: cada refresh rota el jti y
+    reutilizar uno anterior revoca la sesión (posible robo de token).
+    """
+    id: Optional[str] = None
+    user_id: str = ""
+    refresh_jti_hash: str = ""
+
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_used_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc) + timedelta(days=7))
+    revoked_at: Optional[datetime] = None
+    revoked_reason: Optional[str] = None
+
+    user_agent: Optional[str] = None
+    ip_address: Optional[str] = None
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        """Verifica si la sesión no fue revocada ni expiró"""
+        now = now or datetime.now(timezone.utc)
+        return self.revoked_at is None and now <= self.expires_at
+
+    def matches_jti(self, jti: str) -> bool:
+        """Compara el jti presentado con el vigente en tiempo constante"""
+        return hmac.compare_digest(self.refresh_jti_hash, self.hash_jti(jti))
+
+    @staticmethod
+    def generate_jti() -> str:
+        return secrets.token_urlsafe(32)
+
+    @staticmethod
+    def hash_jti(jti: str) -> str:
+        """El jti nunca se guarda en claro"""
+        return hashlib.sha256(jti.encode("utf-8")).hexdigest()
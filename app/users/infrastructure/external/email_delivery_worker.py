@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+import asyncio
+import time
+
+from app.users.domain.outbox_email import OutboxStatus
+from app.users.infrastructure.external.email_service import SMTPEmailService
+from app.users.infrastructure.external.smtp_connection import PooledSMTPConnection
+from app.users.infrastructure.persistence.email_outbox_repository_impl import PostgreSQLEmailOutboxRepository
+
+
+@dataclass
+class EmailQueueMetrics:
+    """Métricas en memoria del worker de emails"""
+    sent: int = 0
+    failed_attempts: int = 0
+    dead_letters: int = 0            # Agotaron los reintentos
+    batches: int = 0
+    last_batch_size: int = 0
+    last_batch_ms: float = 0.0
+    last_run_at: Optional[str] = None
+    last_error: Optional[str] = None
+    queue_depth: Dict[str, int] = field(default_factory=dict)
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+class EmailDeliveryWorker:
+    """
+    Worker en segundo plano que entrega la bandeja de salida de emails.
+
+    - Toma lotes con SELECT ... FOR UPDATE SKIP LOCKED (varias instancias son seguras)
+    - Envía por una única conexión SMTP reutilizada
+    - Reintenta con backoff exponencial y deja en 'failed' al agotar intentos
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        email_service: SMTPEmailService,
+        connection: PooledSMTPConnection,
+        batch_size: int = 50,
+        poll_seconds: float = 5.0,
+        max_attempts: int = 5
+    ):
+        self.session_factory = session_factory
+        self.email_service = email_service
+        self.connection = connection
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+
+        self.metrics = EmailQueueMetrics()
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Inicia el worker como tarea de fondo"""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Detiene el worker y cierra la conexión SMTP"""
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+        await self.connection.close()
+
+    async def run_forever(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                # Error de BD u otro inesperado: esperar y seguir
+                self.metrics.last_error = str(e)
+                print(f"Error en worker de emails: {e}")
+                processed = 0
+
+            # Si el lote vino lleno, seguir sin esperar
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        """Procesa un lote. Retorna cuántos emails se intentaron enviar"""
+        started = time.perf_counter()
+
+        async with self.session_factory() as session:
+            repo = PostgreSQLEmailOutboxRepository(session)
+            batch = await repo.claim_batch(self.batch_size, datetime.now(timezone.utc))
+
+            for email in batch:
+                try:
+                    message = self.email_service.build_message(email.kind, email.to_email, email.context)
+                    await self.connection.send(message)
+                    email.mark_sent()
+                    self.metrics.sent += 1
+                except Exception as e:
+                    email.mark_failed(str(e), self.max_attempts)
+                    self.metrics.failed_attempts += 1
+                    self.metrics.last_error = str(e)
+                    if email.status == OutboxStatus.FAILED:
+                        self.metrics.dead_letters += 1
+
+            if batch:
+                await repo.save_results(batch)
+
+            self.metrics.queue_depth = await repo.count_by_status()
+
+        self.metrics.batches += 1
+        self.metrics.last_batch_size = len(batch)
+        self.metrics.last_batch_ms = round((time.perf_counter() - started) * 1000, 2)
+        self.metrics.last_run_at = datetime.now(timezone.utc).isoformat()
+
+        return len(batch)
@@ -1,10 +1,13 @@
 from typing import Optional
 from app.users.application.ports.email_service import EmailService
+from app.users.domain.outbox_email import EMAIL_ACTIVATION, EMAIL_ACCOUNT_ACTIVATED, EMAIL_SANITARY_DUE_ALERT
 import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Environment, FileSystemLoader
-import os
+from app.users.infrastructure.external.email_templates import (
+    EmailTemplateRegistry,
+    get_email_template_registry
+)
 
 class SMTPEmailService(EmailService):
     """
@@ -19,7 +22,8 @@ class SMTPEmailService(EmailService):
         smtp_username: str,
         smtp_password: str,
         from_email: str,
-        from_name: str = "Sistema de Catering"
+        from_name: str = "Sistema de Catering",
+        template_registry: Optional[EmailTemplateRegistry] = None
     ):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -28,12 +32,11 @@ class SMTPEmailService(EmailService):
         self.from_email = from_email
         self.from_name = from_name
 
-        # Configurar Jinja2 para templates
-        template_dir = os.path.join(
-            os.path.dirname(__file__),
-            "../../templates/emails"
-        )
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Templates ya compilados, compartidos por todo el proceso
+        self.templates = template_registry or get_email_template_registry()
+
+        # Cabecera fija, se arma una sola vez
+        self._from_header = f"{from_name} <{from_email}>"
 
     async def send_activation_email(
         self,
@@ -44,26 +47,79 @@ class SMTPEmailService(EmailService):
     ) -> bool:
         """Envía email de activación de cuenta"""
         try:
-            # Renderizar template
-            template = self.jinja_env.get_template("activation_email.html")
-            html_content = template.render(
-                user_name=user_name,
-                activation_link=activation_link,
-                expires_in_hours=expires_in_hours
+            message = self.build_message(
+                EMAIL_ACTIVATION,
+                to_email,
+                {
+                    "user_name": user_name,
+                    "activation_link": activation_link,
+                    "expires_in_hours": expires_in_hours
+                }
             )
 
-            # Crear mensaje
-            message = MIMEMultipart("alternative")
-            message["Subject"] = "Activa tu cuenta - Sistema de Catering"
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
+            # Enviar email
+            await self._send(message)
+
+            return True
 
-            # Agregar contenido HTML
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
+        except Exception as e:
+            # Log error
+            print(f"Error enviando email de activación: {e}")
+            return False
+
+    async def send_account_activated_email(
+        self,
+        to_email: str,
+        user_name: str
+    ) -> bool:
+        """Envía confirmación de cuenta activada"""
+        try:
+            message = self.build_message(
+                EMAIL_ACCOUNT_ACTIVATED,
+                to_email,
+                {"user_name": user_name}
+            )
+
+            # Enviar email
+            await self._send(message)
+
+            return True
+
+        except Exception as e:
+            # Log error
+            print(f"Error enviando email de confirmación: {e}")
+            return False
+
+    def build_message(self, kind: str, to_email: str, context: dict) -> MIMEMultipart:
+        """
+        Construye el mensaje MIME (HTML + texto plano) para un tipo de email.
+        Lo usan tanto el envío directo como el worker de la bandeja de salida.
+        """
+        if kind == EMAIL_ACTIVATION:
+            return self._build_activation_message(to_email, **context)
+        if kind == EMAIL_ACCOUNT_ACTIVATED:
+            return self._build_account_activated_message(to_email, **context)
+        if kind == EMAIL_SANITARY_DUE_ALERT:
+            return self._build_sanitary_due_alert_message(to_email, **context)
+        raise ValueError(f"Tipo de email no soportado: {kind}")
+
+    def _build_activation_message(
+        self,
+        to_email: str,
+        user_name: str,
+        activation_link: str,
+        expires_in_hours: int = 48
+    ) -> MIMEMultipart:
+        # Renderizar template
+        html_content = self.templates.render(
+            "activation_email.html",
+            user_name=user_name,
+            activation_link=activation_link,
+            expires_in_hours=expires_in_hours
+        )
 
-            # Agregar versión texto plano
-            text_content = f"""
+        # Versión texto plano
+        text_content = f"""
             Hola {user_name},
 
             Tu cuenta ha sido creada en el Sistema de Catering.
@@ -78,49 +134,20 @@ class SMTPEmailService(EmailService):
             Saludos,
             Equipo de Sistema de Catering
             """
-            text_part = MIMEText(text_content, "plain")
-            message.attach(text_part)
 
-            # Enviar email
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_username,
-                password=self.smtp_password,
-                start_tls=True
-            )
+        return self._build_mime(
+            to_email,
+            "Activa tu cuenta - Sistema de Catering",
+            html_content,
+            text_content
+        )
 
-            return True
+    def _build_account_activated_message(self, to_email: str, user_name: str) -> MIMEMultipart:
+        # Renderizar template
+        html_content = self.templates.render("account_activated.html", user_name=user_name)
 
-        except Exception as e:
-            # Log error
-            print(f"Error enviando email de activación: {e}")
-            return False
-
-    async def send_account_activated_email(
-        self,
-        to_email: str,
-        user_name: str
-    ) -> bool:
-        """Envía confirmación de cuenta activada"""
-        try:
-            # Renderizar template
-            template = self.jinja_env.get_template("account_activated.html")
-            html_content = template.render(user_name=user_name)
-
-            # Crear mensaje
-            message = MIMEMultipart("alternative")
-            message["Subject"] = "¡Cuenta activada exitosamente!"
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
-
-            # Agregar contenido HTML
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
-
-            # Agregar versión texto plano
-            text_content = f"""
+        # Versión texto plano
+        text_content = f"""
             Hola {user_name},
 
             ¡Tu cuenta ha sido activada exitosamente!
@@ -131,22 +158,72 @@ class SMTPEmailService(EmailService):
             Saludos,
             Equipo de Sistema de Catering
             """
-            text_part = MIMEText(text_content, "plain")
-            message.attach(text_part)
 
-            # Enviar email
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_username,
-                password=self.smtp_password,
-                start_tls=True
-            )
+        return self._build_mime(
+            to_email,
+            "¡Cuenta activada exitosamente!",
+            html_content,
+            text_content
+        )
 
-            return True
+    def _build_sanitary_due_alert_message(
+        self,
+        to_email: str,
+        user_name: str,
+        overdue: list,
+        upcoming: list
+    ) -> MIMEMultipart:
+        # Renderizar template
+        html_content = self.templates.render(
+            "sanitary_due_alert.html",
+            user_name=user_name,
+            overdue=overdue,
+            upcoming=upcoming
+        )
 
-        except Exception as e:
-            # Log error
-            print(f"Error enviando email de confirmación: {e}")
-            return False
\ No newline at end of file
+        # Versión texto plano
+        lines = [f"Hola {user_name},", ""]
+        if overdue:
+            lines.append("Políticas de sanidad con revisión vencida:")
+            lines += [f"  - {p['name']} (próxima revisión: {p['next_review_date'] or 'sin revisiones'})" for p in overdue]
+            lines.append("")
+        if upcoming:
+            lines.append("Políticas de sanidad por vencer:")
+            lines += [f"  - {p['name']} (próxima revisión: {p['next_review_date']})" for p in upcoming]
+            lines.append("")
+        lines += ["Saludos,", "Equipo de Sistema de Catering"]
+
+        subject = (
+            f"Revisiones de sanidad vencidas: {len(overdue)}"
+            if overdue else f"Revisiones de sanidad por vencer: {len(upcoming)}"
+        )
+        return self._build_mime(to_email, subject, html_content, "\n".join(lines))
+
+    def _build_mime(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: str
+    ) -> MIMEMultipart:
+        # Crear mensaje
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = self._from_header
+        message["To"] = to_email
+
+        # Agregar contenido HTML y versión texto plano
+        message.attach(MIMEText(html_content, "html"))
+        message.attach(MIMEText(text_content, "plain"))
+
+        return message
+
+    async def _send(self, message: MIMEMultipart) -> None:
+        await aiosmtplib.send(
+            message,
+            hostname=self.smtp_host,
+            port=self.smtp_port,
+            username=self.smtp_username,
+            password=self.smtp_password,
+            start_tls=True
+        )
@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING, Dict, Optional
+import os
+import threading
+
+if TYPE_CHECKING:  # jinja2 se importa al crear el entorno (primer uso)
+    from jinja2 import Environment, Template
+
+# Carpeta por defecto de los templates de email
+EMAIL_TEMPLATE_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "../../templates/emails"
+)
+
+
+class EmailTemplateRegistry:
+    """
+    Registro de templates de email compilados, compartido por todo el proceso.
+
+    - Compila todos los templates una sola vez (al arrancar o en el primer uso)
+    - Sin auto_reload: renderizar no hace stat al disco ni recompila
+    - Opcionalmente guarda el bytecode en disco para que los siguientes
+      procesos (workers, CLI) no tengan que volver a compilar
+    - jinja2 se importa recién al primer uso: los procesos que solo encolan
+      emails (la API sin worker) no lo cargan al arrancar
+    """
+
+    def __init__(self, template_dir: str = EMAIL_TEMPLATE_DIR, bytecode_cache_dir: Optional[str] = None):
+        self.template_dir = template_dir
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self._env: Optional["Environment"] = None
+        self._templates: Dict[str, "Template"] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def env(self) -> "Environment":
+        """Entorno de jinja2, creado una sola vez en el primer uso"""
+        if self._env is None:
+            with self._lock:
+                if self._env is None:
+                    self._env = self._create_env()
+        return self._env
+
+    def _create_env(self) -> "Environment":
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+        bytecode_cache = None
+        if self.bytecode_cache_dir:
+            os.makedirs(self.bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(self.bytecode_cache_dir)
+
+        return Environment(
+            loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            cache_size=-1
+        )
+
+    def precompile(self) -> int:
+        """Compila todos los templates del directorio. Retorna cuántos quedaron listos"""
+        with self._lock:
+            for name in self.env.list_templates(extensions=["html", "txt"]):
+                if name not in self._templates:
+                    self._templates[name] = self.env.get_template(name)
+            return len(self._templates)
+
+    def get(self, name: str) -> "Template":
+        """Template compilado; si no estaba precompilado se compila una sola vez"""
+        template = self._templates.get(name)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(name)
+                if template is None:
+                    template = self.env.get_template(name)
+                    self._templates[name] = template
+        return template
+
+    def render(self, name: str, **context) -> str:
+        return self.get(name).render(**context)
+
+
+_registry: Optional[EmailTemplateRegistry] = None
+
+
+def get_email_template_registry(bytecode_cache_dir: Optional[str] = None) -> EmailTemplateRegistry:
+    """
+    Registro único del proceso. El directorio de bytecode solo se toma en
+    cuenta la primera vez (al arrancar la aplicación).
+    """
+    global _registry
+    if _registry is None:
+        _registry = EmailTemplateRegistry(bytecode_cache_dir=bytecode_cache_dir)
+    return _registry
@@ -0,0 +1,50 @@
+from app.users.application.ports.email_service import EmailService
+from app.users.application.ports.email_outbox_repository import EmailOutboxRepository
+from app.users.domain.outbox_email import OutboxEmail, EMAIL_ACTIVATION, EMAIL_ACCOUNT_ACTIVATED
+
+
+class OutboxEmailService(EmailService):
+    """
+    Implementación del servicio de email que solo encola en la bandeja de salida.
+    El envío real lo hace EmailDeliveryWorker en segundo plano, así los casos de
+    uso no esperan al servidor SMTP ni fallan por sus caídas.
+    """
+
+    def __init__(self, outbox_repository: EmailOutboxRepository):
+        self.outbox_repository = outbox_repository
+
+    async def send_activation_email(
+        self,
+        to_email: str,
+        user_name: str,
+        activation_link: str,
+        expires_in_hours: int = 48
+    ) -> bool:
+        """Encola el email de activación de cuenta"""
+        await self.outbox_repository.enqueue(
+            OutboxEmail(
+                kind=EMAIL_ACTIVATION,
+                to_email=to_email,
+                context={
+                    "user_name": user_name,
+                    "activation_link": activation_link,
+                    "expires_in_hours": expires_in_hours
+                }
+            )
+        )
+        return True
+
+    async def send_account_activated_email(
+        self,
+        to_email: str,
+        user_name: str
+    ) -> bool:
+        """Encola la confirmación de cuenta activada"""
+        await self.outbox_repository.enqueue(
+            OutboxEmail(
+                kind=EMAIL_ACCOUNT_ACTIVATED,
+                to_email=to_email,
+                context={"user_name": user_name}
+            )
+        )
+        return True
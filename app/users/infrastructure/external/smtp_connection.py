@@ -0,0 +1,87 @@
+from typing import Optional
+from email.message import Message
+import asyncio
+import time
+import aiosmtplib
+
+
+class PooledSMTPConnection:
+    """
+    Conexión SMTP persistente y reutilizable.
+    Abre la conexión (y STARTTLS/login) una sola vez y la reutiliza para
+    todos los envíos; la reabre si el servidor la cerró o quedó inactiva.
+    """
+
+    def __init__(
+        self,
+        smtp_host: str,
+        smtp_port: int,
+        smtp_username: Optional[str] = None,
+        smtp_password: Optional[str] = None,
+        start_tls: bool = True,
+        max_idle_seconds: float = 60.0,
+        timeout: float = 30.0
+    ):
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.smtp_username = smtp_username
+        self.smtp_password = smtp_password
+        self.start_tls = start_tls
+        self.max_idle_seconds = max_idle_seconds
+        self.timeout = timeout
+
+        self._client: Optional[aiosmtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = asyncio.Lock()
+        self.connections_opened = 0
+
+    async def send(self, message: Message) -> None:
+        """Envía un mensaje reutilizando la conexión; reintenta una vez si se cayó"""
+        async with self._lock:
+            client = await self._ensure_connected()
+            try:
+                await client.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # El servidor cerró la conexión: reconectar y reintentar una vez
+                await self._reset()
+                client = await self._ensure_connected()
+                await client.send_message(message)
+            self._last_used = time.monotonic()
+
+    async def close(self) -> None:
+        """Cierra la conexión si está abierta"""
+        async with self._lock:
+            await self._reset()
+
+    async def _ensure_connected(self) -> aiosmtplib.SMTP:
+        idle = time.monotonic() - self._last_used
+        if self._client and self._client.is_connected and idle < self.max_idle_seconds:
+            return self._client
+
+        await self._reset()
+
+        client = aiosmtplib.SMTP(
+            hostname=self.smtp_host,
+            port=self.smtp_port,
+            start_tls=self.start_tls,
+            timeout=self.timeout
+        )
+        await client.connect()
+        if self.smtp_username:
+            await client.login(self.smtp_username, self.smtp_password or "")
+
+        self._client = client
+        self._last_used = time.monotonic()
+        self.connections_opened += 1
+        return client
+
+    async def _reset(self) -> None:
+        if self._client is None:
+            return
+        try:
+            if self._client.is_connected:
+                await self._client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._client.close()
+        finally:
+            self._client = None
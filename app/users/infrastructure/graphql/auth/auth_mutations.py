@@ -7,6 +7,7 @@ from app.users.infrastructure.graphql.auth.auth_types import (
     LoginResponse,
     RefreshTokenResponse,
     LogoutResponse,
+    RevokeSessionsResponse,
     UserInfo
 )
 from app.users.application.use_cases.login_user import (
@@ -21,7 +22,12 @@ from app.users.application.use_cases.logout_user import (
     LogoutUserUseCase,
     LogoutUserCommand
 )
-from app.building_blocks.exceptions import AuthenticationException
+from app.users.application.use_cases.revoke_user_sessions import (
+    RevokeUserSessionsUseCase,
+    RevokeUserSessionsCommand
+)
+from app.building_blocks.exceptions import AuthenticationException, DomainException
+from app.shared.security.permissions import Permission, requires
 
 
 @strawberry.type
@@ -38,16 +44,23 @@ class AuthMutations:
         Devuelve access token y refresh token.
         """
         try:
+            request = info.context["request"]
+
             # Crear comando
             command = LoginUserCommand(
                 email=input.email,
-                password=input.password
+                password=input.password,
+                user_agent=request.headers.get("user-agent"),
+                ip_address=request.client.host if request.client else None,
+                session_expire_days=info.context["settings"].JWT_REFRESH_TOKEN_EXPIRE_DAYS
             )
 
             # Ejecutar caso de uso
             use_case = LoginUserUseCase(
                 user_repository=info.context["user_repository"],
-                auth_service=info.context["auth_service"]
+                auth_service=info.context["auth_service"],
+                session_repository=info.context["user_session_repository"],
+                rate_limiter=info.context.get("login_rate_limiter")
             )
 
             result = await use_case.execute(command)
@@ -90,13 +103,16 @@ class AuthMutations:
             # Ejecutar caso de uso
             use_case = RefreshTokenUseCase(
                 user_repository=info.context["user_repository"],
-                auth_service=info.context["auth_service"]
+                auth_service=info.context["auth_service"],
+                session_repository=info.context["user_session_repository"],
+                revocation_index=info.context["revoked_sessions"]
             )
 
             result = await use_case.execute(command)
 
             return RefreshTokenResponse(
                 access_token=result["access_token"],
+                refresh_token=result["refresh_token"],
                 token_type=result["token_type"],
                 expires_in=result["expires_in"]
             )
@@ -106,27 +122,29 @@ class AuthMutations:
         except Exception as e:
             raise Exception(f"Error al refrescar token: {str(e)}")
 
-    @strawberry.mutation
+    @strawberry.mutation(metadata=requires(Permission.AUTHENTICATED))
     async def logout(
         self,
-        info: Info
+        info: Info,
+        all_sessions: bool = False
     ) -> LogoutResponse:
         """
-        Cierra la sesión del usuario actual.
+        Cierra la sesión del usuario actual (o todas con all_sessions).
         Requiere autenticación.
         """
         try:
-            # Verificar que hay un usuario autenticado
-            if not info.context["current_user"]:
-                raise AuthenticationException("No autenticado")
-
             # Crear comando
             command = LogoutUserCommand(
-                user_id=info.context["current_user"].id
+                user_id=info.context["current_user"].id,
+                session_id=info.context.get("session_id"),
+                all_sessions=all_sessions
             )
 
             # Ejecutar caso de uso
-            use_case = LogoutUserUseCase()
+            use_case = LogoutUserUseCase(
+                session_repository=info.context["user_session_repository"],
+                revocation_index=info.context["revoked_sessions"]
+            )
             result = await use_case.execute(command)
 
             return LogoutResponse(
@@ -139,3 +157,35 @@ class AuthMutations:
         except Exception as e:
             raise Exception(f"Error en logout: {str(e)}")
 
+    @strawberry.mutation(metadata=requires(Permission.USERS_MANAGE))
+    async def revoke_user_sessions(
+        self,
+        info: Info,
+        user_id: str
+    ) -> RevokeSessionsResponse:
+        """
+        Cierra todas las sesiones de un usuario (solo admin).
+        Sus tokens dejan de funcionar de inmediato.
+        """
+        try:
+            current_user = info.context["current_user"]
+
+            use_case = RevokeUserSessionsUseCase(
+                user_repository=info.context["user_repository"],
+                session_repository=info.context["user_session_repository"],
+                revocation_index=info.context["revoked_sessions"]
+            )
+
+            result = await use_case.execute(RevokeUserSessionsCommand(user_id=user_id))
+
+            return RevokeSessionsResponse(
+                success=True,
+                message=result["message"],
+                revoked_count=result["revoked_count"]
+            )
+
+        except (DomainException, AuthenticationException) as e:
+            return RevokeSessionsResponse(
+                success=False,
+                message=str(e)
+            )
@@ -2,13 +2,13 @@
 import strawberry
 from strawberry.types import Info
 from app.users.infrastructure.graphql.auth.auth_types import CurrentUserResponse
-from app.building_blocks.exceptions import AuthenticationException
+from app.shared.security.permissions import Permission, requires
 
 
 @strawberry.type
 class AuthQueries:
 
-    @strawberry.field
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED))
     async def me(
         self,
         info: Info
@@ -17,10 +17,6 @@ class AuthQueries:
         Obtiene información del usuario actual.
         Requiere autenticación (token JWT en header).
         """
-        # Verificar que hay un usuario autenticado
-        if not info.context["current_user"]:
-            raise Exception("No autenticado. Debes incluir el token en el header Authorization")
-
         user = info.context["current_user"]
 
         return CurrentUserResponse(
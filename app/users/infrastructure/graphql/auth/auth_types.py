@@ -26,6 +26,7 @@ class RefreshTokenResponse:
     access_token: str
     token_type: str
     expires_in: int
+    refresh_token: Optional[str] = None  # Rotado: el anterior deja de servir
 
 @strawberry.type
 class LogoutResponse:
@@ -33,6 +34,13 @@ class LogoutResponse:
     success: bool
     message: str
 
+@strawberry.type
+class RevokeSessionsResponse:
+    """Respuesta de revocar sesiones de un usuario"""
+    success: bool
+    message: str
+    revoked_count: int = 0
+
 @strawberry.type
 class CurrentUserResponse:
     """Respuesta con información del usuario actual"""
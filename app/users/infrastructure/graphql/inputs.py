@@ -27,3 +27,11 @@ class ActivateUserAccountInput:
 class ValidateActivationTokenInput:
     """Input para validar token de activación"""
     token: str
+
+@strawberry.input
+class ImportUserAccountsInput:
+    """Input para alta masiva de usuarios desde archivo de RRHH (solo admin)"""
+    filename: str  # .csv o .xlsx
+    file_base64: str
+    activation_base_url: str = ""
+    dry_run: bool = False  # Solo validar el archivo
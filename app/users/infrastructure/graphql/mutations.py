@@ -1,12 +1,17 @@
+import base64
+import binascii
 import strawberry
 from strawberry.types import Info
 from app.users.infrastructure.graphql.inputs import (
     CreateUserAccountInput,
-    ActivateUserAccountInput
+    ActivateUserAccountInput,
+    ImportUserAccountsInput
 )
 from app.users.infrastructure.graphql.types import (
     CreateUserAccountResult,
-    ActivateUserAccountResult
+    ActivateUserAccountResult,
+    ImportUserAccountsResult,
+    ImportUserRowError
 )
 from app.users.application.use_cases.create_user_account import (
     CreateUserAccountUseCase,
@@ -16,8 +21,14 @@ from app.users.application.use_cases.activate_user_account import (
     ActivateUserAccountUseCase,
     ActivateUserAccountCommand
 )
+from app.users.application.use_cases.import_user_accounts import (
+    ImportUserAccountsUseCase,
+    ImportUserAccountsCommand
+)
 from app.users.domain.user import UserRole
-from app.building_blocks.exceptions import DomainException
+from app.building_blocks.exceptions import DomainException, AuthenticationException
+from app.shared.graphql.cost import cost
+from app.shared.security.permissions import Permission, requires
 
 @strawberry.type
 class UserMutations:
@@ -67,7 +78,8 @@ class UserMutations:
             use_case = CreateUserAccountUseCase(
                 user_repository=info.context["user_repository"],
                 token_repository=info.context["token_repository"],
-                email_service=info.context["email_service"]
+                email_service=info.context["email_service"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -118,7 +130,8 @@ class UserMutations:
             use_case = ActivateUserAccountUseCase(
                 user_repository=info.context["user_repository"],
                 token_repository=info.context["token_repository"],
-                email_service=info.context["email_service"]
+                email_service=info.context["email_service"],
+                unit_of_work=info.context["unit_of_work"]
             )
 
             result = await use_case.execute(command)
@@ -141,3 +154,58 @@ class UserMutations:
                 success=False,
                 message=f"Error al activar la cuenta: {str(e)}"
             )
+
+    @strawberry.mutation(metadata=requires(Permission.USERS_MANAGE, metadata=cost(base=50)))
+    async def import_user_accounts(
+        self,
+        info: Info,
+        input: ImportUserAccountsInput
+    ) -> ImportUserAccountsResult:
+        """
+        Alta masiva de usuarios desde un archivo CSV/XLSX de RRHH (solo admin).
+        Si alguna fila es inválida no se crea ninguna cuenta.
+        """
+        try:
+            current_user = info.context["current_user"]
+
+            try:
+                content = base64.b64decode(input.file_base64, validate=True)
+            except (binascii.Error, ValueError):
+                raise DomainException("El archivo no es un base64 válido")
+
+            command = ImportUserAccountsCommand(
+                filename=input.filename,
+                content=content,
+                created_by=current_user.id,
+                activation_base_url=input.activation_base_url,
+                dry_run=input.dry_run
+            )
+
+            use_case = ImportUserAccountsUseCase(
+                user_repository=info.context["user_repository"],
+                token_repository=info.context["token_repository"],
+                outbox_repository=info.context["email_outbox_repository"],
+                unit_of_work=info.context["unit_of_work"]
+            )
+
+            result = await use_case.execute(command)
+
+            return ImportUserAccountsResult(
+                success=not result["errors"],
+                message=result["message"],
+                created_count=result["created_count"],
+                valid_count=result["valid_count"],
+                errors=[ImportUserRowError(row=e["row"], message=e["message"]) for e in result["errors"]]
+            )
+
+        except (DomainException, AuthenticationException) as e:
+            return ImportUserAccountsResult(
+                success=False,
+                message=str(e)
+            )
+        except Exception as e:
+            # Log error
+            return ImportUserAccountsResult(
+                success=False,
+                message=f"Error al importar usuarios: {str(e)}"
+            )
@@ -1,5 +1,5 @@
 """Module providing ..."""
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 import strawberry
 
@@ -51,4 +51,19 @@ class ValidateActivationTokenResult:
     is_valid: bool
     reason: Optional[str] = None
     user: Optional[UserForActivation] = None
-    expires_at: Optional[str] = None
\ No newline at end of file
+    expires_at: Optional[str] = None
+
+@strawberry.type
+class ImportUserRowError:
+    """Error de validación de una fila del archivo importado"""
+    row: int
+    message: str
+
+@strawberry.type
+class ImportUserAccountsResult:
+    """Resultado de la importación masiva de usuarios"""
+    success: bool
+    message: str
+    created_count: int = 0
+    valid_count: int = 0
+    errors: List[ImportUserRowError] = strawberry.field(default_factory=list)
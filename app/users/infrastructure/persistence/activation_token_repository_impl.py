@@ -1,16 +1,14 @@
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime, timezone
 from app.users.domain.activation_token import ActivationToken
 from app.users.application.ports.activation_token_repository import ActivationTokenRepository
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 import sqlalchemy as sa
-from sqlalchemy.orm import declarative_base
-
-Base = declarative_base()
+from app.shared.database.base import Base
 
 
 class ActivationTokenModel(Base):
@@ -58,7 +56,8 @@ class PostgreSQLActivationTokenRepository(ActivationTokenRepository):
             )
             self.session.add(db_token)
 
-        await self.session.commit()
+        # Sin commit: lo hace la UnitOfWork del caso de uso
+        await self.session.flush()
         await self.session.refresh(db_token)
 
         return self._to_domain(db_token)
@@ -94,7 +93,29 @@ class PostgreSQLActivationTokenRepository(ActivationTokenRepository):
             token.is_used = True
             token.used_at = datetime.now(timezone.utc)
 
-        await self.session.commit()
+        await self.session.flush()
+
+    async def add_many(self, tokens: List[ActivationToken]) -> List[ActivationToken]:
+        """Inserta tokens con un solo INSERT multi-fila (sin commit)"""
+        if not tokens:
+            return []
+
+        rows = []
+        for token in tokens:
+            token.id = token.id or str(uuid.uuid4())
+            rows.append({
+                "id": uuid.UUID(token.id),
+                "token": token.token,
+                "user_id": uuid.UUID(token.user_id),
+                "employee_id": token.employee_id,
+                "created_at": token.created_at,
+                "expires_at": token.expires_at,
+                "used_at": token.used_at,
+                "is_used": token.is_used
+            })
+
+        await self.session.execute(insert(ActivationTokenModel), rows)
+        return tokens
 
     def _to_domain(self, db_token: ActivationTokenModel) -> ActivationToken:
         """Convierte modelo de DB a entidad de dominio"""
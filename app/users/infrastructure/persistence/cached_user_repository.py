@@ -0,0 +1,75 @@
+"""Decorador de UserRepository que mantiene al día la caché de usuarios autenticados"""
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.users.application.ports.user_repository import UserRepository
+from app.users.domain.user import User
+from app.users.domain.user_role import UserRole
+from app.shared.security.user_cache import AuthenticatedUserCache
+
+
+class CachedUserRepository(UserRepository):
+    """
+    Las lecturas van a la BD (los casos de uso necesitan el usuario
+    completo y lo modifican); current_user se arma desde la caché en
+    get_context. Cada `save` invalida al usuario en la caché:
+
+    - en el momento, para que ninguna carga en curso se instale
+    - y otra vez tras el commit de la sesión (avisando a los demás
+      workers), para que ningún request vuelva a cachear la versión
+      anterior antes de que el cambio sea visible
+    """
+
+    def __init__(self, delegate: UserRepository, cache: AuthenticatedUserCache, session: AsyncSession) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._session = session
+        self._pending: Set[str] = set()
+
+    async def save(self, user: User) -> User:
+        saved = await self._delegate.save(user)
+        if saved.id:
+            self._invalidate_on_commit(str(saved.id))
+        return saved
+
+    def _invalidate_on_commit(self, user_id: str) -> None:
+        self._cache.invalidate(user_id, publish=False)
+        if not self._pending:
+            event.listen(self._session.sync_session, "after_commit", self._after_commit, once=True)
+        self._pending.add(user_id)
+
+    def _after_commit(self, _session) -> None:
+        pending, self._pending = self._pending, set()
+        for user_id in pending:
+            self._cache.invalidate(user_id)
+
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        return await self._delegate.find_by_id(user_id)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self._delegate.find_by_email(email)
+
+    async def find_by_employee_id(self, employee_id: str) -> Optional[User]:
+        return await self._delegate.find_by_employee_id(employee_id)
+
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._delegate.exists_by_email(email)
+
+    async def exists_by_employee_id(self, employee_id: str) -> bool:
+        return await self._delegate.exists_by_employee_id(employee_id)
+
+    async def find_existing_identifiers(
+        self,
+        employee_ids: List[str],
+        emails: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        return await self._delegate.find_existing_identifiers(employee_ids, emails)
+
+    async def add_many(self, users: List[User]) -> List[User]:
+        # Usuarios nuevos: todavía no pueden estar en la caché
+        return await self._delegate.add_many(users)
+
+    async def find_active_by_roles(self, roles: List[UserRole]) -> List[User]:
+        return await self._delegate.find_active_by_roles(roles)
@@ -0,0 +1,182 @@
+from typing import Dict, List
+from datetime import datetime, timedelta
+from app.users.domain.outbox_email import OutboxEmail, OutboxStatus
+from app.users.application.ports.email_outbox_repository import EmailOutboxRepository
+from sqlalchemy import Column, String, DateTime, Integer, JSON, Text, update, insert, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+import sqlalchemy as sa
+from app.shared.database.base import Base
+
+
+# Un email en 'sending' por más de este tiempo se considera abandonado (worker caído)
+STALE_LOCK_MINUTES = 10
+
+
+class EmailOutboxModel(Base):
+    """Modelo SQLAlchemy para la bandeja de salida de emails"""
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)
+    to_email = Column(String(255), nullable=False)
+    context = Column(JSON, nullable=False, default=dict)
+
+    status = Column(String(20), nullable=False, default=OutboxStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class PostgreSQLEmailOutboxRepository(EmailOutboxRepository):
+    """Implementación de la bandeja de salida de emails para PostgreSQL"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        """
+        Encola un email.
+        No hace commit: queda dentro de la transacción del caso de uso.
+        """
+        db_email = EmailOutboxModel(
+            id=uuid.uuid4() if not email.id else uuid.UUID(email.id),
+            **self._to_dict(email)
+        )
+        self.session.add(db_email)
+        await self.session.flush()
+
+        email.id = str(db_email.id)
+        return email
+
+    async def enqueue_many(self, emails: List[OutboxEmail]) -> int:
+        """
+        Encola varios emails con un solo INSERT multi-fila.
+        No hace commit: queda dentro de la transacción del caso de uso.
+        """
+        if not emails:
+            return 0
+
+        rows = []
+        for email in emails:
+            email.id = email.id or str(uuid.uuid4())
+            rows.append({"id": uuid.UUID(email.id), **self._to_dict(email)})
+
+        await self.session.execute(insert(EmailOutboxModel), rows)
+        return len(rows)
+
+    async def claim_batch(self, limit: int, now: datetime) -> List[OutboxEmail]:
+        """Toma un lote listo para enviar (FOR UPDATE SKIP LOCKED) y lo marca como 'sending'"""
+        stale = now - timedelta(minutes=STALE_LOCK_MINUTES)
+
+        ready = (
+            select(EmailOutboxModel.id)
+            .where(
+                or_(
+                    and_(
+                        EmailOutboxModel.status == OutboxStatus.PENDING.value,
+                        EmailOutboxModel.next_attempt_at <= now
+                    ),
+                    and_(
+                        EmailOutboxModel.status == OutboxStatus.SENDING.value,
+                        EmailOutboxModel.locked_at < stale
+                    )
+                )
+            )
+            .order_by(EmailOutboxModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(ready))
+            .values(
+                status=OutboxStatus.SENDING.value,
+                attempts=EmailOutboxModel.attempts + 1,
+                locked_at=now
+            )
+            .returning(EmailOutboxModel)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        claimed = [self._to_domain(m) for m in result.scalars().all()]
+        await self.session.commit()
+
+        return claimed
+
+    async def save_results(self, emails: List[OutboxEmail]) -> None:
+        """Persiste el resultado de un lote: un UPDATE para los enviados y uno por fallo"""
+        sent = [e for e in emails if e.status == OutboxStatus.SENT]
+        if sent:
+            await self.session.execute(
+                update(EmailOutboxModel)
+                .where(EmailOutboxModel.id.in_([uuid.UUID(e.id) for e in sent]))
+                .values(
+                    status=OutboxStatus.SENT.value,
+                    sent_at=sent[0].sent_at,
+                    last_error=None,
+                    locked_at=None
+                )
+            )
+
+        for email in emails:
+            if email.status == OutboxStatus.SENT:
+                continue
+            await self.session.execute(
+                update(EmailOutboxModel)
+                .where(EmailOutboxModel.id == uuid.UUID(email.id))
+                .values(
+                    status=email.status.value,
+                    next_attempt_at=email.next_attempt_at,
+                    last_error=email.last_error,
+                    locked_at=None
+                )
+            )
+
+        await self.session.commit()
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """Cantidad de emails por estado"""
+        stmt = select(EmailOutboxModel.status, func.count()).group_by(EmailOutboxModel.status)
+        result = await self.session.execute(stmt)
+        return {status: count for status, count in result.all()}
+
+    @staticmethod
+    def _to_dict(email: OutboxEmail) -> dict:
+        """Convierte entidad de dominio a diccionario para BD"""
+        return {
+            "kind": email.kind,
+            "to_email": email.to_email,
+            "context": email.context,
+            "status": email.status.value,
+            "attempts": email.attempts,
+            "last_error": email.last_error,
+            "created_at": email.created_at,
+            "next_attempt_at": email.next_attempt_at,
+            "sent_at": email.sent_at
+        }
+
+    @staticmethod
+    def _to_domain(model: EmailOutboxModel) -> OutboxEmail:
+        """Convierte modelo de BD a entidad de dominio"""
+        return OutboxEmail(
+            id=str(model.id),
+            kind=model.kind,
+            to_email=model.to_email,
+            context=model.context or {},
+            status=OutboxStatus(model.status),
+            attempts=model.attempts,
+            last_error=model.last_error,
+            created_at=model.created_at,
+            next_attempt_at=model.next_attempt_at,
+            sent_at=model.sent_at
+        )
@@ -0,0 +1,76 @@
+from typing import Callable, Dict, Optional, Tuple
+from datetime import datetime, timezone
+from app.shared.security.rate_limiter import RateLimitBackend
+from sqlalchemy import Column, String, DateTime, BigInteger, delete, insert, func
+from sqlalchemy.future import select
+from app.shared.database.base import Base
+
+
+class LoginAttemptModel(Base):
+    """Modelo SQLAlchemy para intentos de login (tabla UNLOGGED, datos efímeros)"""
+    __tablename__ = "login_attempts"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    key = Column(String(320), nullable=False)
+    attempted_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class PostgreSQLRateLimitBackend(RateLimitBackend):
+    """
+    Backend compartido del limitador de login: todos los workers ven los
+    mismos intentos. Cada intento es una transacción de 4 sentencias cortas
+    sobre un índice (key, attempted_at), muy por debajo del costo de un bcrypt.
+
+    Las claves se bloquean con advisory locks de transacción (en orden) para
+    que dos workers no cuenten a la vez y se pasen del límite.
+    """
+
+    def __init__(self, session_factory: Callable):
+        self.session_factory = session_factory
+        self._last_purge = 0.0
+
+    async def hit(self, limits: Dict[str, int], now: float, window_seconds: int) -> Optional[Tuple[str, float]]:
+        attempted_at = datetime.fromtimestamp(now, tz=timezone.utc)
+        cutoff = datetime.fromtimestamp(now - window_seconds, tz=timezone.utc)
+        keys = list(limits)
+
+        # Limpieza global como mucho una vez por ventana (claves que no volvieron)
+        purge_all = now - self._last_purge > window_seconds
+        if purge_all:
+            self._last_purge = now
+
+        async with self.session_factory() as session:
+            await session.execute(
+                select(*[func.pg_advisory_xact_lock(func.hashtext(key)) for key in sorted(keys)])
+            )
+
+            stale = delete(LoginAttemptModel).where(LoginAttemptModel.attempted_at <= cutoff)
+            if not purge_all:
+                stale = stale.where(LoginAttemptModel.key.in_(keys))
+            await session.execute(stale)
+
+            result = await session.execute(
+                select(LoginAttemptModel.key, func.count(), func.min(LoginAttemptModel.attempted_at))
+                .where(LoginAttemptModel.key.in_(keys))
+                .group_by(LoginAttemptModel.key)
+            )
+            windows = {key: (count, oldest) for key, count, oldest in result.all()}
+
+            for key in keys:
+                count, oldest = windows.get(key, (0, None))
+                if count >= limits[key]:
+                    await session.commit()  # Conserva la limpieza
+                    return key, oldest.timestamp()
+
+            await session.execute(
+                insert(LoginAttemptModel),
+                [{"key": key, "attempted_at": attempted_at} for key in keys]
+            )
+            await session.commit()
+
+        return None
+
+    async def reset(self, key: str) -> None:
+        async with self.session_factory() as session:
+            await session.execute(delete(LoginAttemptModel).where(LoginAttemptModel.key == key))
+            await session.commit()
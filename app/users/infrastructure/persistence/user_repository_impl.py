@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List, Set, Tuple
 from datetime import datetime, timezone
 from app.users.domain.user import User, UserStatus
 from app.users.domain.user_role import UserRole
@@ -6,14 +6,13 @@ from app.users.application.ports.user_repository import UserRepository
 
 # OPCIÓN 1: PostgreSQL con SQLAlchemy
 import sqlalchemy as sa
-from sqlalchemy import Column, String, DateTime, Boolean, JSON, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, JSON, Enum as SQLEnum, insert, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
+from app.shared.database.base import Base
 
-Base = declarative_base()
 
 class UserModel(Base):
     """Modelo SQLAlchemy para PostgreSQL"""
@@ -96,7 +95,8 @@ class PostgreSQLUserRepository(UserRepository):
             )
             self.session.add(db_user)
 
-        await self.session.commit()
+        # Sin commit: lo hace la UnitOfWork del caso de uso
+        await self.session.flush()
         await self.session.refresh(db_user)
 
         return self._to_domain(db_user)
@@ -137,6 +137,75 @@ class PostgreSQLUserRepository(UserRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def find_existing_identifiers(
+        self,
+        employee_ids: List[str],
+        emails: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """Busca employee_id y emails existentes con un solo WHERE ... IN"""
+        if not employee_ids and not emails:
+            return set(), set()
+
+        stmt = select(UserModel.employee_id, UserModel.email).where(
+            or_(
+                UserModel.employee_id.in_(employee_ids),
+                UserModel.email.in_(emails)
+            )
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        wanted_employee_ids = set(employee_ids)
+        wanted_emails = set(emails)
+        return (
+            {row.employee_id for row in rows if row.employee_id in wanted_employee_ids},
+            {row.email for row in rows if row.email in wanted_emails}
+        )
+
+    async def add_many(self, users: List[User]) -> List[User]:
+        """Inserta usuarios nuevos con un solo INSERT multi-fila (sin commit)"""
+        if not users:
+            return []
+
+        rows = []
+        for user in users:
+            user.id = user.id or str(uuid.uuid4())
+            rows.append({
+                "id": uuid.UUID(user.id),
+                "employee_id": user.employee_id,
+                "email": user.email,
+                "personal_email": user.personal_email,
+                "password_hash": user.password_hash,
+                "role": user.role.value,
+                "status": user.status.value,
+                "full_name": user.full_name,
+                "dni": user.dni,
+                "phone": user.phone,
+                "address": user.address,
+                "data_processing_consent": user.data_processing_consent,
+                "data_processing_consent_date": user.data_processing_consent_date,
+                "created_at": user.created_at,
+                "updated_at": user.updated_at,
+                "created_by": uuid.UUID(user.created_by) if user.created_by else None,
+                "activated_at": user.activated_at,
+                "previous_passwords": user.previous_passwords
+            })
+
+        await self.session.execute(insert(UserModel), rows)
+        return users
+
+    async def find_active_by_roles(self, roles: List[UserRole]) -> List[User]:
+        """Usuarios activos con alguno de los roles (un solo WHERE ... IN)"""
+        if not roles:
+            return []
+
+        stmt = select(UserModel).where(
+            UserModel.role.in_([role.value for role in roles]),
+            UserModel.status == UserStatus.ACTIVE.value
+        ).order_by(UserModel.full_name)
+        result = await self.session.execute(stmt)
+        return [self._to_domain(db_user) for db_user in result.scalars().all()]
+
     def _to_domain(self, db_user: UserModel) -> User:
         """Convierte modelo de DB a entidad de dominio"""
         return User(
@@ -0,0 +1,150 @@
+from typing import Optional, List
+from datetime import datetime
+from app.users.domain.user_session import UserSession
+from app.users.application.ports.user_session_repository import UserSessionRepository
+from sqlalchemy import Column, String, DateTime, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+import sqlalchemy as sa
+from app.shared.database.base import Base
+
+
+class UserSessionModel(Base):
+    """Modelo SQLAlchemy para sesiones (refresh tokens)"""
+    __tablename__ = "user_sessions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    refresh_jti_hash = Column(String(64), unique=True, nullable=False, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    last_used_at = Column(DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_reason = Column(String(50), nullable=True)
+
+    user_agent = Column(String(255), nullable=True)
+    ip_address = Column(String(45), nullable=True)
+
+
+class PostgreSQLUserSessionRepository(UserSessionRepository):
+    """Implementación del repositorio de sesiones para PostgreSQL"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, user_session: UserSession) -> UserSession:
+        """Registra una sesión nueva"""
+        db_session = UserSessionModel(
+            id=uuid.uuid4() if not user_session.id else uuid.UUID(user_session.id),
+            user_id=uuid.UUID(user_session.user_id),
+            refresh_jti_hash=user_session.refresh_jti_hash,
+            created_at=user_session.created_at,
+            last_used_at=user_session.last_used_at,
+            expires_at=user_session.expires_at,
+            user_agent=(user_session.user_agent or "")[:255] or None,
+            ip_address=user_session.ip_address
+        )
+        self.session.add(db_session)
+
+        await self.session.commit()
+
+        user_session.id = str(db_session.id)
+        return user_session
+
+    async def find_by_id(self, session_id: str) -> Optional[UserSession]:
+        """Busca una sesión por ID"""
+        stmt = select(UserSessionModel).where(UserSessionModel.id == uuid.UUID(session_id))
+        result = await self.session.execute(stmt)
+        db_session = result.scalar_one_or_none()
+
+        return self._to_domain(db_session) if db_session else None
+
+    async def rotate(
+        self,
+        session_id: str,
+        current_jti_hash: str,
+        new_jti_hash: str,
+        now: datetime
+    ) -> bool:
+        """Rota el jti con un UPDATE condicional (dos refresh simultáneos no rotan ambos)"""
+        stmt = (
+            update(UserSessionModel)
+            .where(
+                UserSessionModel.id == uuid.UUID(session_id),
+                UserSessionModel.refresh_jti_hash == current_jti_hash,
+                UserSessionModel.revoked_at.is_(None),
+                UserSessionModel.expires_at > now
+            )
+            .values(refresh_jti_hash=new_jti_hash, last_used_at=now)
+            .returning(UserSessionModel.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        rotated = result.scalar_one_or_none() is not None
+        await self.session.commit()
+
+        return rotated
+
+    async def revoke(self, session_id: str, reason: str, now: datetime) -> Optional[UserSession]:
+        """Revoca una sesión"""
+        stmt = (
+            update(UserSessionModel)
+            .where(
+                UserSessionModel.id == uuid.UUID(session_id),
+                UserSessionModel.revoked_at.is_(None)
+            )
+            .values(revoked_at=now, revoked_reason=reason)
+            .returning(UserSessionModel)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        db_session = result.scalar_one_or_none()
+        await self.session.commit()
+
+        return self._to_domain(db_session) if db_session else None
+
+    async def revoke_all_for_user(self, user_id: str, reason: str, now: datetime) -> List[UserSession]:
+        """Revoca todas las sesiones activas de un usuario con un solo UPDATE"""
+        stmt = (
+            update(UserSessionModel)
+            .where(
+                UserSessionModel.user_id == uuid.UUID(user_id),
+                UserSessionModel.revoked_at.is_(None),
+                UserSessionModel.expires_at > now
+            )
+            .values(revoked_at=now, revoked_reason=reason)
+            .returning(UserSessionModel)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        revoked = [self._to_domain(m) for m in result.scalars().all()]
+        await self.session.commit()
+
+        return revoked
+
+    async def find_revoked_since(self, since: datetime) -> List[UserSession]:
+        """Sesiones revocadas desde `since`"""
+        stmt = select(UserSessionModel).where(UserSessionModel.revoked_at >= since)
+        result = await self.session.execute(stmt)
+        return [self._to_domain(m) for m in result.scalars().all()]
+
+    def _to_domain(self, db_session: UserSessionModel) -> UserSession:
+        """Convierte modelo de DB a entidad de dominio"""
+        return UserSession(
+            id=str(db_session.id),
+            user_id=str(db_session.user_id),
+            refresh_jti_hash=db_session.refresh_jti_hash,
+            created_at=db_session.created_at,
+            last_used_at=db_session.last_used_at,
+            expires_at=db_session.expires_at,
+            revoked_at=db_session.revoked_at,
+            revoked_reason=db_session.revoked_reason,
+            user_agent=db_session.user_agent,
+            ip_address=db_session.ip_address
+        )
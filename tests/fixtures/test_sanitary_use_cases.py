@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, Mock, patch
 from datetime import date, timedelta
 from uuid import UUID, uuid4
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.sanitary.domain.incident_type import IncidentType
 from app.sanitary.domain.sanitary_company import SanitaryCompany
 from app.sanitary.domain.sanitary_policy import SanitaryPolicy
@@ -17,6 +19,38 @@ from app.sanitary.application.use_cases.get_sanitary_policy_history import (
 from app.sanitary.application.use_cases.register_sanitary_review import (
     RegisterSanitaryReviewUseCase, RegisterSanitaryReviewCommand
 )
+from app.sanitary.application.use_cases.get_sanitary_compliance_overview import (
+    GetSanitaryComplianceOverviewUseCase, GetSanitaryComplianceOverviewCommand
+)
+from app.sanitary.application.use_cases.register_sanitary_reviews import (
+    RegisterSanitaryReviewsUseCase, RegisterSanitaryReviewsCommand, SanitaryReviewItem
+)
+from app.sanitary.application.use_cases.import_sanitary_reviews import (
+    ImportSanitaryReviewsUseCase, ImportSanitaryReviewsCommand
+)
+from app.sanitary.application.use_cases.get_nonconformity_analytics import (
+    GetNonconformityAnalyticsCommand,
+    GetNonconformityAnalyticsUseCase,
+)
+from app.sanitary.domain.sanitary_analytics import NonconformityCount
+from app.sanitary.domain.sanitary_compliance import PolicyCompliance
+from app.sanitary.domain.sanitary_history import PolicyHistoryPage
+from app.sanitary.infrastructure.persistence.cached_reference_repositories import (
+    POLICIES_CACHE_KEY,
+    CachedIncidentTypeRepository,
+    CachedSanitaryCompanyRepository,
+    CachedSanitaryPolicyRepository,
+)
+from app.sanitary.infrastructure.persistence.cached_sanitary_review_repository import (
+    CachedSanitaryReviewRepository,
+)
+from app.sanitary.infrastructure.services.review_due_scheduler import (
+    STAGE_OVERDUE,
+    STAGE_UPCOMING,
+    SanitaryReviewDueScheduler,
+)
+from app.shared.cache.query_results import QueryResultCache
+from app.shared.cache.reference_data import ReferenceDataCache
 
 
 # ==============================================================================
@@ -381,8 +415,9 @@ class TestGetSanitaryPolicyHistoryUseCase(unittest.IsolatedAsyncioTestCase):
 
         # Configuramos los mocks
         self.mock_policy_repo.get_by_id.return_value = policy_mock
-        self.mock_review_repo.get_last_by_policy.return_value = review_last_mock
-        self.mock_review_repo.list_by_policy_and_period.return_value = [create_review_mock()]
+        self.mock_review_repo.get_policy_history.return_value = PolicyHistoryPage(
+            reviews=[create_review_mock()], last_review=review_last_mock
+        )
 
         cmd = GetSanitaryPolicyHistoryCommand(policy_id=self.POLICY_ID, months_back=6)
         result = await self.use_case.execute(cmd)
@@ -405,8 +440,7 @@ class TestGetSanitaryPolicyHistoryUseCase(unittest.IsolatedAsyncioTestCase):
         """
         # Configuramos los mocks para simular ausencia de revisiones
         self.mock_policy_repo.get_by_id.return_value = create_policy_mock()
-        self.mock_review_repo.get_last_by_policy.return_value = None
-        self.mock_review_repo.list_by_policy_and_period.return_value = []
+        self.mock_review_repo.get_policy_history.return_value = PolicyHistoryPage()
 
         cmd = GetSanitaryPolicyHistoryCommand(policy_id=self.POLICY_ID, months_back=6)
         result = await self.use_case.execute(cmd)
@@ -416,6 +450,65 @@ class TestGetSanitaryPolicyHistoryUseCase(unittest.IsolatedAsyncioTestCase):
         # No debe haber fecha de próxima revisión
         self.assertIsNone(result['next_review_date'])
 
+    async def test_period_uses_calendar_months(self):
+        """
+        24 meses antes del 2026-02-28 es el 2024-02-28 (no 720 días antes),
+        y 6 meses antes del 2025-08-31 es el 2025-02-28 (fin de mes).
+        """
+        self.mock_policy_repo.get_by_id.return_value = create_policy_mock()
+        self.mock_review_repo.get_policy_history.return_value = PolicyHistoryPage()
+
+        for today, months_back, expected in [
+            (date(2026, 2, 28), 24, date(2024, 2, 28)),
+            (date(2025, 8, 31), 6, date(2025, 2, 28)),
+        ]:
+            result = await self.use_case.execute(
+                GetSanitaryPolicyHistoryCommand(policy_id=self.POLICY_ID, months_back=months_back, today=today)
+            )
+            self.assertEqual(result['start_date'], expected.isoformat())
+            self.assertEqual(
+                self.mock_review_repo.get_policy_history.await_args.kwargs['start_date'], expected
+            )
+
+    async def test_keyset_pagination(self):
+        """
+        Con first=2 y tres revisiones devueltas (una extra):
+        - has_more es True y el cursor apunta a la última de la página
+        - La siguiente página pasa (fecha, id) de ese cursor al repositorio
+        - Todo sale de una sola consulta por página
+        """
+        self.mock_policy_repo.get_by_id.return_value = create_policy_mock()
+        reviews = [create_review_mock(date_val=self.TODAY - timedelta(days=d)) for d in (1, 2, 3)]
+        self.mock_review_repo.get_policy_history.return_value = PolicyHistoryPage(
+            reviews=reviews, last_review=reviews[0]
+        )
+
+        result = await self.use_case.execute(
+            GetSanitaryPolicyHistoryCommand(policy_id=self.POLICY_ID, months_back=6, first=2)
+        )
+
+        self.assertEqual(len(result['history']), 2)
+        self.assertTrue(result['has_more'])
+        self.assertEqual(self.mock_review_repo.get_policy_history.await_args.kwargs['limit'], 3)
+        self.mock_review_repo.get_last_by_policy.assert_not_awaited()
+
+        await self.use_case.execute(GetSanitaryPolicyHistoryCommand(
+            policy_id=self.POLICY_ID, months_back=6, first=2, after=result['next_cursor']
+        ))
+        self.assertEqual(
+            self.mock_review_repo.get_policy_history.await_args.kwargs['after'],
+            (reviews[1].date, reviews[1].id),
+        )
+
+    async def test_invalid_cursor(self):
+        """Un cursor manipulado no llega a la base de datos"""
+        result = await self.use_case.execute(
+            GetSanitaryPolicyHistoryCommand(policy_id=self.POLICY_ID, months_back=6, after="no-es-un-cursor")
+        )
+
+        self.assertFalse(result['success'])
+        self.mock_review_repo.get_policy_history.assert_not_awaited()
+
 
 class TestRegisterSanitaryReviewUseCase(unittest.IsolatedAsyncioTestCase):
     """
@@ -585,4 +678,484 @@ class TestRegisterSanitaryReviewUseCase(unittest.IsolatedAsyncioTestCase):
         # Verificamos que se consultó el tipo de incidencia (es necesario validarlo)
         self.mock_incident_type_repo.get_by_id.assert_awaited_once()
         # Verificamos que se guardó la revisión
-        self.mock_review_repo.save.assert_awaited_once()
\ No newline at end of file
+        self.mock_review_repo.save.assert_awaited_once()
+
+
+class TestGetSanitaryComplianceOverviewUseCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Pruebas para el tablero de cumplimiento de sanidad.
+    El repositorio entrega todas las políticas en una sola consulta; el caso
+    de uso calcula la próxima revisión y si está vencida o por vencer.
+    """
+
+    def setUp(self):
+        self.TODAY = date(2030, 6, 15)
+        self.mock_review_repo = AsyncMock()
+        self.use_case = GetSanitaryComplianceOverviewUseCase(self.mock_review_repo)
+
+    def _row(self, name, last_review_date=None, nonconformities=0):
+        return PolicyCompliance(
+            policy_id=uuid4(),
+            policy_name=name,
+            policy_description=None,
+            is_active=True,
+            last_review_date=last_review_date,
+            last_review_is_conform=True if last_review_date else None,
+            reviews_in_period=1 if last_review_date else 0,
+            nonconformities_in_period=nonconformities,
+        )
+
+    async def test_overdue_upcoming_and_never_reviewed(self):
+        """
+        - Revisada hace 40 días: vencida (próxima = última + 30 días)
+        - Revisada hace 25 días: por vencer (faltan 5 días)
+        - Nunca revisada: vencida y sin próxima fecha
+        """
+        self.mock_review_repo.get_compliance_overview.return_value = [
+            self._row("Control de Plagas", self.TODAY - timedelta(days=40), nonconformities=2),
+            self._row("Control de Temperatura", self.TODAY - timedelta(days=25)),
+            self._row("Limpieza de Campanas"),
+        ]
+
+        result = await self.use_case.execute(
+            GetSanitaryComplianceOverviewCommand(months_back=6, today=self.TODAY)
+        )
+
+        # Una sola consulta para todas las políticas
+        self.mock_review_repo.get_compliance_overview.assert_awaited_once()
+        self.assertEqual(result["overdue_count"], 2)
+        self.assertEqual(result["upcoming_count"], 1)
+
+        plagas, temperatura, campanas = result["items"]
+        self.assertTrue(plagas["is_overdue"])
+        self.assertEqual(plagas["nonconformities_in_period"], 2)
+        self.assertTrue(temperatura["is_upcoming"])
+        self.assertEqual(temperatura["days_until_due"], 5)
+        self.assertTrue(campanas["is_overdue"])
+        self.assertIsNone(campanas["next_review_date"])
+
+
+class TestCachedSanitaryReferenceRepositories(unittest.IsolatedAsyncioTestCase):
+    """
+    Pruebas para la caché de catálogos de sanidad.
+    Verifica que el registro de revisiones valide en memoria y que las
+    escrituras invaliden el catálogo.
+    """
+
+    def setUp(self):
+        self.cache = ReferenceDataCache(ttl_seconds=300)
+        self.session = AsyncSession()
+        self.policy = SanitaryPolicy.create(name="Control de Plagas")
+        self.incident_type = IncidentType.create(policy_id=self.policy.id, name="Roedores")
+        self.company = SanitaryCompany.create(business_name="Fumigaciones SAC", ruc="20123456789")
+
+        self.policy_delegate = AsyncMock()
+        self.policy_delegate.list_all.return_value = [self.policy]
+        self.incident_delegate = AsyncMock()
+        self.incident_delegate.list_all.return_value = [self.incident_type]
+        self.company_delegate = AsyncMock()
+        self.company_delegate.list_all.return_value = [self.company]
+
+        self.policy_repo = CachedSanitaryPolicyRepository(self.policy_delegate, self.cache, self.session)
+        self.use_case = RegisterSanitaryReviewUseCase(
+            policy_repo=self.policy_repo,
+            incident_type_repo=CachedIncidentTypeRepository(self.incident_delegate, self.cache, self.session),
+            review_repo=AsyncMock(save=AsyncMock(side_effect=lambda review: review)),
+            company_repo=CachedSanitaryCompanyRepository(self.company_delegate, self.cache, self.session),
+        )
+
+    def _non_conform_cmd(self):
+        return RegisterSanitaryReviewCommand(
+            policy_id=self.policy.id,
+            date=date(2026, 2, 20),
+            is_conform=False,
+            user_id=uuid4(),
+            incident_type_id=self.incident_type.id,
+            company_id=self.company.id,
+        )
+
+    async def test_register_validates_from_memory(self):
+        """
+        Tres revisiones seguidas: cada catálogo se carga una sola vez y nunca
+        se llama a get_by_id en la BD.
+        """
+        for _ in range(3):
+            result = await self.use_case.execute(self._non_conform_cmd())
+            self.assertTrue(result["success"])
+
+        self.policy_delegate.list_all.assert_awaited_once()
+        self.incident_delegate.list_all.assert_awaited_once()
+        self.company_delegate.list_all.assert_awaited_once()
+        self.policy_delegate.get_by_id.assert_not_awaited()
+        self.incident_delegate.get_by_id.assert_not_awaited()
+
+    async def test_incident_types_by_policy_accepts_string_ids(self):
+        """El resolver pasa el ID como string (strawberry.ID)"""
+        repo = CachedIncidentTypeRepository(self.incident_delegate, self.cache, self.session)
+
+        incident_types = await repo.list_by_policy(str(self.policy.id))
+
+        self.assertEqual([t.id for t in incident_types], [self.incident_type.id])
+
+    async def test_save_invalidates_catalog(self):
+        """Después de guardar, la siguiente lectura vuelve a cargar desde la BD"""
+        await self.policy_repo.list_active()
+        renamed = SanitaryPolicy(id=self.policy.id, name="Plagas", description=None, is_active=True)
+        self.policy_delegate.save.return_value = renamed
+        self.policy_delegate.list_all.return_value = [renamed]
+
+        await self.policy_repo.save(renamed)
+        policies = await self.policy_repo.list_active()
+
+        self.assertEqual(self.policy_delegate.list_all.await_count, 2)
+        self.assertEqual(policies[0].name, "Plagas")
+
+    async def test_load_between_flush_and_commit_is_not_cached(self):
+        """Una carga que leyó la BD antes del commit no queda en la caché; los demás workers se enteran tras el commit"""
+        published = []
+        self.cache.publisher = published.append
+        renamed = SanitaryPolicy(id=self.policy.id, name="Plagas", description=None, is_active=True)
+        self.policy_delegate.save.return_value = renamed
+
+        await self.policy_repo.save(renamed)  # Solo flush: otras sesiones siguen viendo la versión anterior
+        await self.policy_repo.list_all()
+        self.assertEqual(published, [])
+
+        await self.session.commit()
+
+        self.assertIsNone(self.cache.peek(POLICIES_CACHE_KEY))
+        self.assertEqual(published, [{"key": POLICIES_CACHE_KEY}])
+        self.policy_delegate.list_all.return_value = [renamed]
+        policies = await self.policy_repo.list_all()
+        self.assertEqual(policies[0].name, "Plagas")
+
+    async def test_load_overtaken_by_write_is_not_cached(self):
+        """Si hubo una escritura mientras se cargaba, ese resultado no se guarda"""
+        async def stale_load():
+            self.cache.invalidate(POLICIES_CACHE_KEY)  # Escritura concurrente
+            return [self.policy]
+
+        self.policy_delegate.list_all.side_effect = stale_load
+        await self.policy_repo.list_all()
+
+        self.assertIsNone(self.cache.peek(POLICIES_CACHE_KEY))
+        self.assertEqual(self.cache.metrics.stale_loads, 1)
+
+
+class TestRegisterSanitaryReviewsUseCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Pruebas para el registro en lote y la importación de revisiones.
+    Verifica las consultas por tabla, los errores por fila y el todo o nada.
+    """
+
+    def setUp(self):
+        self.policy = SanitaryPolicy.create(name="Control de Plagas")
+        self.other_policy = SanitaryPolicy.create(name="Control de Temperatura")
+        self.incident_type = IncidentType.create(policy_id=self.policy.id, name="Roedores")
+        self.company = SanitaryCompany.create(business_name="Fumigaciones SAC", ruc="20123456789")
+        self.user_id = uuid4()
+
+        self.mock_policy_repo = AsyncMock()
+        self.mock_policy_repo.get_many_by_ids.return_value = {
+            p.id: p for p in (self.policy, self.other_policy)
+        }
+        self.mock_policy_repo.list_all.return_value = [self.policy, self.other_policy]
+        self.mock_incident_repo = AsyncMock()
+        self.mock_incident_repo.get_many_by_ids.return_value = {self.incident_type.id: self.incident_type}
+        self.mock_incident_repo.list_all.return_value = [self.incident_type]
+        self.mock_company_repo = AsyncMock()
+        self.mock_company_repo.get_many_by_ids.return_value = {self.company.id: self.company}
+        self.mock_company_repo.list_all.return_value = [self.company]
+        self.mock_review_repo = AsyncMock()
+        self.mock_uow = AsyncMock()
+
+        repos = dict(
+            policy_repo=self.mock_policy_repo,
+            incident_type_repo=self.mock_incident_repo,
+            review_repo=self.mock_review_repo,
+            company_repo=self.mock_company_repo,
+            unit_of_work=self.mock_uow,
+        )
+        self.use_case = RegisterSanitaryReviewsUseCase(**repos)
+        self.import_use_case = ImportSanitaryReviewsUseCase(**repos)
+
+    def _item(self, row, policy_id, is_conform=True, **kwargs):
+        return SanitaryReviewItem(row=row, policy_id=policy_id, date=date(2026, 2, 20), is_conform=is_conform, **kwargs)
+
+    async def test_valid_batch_is_inserted_at_once(self):
+        """
+        Dos revisiones válidas:
+        - Una consulta por tabla de referencia
+        - Un solo add_many y un commit
+        """
+        items = [
+            self._item(1, self.policy.id, is_conform=False,
+                       incident_type_id=self.incident_type.id, company_id=self.company.id),
+            self._item(2, self.other_policy.id),
+        ]
+
+        result = await self.use_case.execute(RegisterSanitaryReviewsCommand(items=items, user_id=self.user_id))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["created_count"], 2)
+        self.mock_policy_repo.get_many_by_ids.assert_awaited_once()
+        self.mock_incident_repo.get_many_by_ids.assert_awaited_once()
+        self.mock_company_repo.get_many_by_ids.assert_awaited_once()
+        self.mock_policy_repo.get_by_id.assert_not_awaited()
+        self.mock_review_repo.add_many.assert_awaited_once()
+        self.assertEqual(len(self.mock_review_repo.add_many.await_args.args[0]), 2)
+        self.mock_uow.commit.assert_awaited_once()
+
+    async def test_row_errors_reject_whole_batch(self):
+        """
+        - Fila 2: tipo de incidencia de otra política
+        - Fila 3: misma política y fecha que la fila 1
+        No se registra nada y se informan ambas filas.
+        """
+        items = [
+            self._item(1, self.policy.id),
+            self._item(2, self.other_policy.id, is_conform=False,
+                       incident_type_id=self.incident_type.id, company_id=self.company.id),
+            self._item(3, self.policy.id),
+        ]
+
+        result = await self.use_case.execute(RegisterSanitaryReviewsCommand(items=items, user_id=self.user_id))
+
+        self.assertFalse(result["success"])
+        self.assertEqual([e["row"] for e in result["errors"]], [2, 3])
+        self.assertIn("no pertenece", result["errors"][0]["message"])
+        self.mock_review_repo.add_many.assert_not_awaited()
+        self.mock_uow.commit.assert_not_awaited()
+
+    async def test_import_csv_resolves_names(self):
+        """
+        El CSV trae nombres (con otra capitalización) y RUC en vez de IDs;
+        una fila con política desconocida se reporta con su número de fila.
+        """
+        content = (
+            "Politica;Fecha;Resultado;Tipo de incidencia;Empresa;Observacion\n"
+            "control de plagas;20/02/2026;Inconforme;roedores;20123456789;Trampa vacía\n"
+            "Control de Temperatura;2026-02-20;Conforme;;;\n"
+            "Política inexistente;2026-02-20;Conforme;;;\n"
+        ).encode("utf-8")
+
+        result = await self.import_use_case.execute(ImportSanitaryReviewsCommand(
+            filename="ronda.csv", content=content, user_id=self.user_id, dry_run=True
+        ))
+
+        self.assertEqual(result["valid_count"], 2)
+        self.assertEqual(result["errors"], [{"row": 4, "message": "La política 'Política inexistente' no existe."}])
+        self.mock_policy_repo.list_all.assert_awaited_once()
+        self.mock_review_repo.add_many.assert_not_awaited()
+
+
+class TestSanitaryReviewDueScheduler(unittest.IsolatedAsyncioTestCase):
+    """
+    Pruebas del planificador de vencimientos (heap en memoria).
+    Verifica que solo se consulte la BD cuando hay algo que avisar.
+    """
+
+    def setUp(self):
+        self.today = date(2026, 3, 10)
+        self.session = Mock()
+        self.session_factory = Mock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=self.session)))
+        self.scheduler = SanitaryReviewDueScheduler(
+            session_factory=self.session_factory,
+            upcoming_days=3,
+            today=lambda: self.today,
+        )
+        self.scheduler._loaded_at = float("inf")  # Sin recarga desde la BD
+
+    def test_collect_due_in_date_order(self):
+        """
+        - Sin revisiones: vencida desde el inicio
+        - Última revisión hace 28 días: vence en 2 días (por vencer)
+        - Última revisión hace 5 días: todavía no se avisa
+        """
+        never, soon, fine = uuid4(), uuid4(), uuid4()
+        self.scheduler.track(fine, "Limpieza", self.today - timedelta(days=5))
+        self.scheduler.track(soon, "Temperatura", self.today - timedelta(days=28))
+        self.scheduler.track(never, "Plagas", None)
+
+        alerts = self.scheduler.collect_due(self.today)
+
+        self.assertEqual([(a.policy_id, a.stage) for a in alerts], [(never, STAGE_OVERDUE), (soon, STAGE_UPCOMING)])
+        # Lo que queda: el aviso de vencida de 'soon' y el previo de 'fine'
+        self.assertEqual(self.scheduler.collect_due(self.today), [])
+
+    def test_record_review_reschedules_without_duplicates(self):
+        """Una revisión nueva deja obsoleta la entrada anterior; una más antigua no cambia nada"""
+        policy_id = uuid4()
+        self.scheduler.track(policy_id, "Plagas", self.today - timedelta(days=40))
+
+        self.scheduler.record_review(policy_id, self.today)
+        self.scheduler.record_review(policy_id, self.today - timedelta(days=60))
+
+        self.assertEqual(self.scheduler.collect_due(self.today), [])
+        later = self.today + timedelta(days=28)
+        self.assertEqual([a.stage for a in self.scheduler.collect_due(later)], [STAGE_UPCOMING])
+        self.assertEqual([a.stage for a in self.scheduler.collect_due(later + timedelta(days=3))], [STAGE_OVERDUE])
+
+    async def test_idle_tick_does_not_touch_database(self):
+        """Si el tope del heap no venció, el tick no abre sesión"""
+        self.scheduler.track(uuid4(), "Plagas", self.today)
+
+        processed = await self.scheduler.run_once()
+
+        self.assertEqual(processed, 0)
+        self.session_factory.assert_not_called()
+        self.assertEqual(self.scheduler.metrics.idle_ticks, 1)
+
+    async def test_due_alerts_are_batched_per_recipient(self):
+        """Dos políticas vencidas -> un solo email por destinatario; el siguiente tick no repite"""
+        self.scheduler.track(uuid4(), "Plagas", None)
+        self.scheduler.track(uuid4(), "Temperatura", self.today - timedelta(days=45))
+        recipients = [Mock(email="nutri@catering.com", full_name="Ana"), Mock(email="admin@catering.com", full_name="Luis")]
+        user_repo = AsyncMock(find_active_by_roles=AsyncMock(return_value=recipients))
+        outbox_repo = AsyncMock(enqueue_many=AsyncMock(side_effect=lambda emails: len(emails)))
+
+        module = "app.sanitary.infrastructure.services.review_due_scheduler"
+        with patch(f"{module}.PostgreSQLUserRepository", return_value=user_repo), \
+                patch(f"{module}.PostgreSQLEmailOutboxRepository", return_value=outbox_repo):
+            self.assertEqual(await self.scheduler.run_once(), 2)
+            self.assertEqual(await self.scheduler.run_once(), 0)
+
+        emails = outbox_repo.enqueue_many.await_args.args[0]
+        self.assertEqual([e.to_email for e in emails], ["nutri@catering.com", "admin@catering.com"])
+        self.assertEqual(len(emails[0].context["overdue"]), 2)
+        outbox_repo.enqueue_many.assert_awaited_once()
+
+    async def test_standby_worker_forwards_reviews_to_leader(self):
+        """Un worker sin el lock no toca la BD y publica sus revisiones para el líder"""
+        policy_id = uuid4()
+        published = []
+        standby = SanitaryReviewDueScheduler(
+            session_factory=self.session_factory,
+            today=lambda: self.today,
+            leader=AsyncMock(return_value=False),
+            publisher=published.append,
+        )
+        self.scheduler.track(policy_id, "Plagas", self.today - timedelta(days=40))
+
+        self.assertEqual(await standby.run_once(), 0)
+        standby.record_review(policy_id, self.today)
+        for data in published:
+            self.scheduler.apply_remote(data)
+
+        self.session_factory.assert_not_called()
+        self.assertEqual(standby.metrics.standby_ticks, 1)
+        # El líder ya no la considera vencida
+        self.assertEqual(self.scheduler.collect_due(self.today), [])
+
+
+class TestGetNonconformityAnalyticsUseCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Pruebas de la analítica de inconformidades (tendencias por mes).
+    """
+
+    def setUp(self):
+        self.policy = SanitaryPolicy.create(name="Control de Plagas")
+        self.incident_type = IncidentType.create(policy_id=self.policy.id, name="Roedores")
+        self.company = SanitaryCompany.create(ruc="20123456789", business_name="Fumigaciones SAC")
+        self.counts = [
+            NonconformityCount(date(2026, 1, 1), self.policy.id, self.incident_type.id, self.company.id, 3),
+            NonconformityCount(date(2026, 2, 1), self.policy.id, self.incident_type.id, self.company.id, 1),
+            NonconformityCount(date(2026, 2, 1), self.policy.id, None, None, 2),
+        ]
+
+        self.delegate = AsyncMock()
+        self.delegate.get_nonconformity_counts.return_value = self.counts
+        self.cache = QueryResultCache()
+        self.session = AsyncSession()
+        policy_repo = AsyncMock(
+            get_many_by_ids=AsyncMock(return_value={self.policy.id: self.policy}),
+            get_by_id=AsyncMock(side_effect=lambda policy_id: self.policy if policy_id == self.policy.id else None),
+        )
+        company_repo = AsyncMock(
+            get_many_by_ids=AsyncMock(return_value={self.company.id: self.company}),
+            get_by_id=AsyncMock(side_effect=lambda company_id: self.company if company_id == self.company.id else None),
+        )
+        self.review_repo = CachedSanitaryReviewRepository(
+            self.delegate, self.cache, self.session, policy_repo=policy_repo, company_repo=company_repo
+        )
+
+        self.use_case = GetNonconformityAnalyticsUseCase(
+            review_repo=self.review_repo,
+            policy_repo=policy_repo,
+            incident_type_repo=AsyncMock(
+                get_many_by_ids=AsyncMock(return_value={self.incident_type.id: self.incident_type})
+            ),
+            company_repo=company_repo,
+        )
+
+    async def test_counts_grouped_by_month_with_names(self):
+        """Periodo alineado al día 1, nombres resueltos y totales por mes"""
+        result = await self.use_case.execute(GetNonconformityAnalyticsCommand(months=12, today=date(2026, 2, 20)))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["start_date"], "2025-03-01")
+        self.assertEqual(result["total"], 6)
+        self.assertEqual(result["monthly_totals"], [
+            {"month": "2026-01-01", "count": 3},
+            {"month": "2026-02-01", "count": 3},
+        ])
+        self.assertEqual(result["items"][0]["incident_type_name"], "Roedores")
+        self.assertEqual(result["items"][0]["company_name"], "Fumigaciones SAC")
+        self.assertIsNone(result["items"][2]["company_name"])
+
+    async def test_period_is_cached_until_a_review_is_registered(self):
+        """Misma consulta dos veces -> una sola ida a la BD; un lote nuevo invalida"""
+        cmd = GetNonconformityAnalyticsCommand(months=24, today=date(2026, 2, 20))
+
+        await self.use_case.execute(cmd)
+        await self.use_case.execute(cmd)
+        self.assertEqual(self.delegate.get_nonconformity_counts.await_count, 1)
+
+        await self.review_repo.add_many([])
+        await self.use_case.execute(cmd)
+        self.assertEqual(self.delegate.get_nonconformity_counts.await_count, 2)
+
+    async def test_load_between_flush_and_commit_is_not_cached(self):
+        """Conteos leídos antes del commit del lote no quedan en la caché; los demás workers se enteran tras el commit"""
+        published = []
+        self.cache.publisher = published.append
+        cmd = GetNonconformityAnalyticsCommand(months=12, today=date(2026, 2, 20))
+
+        await self.review_repo.add_many([])  # Solo flush: otras sesiones siguen viendo los conteos anteriores
+        await self.use_case.execute(cmd)
+        self.assertEqual(published, [])
+
+        await self.session.commit()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(published, [{}])
+        await self.use_case.execute(cmd)
+        self.assertEqual(self.delegate.get_nonconformity_counts.await_count, 2)
+
+    async def test_unknown_filters_are_not_cached(self):
+        """Una política o empresa que no existe va directo a la BD y no ocupa entradas"""
+        cmd = GetNonconformityAnalyticsCommand(months=12, policy_id=uuid4(), today=date(2026, 2, 20))
+
+        await self.use_case.execute(cmd)
+        await self.use_case.execute(cmd)
+        await self.use_case.execute(GetNonconformityAnalyticsCommand(months=12, company_id=uuid4()))
+
+        self.assertEqual(self.delegate.get_nonconformity_counts.await_count, 3)
+        self.assertEqual(len(self.cache), 0)
+
+    async def test_known_filters_are_cached(self):
+        cmd = GetNonconformityAnalyticsCommand(
+            months=12, policy_id=self.policy.id, company_id=self.company.id, today=date(2026, 2, 20)
+        )
+
+        await self.use_case.execute(cmd)
+        await self.use_case.execute(cmd)
+
+        self.assertEqual(self.delegate.get_nonconformity_counts.await_count, 1)
+        self.assertEqual(len(self.cache), 1)
+
+    async def test_invalid_period(self):
+        result = await self.use_case.execute(GetNonconformityAnalyticsCommand(months=0))
+
+        self.assertFalse(result["success"])
+        self.delegate.get_nonconformity_counts.assert_not_awaited()
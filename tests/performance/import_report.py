@@ -0,0 +1,78 @@
+"""
+Reporte de tiempos de importación (`python -X importtime`).
+
+Uso:
+    python -m tests.performance.import_report            # app.main, top 25
+    python -m tests.performance.import_report app.main 40
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+import os
+import subprocess
+import sys
+
+from dotenv import dotenv_values
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Una línea de -X importtime (tiempos en microsegundos)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def _startup_env() -> Dict[str, str]:
+    """Entorno del proceso hijo: variables de .env.example (sin pisar las reales)"""
+    env = {k: v for k, v in dotenv_values(ROOT_DIR / ".env.example").items() if v is not None}
+    env.update(os.environ)
+    return env
+
+
+def measure_imports(module: str = "app.main") -> List[ImportTiming]:
+    """Importa `module` en un proceso nuevo y devuelve los tiempos de cada import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        env=_startup_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings: List[ImportTiming] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append(
+            ImportTiming(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return timings
+
+
+def total_ms(timings: List[ImportTiming], module: str = "app.main") -> float:
+    return next(t.cumulative_us for t in timings if t.module == module) / 1000
+
+
+def format_report(timings: List[ImportTiming], top: int = 25) -> str:
+    """Los imports más caros (acumulado) como tabla de texto"""
+    rows = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    lines = [f"{'acumulado ms':>12} {'propio ms':>10}  módulo"]
+    lines += [f"{t.cumulative_us / 1000:12.1f} {t.self_us / 1000:10.1f}  {t.module}" for t in rows]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "app.main"
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    timings = measure_imports(target)
+    print(f"import {target}: {total_ms(timings, target):.1f} ms")
+    print(format_report(timings, top))
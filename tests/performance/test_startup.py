@@ -0,0 +1,30 @@
+"""Presupuesto de arranque: lo que cuesta importar app.main en un worker nuevo"""
+import os
+
+from tests.performance.import_report import format_report, measure_imports, total_ms
+
+# Margen amplio para CI; bajar localmente con STARTUP_IMPORT_BUDGET_MS
+STARTUP_IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "3000"))
+
+# Dependencias que solo se usan en operaciones puntuales (se importan al primer uso)
+LAZY_MODULES = ("openpyxl", "jinja2")
+
+# No deben cargarse nunca al arrancar la API
+FORBIDDEN_MODULES = ("pandas", "numpy", "scipy", "matplotlib", "IPython", "tornado")
+
+
+def test_startup_does_not_import_heavy_modules():
+    """openpyxl (Excel) y jinja2 (emails) quedan fuera del arranque"""
+    imported = {t.module.split(".")[0] for t in measure_imports("app.main")}
+
+    assert not imported & set(LAZY_MODULES + FORBIDDEN_MODULES)
+
+
+def test_startup_import_time_within_budget():
+    timings = measure_imports("app.main")
+
+    elapsed = total_ms(timings)
+    assert elapsed < STARTUP_IMPORT_BUDGET_MS, (
+        f"import app.main tardó {elapsed:.0f} ms (presupuesto {STARTUP_IMPORT_BUDGET_MS:.0f} ms)\n"
+        + format_report(timings)
+    )
@@ -0,0 +1,114 @@
+"""Tests unitarios para el cierre automático y la regularización en bloque"""
+import asyncio
+import uuid
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from app.attendance.application.use_cases.auto_close_attendances import (
+    AutoCloseAttendancesUseCase,
+    AutoCloseAttendancesCommand,
+    AUTO_CLOSE_REASON
+)
+from app.attendance.application.use_cases.bulk_regularize_attendances import (
+    BulkRegularizeAttendancesUseCase,
+    BulkRegularizeAttendancesCommand
+)
+from app.building_blocks.exceptions import DomainException
+
+NOW = datetime(2025, 3, 12, 4, 30, tzinfo=timezone.utc)
+A1, A2, A3 = (str(uuid.uuid4()) for _ in range(3))
+
+
+def test_auto_close_marks_stale_days_and_rebuilds_their_range():
+    """Un solo UPDATE y un solo rebuild acotado a los días y usuarios afectados"""
+    attendance_repo = AsyncMock()
+    attendance_repo.mark_open_for_regularization.return_value = [
+        ("u2", date(2025, 3, 11)),
+        ("u1", date(2025, 3, 9)),
+        ("u1", date(2025, 3, 10)),
+    ]
+    summary_repo = AsyncMock()
+    unit_of_work = AsyncMock()
+
+    result = asyncio.run(AutoCloseAttendancesUseCase(attendance_repo, summary_repo, unit_of_work).execute(
+        AutoCloseAttendancesCommand(now=NOW)
+    ))
+
+    assert result["closed_count"] == 3
+    attendance_repo.mark_open_for_regularization.assert_awaited_once_with(NOW, AUTO_CLOSE_REASON)
+    summary_repo.rebuild.assert_awaited_once_with(date(2025, 3, 9), date(2025, 3, 11), ["u1", "u2"])
+    unit_of_work.commit.assert_awaited_once()
+
+
+def test_auto_close_without_stale_days_skips_rebuild():
+    """Sin jornadas abiertas no se recalcula el resumen"""
+    attendance_repo = AsyncMock()
+    attendance_repo.mark_open_for_regularization.return_value = []
+    summary_repo = AsyncMock()
+
+    result = asyncio.run(AutoCloseAttendancesUseCase(attendance_repo, summary_repo, AsyncMock()).execute(
+        AutoCloseAttendancesCommand(now=NOW)
+    ))
+
+    assert result["closed_count"] == 0
+    summary_repo.rebuild.assert_not_awaited()
+
+
+def test_auto_close_rolls_back_when_rebuild_fails():
+    """Marcado y resumen se confirman juntos o no se confirma nada"""
+    attendance_repo = AsyncMock()
+    attendance_repo.mark_open_for_regularization.return_value = [("u1", date(2025, 3, 11))]
+    summary_repo = AsyncMock()
+    summary_repo.rebuild.side_effect = RuntimeError("rebuild failed")
+    unit_of_work = AsyncMock()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(AutoCloseAttendancesUseCase(attendance_repo, summary_repo, unit_of_work).execute(
+            AutoCloseAttendancesCommand(now=NOW)
+        ))
+
+    unit_of_work.commit.assert_not_awaited()
+    unit_of_work.rollback.assert_awaited_once()
+
+
+def test_bulk_regularize_reports_missing_ids_and_rebuilds_once():
+    """Los ids que no existen se reportan uno por uno; el resumen se recalcula una sola vez"""
+    attendance_repo = AsyncMock()
+    attendance_repo.regularize_many.return_value = [
+        (A1, "u1", date(2025, 3, 10)),
+        (A2, "u2", date(2025, 3, 7)),
+    ]
+    summary_repo = AsyncMock()
+    unit_of_work = AsyncMock()
+
+    result = asyncio.run(BulkRegularizeAttendancesUseCase(attendance_repo, summary_repo, unit_of_work).execute(
+        BulkRegularizeAttendancesCommand(attendance_ids=[A1, A2, A1, A3], admin_id=str(uuid.uuid4()), notes="  Olvidó marcar  ")
+    ))
+
+    assert result["regularized_count"] == 2
+    assert result["not_found_ids"] == [A3]
+    ids, _, notes, _ = attendance_repo.regularize_many.await_args.args
+    assert ids == [A1, A2, A3]
+    assert notes == "Olvidó marcar"
+    summary_repo.rebuild.assert_awaited_once_with(date(2025, 3, 7), date(2025, 3, 10), ["u1", "u2"])
+    unit_of_work.commit.assert_awaited_once()
+
+
+@pytest.mark.parametrize("attendance_ids, notes, message", [
+    ([], "ok", "al menos una"),
+    ([A1, "no-es-uuid"], "ok", "no-es-uuid"),
+    ([A1], "   ", "notas"),
+])
+def test_bulk_regularize_rejects_invalid_input_before_writing(attendance_ids, notes, message):
+    """Entradas inválidas se rechazan sin tocar la BD"""
+    attendance_repo = AsyncMock()
+    unit_of_work = AsyncMock()
+
+    with pytest.raises(DomainException, match=message):
+        asyncio.run(BulkRegularizeAttendancesUseCase(attendance_repo, AsyncMock(), unit_of_work).execute(
+            BulkRegularizeAttendancesCommand(attendance_ids=attendance_ids, admin_id="admin", notes=notes)
+        ))
+
+    attendance_repo.regularize_many.assert_not_awaited()
+    unit_of_work.commit.assert_not_awaited()
@@ -0,0 +1,42 @@
+"""Tests unitarios para la entidad Attendance"""
+from datetime import datetime, timezone, timedelta
+from app.attendance.domain.attendance import Attendance
+from app.attendance.domain.attendance_status import AttendanceStatus, BreakStatus
+from app.attendance.domain.break_period import BreakPeriod
+
+
+def _closed_attendance() -> Attendance:
+    start = datetime(2025, 3, 10, 13, 0, tzinfo=timezone.utc)
+    return Attendance(
+        id="a1",
+        user_id="u1",
+        date=start,
+        check_in_time=start,
+        check_out_time=start + timedelta(hours=8, minutes=30),
+        status=AttendanceStatus.COMPLETED,
+        break_periods=[
+            BreakPeriod(
+                id="b1",
+                attendance_id="a1",
+                start_time=start + timedelta(hours=4),
+                end_time=start + timedelta(hours=4, minutes=30),
+                status=BreakStatus.COMPLETED
+            )
+        ]
+    )
+
+
+def test_worked_minutes_discount_breaks():
+    """Debe descontar los descansos finalizados de los minutos trabajados"""
+    attendance = _closed_attendance()
+
+    assert attendance.get_break_minutes() == 30
+    assert attendance.get_worked_minutes() == 480
+
+
+def test_worked_minutes_is_zero_without_check_out():
+    """Una jornada abierta no suma minutos trabajados al resumen"""
+    attendance = _closed_attendance()
+    attendance.check_out_time = None
+
+    assert attendance.get_worked_minutes() == 0
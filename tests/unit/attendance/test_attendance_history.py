@@ -0,0 +1,46 @@
+"""Tests unitarios para el historial paginado de asistencia"""
+import asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from app.attendance.domain.attendance import Attendance
+from app.attendance.application.use_cases.get_attendance_history import (
+    GetAttendanceHistoryUseCase,
+    GetAttendanceHistoryCommand,
+    encode_cursor,
+    decode_cursor
+)
+from app.building_blocks.exceptions import DomainException
+
+ATTENDANCE_ID = "5b0e7a52-8d1f-4c1e-9b53-0d6a2f7f4a10"
+
+
+def test_cursor_roundtrip():
+    """El cursor debe decodificarse al mismo (date, id)"""
+    cursor = encode_cursor(date(2024, 12, 31), ATTENDANCE_ID)
+
+    assert decode_cursor(cursor) == (date(2024, 12, 31), ATTENDANCE_ID)
+
+
+def test_invalid_cursor_raises_domain_exception():
+    """Un cursor manipulado debe rechazarse"""
+    with pytest.raises(DomainException, match="Cursor inválido"):
+        decode_cursor("no-es-un-cursor")
+
+
+def test_history_returns_next_cursor_when_more_pages():
+    """Debe pedir un registro extra y devolver el cursor del último de la página"""
+    repo = AsyncMock()
+    repo.find_history.return_value = [
+        Attendance(id=ATTENDANCE_ID, user_id="u1", date=datetime(2025, 1, 3)),
+        Attendance(id="e3a7c9a4-1a8b-4f0e-8d77-3c5f8c2b9e01", user_id="u1", date=datetime(2025, 1, 2)),
+    ]
+    use_case = GetAttendanceHistoryUseCase(attendance_repository=repo)
+
+    result = asyncio.run(use_case.execute(GetAttendanceHistoryCommand(user_id="u1", first=1)))
+
+    repo.find_history.assert_awaited_once_with("u1", 2, None)
+    assert len(result["items"]) == 1
+    assert result["has_more"] is True
+    assert decode_cursor(result["next_cursor"]) == (date(2025, 1, 3), ATTENDANCE_ID)
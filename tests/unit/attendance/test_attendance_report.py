@@ -0,0 +1,49 @@
+"""Tests unitarios para el reporte de asistencia"""
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+from app.attendance.domain.attendance_report import AttendanceAggregate
+from app.attendance.application.use_cases.get_attendance_report import (
+    GetAttendanceReportUseCase,
+    GetAttendanceReportCommand
+)
+from app.building_blocks.exceptions import DomainException
+
+
+def test_report_rejects_inverted_range():
+    """Debe fallar si la fecha de inicio es posterior a la de fin"""
+    repo = AsyncMock()
+    use_case = GetAttendanceReportUseCase(attendance_report_repository=repo)
+
+    with pytest.raises(DomainException, match="fecha de inicio"):
+        asyncio.run(use_case.execute(GetAttendanceReportCommand(
+            start_date=date(2025, 2, 1),
+            end_date=date(2025, 1, 1)
+        )))
+
+    repo.aggregate_by_user.assert_not_called()
+
+
+def test_report_by_team_uses_role_aggregate():
+    """Debe delegar el reporte por equipo al agregado por rol y sumar totales"""
+    repo = AsyncMock()
+    repo.aggregate_by_role.return_value = [
+        AttendanceAggregate(group_key="cook", group_label="cook", users_count=3,
+                            days_worked=60, worked_minutes=28800, late_minutes=45, late_count=3),
+        AttendanceAggregate(group_key="warehouse", group_label="warehouse", users_count=1,
+                            days_worked=20, worked_minutes=9600, late_minutes=5, late_count=1),
+    ]
+    use_case = GetAttendanceReportUseCase(attendance_report_repository=repo)
+
+    result = asyncio.run(use_case.execute(GetAttendanceReportCommand(
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 31),
+        group_by="team"
+    )))
+
+    repo.aggregate_by_role.assert_awaited_once_with(date(2025, 1, 1), date(2025, 1, 31))
+    assert result["rows"][0]["worked_hours"] == 480.0
+    assert result["total_worked_hours"] == 640.0
+    assert result["total_late_minutes"] == 50
@@ -0,0 +1,102 @@
+"""Tests unitarios para iniciar/finalizar descanso (tabla break_periods)"""
+import asyncio
+import pytest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock
+
+from app.attendance.application.use_cases.start_break import StartBreakUseCase, StartBreakCommand
+from app.attendance.application.use_cases.end_break import EndBreakUseCase, EndBreakCommand
+from app.attendance.domain.attendance import Attendance
+from app.attendance.domain.attendance_status import AttendanceStatus, BreakStatus
+from app.attendance.domain.geolocation import Geolocation
+from app.building_blocks.exceptions import DomainException
+
+
+def _attendance_in_progress() -> Attendance:
+    start = datetime.now(timezone.utc) - timedelta(hours=2)
+    return Attendance(
+        id="a1",
+        user_id="u1",
+        date=start,
+        check_in_time=start,
+        status=AttendanceStatus.IN_PROGRESS,
+        workplace_location=Geolocation(latitude=-12.0, longitude=-77.0)
+    )
+
+
+def _repositories(attendance):
+    attendance_repo = AsyncMock()
+    attendance_repo.find_by_user_and_date.return_value = attendance
+    break_repo = AsyncMock()
+
+    async def add(break_period):
+        break_period.id = "b1"
+        return break_period
+
+    break_repo.add.side_effect = add
+    break_repo.update.side_effect = lambda break_period: break_period
+    return attendance_repo, break_repo, AsyncMock(), AsyncMock()
+
+
+def test_start_break_adds_one_row_and_commits_once():
+    """Asistencia y fila de descanso se confirman en la misma transacción"""
+    attendance = _attendance_in_progress()
+    attendance_repo, break_repo, _, unit_of_work = _repositories(attendance)
+    use_case = StartBreakUseCase(attendance_repo, break_repo, unit_of_work)
+
+    result = asyncio.run(use_case.execute(StartBreakCommand(user_id="u1", latitude=-12.0, longitude=-77.0)))
+
+    assert result["break_id"] == "b1"
+    assert attendance.status == AttendanceStatus.ON_BREAK
+    attendance_repo.save.assert_awaited_once_with(attendance)
+    added = break_repo.add.await_args.args[0]
+    assert added.attendance_id == "a1"
+    assert added.status == BreakStatus.IN_PROGRESS
+    unit_of_work.commit.assert_awaited_once()
+    unit_of_work.rollback.assert_not_awaited()
+
+
+def test_start_break_rolls_back_when_break_row_fails():
+    """Si la fila de descanso no se inserta, la asistencia tampoco queda en descanso"""
+    attendance_repo, break_repo, _, unit_of_work = _repositories(_attendance_in_progress())
+    break_repo.add.side_effect = RuntimeError("insert failed")
+    use_case = StartBreakUseCase(attendance_repo, break_repo, unit_of_work)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(use_case.execute(StartBreakCommand(user_id="u1", latitude=-12.0, longitude=-77.0)))
+
+    unit_of_work.commit.assert_not_awaited()
+    unit_of_work.rollback.assert_awaited_once()
+
+
+def test_end_break_updates_row_and_summary_in_one_commit():
+    """Finalizar actualiza la fila del descanso y el resumen diario con un solo commit"""
+    attendance = _attendance_in_progress()
+    attendance_repo, break_repo, summary_repo, unit_of_work = _repositories(attendance)
+    asyncio.run(StartBreakUseCase(attendance_repo, break_repo, AsyncMock()).execute(
+        StartBreakCommand(user_id="u1", latitude=-12.0, longitude=-77.0)
+    ))
+    use_case = EndBreakUseCase(attendance_repo, break_repo, summary_repo, unit_of_work)
+
+    result = asyncio.run(use_case.execute(EndBreakCommand(user_id="u1", latitude=-12.0, longitude=-77.0)))
+
+    assert attendance.status == AttendanceStatus.IN_PROGRESS
+    assert not result["is_exceeded"]
+    updated = break_repo.update.await_args.args[0]
+    assert updated.id == "b1"
+    assert updated.status == BreakStatus.COMPLETED
+    summary_repo.upsert_from_attendance.assert_awaited_once_with(attendance)
+    unit_of_work.commit.assert_awaited_once()
+
+
+def test_end_break_without_break_writes_nothing():
+    """Sin descanso activo no se escribe nada"""
+    attendance_repo, break_repo, summary_repo, unit_of_work = _repositories(_attendance_in_progress())
+    use_case = EndBreakUseCase(attendance_repo, break_repo, summary_repo, unit_of_work)
+
+    with pytest.raises(DomainException):
+        asyncio.run(use_case.execute(EndBreakCommand(user_id="u1", latitude=-12.0, longitude=-77.0)))
+
+    attendance_repo.save.assert_not_awaited()
+    break_repo.update.assert_not_awaited()
+    unit_of_work.commit.assert_not_awaited()
@@ -0,0 +1,41 @@
+"""Tests unitarios para el registro de entrada"""
+import asyncio
+from datetime import time
+from unittest.mock import AsyncMock, MagicMock
+
+from app.attendance.application.use_cases.check_in import CheckInUseCase, CheckInCommand
+from app.attendance.domain.attendance_status import AttendanceStatus
+
+
+def test_check_in_opens_summary_row_in_same_commit():
+    """La jornada en curso aparece en el resumen (y en el reporte) desde la entrada"""
+    attendance_repo = AsyncMock()
+    attendance_repo.has_pending_regularization.return_value = False
+    attendance_repo.find_by_user_and_date.return_value = None
+
+    async def save(attendance):
+        attendance.id = "a1"
+        return attendance
+
+    attendance_repo.save.side_effect = save
+
+    schedule = MagicMock(start_time=time(8, 0), end_time=time(17, 0), late_tolerance_minutes=15)
+    schedule.is_working_day.return_value = True
+    schedule_repo = AsyncMock()
+    schedule_repo.find_by_user_and_date.return_value = schedule
+    holiday_service = AsyncMock()
+    holiday_service.is_holiday.return_value = False
+    summary_repo = AsyncMock()
+    unit_of_work = AsyncMock()
+
+    use_case = CheckInUseCase(attendance_repo, holiday_service, schedule_repo, summary_repo, unit_of_work)
+    result = asyncio.run(use_case.execute(CheckInCommand(
+        user_id="u1", latitude=-12.0, longitude=-77.0,
+        workplace_latitude=-12.0, workplace_longitude=-77.0, workplace_radius_meters=100.0
+    )))
+
+    assert result["attendance_id"] == "a1"
+    saved = summary_repo.upsert_from_attendance.await_args.args[0]
+    assert saved.id == "a1"
+    assert saved.status == AttendanceStatus.IN_PROGRESS
+    unit_of_work.commit.assert_awaited_once()
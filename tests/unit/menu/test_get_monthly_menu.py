@@ -0,0 +1,84 @@
+"""Tests unitarios para el menú mensual y el registro de modelos"""
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.menu.application.use_cases.get_monthly_menu import (
+    GetMonthlyMenuUseCase,
+    GetMonthlyMenuQuery
+)
+from app.menu.domain.daily_menu import DailyMenu
+from app.menu.domain.meal import Meal
+from app.menu.domain.meal_component import MealComponent
+from app.menu.domain.menu_day_detail import MealDetail, MenuDayDetail
+from app.menu.domain.menu_enums import MealType
+from app.menu.domain.monthly_menu import MonthlyMenu
+from app.shared.database.models import register_models
+
+
+def _detail(meal_type: MealType, *dishes: str) -> MealDetail:
+    meal = Meal(id=f"m-{meal_type.name}", daily_menu_id="d1", meal_type=meal_type, total_kcal=650.0)
+    return MealDetail(
+        meal=meal,
+        components=[
+            MealComponent(
+                id=f"c{i}",
+                meal_id=meal.id,
+                component_type_id="t1",
+                dish_name=dish,
+                calories=100.0,
+                order_position=i,
+                component_type_name="Fondo",
+            )
+            for i, dish in enumerate(dishes)
+        ],
+    )
+
+
+def test_monthly_menu_is_built_from_one_bulk_read():
+    """El mes se arma con list_days_with_meals, sin consultas por día"""
+    repo = AsyncMock()
+    repo.find_by_year_month.return_value = MonthlyMenu(id="menu-1", year=2030, month=3)
+    repo.list_days_with_meals.return_value = [
+        MenuDayDetail(
+            day=DailyMenu(id="d1", weekly_menu_id="w1", date=date(2030, 3, 4)),
+            meals={
+                MealType.LUNCH: _detail(MealType.LUNCH, "Lomo saltado", "Arroz"),
+                MealType.BREAKFAST: _detail(MealType.BREAKFAST, "Avena"),
+                MealType.DINNER: _detail(MealType.DINNER),
+            },
+        )
+    ]
+
+    days = asyncio.run(GetMonthlyMenuUseCase(repo).execute(GetMonthlyMenuQuery(year=2030, month=3)))
+
+    repo.list_days_with_meals.assert_awaited_once_with("menu-1")
+    assert len(days) == 1
+    day = days[0]
+    assert (day["date"], day["breakfast"], day["lunch"], day["dinner"]) == ("2030-03-04", "Avena", "Lomo saltado", "")
+    # Orden fijo de comidas; las que no tienen componentes no se devuelven
+    assert [m["meal_type"] for m in day["meals"]] == ["BREAKFAST", "LUNCH"]
+    assert day["meals"][1]["components"][1] == {
+        "component_type": "Fondo",
+        "dish_name": "Arroz",
+        "calories": 100.0,
+        "order": 1,
+    }
+
+
+def test_monthly_menu_without_menu_returns_empty_list():
+    repo = AsyncMock()
+    repo.find_by_year_month.return_value = None
+
+    assert asyncio.run(GetMonthlyMenuUseCase(repo).execute(GetMonthlyMenuQuery(year=2030, month=3))) == []
+    repo.list_days_with_meals.assert_not_awaited()
+
+
+def test_register_models_uses_a_single_metadata():
+    """Todos los modelos comparten un Base: una tabla work_schedules y relaciones configuradas"""
+    metadata = register_models()
+
+    assert "work_schedules" in metadata.tables
+    assert "sanitary_reviews" in metadata.tables
+    assert "meal_components" in metadata.tables
+    assert metadata.tables["work_schedules"].c.late_tolerance_minutes.server_default.arg.text == "15"
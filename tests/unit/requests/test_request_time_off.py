@@ -0,0 +1,58 @@
+"""Tests unitarios para solicitar vacaciones con consumo atómico del saldo"""
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from app.building_blocks.exceptions import DomainException
+from app.requests.application.use_cases.request_time_off import (
+    RequestTimeOffUseCase,
+    RequestTimeOffCommand
+)
+from app.requests.domain.request_status import RequestType
+from app.requests.domain.vacation_balance import VacationBalance
+
+START = date.today() + timedelta(days=10)
+
+
+def _command() -> RequestTimeOffCommand:
+    return RequestTimeOffCommand(
+        user_id="11111111-1111-1111-1111-111111111111",
+        type=RequestType.VACATION,
+        start_date=START,
+        end_date=START + timedelta(days=2),
+        reason="Viaje"
+    )
+
+
+def _use_case(consumed, balance=None):
+    request_repo = AsyncMock()
+    request_repo.save.side_effect = lambda req: req
+    balance_repo = AsyncMock()
+    balance_repo.try_consume.return_value = consumed
+    balance_repo.get_for_user_year.return_value = balance
+    return RequestTimeOffUseCase(request_repo, balance_repo), balance_repo
+
+
+def test_vacation_is_consumed_without_reading_balance_first():
+    """El UPDATE condicional es el único viaje a la BD para el saldo"""
+    balance = VacationBalance(id="b1", user_id=_command().user_id, year=START.year, total_days=10, used_days=3)
+    use_case, balance_repo = _use_case(consumed=balance)
+
+    result = asyncio.run(use_case.execute(_command()))
+
+    assert result.days_requested == 3
+    balance_repo.try_consume.assert_awaited_once_with(_command().user_id, START.year, 3)
+    balance_repo.get_for_user_year.assert_not_awaited()
+
+
+@pytest.mark.parametrize("balance, message", [
+    (None, "configurado"),
+    (VacationBalance(id="b1", user_id="u1", year=START.year, total_days=2), "suficientes"),
+])
+def test_failed_consumption_explains_why(balance, message):
+    """Si el UPDATE no consume, se lee el saldo solo para dar el mensaje correcto"""
+    use_case, _ = _use_case(consumed=None, balance=balance)
+
+    with pytest.raises(DomainException, match=message):
+        asyncio.run(use_case.execute(_command()))
@@ -0,0 +1,85 @@
+"""Tests unitarios para la revisión masiva de solicitudes de días"""
+import asyncio
+import pytest
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+from app.building_blocks.exceptions import DomainException
+from app.requests.application.use_cases.review_time_off_requests import (
+    ReviewTimeOffRequestsUseCase,
+    ReviewTimeOffRequestsCommand
+)
+from app.requests.domain.request_status import RequestStatus, RequestType
+from app.requests.domain.time_off_request import TimeOffRequest
+from app.requests.domain.vacation_balance import VacationBalance
+
+START = date.today() + timedelta(days=10)
+
+
+def _request(request_id: str, user_id: str, days: int, status=RequestStatus.PENDING) -> TimeOffRequest:
+    return TimeOffRequest(
+        id=request_id,
+        user_id=user_id,
+        type=RequestType.VACATION,
+        start_date=START,
+        end_date=START + timedelta(days=days - 1),
+        days_requested=days,
+        status=status
+    )
+
+
+def _use_case(requests, balances):
+    request_repo = AsyncMock()
+    request_repo.find_many_for_update.return_value = requests
+    balance_repo = AsyncMock()
+    balance_repo.get_many_for_update.return_value = {(b.user_id, b.year): b for b in balances}
+    unit_of_work = AsyncMock()
+    return ReviewTimeOffRequestsUseCase(request_repo, balance_repo, unit_of_work), request_repo, balance_repo, unit_of_work
+
+
+def test_bulk_approve_accumulates_balance_and_reports_rows():
+    """El saldo de un usuario se consume acumulado; lo que no cumple se reporta por fila"""
+    balance = VacationBalance(id="b1", user_id="u1", year=START.year, total_days=5)
+    requests = [
+        _request("r1", "u1", 3),
+        _request("r2", "u1", 3),  # ya no alcanza el saldo
+        _request("r3", "u2", 1, status=RequestStatus.APPROVED),
+    ]
+    use_case, request_repo, balance_repo, unit_of_work = _use_case(requests, [balance])
+
+    result = asyncio.run(use_case.execute(ReviewTimeOffRequestsCommand(
+        request_ids=["r1", "r2", "r3", "r1", "nope"], admin_id="admin", approve=True
+    )))
+
+    assert result["processed"] == 1
+    assert [row["success"] for row in result["results"]] == [True, False, False, False]
+    assert balance.used_days == 3
+
+    # Dos consultas de carga y una sola transacción
+    request_repo.find_many_for_update.assert_awaited_once_with(["r1", "r2", "r3", "nope"])
+    balance_repo.get_many_for_update.assert_awaited_once_with({("u1", START.year)})
+    balance_repo.save_many.assert_awaited_once_with([balance])
+    assert [r.id for r in request_repo.save_many.await_args.args[0]] == ["r1"]
+    unit_of_work.commit.assert_awaited_once()
+
+
+def test_bulk_reject_requires_reason_and_rolls_back_on_error():
+    """Rechazar exige motivo; un error de BD revierte todo el lote"""
+    use_case, request_repo, _, unit_of_work = _use_case([_request("r1", "u1", 1)], [])
+
+    with pytest.raises(DomainException):
+        asyncio.run(use_case.execute(ReviewTimeOffRequestsCommand(
+            request_ids=["r1"], admin_id="admin", approve=False
+        )))
+
+    result = asyncio.run(use_case.execute(ReviewTimeOffRequestsCommand(
+        request_ids=["r1"], admin_id="admin", approve=False, reason="Cierre de mes"
+    )))
+    assert result["processed"] == 1
+
+    request_repo.save_many.side_effect = RuntimeError("db caída")
+    with pytest.raises(RuntimeError):
+        asyncio.run(use_case.execute(ReviewTimeOffRequestsCommand(
+            request_ids=["r1"], admin_id="admin", approve=False, reason="x"
+        )))
+    unit_of_work.rollback.assert_awaited_once()
@@ -0,0 +1,43 @@
+"""Tests unitarios para el calendario de ausencias del equipo"""
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.requests.application.use_cases.get_team_absences import (
+    GetTeamAbsencesUseCase,
+    GetTeamAbsencesCommand
+)
+from app.requests.domain.team_absence import TeamAbsence
+
+
+def _absence(user_id: str, status: str, start: int, end: int) -> TeamAbsence:
+    return TeamAbsence(
+        request_id=f"r-{user_id}-{start}",
+        user_id=user_id,
+        type="vacation",
+        status=status,
+        start_date=date(2030, 3, start),
+        end_date=date(2030, 3, end)
+    )
+
+
+def test_daily_headcount_counts_each_person_once():
+    """Cada persona cuenta una vez por día; aprobado tiene prioridad sobre pendiente"""
+    repo = AsyncMock()
+    repo.find_team_absences.return_value = [
+        _absence("u1", "approved", 1, 3),
+        _absence("u1", "pending", 3, 4),
+        _absence("u2", "pending", 2, 2),
+        _absence("u3", "approved", 1, 20),  # empieza antes y termina después del rango
+    ]
+
+    result = asyncio.run(GetTeamAbsencesUseCase(repo).execute(GetTeamAbsencesCommand(
+        start_date=date(2030, 3, 2), end_date=date(2030, 3, 4)
+    )))
+
+    repo.find_team_absences.assert_awaited_once()
+    assert [(d["approved"], d["pending"], d["total"]) for d in result["days"]] == [
+        (2, 1, 3),  # 2 de marzo: u1 y u3 aprobados, u2 pendiente
+        (2, 0, 2),  # 3 de marzo: u1 (aprobado y pendiente) cuenta una vez
+        (1, 1, 2),
+    ]
@@ -0,0 +1,98 @@
+"""Tests unitarios para el análisis de costo de GraphQL"""
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import strawberry
+
+from app.shared.graphql.cost import (
+    QueryCostExtension,
+    QueryCostLimiter,
+    TokenBucketBudget,
+    by_arg,
+    cost,
+    days_in_month,
+)
+from app.shared.graphql.permissions import PermissionExtension
+from app.shared.security.permissions import Permission, requires
+from app.users.domain.user_role import UserRole
+
+calls = []
+
+
+@strawberry.type
+class Day:
+    date: str
+    meals: List[str]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field(metadata=requires(Permission.AUTHENTICATED, metadata=cost(multiplier=days_in_month)))
+    def menu(self, year: int, month: int) -> List[Day]:
+        calls.append("menu")
+        return []
+
+    @strawberry.field(metadata=cost(multiplier=by_arg("months_back", 6)))
+    def history(self, months_back: int = 6) -> int:
+        calls.append("history")
+        return months_back
+
+
+schema = strawberry.Schema(query=Query, extensions=[PermissionExtension, QueryCostExtension])
+
+
+def run(query, limiter, variables=None, user_id="u1"):
+    user = SimpleNamespace(id=user_id, role=UserRole.EMPLOYEE)
+    context = {"current_user": user, "query_cost_limiter": limiter}
+    return asyncio.run(schema.execute(query, variable_values=variables, context_value=context))
+
+
+def test_aliased_months_are_rejected_before_execution():
+    """12 menús con alias cuestan 12 meses de días: se rechaza sin ejecutar resolvers"""
+    calls.clear()
+    limiter = QueryCostLimiter(max_cost=300, max_depth=10)
+
+    result = run("{ feb: menu(year: 2026, month: 2) { date meals } }", limiter)
+    assert result.errors is None
+    assert limiter.metrics.cost_by_field == {"menu": 28}
+
+    aliases = " ".join(f"m{m}: menu(year: 2026, month: {m}) {{ date }}" for m in range(1, 13))
+    result = run(f"{{ {aliases} }}", limiter)
+
+    assert result.errors[0].extensions == {"code": "QUERY_TOO_COMPLEX", "cost": 365, "max_cost": 300}
+    assert calls == ["menu"]
+    assert limiter.metrics.rejected_by_cost == 1
+
+
+def test_cost_uses_variables_and_default_root_cost():
+    limiter = QueryCostLimiter(max_cost=20, max_depth=10)
+
+    result = run("query H($m: Int!) { history(monthsBack: $m) }", limiter, {"m": 24})
+
+    assert result.errors[0].extensions["cost"] == 24
+    assert run("{ history hello: history(monthsBack: 1) }", limiter).errors is None
+
+
+def test_user_budget_refills_over_time():
+    """Token bucket: sin presupuesto se rechaza y al rato se recupera"""
+    budget = TokenBucketBudget(capacity=60, refill_per_second=10)
+
+    assert budget.try_consume("user:u1", 31, now=0.0) == (True, 0.0)
+    accepted, retry_after = budget.try_consume("user:u1", 31, now=0.0)
+    assert not accepted and retry_after == 0.2
+    assert budget.try_consume("user:u1", 31, now=1.0)[0]
+    # Cada usuario tiene su propio presupuesto
+    assert budget.try_consume("user:u2", 60, now=0.0)[0]
+
+
+def test_budget_rejection_reported_as_rate_limited():
+    limiter = QueryCostLimiter(max_cost=300, max_depth=10, budget=TokenBucketBudget(capacity=40, refill_per_second=0.1))
+    query = "{ menu(year: 2026, month: 1) { date } }"
+
+    assert run(query, limiter).errors is None
+    result = run(query, limiter)
+
+    assert result.errors[0].extensions["code"] == "RATE_LIMITED"
+    assert run(query, limiter, user_id="u2").errors is None
+    assert limiter.metrics.rejected_by_budget == 1
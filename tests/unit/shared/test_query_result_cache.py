@@ -0,0 +1,79 @@
+"""Tests unitarios para la caché acotada de resultados (analítica)"""
+import asyncio
+from unittest.mock import patch
+
+from app.shared.cache.query_results import QueryResultCache
+
+
+def _value(v):
+    async def loader():
+        return v
+    return loader
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryResultCache(max_entries=2)
+
+    async def scenario():
+        await cache.get("a", _value(1))
+        await cache.get("b", _value(2))
+        await cache.get("a", _value(1))  # "a" pasa a ser la más reciente
+        await cache.get("c", _value(3))
+
+    asyncio.run(scenario())
+
+    assert len(cache) == 2
+    assert cache.peek("b") is None
+    assert cache.peek("a") == 1
+    assert cache.metrics.evictions == 1
+
+
+def test_expired_entries_are_removed_when_storing_another():
+    """Las claves vencidas no se acumulan aunque nadie vuelva a leerlas"""
+    cache = QueryResultCache(ttl_seconds=10)
+
+    async def scenario():
+        with patch("app.shared.cache.query_results.time.monotonic", return_value=100.0):
+            await cache.get("ayer", _value(1))
+        with patch("app.shared.cache.query_results.time.monotonic", return_value=200.0):
+            await cache.get("hoy", _value(2))
+
+    asyncio.run(scenario())
+
+    assert len(cache) == 1
+    assert cache.metrics.evictions == 1
+
+
+def test_load_locks_are_released_after_loading():
+    """Cargas concurrentes de una clave: una sola consulta y ningún lock queda guardado"""
+    cache = QueryResultCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["conteo"]
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get("k", loader) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert results == [["conteo"]] * 3
+    assert len(calls) == 1
+    assert cache._loads == {}
+
+
+def test_load_overtaken_by_invalidation_is_not_stored():
+    cache = QueryResultCache()
+    published = []
+    cache.publisher = published.append
+
+    async def loader():
+        cache.invalidate()  # Escritura concurrente
+        return ["conteo"]
+
+    assert asyncio.run(cache.get("k", loader)) == ["conteo"]
+    assert cache.peek("k") is None
+    assert cache.metrics.stale_loads == 1
+    assert published == [{}]
@@ -0,0 +1,128 @@
+"""Tests unitarios para la bandeja de salida de emails"""
+import asyncio
+import socket
+from datetime import datetime, timezone
+from email.mime.text import MIMEText
+from unittest.mock import AsyncMock
+
+import pytest
+from app.users.application.use_cases.create_user_account import (
+    CreateUserAccountUseCase,
+    CreateUserAccountCommand
+)
+from app.users.domain.outbox_email import OutboxEmail, OutboxStatus, EMAIL_ACTIVATION
+from app.users.domain.user_role import UserRole
+from app.users.infrastructure.external.outbox_email_service import OutboxEmailService
+from app.users.infrastructure.external.smtp_connection import PooledSMTPConnection
+
+
+def test_failed_email_is_rescheduled_with_backoff():
+    """Un fallo con intentos disponibles debe reprogramarse más tarde"""
+    email = OutboxEmail(kind="activation", to_email="a@catering.com", attempts=2)
+    before = datetime.now(timezone.utc)
+
+    email.mark_failed("timeout", max_attempts=5)
+
+    assert email.status == OutboxStatus.PENDING
+    assert (email.next_attempt_at - before).total_seconds() >= 60
+    assert email.last_error == "timeout"
+
+
+def test_failed_email_without_attempts_left_is_dead():
+    """Al agotar los intentos el email queda como fallido"""
+    email = OutboxEmail(kind="activation", to_email="a@catering.com", attempts=5)
+
+    email.mark_failed("550 mailbox unavailable", max_attempts=5)
+
+    assert email.status == OutboxStatus.FAILED
+
+
+def _create_user_use_case(outbox_repo):
+    user_repo = AsyncMock()
+    user_repo.exists_by_employee_id.return_value = False
+    user_repo.exists_by_email.return_value = False
+    user_repo.save.side_effect = lambda user: user
+    token_repo = AsyncMock()
+    token_repo.save.side_effect = lambda token: token
+    unit_of_work = AsyncMock()
+    use_case = CreateUserAccountUseCase(user_repo, token_repo, OutboxEmailService(outbox_repo), unit_of_work)
+    return use_case, unit_of_work
+
+
+def _create_user_command() -> CreateUserAccountCommand:
+    return CreateUserAccountCommand(
+        employee_id="EMP001", email="ana@catering.com", full_name="Ana Pérez",
+        dni="12345678", role=UserRole.EMPLOYEE, activation_base_url="https://app"
+    )
+
+
+def test_activation_email_is_enqueued_in_the_user_transaction():
+    """El email se encola antes del único commit que confirma al usuario"""
+    outbox_repo = AsyncMock()
+    use_case, unit_of_work = _create_user_use_case(outbox_repo)
+    calls = []
+    outbox_repo.enqueue.side_effect = lambda email: calls.append("enqueue") or email
+    unit_of_work.commit.side_effect = lambda: calls.append("commit")
+
+    asyncio.run(use_case.execute(_create_user_command()))
+
+    assert calls == ["enqueue", "commit"]
+    assert outbox_repo.enqueue.await_args.args[0].kind == EMAIL_ACTIVATION
+
+
+def test_user_is_not_committed_when_enqueue_fails():
+    """Si no se puede encolar el email, tampoco se crea el usuario"""
+    outbox_repo = AsyncMock()
+    outbox_repo.enqueue.side_effect = RuntimeError("insert failed")
+    use_case, unit_of_work = _create_user_use_case(outbox_repo)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(use_case.execute(_create_user_command()))
+
+    unit_of_work.commit.assert_not_awaited()
+    unit_of_work.rollback.assert_awaited_once()
+
+
+def test_pooled_connection_reuses_smtp_session():
+    """Varios envíos deben usar una sola conexión SMTP (servidor local aiosmtpd)"""
+    controller_module = pytest.importorskip("aiosmtpd.controller")
+    from aiosmtpd.handlers import Sink
+
+    class CountingHandler(Sink):
+        def __init__(self):
+            self.messages = 0
+
+        async def handle_DATA(self, server, session, envelope):
+            self.messages += 1
+            return "250 OK"
+
+    # Puerto libre para el servidor SMTP local
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = CountingHandler()
+    controller = controller_module.Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        connection = PooledSMTPConnection(
+            smtp_host="127.0.0.1",
+            smtp_port=port,
+            start_tls=False
+        )
+
+        async def send_all():
+            for i in range(3):
+                message = MIMEText(f"Mensaje {i}")
+                message["From"] = "noreply@catering.com"
+                message["To"] = f"user{i}@catering.com"
+                message["Subject"] = "Prueba"
+                await connection.send(message)
+            await connection.close()
+
+        asyncio.run(send_all())
+
+        assert handler.messages == 3
+        assert connection.connections_opened == 1
+    finally:
+        controller.stop()
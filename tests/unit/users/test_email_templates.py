@@ -0,0 +1,46 @@
+"""Tests unitarios para el registro de templates de email"""
+from app.users.infrastructure.external.email_templates import EmailTemplateRegistry
+from app.users.infrastructure.external.email_service import SMTPEmailService
+from app.users.domain.outbox_email import EMAIL_ACTIVATION
+
+
+def test_precompile_loads_all_email_templates():
+    """Al arrancar se compilan todos los templates y luego no se vuelve a cargar del disco"""
+    registry = EmailTemplateRegistry()
+
+    assert registry.precompile() == 3
+
+    first = registry.get("activation_email.html")
+    assert registry.get("activation_email.html") is first
+
+
+def test_bytecode_cache_is_written_to_disk(tmp_path):
+    """Con directorio de bytecode, la compilación queda guardada para otros procesos"""
+    registry = EmailTemplateRegistry(bytecode_cache_dir=str(tmp_path / "jinja"))
+
+    registry.precompile()
+
+    assert len(list((tmp_path / "jinja").iterdir())) == 3
+
+
+def test_service_renders_with_shared_registry():
+    """El servicio de email renderiza con los templates del registro"""
+    registry = EmailTemplateRegistry()
+    service = SMTPEmailService(
+        smtp_host="localhost",
+        smtp_port=25,
+        smtp_username="",
+        smtp_password="",
+        from_email="noreply@catering.com",
+        template_registry=registry
+    )
+
+    message = service.build_message(
+        EMAIL_ACTIVATION,
+        "ana@catering.com",
+        {"user_name": "Ana", "activation_link": "https://app/activate?token=abc", "expires_in_hours": 48}
+    )
+
+    html = message.get_payload()[0].get_payload(decode=True).decode()
+    assert "https://app/activate?token=abc" in html
+    assert message["From"] == "Sistema de Catering <noreply@catering.com>"
@@ -0,0 +1,81 @@
+"""Tests unitarios para el alta masiva de usuarios"""
+import asyncio
+from unittest.mock import AsyncMock
+
+from app.users.application.use_cases.import_user_accounts import (
+    ImportUserAccountsUseCase,
+    ImportUserAccountsCommand
+)
+
+CSV_HEADER = "employee_id,email,full_name,dni,role,phone\n"
+
+
+def _use_case(existing=(set(), set())):
+    user_repo = AsyncMock()
+    user_repo.find_existing_identifiers.return_value = existing
+    user_repo.add_many.side_effect = lambda users: [setattr(u, "id", f"id-{u.employee_id}") or u for u in users]
+    token_repo = AsyncMock()
+    outbox_repo = AsyncMock()
+    unit_of_work = AsyncMock()
+    use_case = ImportUserAccountsUseCase(user_repo, token_repo, outbox_repo, unit_of_work)
+    return use_case, user_repo, token_repo, outbox_repo, unit_of_work
+
+
+def _command(csv_text: str, dry_run: bool = False) -> ImportUserAccountsCommand:
+    return ImportUserAccountsCommand(
+        filename="empleados.csv",
+        content=(CSV_HEADER + csv_text).encode(),
+        activation_base_url="https://app.catering.com",
+        dry_run=dry_run
+    )
+
+
+def test_valid_file_is_inserted_in_one_transaction():
+    """Todas las filas válidas se insertan en bloque y se encolan sus emails"""
+    use_case, user_repo, token_repo, outbox_repo, unit_of_work = _use_case()
+
+    result = asyncio.run(use_case.execute(_command(
+        "EMP001,ana@catering.com,Ana Ruiz,11111111,cook,987654321\n"
+        "EMP002,luis@catering.com,Luis Soto,22222222,employee,\n"
+    )))
+
+    assert result["created_count"] == 2
+    user_repo.find_existing_identifiers.assert_awaited_once()
+    user_repo.add_many.assert_awaited_once()
+    tokens = token_repo.add_many.await_args.args[0]
+    assert [t.user_id for t in tokens] == ["id-EMP001", "id-EMP002"]
+    emails = outbox_repo.enqueue_many.await_args.args[0]
+    assert emails[0].context["activation_link"].endswith(tokens[0].token)
+    unit_of_work.commit.assert_awaited_once()
+
+
+def test_invalid_rows_abort_whole_import():
+    """Errores de formato, duplicados en archivo y en BD se reportan por fila sin crear nada"""
+    use_case, user_repo, _, _, unit_of_work = _use_case(existing=({"EMP003"}, set()))
+
+    result = asyncio.run(use_case.execute(_command(
+        "EMP001,ana@catering.com,Ana Ruiz,11111111,chef,\n"
+        "EMP002,correo-invalido,Luis Soto,22222222,employee,\n"
+        "EMP003,rosa@catering.com,Rosa Díaz,33333333,employee,\n"
+        "EMP004,ROSA@catering.com,Rosa Díaz,44444444,employee,\n"
+        "EMP005,,Sin Email,55555555,employee,\n"
+    )))
+
+    assert result["created_count"] == 0
+    assert [e["row"] for e in result["errors"]] == [2, 3, 4, 5, 6]
+    user_repo.add_many.assert_not_awaited()
+    unit_of_work.commit.assert_not_awaited()
+
+
+def test_dry_run_only_validates():
+    """En modo validación no se escribe nada"""
+    use_case, user_repo, _, _, unit_of_work = _use_case()
+
+    result = asyncio.run(use_case.execute(_command(
+        "EMP001,ana@catering.com,Ana Ruiz,11111111,cook,\n", dry_run=True
+    )))
+
+    assert result["valid_count"] == 1
+    assert result["created_count"] == 0
+    user_repo.add_many.assert_not_awaited()
+    unit_of_work.commit.assert_not_awaited()
@@ -0,0 +1,51 @@
+"""Tests unitarios para la firma JWT con llavero de claves"""
+import asyncio
+
+import pytest
+from app.cli.commands.generate_jwt_key import generate_jwt_key
+from app.shared.security.auth import JWTAuthService
+from app.shared.security.keyring import JWTKeyring
+from app.users.domain.user import User
+
+pytest.importorskip("cryptography")
+
+SECRET = "clave-de-pruebas-de-al-menos-32-bytes"
+
+
+def _user() -> User:
+    return User(id="11111111-1111-1111-1111-111111111111", employee_id="EMP001", email="ana@catering.com")
+
+
+def test_rotated_key_still_verifies_old_tokens(tmp_path, capsys):
+    """Tras rotar, los tokens firmados con la clave retirada siguen siendo válidos"""
+    generate_jwt_key(["--dir", str(tmp_path), "--kid", "k1", "--algorithm", "RS256"])
+    old_service = JWTAuthService(SECRET, keyring=JWTKeyring.from_directory(str(tmp_path), "k1"))
+    old_token = asyncio.run(old_service.generate_access_token(_user()))
+
+    generate_jwt_key(["--dir", str(tmp_path), "--kid", "k2", "--retire-others"])
+    keyring = JWTKeyring.from_directory(str(tmp_path), "k2")
+    service = JWTAuthService(SECRET, keyring=keyring)
+
+    assert asyncio.run(service.verify_token(old_token))["sub"] == _user().id
+    new_token = asyncio.run(service.generate_access_token(_user()))
+    assert asyncio.run(service.verify_token(new_token))["email"] == "ana@catering.com"
+    assert {k["kid"]: k["kty"] for k in keyring.jwks()["keys"]} == {"k1": "RSA", "k2": "OKP"}
+    assert keyring.get("k1").private_key is None
+
+
+def test_unknown_kid_and_legacy_tokens(tmp_path, capsys):
+    """kid desconocido se rechaza; HS256 sin kid solo si se permite la migración"""
+    generate_jwt_key(["--dir", str(tmp_path), "--kid", "k1"])
+    keyring = JWTKeyring.from_directory(str(tmp_path), "k1")
+    legacy_token = asyncio.run(JWTAuthService(SECRET).generate_access_token(_user()))
+
+    assert asyncio.run(JWTAuthService(SECRET, keyring=keyring).verify_token(legacy_token)) is not None
+    assert asyncio.run(
+        JWTAuthService(SECRET, keyring=keyring, accept_legacy_hs256=False).verify_token(legacy_token)
+    ) is None
+
+    other_dir = tmp_path / "otro"
+    generate_jwt_key(["--dir", str(other_dir), "--kid", "k9"])
+    foreign = JWTAuthService(SECRET, keyring=JWTKeyring.from_directory(str(other_dir), "k9"))
+    foreign_token = asyncio.run(foreign.generate_access_token(_user()))
+    assert asyncio.run(JWTAuthService(SECRET, keyring=keyring).verify_token(foreign_token)) is None
@@ -0,0 +1,76 @@
+"""Tests unitarios para el límite de intentos de login"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from app.building_blocks.exceptions import AuthenticationException
+from app.shared.security.rate_limiter import SlidingWindowLoginRateLimiter, InMemoryRateLimitBackend
+from app.users.application.use_cases.login_user import LoginUserUseCase, LoginUserCommand
+
+
+def test_limits_by_email_and_ip():
+    """Se corta al superar el límite por email o por IP; el éxito limpia el email"""
+    limiter = SlidingWindowLoginRateLimiter(
+        InMemoryRateLimitBackend(), max_attempts_per_email=2, max_attempts_per_ip=3, window_seconds=60
+    )
+
+    async def scenario():
+        assert await limiter.acquire("Ana@catering.com", "10.0.0.1") is None
+        assert await limiter.acquire("ana@catering.com", "10.0.0.2") is None
+        assert await limiter.acquire("ana@catering.com ", "10.0.0.3") > 0
+        await limiter.reset("ana@catering.com")
+        assert await limiter.acquire("ana@catering.com", "10.0.0.4") is None
+
+        # Credential stuffing: muchos emails desde una IP
+        for i in range(3):
+            assert await limiter.acquire(f"user{i}@catering.com", "10.0.0.9") is None
+        assert await limiter.acquire("otro@catering.com", "10.0.0.9") is not None
+
+    asyncio.run(scenario())
+    assert limiter.metrics.rejected_by_email == 1
+    assert limiter.metrics.rejected_by_ip == 1
+
+
+def test_window_slides():
+    """Los intentos fuera de la ventana dejan de contar"""
+    backend = InMemoryRateLimitBackend()
+    limits = {"email:a": 2}
+
+    async def scenario():
+        assert await backend.hit(limits, now=0, window_seconds=10) is None
+        assert await backend.hit(limits, now=5, window_seconds=10) is None
+        assert await backend.hit(limits, now=8, window_seconds=10) == ("email:a", 0)
+        return await backend.hit(limits, now=12, window_seconds=10)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_rejected_attempts_do_not_extend_lockout():
+    """Seguir intentando con un email bloqueado no lo mantiene bloqueado"""
+    backend = InMemoryRateLimitBackend()
+    limits = {"ip:10.0.0.1": 100, "email:ana@catering.com": 2}
+
+    async def scenario():
+        await backend.hit(limits, now=0, window_seconds=10)
+        await backend.hit(limits, now=1, window_seconds=10)
+        for now in range(2, 10):
+            assert await backend.hit(limits, now=now, window_seconds=10) is not None
+        # El primer intento salió de la ventana: el email vuelve a tener lugar
+        return await backend.hit({"email:ana@catering.com": 2}, now=10, window_seconds=10)
+
+    assert asyncio.run(scenario()) is None
+    # Los intentos rechazados tampoco cuentan para la IP
+    assert len(backend._hits["ip:10.0.0.1"]) == 2
+
+
+def test_blocked_login_skips_database_and_bcrypt():
+    """Un intento bloqueado no consulta al usuario ni verifica la contraseña"""
+    limiter = AsyncMock()
+    limiter.acquire.return_value = 300
+    user_repo = AsyncMock()
+    use_case = LoginUserUseCase(user_repo, AsyncMock(), AsyncMock(), rate_limiter=limiter)
+
+    with pytest.raises(AuthenticationException, match="Demasiados intentos"):
+        asyncio.run(use_case.execute(LoginUserCommand(email="ana@catering.com", password="x", ip_address="10.0.0.1")))
+
+    user_repo.find_by_email.assert_not_awaited()
@@ -0,0 +1,57 @@
+"""Tests unitarios para los permisos por rol"""
+import asyncio
+from types import SimpleNamespace
+
+import strawberry
+
+from app.shared.graphql.permissions import PermissionExtension
+from app.shared.security.permissions import ROLE_PERMISSIONS, Permission, requires
+from app.users.domain.user_role import UserRole
+
+
+def test_role_permissions_table():
+    """ADMIN tiene todos los permisos; el resto solo los que le corresponden"""
+    assert ROLE_PERMISSIONS[UserRole.ADMIN] == frozenset(Permission)
+    assert ROLE_PERMISSIONS[UserRole.EMPLOYEE] == {Permission.AUTHENTICATED}
+    assert Permission.MENU_PROPOSE_CHANGE in ROLE_PERMISSIONS[UserRole.COOK]
+    assert Permission.MENU_UPLOAD not in ROLE_PERMISSIONS[UserRole.COOK]
+    assert Permission.MENU_REVIEW_CHANGE in ROLE_PERMISSIONS[UserRole.NUTRITIONIST]
+
+
+def test_rejects_before_executing_resolvers():
+    """Sin permiso la operación falla en validación y ningún resolver se ejecuta"""
+    calls = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(metadata=requires(Permission.AUTHENTICATED))
+        def me(self) -> str:
+            calls.append("me")
+            return "ok"
+
+    @strawberry.type
+    class Mutation:
+        @strawberry.mutation(metadata=requires(Permission.TIME_OFF_APPROVE))
+        def approve(self) -> bool:
+            calls.append("approve")
+            return True
+
+    schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PermissionExtension])
+
+    def run(query, role=None):
+        user = SimpleNamespace(role=role) if role else None
+        context = {"current_user": user}
+        return asyncio.run(schema.execute(query, context_value=context)), context
+
+    result, _ = run("{ me }")
+    assert result.errors[0].extensions["code"] == "UNAUTHENTICATED"
+
+    result, _ = run("mutation { approve }", UserRole.EMPLOYEE)
+    assert result.errors[0].extensions["code"] == "FORBIDDEN"
+    assert result.errors[0].extensions["missing_permissions"] == ["time_off:approve"]
+    assert calls == []
+
+    result, context = run("mutation { approve }", UserRole.ADMIN)
+    assert result.errors is None
+    assert calls == ["approve"]
+    assert context["permissions"] == ROLE_PERMISSIONS[UserRole.ADMIN]
@@ -0,0 +1,157 @@
+"""Tests unitarios para sesiones y rotación de refresh tokens"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.building_blocks.exceptions import AuthenticationException
+from app.shared.security.auth import JWTAuthService
+from app.shared.security.session_revocation import RevokedSessionIndex
+from app.shared.security.user_cache import AuthenticatedUserCache
+from app.users.infrastructure.persistence.cached_user_repository import CachedUserRepository
+from app.users.application.use_cases.refresh_token import RefreshTokenUseCase, RefreshTokenCommand
+from app.users.domain.user import User, UserStatus
+from app.users.domain.user_session import UserSession
+
+
+def test_revoked_session_expires_from_index():
+    """Una revocación solo se guarda mientras un access token podría seguir vigente"""
+    index = RevokedSessionIndex(ttl=timedelta(minutes=30))
+    index.revoke("s1", datetime.now(timezone.utc) - timedelta(minutes=31))
+    index.revoke("s2")
+
+    assert not index.is_revoked("s1")
+    assert index.is_revoked("s2")
+    assert not index.is_revoked(None)
+    assert len(index) == 1
+
+
+def test_index_is_bounded():
+    """El índice no crece más allá de su capacidad"""
+    index = RevokedSessionIndex(ttl=timedelta(minutes=30), max_entries=2)
+    for session_id in ("s1", "s2", "s3"):
+        index.revoke(session_id)
+
+    assert not index.is_revoked("s1")
+    assert index.is_revoked("s3")
+
+
+def test_revocation_is_published_to_other_workers():
+    """Una revocación en un worker llega al índice de los demás (canal entre workers)"""
+    other = RevokedSessionIndex(ttl=timedelta(minutes=30))
+    index = RevokedSessionIndex(ttl=timedelta(minutes=30), publisher=other.apply_remote)
+
+    index.revoke_many(["s1", "s2"])
+
+    assert other.is_revoked("s1") and other.is_revoked("s2")
+
+
+def _active_user() -> User:
+    return User(id="11111111-1111-1111-1111-111111111111", employee_id="EMP001",
+                email="ana@catering.com", status=UserStatus.ACTIVE, password_hash="hash")
+
+
+def test_current_user_is_loaded_once_per_ttl():
+    """Los requests autenticados no consultan la tabla users mientras el usuario esté en caché"""
+    cache = AuthenticatedUserCache(ttl_seconds=60)
+    loader = AsyncMock(return_value=_active_user())
+
+    first = asyncio.run(cache.get("u1", loader))
+    second = asyncio.run(cache.get("u1", loader))
+
+    assert loader.await_count == 1
+    assert first is second
+    assert first.password_hash is None
+    assert cache.metrics.hits == 1
+
+
+def test_user_change_invalidates_cache_in_every_worker():
+    """Un cambio de rol o estado se ve en el siguiente request, también en otros workers"""
+    other = AuthenticatedUserCache()
+    cache = AuthenticatedUserCache(publisher=other.apply_remote)
+    loader = AsyncMock(return_value=_active_user())
+    asyncio.run(cache.get("u1", loader))
+    asyncio.run(other.get("u1", loader))
+
+    cache.invalidate("u1")
+
+    assert cache.peek("u1") is None and other.peek("u1") is None
+
+
+def test_load_racing_an_invalidation_is_not_cached():
+    """Una lectura que empezó antes de la invalidación no deja la versión anterior en caché"""
+    cache = AuthenticatedUserCache()
+
+    async def loader():
+        cache.invalidate("u1")
+        return _active_user()
+
+    assert asyncio.run(cache.get("u1", loader)) is not None
+    assert cache.peek("u1") is None
+    assert cache.metrics.stale_loads == 1
+
+
+def test_saving_a_user_invalidates_again_after_commit():
+    """save invalida al usuario y vuelve a invalidarlo cuando la transacción se confirma"""
+    cache = AuthenticatedUserCache()
+    published = []
+    cache.publisher = published.append
+    delegate = AsyncMock()
+    delegate.save.side_effect = lambda user: user
+
+    async def scenario():
+        session = AsyncSession()
+        repo = CachedUserRepository(delegate, cache, session)
+        await repo.save(_active_user())
+        assert published == []  # Los demás workers se enteran recién tras el commit
+        await cache.get("11111111-1111-1111-1111-111111111111", AsyncMock(return_value=_active_user()))
+        await session.commit()
+        await session.close()
+
+    asyncio.run(scenario())
+
+    assert cache.peek("11111111-1111-1111-1111-111111111111") is None
+    assert published == [{"user_id": "11111111-1111-1111-1111-111111111111"}]
+
+
+def _setup(stored_jti: str):
+    auth = JWTAuthService(secret_key="clave-de-pruebas-de-al-menos-32-bytes")
+    user = User(id="11111111-1111-1111-1111-111111111111", employee_id="EMP001",
+                email="ana@catering.com", status=UserStatus.ACTIVE)
+    session = UserSession(id="22222222-2222-2222-2222-222222222222", user_id=user.id,
+                          refresh_jti_hash=UserSession.hash_jti(stored_jti))
+    user_repo = AsyncMock()
+    user_repo.find_by_id.return_value = user
+    session_repo = AsyncMock()
+    session_repo.find_by_id.return_value = session
+    session_repo.rotate.return_value = True
+    index = RevokedSessionIndex(ttl=timedelta(minutes=30))
+    use_case = RefreshTokenUseCase(user_repo, auth, session_repo, index)
+    return auth, user, session, session_repo, index, use_case
+
+
+def test_refresh_rotates_token():
+    """El refresh entrega un refresh token nuevo y rota el jti en el servidor"""
+    auth, user, session, session_repo, _, use_case = _setup("jti-1")
+    token = asyncio.run(auth.generate_refresh_token(user, session_id=session.id, jti="jti-1"))
+
+    result = asyncio.run(use_case.execute(RefreshTokenCommand(refresh_token=token)))
+
+    new_payload = asyncio.run(auth.verify_token(result["refresh_token"]))
+    assert new_payload["sid"] == session.id
+    assert new_payload["jti"] != "jti-1"
+    assert session_repo.rotate.await_args.args[2] == UserSession.hash_jti(new_payload["jti"])
+
+
+def test_reused_refresh_token_revokes_session():
+    """Presentar un refresh token ya rotado revoca toda la sesión"""
+    auth, user, session, session_repo, index, use_case = _setup("jti-2")
+    old_token = asyncio.run(auth.generate_refresh_token(user, session_id=session.id, jti="jti-1"))
+
+    with pytest.raises(AuthenticationException):
+        asyncio.run(use_case.execute(RefreshTokenCommand(refresh_token=old_token)))
+
+    session_repo.revoke.assert_awaited_once()
+    session_repo.rotate.assert_not_awaited()
+    assert index.is_revoked(session.id)